@@ -23,6 +23,11 @@ __all__ = [
     "config",
     "conn",
     "Connection",
+    "ConnectionPool",
+    "QueryCache",
+    "profile",
+    "add_query_hook",
+    "remove_query_hook",
     "Instance",
     "Schema",
     "VirtualModule",
@@ -50,7 +55,9 @@ __all__ = [
     "list_codecs",
     "get_codec",
     "ObjectRef",
+    "verify_many",
     "NpyRef",
+    "ChunkedRef",
     # SparkAdapter Codec Protocol
     "SparkAdapter",
     # Storage Adapter API
@@ -60,6 +67,8 @@ __all__ = [
     "errors",
     "migrate",
     "deploy",
+    "export_schema",
+    "import_schema",
     "DataJointError",
     "ThreadSafetyError",
     "logger",
@@ -81,14 +90,18 @@ from .codecs import (
 from .builtin_codecs import (
     SchemaCodec,
     NpyRef,
+    ChunkedRef,
 )
 from .blob import MatCell, MatStruct
-from .connection import Connection
+from .connection import Connection, ConnectionPool
 from .errors import DataJointError, ThreadSafetyError
+from .export import export_schema, import_schema
 from .expression import AndList, Not, Top, U
 from .instance import Instance, _ConfigProxy, _get_singleton_connection, _global_config, _check_thread_safe
 from .logging import logger
-from .objectref import ObjectRef
+from .objectref import ObjectRef, verify_many
+from .profiling import add_query_hook, profile, remove_query_hook
+from .query_cache import QueryCache
 from .spark import SparkAdapter
 from .storage_adapter import StorageAdapter, get_storage_adapter
 from .schemas import _Schema, VirtualModule, list_schemas, virtual_schema
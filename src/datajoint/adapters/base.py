@@ -128,7 +128,7 @@ class DatabaseAdapter(ABC):
         ...
 
     @abstractmethod
-    def get_cursor(self, connection: Any, as_dict: bool = False) -> Any:
+    def get_cursor(self, connection: Any, as_dict: bool = False, server_side: bool = False) -> Any:
         """
         Get a cursor from the database connection.
 
@@ -140,6 +140,11 @@ class DatabaseAdapter(ABC):
             If True, return cursor that yields rows as dictionaries.
             If False, return cursor that yields rows as tuples.
             Default False.
+        server_side : bool, optional
+            If True, return a cursor that streams rows from the server instead
+            of buffering the whole result on the client. The result must be
+            fully consumed (or the cursor closed) before the next query on the
+            same connection. Default False.
 
         Returns
         -------
@@ -1117,6 +1122,52 @@ class DatabaseAdapter(ABC):
         """
         ...
 
+    @abstractmethod
+    def json_text_expr(self, column: str, key: str) -> str:
+        """
+        Generate an expression extracting a top-level JSON value as unbounded text.
+
+        Unlike :meth:`json_path_expr`, the result is not length-limited, and a
+        missing key or JSON ``null`` yields SQL ``NULL``.
+
+        Parameters
+        ----------
+        column : str
+            Column name containing JSON data.
+        key : str
+            Top-level key.
+
+        Returns
+        -------
+        str
+            Database-specific SQL expression.
+
+        Examples
+        --------
+        MySQL: json_unquote(nullif(json_extract(`column`, '$.key'), cast('null' as json)))
+        PostgreSQL: ("column" ->> 'key')
+        """
+        ...
+
+    @abstractmethod
+    def temporary_table_name(self, database: str, table_name: str) -> str:
+        """
+        Quoted name for a session-scoped temporary table.
+
+        Parameters
+        ----------
+        database : str
+            Schema the session works in (MySQL qualifies temporary tables with it).
+        table_name : str
+            Unquoted table name.
+
+        Returns
+        -------
+        str
+            Name usable in ``CREATE TEMPORARY TABLE``, queries, and ``DROP TABLE``.
+        """
+        ...
+
     def translate_expression(self, expr: str) -> str:
         """
         Translate SQL expression for backend compatibility.
@@ -157,7 +157,7 @@ class MySQLAdapter(DatabaseAdapter):
         """Backend identifier: 'mysql'."""
         return "mysql"
 
-    def get_cursor(self, connection: Any, as_dict: bool = False) -> Any:
+    def get_cursor(self, connection: Any, as_dict: bool = False, server_side: bool = False) -> Any:
         """
         Get a cursor from MySQL connection.
 
@@ -169,6 +169,8 @@ class MySQLAdapter(DatabaseAdapter):
             If True, return DictCursor that yields rows as dictionaries.
             If False, return standard Cursor that yields rows as tuples.
             Default False.
+        server_side : bool, optional
+            If True, return an unbuffered SSCursor/SSDictCursor. Default False.
 
         Returns
         -------
@@ -177,7 +179,10 @@ class MySQLAdapter(DatabaseAdapter):
         """
         import pymysql
 
-        cursor_class = pymysql.cursors.DictCursor if as_dict else pymysql.cursors.Cursor
+        if server_side:
+            cursor_class = pymysql.cursors.SSDictCursor if as_dict else pymysql.cursors.SSCursor
+        else:
+            cursor_class = pymysql.cursors.DictCursor if as_dict else pymysql.cursors.Cursor
         return connection.cursor(cursor=cursor_class)
 
     # =========================================================================
@@ -874,6 +879,22 @@ class MySQLAdapter(DatabaseAdapter):
         return_clause = f" returning {return_type}" if return_type else ""
         return f"json_value({quoted_col}, _utf8mb4'$.{path}'{return_clause})"
 
+    def json_text_expr(self, column: str, key: str) -> str:
+        """
+        Generate MySQL json_extract() expression returning unquoted text.
+
+        Examples
+        --------
+        >>> adapter.json_text_expr('meta', 'path')
+        "json_unquote(nullif(json_extract(`meta`, _utf8mb4'$.path'), cast('null' as json)))"
+        """
+        quoted_col = self.quote_identifier(column)
+        return f"json_unquote(nullif(json_extract({quoted_col}, _utf8mb4'$.{key}'), cast('null' as json)))"
+
+    def temporary_table_name(self, database: str, table_name: str) -> str:
+        """MySQL temporary tables are qualified with the schema (no default database is selected)."""
+        return self.make_full_table_name(database, table_name)
+
     def translate_expression(self, expr: str) -> str:
         """
         Translate SQL expression for MySQL compatibility.
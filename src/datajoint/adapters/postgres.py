@@ -205,7 +205,7 @@ class PostgreSQLAdapter(DatabaseAdapter):
         """Backend identifier: 'postgresql'."""
         return "postgresql"
 
-    def get_cursor(self, connection: Any, as_dict: bool = False) -> Any:
+    def get_cursor(self, connection: Any, as_dict: bool = False, server_side: bool = False) -> Any:
         """
         Get a cursor from PostgreSQL connection.
 
@@ -217,6 +217,9 @@ class PostgreSQLAdapter(DatabaseAdapter):
             If True, return Real DictCursor that yields rows as dictionaries.
             If False, return standard cursor that yields rows as tuples.
             Default False.
+        server_side : bool, optional
+            If True, return a named (server-side) cursor. It is declared
+            ``WITH HOLD`` so it works on autocommit connections. Default False.
 
         Returns
         -------
@@ -225,8 +228,13 @@ class PostgreSQLAdapter(DatabaseAdapter):
         """
         import psycopg2.extras
 
+        cursor_factory = psycopg2.extras.RealDictCursor if as_dict else None
+        if server_side:
+            import secrets
+
+            return connection.cursor(name=f"dj_{secrets.token_hex(8)}", cursor_factory=cursor_factory, withhold=True)
         if as_dict:
-            return connection.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
+            return connection.cursor(cursor_factory=cursor_factory)
         return connection.cursor()
 
     # =========================================================================
@@ -1120,6 +1128,21 @@ class PostgreSQLAdapter(DatabaseAdapter):
             expr = f"({expr})::{pg_type}"
         return expr
 
+    def json_text_expr(self, column: str, key: str) -> str:
+        """
+        Generate PostgreSQL ->> expression returning text.
+
+        Examples
+        --------
+        >>> adapter.json_text_expr('meta', 'path')
+        '("meta" ->> \\'path\\')'
+        """
+        return f"({self.quote_identifier(column)} ->> '{key}')"
+
+    def temporary_table_name(self, database: str, table_name: str) -> str:
+        """PostgreSQL temporary tables live in the session's own schema and are not qualified."""
+        return self.quote_identifier(table_name)
+
     def translate_expression(self, expr: str) -> str:
         """
         Translate SQL expression for PostgreSQL compatibility.
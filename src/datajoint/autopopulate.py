@@ -13,6 +13,7 @@ from typing import TYPE_CHECKING, Any, Generator
 
 from .errors import DataJointError, LostConnectionError
 from .expression import AndList, QueryExpression
+from .profiling import operation
 
 if TYPE_CHECKING:
     from .jobs import Job
@@ -362,6 +363,7 @@ class AutoPopulate:
             pass
         return (todo & AndList(restrictions)).proj()
 
+    @operation("populate")
     def populate(
         self,
         *restrictions: Any,
@@ -685,23 +687,24 @@ class AutoPopulate:
         self._upstream = None
 
         try:
-            if not is_generator:
-                make(dict(key), **(make_kwargs or {}))
-            else:
-                # tripartite make - transaction is delayed until the final stage
-                gen = make(dict(key), **(make_kwargs or {}))
-                fetched_data = next(gen)
-                fetch_hash = deepdiff.DeepHash(fetched_data, ignore_iterable_order=False)[fetched_data]
-                computed_result = next(gen)  # perform the computation
-                # fetch and insert inside a transaction
-                self.connection.start_transaction()
-                gen = make(dict(key), **(make_kwargs or {}))  # restart make
-                fetched_data = next(gen)
-                if (
-                    fetch_hash != deepdiff.DeepHash(fetched_data, ignore_iterable_order=False)[fetched_data]
-                ):  # raise error if fetched data has changed
-                    raise DataJointError("Referential integrity failed! The `make_fetch` data has changed")
-                gen.send(computed_result)  # insert
+            with operation("populate.make"):
+                if not is_generator:
+                    make(dict(key), **(make_kwargs or {}))
+                else:
+                    # tripartite make - transaction is delayed until the final stage
+                    gen = make(dict(key), **(make_kwargs or {}))
+                    fetched_data = next(gen)
+                    fetch_hash = deepdiff.DeepHash(fetched_data, ignore_iterable_order=False)[fetched_data]
+                    computed_result = next(gen)  # perform the computation
+                    # fetch and insert inside a transaction
+                    self.connection.start_transaction()
+                    gen = make(dict(key), **(make_kwargs or {}))  # restart make
+                    fetched_data = next(gen)
+                    if (
+                        fetch_hash != deepdiff.DeepHash(fetched_data, ignore_iterable_order=False)[fetched_data]
+                    ):  # raise error if fetched data has changed
+                        raise DataJointError("Referential integrity failed! The `make_fetch` data has changed")
+                    gen.send(computed_result)  # insert
 
         except (KeyboardInterrupt, SystemExit, Exception) as error:
             try:
@@ -10,10 +10,14 @@ from __future__ import annotations
 
 import collections
 import datetime
+import importlib
+import io
+import itertools
 import uuid
 import zlib
 from decimal import Decimal
 from itertools import repeat
+from typing import BinaryIO, Protocol
 
 import numpy as np
 
@@ -58,7 +62,227 @@ serialize_lookup = {
 }
 
 
-compression = {b"ZL123\0": zlib.decompress}
+# maximum number of bytes fed to or produced by each zlib step while inflating
+INFLATE_CHUNK = 1 << 20
+
+# number of bytes read, written, or fed to a compressor per step when streaming
+STREAM_CHUNK = 1 << 16
+
+
+def _inflate(data, size: int) -> bytearray:
+    """Decompress zlib ``data`` straight into a buffer of the expected ``size``."""
+    out = bytearray(size)
+    view = memoryview(out)
+    pos = 0
+    decompressor = zlib.decompressobj()
+
+    def write(piece):
+        nonlocal pos
+        if pos + len(piece) > size:
+            raise DataJointError(f"Blob size mismatch: expected {size}, got more")
+        view[pos : pos + len(piece)] = piece
+        pos += len(piece)
+
+    for start in range(0, len(data), INFLATE_CHUNK):
+        tail = data[start : start + INFLATE_CHUNK]
+        while tail:
+            # bound each step so highly compressible data never materializes more than a chunk
+            write(decompressor.decompress(tail, INFLATE_CHUNK))
+            tail = decompressor.unconsumed_tail
+    write(decompressor.flush())
+    if not decompressor.eof or pos != size:
+        raise DataJointError(f"Blob size mismatch: expected {size}, got {pos}")
+    return out
+
+
+def _import_codec(module: str, extra: str):
+    try:
+        return importlib.import_module(module)
+    except ImportError:
+        raise ImportError(f"{module} is required for {extra} blob compression. Install with: pip install datajoint[{extra}]")
+
+
+def _zlib_compressobj(level, threads):
+    return zlib.compressobj(-1 if level is None else level)
+
+
+def _zstd_compressobj(level, threads):
+    zstd = _import_codec("zstandard", "zstd")
+    return zstd.ZstdCompressor(level=3 if level is None else level, threads=threads).compressobj()
+
+
+def _zstd_decompress(data, size: int) -> bytes:
+    zstd = _import_codec("zstandard", "zstd")
+    return zstd.ZstdDecompressor().decompress(data, max_output_size=size)
+
+
+class _LZ4Stream:
+    """Adapt the lz4 frame compressor to the ``compress()``/``flush()`` protocol of zlib."""
+
+    def __init__(self, level, threads):
+        self._compressor = _import_codec("lz4.frame", "lz4").LZ4FrameCompressor(compression_level=level or 0)
+        self._header = self._compressor.begin()
+
+    def compress(self, data) -> bytes:
+        header, self._header = self._header, b""
+        return header + self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._header + self._compressor.flush()
+
+
+def _lz4_decompress(data, size: int) -> bytes:
+    return _import_codec("lz4.frame", "lz4").decompress(data)
+
+
+SHUFFLE_PREFIX = b"SH123\0"
+
+
+def _shuffle(segments, size: int, typesize: int) -> list:
+    """Group the k-th bytes of every ``typesize``-byte word together to help compression of numeric data."""
+    data = np.frombuffer(b"".join(segments), np.uint8)
+    n = size - size % typesize
+    return [memoryview(np.ascontiguousarray(data[:n].reshape(-1, typesize).T).ravel()), memoryview(data[n:])]
+
+
+def _inner_prefix(head) -> bytes:
+    try:
+        return next(p for p in compression if p != SHUFFLE_PREFIX and head[: len(p)] == p)
+    except StopIteration:
+        raise DataJointError("Unknown compression of shuffled blob")
+
+
+def _unshuffle(data, size: int) -> np.ndarray:
+    """Decompress a shuffled blob: ``typesize (u8) + inner prefix + inner payload``."""
+    typesize, inner = data[0], data[1:]
+    prefix = _inner_prefix(inner)
+    return _unshuffle_buffer(compression[prefix](inner[len(prefix) :], size), size, typesize)
+
+
+def _unshuffle_buffer(buffer, size: int, typesize: int) -> np.ndarray:
+    shuffled = np.frombuffer(buffer, np.uint8)
+    if len(shuffled) != size:
+        raise DataJointError(f"Blob size mismatch: expected {size}, got {len(shuffled)}")
+    n = size - size % typesize
+    out = np.empty(size, np.uint8)
+    out[:n].reshape(-1, typesize)[...] = shuffled[:n].reshape(typesize, -1).T
+    out[n:] = shuffled[n:]
+    return out
+
+
+# Blob compression registry. Every compressed blob starts with a six-byte prefix and the
+# uncompressed size (u64), followed by the compressed payload.
+# compressors: name -> (prefix, ``f(level, threads)`` returning an object with compress()/flush())
+compressors = {
+    "zlib": (b"ZL123\0", _zlib_compressobj),
+    "zstd": (b"ZS123\0", _zstd_compressobj),
+    "lz4": (b"LZ123\0", _LZ4Stream),
+}
+# decompressors keyed by blob prefix: ``f(compressed_buffer, expected_size) -> buffer``
+compression = {
+    b"ZL123\0": _inflate,
+    b"ZS123\0": _zstd_decompress,
+    b"LZ123\0": _lz4_decompress,
+    SHUFFLE_PREFIX: _unshuffle,
+}
+# incremental decompressors for unpack_from: prefix -> ``f()`` returning an object with decompress()
+stream_decompression = {
+    b"ZL123\0": zlib.decompressobj,
+    b"ZS123\0": lambda: _import_codec("zstandard", "zstd").ZstdDecompressor().decompressobj(),
+    b"LZ123\0": lambda: _import_codec("lz4.frame", "lz4").LZ4FrameDecompressor(),
+}
+
+
+class WritableFile(Protocol):
+    """
+    Destination of :func:`pack_to`: a binary file, or a wrapper such as ``HashingWriter``.
+
+    ``tell``, ``seek`` and ``truncate`` are used only if the object is seekable.
+    """
+
+    def write(self, data: bytes, /) -> int: ...
+
+    def tell(self) -> int: ...
+
+    def seek(self, offset: int, whence: int = ..., /) -> int: ...
+
+    def truncate(self, size: int | None = ..., /) -> int: ...
+
+
+def _seekable(fileobj) -> bool:
+    try:
+        return fileobj.seekable()
+    except AttributeError:
+        return hasattr(fileobj, "seek") and hasattr(fileobj, "tell")
+
+
+def _read_exact(fileobj, n: int) -> bytes:
+    data = fileobj.read(n)
+    if len(data) != n:
+        raise DataJointError("Invalid blob: unexpected end of data")
+    return data
+
+
+def _decompress_stream(prefix: bytes, fileobj, size: int):
+    """Decompress the rest of ``fileobj`` in chunks into one buffer of ``size`` bytes."""
+    if prefix == SHUFFLE_PREFIX:
+        typesize = _read_exact(fileobj, 1)[0]
+        inner = _inner_prefix(_read_exact(fileobj, 6))
+        return _unshuffle_buffer(_decompress_stream(inner, fileobj, size), size, typesize)
+    if prefix not in stream_decompression:  # registered without an incremental decompressor
+        return compression[prefix](fileobj.read(), size)
+    decompressor = stream_decompression[prefix]()
+    out = bytearray(size)
+    view = memoryview(out)
+    pos = 0
+    pieces = iter(lambda: fileobj.read(STREAM_CHUNK), b"")
+    for piece in itertools.chain(map(decompressor.decompress, pieces), [getattr(decompressor, "flush", bytes)()]):
+        if pos + len(piece) > size:
+            raise DataJointError(f"Blob size mismatch: expected {size}, got more")
+        view[pos : pos + len(piece)] = piece
+        pos += len(piece)
+    if pos != size:
+        raise DataJointError(f"Blob size mismatch: expected {size}, got {pos}")
+    return out
+
+
+def register_compression(name: str, prefix: bytes, compressobj, decompress, decompressobj=None) -> None:
+    """
+    Register a blob compression method.
+
+    Parameters
+    ----------
+    name : str
+        Name used in ``dj.config.blob.compression`` and ``pack(compression=...)``.
+    prefix : bytes
+        Six-byte header ending in a null byte (e.g. ``b"ZS123\\0"``) identifying the method
+        in stored blobs. Prefixes are permanent: blobs written with them must stay readable.
+    compressobj : callable
+        ``compressobj(level, threads)`` returning an object with ``compress(data)`` and
+        ``flush()`` methods, like ``zlib.compressobj()``. ``level`` may be None.
+    decompress : callable
+        ``decompress(data, size)`` returning the decompressed buffer of ``size`` bytes.
+    decompressobj : callable, optional
+        ``decompressobj()`` returning an object whose ``decompress(chunk)`` method
+        decompresses incrementally, used by ``unpack_from()``. Without it,
+        ``unpack_from()`` reads the whole compressed blob before decompressing.
+
+    Raises
+    ------
+    DataJointError
+        If the prefix is malformed or already used by another method.
+    """
+    if len(prefix) != 6 or not prefix.endswith(b"\0"):
+        raise DataJointError("Blob compression prefixes must be six bytes ending in a null byte")
+    if prefix == SHUFFLE_PREFIX or any(p == prefix and n != name for n, (p, _) in compressors.items()):
+        raise DataJointError(f"Blob compression prefix {prefix!r} is already in use")
+    compressors[name] = (prefix, compressobj)
+    compression[prefix] = decompress
+    if decompressobj is None:
+        stream_decompression.pop(prefix, None)
+    else:
+        stream_decompression[prefix] = decompressobj
+
 
 # runtime setting to read integers as 32-bit to read blobs created by the 32-bit
 # version of the mYm library for MATLAB
@@ -73,6 +297,20 @@ def len_u32(obj):
     return np.uint32(len(obj)).tobytes()
 
 
+# The packer builds each blob as a list of segments (bytes or byte-format memoryviews)
+# that are joined into the result once, so nested structures and array data are copied
+# only when the final blob is assembled.
+
+
+def _nbytes(segments) -> int:
+    return sum(len(segment) for segment in segments)
+
+
+def _array_data(array: np.ndarray) -> memoryview:
+    """Array data in Fortran order; a view of the array unless it must be reordered."""
+    return memoryview(np.asarray(array).ravel(order="F").view(np.uint8))
+
+
 class MatCell(np.ndarray):
     """
     NumPy ndarray subclass representing a MATLAB cell array.
@@ -110,6 +348,12 @@ class Blob:
     squeeze : bool, optional
         If True, remove singleton dimensions from arrays and convert
         0-dimensional arrays to scalars. Default False.
+    writeable : bool, optional
+        Writeable policy for unpacked arrays. If False (default), numeric
+        arrays are read-only views sharing memory with the blob buffer.
+        If True, arrays are writeable: they still share the decompressed
+        buffer of compressed blobs, but arrays over an immutable input
+        buffer are copied.
 
     Attributes
     ----------
@@ -117,8 +361,11 @@ class Blob:
         Current serialization protocol (``b"mYm\\0"`` or ``b"dj0\\0"``).
     """
 
-    def __init__(self, squeeze: bool = False) -> None:
+    def __init__(self, squeeze: bool = False, writeable: bool = False) -> None:
         self._squeeze = squeeze
+        self._writeable = writeable
+        self._typesize = 1
+        self._typed_bytes = 0
         self._blob = None
         self._pos = 0
         self.protocol = None
@@ -149,23 +396,45 @@ class Blob:
         return array.item() if array.ndim == 0 and convert_to_scalar else array
 
     def unpack(self, blob):
-        # PostgreSQL returns bytea as memoryview; convert to bytes for string operations
-        if isinstance(blob, memoryview):
-            blob = bytes(blob)
-        self._blob = blob
+        # Deserialize over a flat memoryview (PostgreSQL already returns bytea as one)
+        # so that slicing, prefix checks, and decompression never copy the input.
+        self._blob = memoryview(blob).cast("B")
         try:
             # decompress
-            prefix = next(p for p in compression if self._blob[self._pos :].startswith(p))
+            prefix = next(p for p in compression if self._blob[self._pos : self._pos + len(p)] == p)
         except StopIteration:
             pass  # assume uncompressed but could be unrecognized compression
         else:
             self._pos += len(prefix)
-            blob_size = self.read_value()
-            blob = compression[prefix](self._blob[self._pos :])
-            if len(blob) != blob_size:
-                raise DataJointError(f"Blob size mismatch: expected {blob_size}, got {len(blob)}")
-            self._blob = blob
-            self._pos = 0
+            blob_size = int(self.read_value())
+            self._set_payload(compression[prefix](self._blob[self._pos :], blob_size), blob_size)
+        return self.read_payload()
+
+    def unpack_from(self, fileobj):
+        head = fileobj.read(6)
+        prefix = next((p for p in compression if head.startswith(p)), None)
+        if prefix is None:
+            # uncompressed: read the whole blob into one buffer that the arrays will share
+            if not _seekable(fileobj):
+                return self.unpack(head + fileobj.read())
+            start = fileobj.tell() - len(head)
+            buffer = memoryview(bytearray(fileobj.seek(0, io.SEEK_END) - start))
+            fileobj.seek(start)
+            pos = 0
+            while pos < len(buffer) and (n := fileobj.readinto(buffer[pos:])):
+                pos += n
+            return self.unpack(buffer[:pos])
+        blob_size = int(np.frombuffer(_read_exact(fileobj, 8), np.uint64)[0])
+        self._set_payload(_decompress_stream(prefix, fileobj, blob_size), blob_size)
+        return self.read_payload()
+
+    def _set_payload(self, payload, size: int) -> None:
+        self._blob = memoryview(payload).cast("B")
+        if len(self._blob) != size:
+            raise DataJointError(f"Blob size mismatch: expected {size}, got {len(self._blob)}")
+        self._pos = 0
+
+    def read_payload(self):
         blob_format = self.read_zero_terminated_string()
         if blob_format in ("mYm", "dj0"):
             return self.read_blob(n_bytes=len(self._blob) - self._pos)
@@ -283,11 +552,15 @@ class Blob:
             data = self.read_value(dtype, count=n_elem)
             if is_complex:
                 data = data + 1j * self.read_value(dtype, count=n_elem)
+            elif self._writeable and not data.flags.writeable:
+                data = data.copy()
+            elif not self._writeable and data.flags.writeable:
+                data.flags.writeable = False
         return self.squeeze(data.reshape(shape, order="F"))
 
-    def pack_array(self, array: np.ndarray) -> bytes:
+    def pack_array(self, array: np.ndarray) -> list:
         """
-        Serialize a NumPy array into bytes.
+        Serialize a NumPy array.
 
         Parameters
         ----------
@@ -296,12 +569,13 @@ class Blob:
 
         Returns
         -------
-        bytes
-            Serialized array data.
+        list
+            Serialized array as bytes-like segments. The data segment of a
+            Fortran-contiguous array is a view of the array itself.
         """
         if "datetime64" in array.dtype.name:
             self.set_dj0()
-        blob = b"A" + np.uint64(array.ndim).tobytes() + np.array(array.shape, dtype=np.uint64).tobytes()
+        blob = [b"A" + np.uint64(array.ndim).tobytes() + np.array(array.shape, dtype=np.uint64).tobytes()]
         is_complex = np.iscomplexobj(array)
         if is_complex:
             array, imaginary = np.real(array), np.imag(array)
@@ -314,20 +588,31 @@ class Blob:
             else:
                 raise DataJointError(f"Type {array.dtype} is ambiguous or unknown")
 
-        blob += np.array([type_id, is_complex], dtype=np.uint32).tobytes()
+        blob.append(np.array([type_id, is_complex], dtype=np.uint32).tobytes())
         if array.dtype.char == "U" or serialize_lookup[array.dtype]["scalar_type"] == "VOID":
-            blob += b"".join(len_u64(it) + it for it in (self.pack_blob(e) for e in array.flatten(order="F")))
+            blob += self.pack_items(array.flatten(order="F"))
             self.set_dj0()  # not supported by original mym
         elif serialize_lookup[array.dtype]["scalar_type"] == "CHAR":
-            blob += array.view(np.uint8).astype(np.uint16).tobytes()  # convert to 16-bit chars for MATLAB
+            blob.append(array.view(np.uint8).astype(np.uint16).tobytes())  # convert to 16-bit chars for MATLAB
         else:  # numeric arrays
             if array.ndim == 0:  # not supported by original mym
                 self.set_dj0()
-            blob += array.tobytes(order="F")
+            if array.nbytes > self._typed_bytes:  # the largest numeric array sets the shuffle word size
+                self._typesize, self._typed_bytes = array.dtype.itemsize, array.nbytes
+            blob.append(_array_data(array))
             if is_complex:
-                blob += imaginary.tobytes(order="F")
+                blob.append(_array_data(imaginary))
         return blob
 
+    def pack_items(self, items) -> list:
+        """Serialize each item as a length-prefixed blob."""
+        segments = []
+        for item in items:
+            packed = self.pack_blob(item)
+            segments.append(np.uint64(_nbytes(packed)).tobytes())
+            segments += packed
+        return segments
+
     def read_recarray(self):
         """
         Serialize an np.ndarray with fields, including recarrays
@@ -347,16 +632,15 @@ class Blob:
 
     def pack_recarray(self, array):
         """Serialize a Matlab struct array"""
-        return (
+        blob = [
             b"F"
-            + len_u32(array.dtype)
-            + "\0".join(array.dtype.names).encode()  # number of fields
+            + len_u32(array.dtype)  # number of fields
+            + "\0".join(array.dtype.names).encode()  # field names
             + b"\0"
-            + b"".join(  # field names
-                (self.pack_recarray(array[f]) if array[f].dtype.fields else self.pack_array(array[f]))
-                for f in array.dtype.names
-            )
-        )
+        ]
+        for f in array.dtype.names:
+            blob += self.pack_recarray(array[f]) if array[f].dtype.fields else self.pack_array(array[f])
+        return blob
 
     def read_sparse_array(self):
         raise DataJointError("datajoint-python does not yet support sparse arrays. Issue (#590)")
@@ -369,28 +653,28 @@ class Blob:
         n_bytes = v.bit_length() // 8 + 1
         if not (0 < n_bytes <= 0xFFFF):
             raise DataJointError("Integers are limited to 65535 bytes")
-        return b"\x0a" + np.uint16(n_bytes).tobytes() + v.to_bytes(n_bytes, byteorder="little", signed=True)
+        return [b"\x0a" + np.uint16(n_bytes).tobytes() + v.to_bytes(n_bytes, byteorder="little", signed=True)]
 
     def read_bool(self):
         return bool(self.read_value("bool"))
 
     @staticmethod
     def pack_bool(v):
-        return b"\x0b" + np.array(v, dtype="bool").tobytes()
+        return [b"\x0b" + np.array(v, dtype="bool").tobytes()]
 
     def read_complex(self):
         return complex(self.read_value("complex128"))
 
     @staticmethod
     def pack_complex(v):
-        return b"\x0c" + np.array(v, dtype="complex128").tobytes()
+        return [b"\x0c" + np.array(v, dtype="complex128").tobytes()]
 
     def read_float(self):
         return float(self.read_value("float64"))
 
     @staticmethod
     def pack_float(v):
-        return b"\x0d" + np.array(v, dtype="float64").tobytes()
+        return [b"\x0d" + np.array(v, dtype="float64").tobytes()]
 
     def read_decimal(self):
         return Decimal(self.read_string())
@@ -398,59 +682,53 @@ class Blob:
     @staticmethod
     def pack_decimal(d):
         s = str(d)
-        return b"d" + len_u64(s) + s.encode()
+        return [b"d" + len_u64(s) + s.encode()]
 
     def read_string(self):
-        return self.read_binary(self.read_value()).decode()
+        return str(self.read_binary(self.read_value()), "utf-8")
 
     @staticmethod
     def pack_string(s):
         blob = s.encode()
-        return b"\5" + len_u64(blob) + blob
+        return [b"\5" + len_u64(blob), blob]
 
     def read_bytes(self):
-        return self.read_binary(self.read_value())
+        return bytes(self.read_binary(self.read_value()))
 
     @staticmethod
     def pack_bytes(s):
-        return b"\6" + len_u64(s) + s
+        return [b"\6" + len_u64(s), s]
 
     def read_none(self):
         pass
 
     @staticmethod
     def pack_none():
-        return b"\xff"
+        return [b"\xff"]
 
     def read_tuple(self):
         return tuple(self.read_blob(self.read_value()) for _ in range(self.read_value()))
 
     def pack_tuple(self, t):
-        return b"\1" + len_u64(t) + b"".join(len_u64(it) + it for it in (self.pack_blob(i) for i in t))
+        return [b"\1" + len_u64(t), *self.pack_items(t)]
 
     def read_list(self):
         return list(self.read_blob(self.read_value()) for _ in range(self.read_value()))
 
     def pack_list(self, t):
-        return b"\2" + len_u64(t) + b"".join(len_u64(it) + it for it in (self.pack_blob(i) for i in t))
+        return [b"\2" + len_u64(t), *self.pack_items(t)]
 
     def read_set(self):
         return set(self.read_blob(self.read_value()) for _ in range(self.read_value()))
 
     def pack_set(self, t):
-        return b"\3" + len_u64(t) + b"".join(len_u64(it) + it for it in (self.pack_blob(i) for i in t))
+        return [b"\3" + len_u64(t), *self.pack_items(t)]
 
     def read_dict(self):
         return dict((self.read_blob(self.read_value()), self.read_blob(self.read_value())) for _ in range(self.read_value()))
 
     def pack_dict(self, d):
-        return (
-            b"\4"
-            + len_u64(d)
-            + b"".join(
-                b"".join((len_u64(it) + it) for it in packed) for packed in (map(self.pack_blob, pair) for pair in d.items())
-            )
-        )
+        return [b"\4" + len_u64(d), *self.pack_items(itertools.chain.from_iterable(d.items()))]
 
     def read_struct(self):
         """deserialize matlab struct"""
@@ -461,22 +739,26 @@ class Blob:
         if not n_fields:
             return np.array(None)  # empty array
         field_names = [self.read_zero_terminated_string() for _ in range(n_fields)]
-        raw_data = [tuple(self.read_blob(n_bytes=int(self.read_value())) for _ in range(n_fields)) for __ in range(n_elem)]
-        data = np.array(raw_data, dtype=list(zip(field_names, repeat(object))))
+        columns = self.read_fixed_records(n_elem, n_fields)
+        if columns is None:
+            raw_data = [tuple(self.read_blob(n_bytes=int(self.read_value())) for _ in range(n_fields)) for __ in range(n_elem)]
+            data = np.array(raw_data, dtype=list(zip(field_names, repeat(object))))
+        else:
+            data = np.empty(n_elem, dtype=list(zip(field_names, repeat(object))))
+            for name, column in zip(field_names, columns):
+                data[name] = column
         return self.squeeze(data.reshape(shape, order="F"), convert_to_scalar=False).view(MatStruct)
 
     def pack_struct(self, array):
         """Serialize a Matlab struct array"""
-        return (
+        return [
             b"S"
-            + np.array((array.ndim,) + array.shape, dtype=np.uint64).tobytes()
-            + len_u32(array.dtype.names)  # dimensionality
-            + "\0".join(array.dtype.names).encode()  # number of fields
-            + b"\0"
-            + b"".join(  # field names
-                len_u64(it) + it for it in (self.pack_blob(e) for rec in array.flatten(order="F") for e in rec)
-            )
-        )  # values
+            + np.array((array.ndim,) + array.shape, dtype=np.uint64).tobytes()  # dimensionality
+            + len_u32(array.dtype.names)  # number of fields
+            + "\0".join(array.dtype.names).encode()  # field names
+            + b"\0",
+            *self.pack_items(e for rec in array.flatten(order="F") for e in rec),  # values
+        ]
 
     def read_cell_array(self):
         """
@@ -491,25 +773,129 @@ class Blob:
         n_dims = self.read_value()
         shape = self.read_value(count=n_dims)
         n_elem = int(np.prod(shape))
-        result = [self.read_blob(n_bytes=self.read_value()) for _ in range(n_elem)]
 
         # Handle empty cell array
         if n_elem == 0:
             return np.empty(0, dtype=object).view(MatCell)
 
-        # Use object dtype to handle ragged/nested arrays without reshape errors.
-        # This avoids NumPy's array homogeneity requirements that cause failures
-        # with MATLAB cell arrays containing arrays of different sizes.
-        arr = np.empty(n_elem, dtype=object)
-        arr[:] = result
+        columns = self.read_fixed_records(n_elem, 1)
+        if columns is not None:
+            arr = columns[0]
+        else:
+            result = [self.read_blob(n_bytes=self.read_value()) for _ in range(n_elem)]
+            # Use object dtype to handle ragged/nested arrays without reshape errors.
+            # This avoids NumPy's array homogeneity requirements that cause failures
+            # with MATLAB cell arrays containing arrays of different sizes.
+            arr = np.empty(n_elem, dtype=object)
+            arr[:] = result
         return self.squeeze(arr.reshape(shape, order="F"), convert_to_scalar=False).view(MatCell)
 
+    def read_fixed_records(self, n_elem: int, n_fields: int) -> list[np.ndarray] | None:
+        """
+        Fast path for struct and cell arrays whose elements all have the same byte layout.
+
+        Elements are stored one after another, each as ``n_fields`` length-prefixed blobs.
+        If every element has the same field lengths, the elements form a table of fixed-size
+        records. Fields holding the same array type and shape in every element (the common
+        case of scalar or fixed-size numeric fields, and equal-length strings) are then
+        decoded at once, numeric ones as one strided view per field; other fields are read
+        element by element.
+
+        Returns
+        -------
+        list of np.ndarray or None
+            One object array of ``n_elem`` values per field, or None (with the position
+            unchanged) if the layout is not fixed and the generic path must be used.
+        """
+        width = 4 if use_32bit_dims else 8  # size of lengths and dimensions
+        blob, start = self._blob, self._pos
+        # field offsets and lengths from the first element
+        offsets, lengths, pos = [], [], start
+        for _ in range(n_fields):
+            if pos + width > len(blob):
+                return None
+            offsets.append(pos - start)
+            lengths.append(int(self.read_value()))
+            pos = self._pos = self._pos + lengths[-1]
+        self._pos = start
+        record_size = pos - start
+        if n_elem < 2 or start + n_elem * record_size > len(blob):
+            return None
+        records = np.frombuffer(blob, np.uint8, count=n_elem * record_size, offset=start).reshape(n_elem, record_size)
+        # the layout is fixed if every element repeats the field lengths of the first one
+        prefixes = np.concatenate([records[:, off : off + width] for off in offsets], axis=1)
+        if not (prefixes == prefixes[0]).all():
+            return None
+
+        columns = []
+        for off, length in zip(offsets, lengths):
+            column = self._read_array_column(records, off + width, length)
+            if column is None:  # not a uniform array field: decode each element
+                values = []
+                for i in range(n_elem):
+                    self._pos = start + i * record_size + off + width
+                    values.append(self.read_blob(n_bytes=length))
+            else:
+                values = column
+            column = np.empty(n_elem, dtype=object)
+            for i, value in enumerate(values):
+                column[i] = value
+            columns.append(column)
+        self._pos = start + n_elem * record_size
+        return columns
+
+    def _read_array_column(self, records: np.ndarray, off: int, length: int):
+        """Decode one field of fixed-size records if it is the same real array type in all of them."""
+        width = 4 if use_32bit_dims else 8
+        header = records[0, off : off + length]
+        if length < 1 + width or header[0] != ord("A"):
+            return None
+        n_dims = int(header[1 : 1 + width].view(f"u{width}")[0])
+        header_size = 1 + width * (1 + n_dims) + 8
+        if length < header_size:
+            return None
+        shape = tuple(int(d) for d in header[1 + width : 1 + width * (1 + n_dims)].view(f"u{width}"))
+        count = int(np.prod(shape, dtype=int))
+        dtype_id, is_complex = header[header_size - 8 : header_size].view("uint32")
+        lookup = deserialize_lookup.get(int(dtype_id))
+        is_char = lookup is not None and lookup["scalar_type"] == "CHAR"
+        if (
+            is_complex
+            or lookup is None
+            or lookup["scalar_type"] == "VOID"
+            or lookup["dtype"] is None
+            or length - header_size != count * (2 if is_char else lookup["dtype"].itemsize)
+            or not (records[:, off : off + header_size] == header[:header_size]).all()
+        ):
+            return None
+        data = records[:, off + header_size : off + length]
+        if is_char:
+            return self._read_char_column(data, shape, count)
+        # same writeable policy as read_array, where single values come out as new arrays
+        writeable = self._writeable or count == 1
+        if writeable and not data.flags.writeable:
+            data = data.copy()
+        elif not writeable and data.flags.writeable:
+            data.flags.writeable = False
+        # element i is data[i] reshaped in Fortran order, as read_array would produce
+        values = data.view(lookup["dtype"]).reshape((len(records),) + shape[::-1]).transpose(0, *range(n_dims, 0, -1))
+        if not self._squeeze:
+            return values
+        values = values.reshape((len(records),) + tuple(d for d in shape if d != 1))
+        return values.tolist() if values.ndim == 1 else values
+
+    def _read_char_column(self, data: np.ndarray, shape: tuple, count: int):
+        """Decode equal-length MATLAB strings (16-bit chars) as read_array does; char matrices take the generic path."""
+        if not count or not (len(shape) == 1 or len(shape) == 2 and shape[0] == 1):
+            return None
+        strings = np.ascontiguousarray(data[:, ::2]).view(f"S{count}")[:, 0].astype(f"U{count}")
+        return strings.tolist() if self._squeeze else strings.reshape(-1, 1)
+
     def pack_cell_array(self, array):
-        return (
-            b"C"
-            + np.array((array.ndim,) + array.shape, dtype=np.uint64).tobytes()
-            + b"".join(len_u64(it) + it for it in (self.pack_blob(e) for e in array.flatten(order="F")))
-        )
+        return [
+            b"C" + np.array((array.ndim,) + array.shape, dtype=np.uint64).tobytes(),
+            *self.pack_items(array.flatten(order="F")),
+        ]
 
     def read_datetime(self):
         """deserialize datetime.date, .time, or .datetime"""
@@ -535,25 +921,30 @@ class Blob:
             date, time = d, None
         else:
             date, time = None, d
-        return b"t" + (
-            np.int32(-1 if date is None else (date.year * 100 + date.month) * 100 + date.day).tobytes()
+        return [
+            b"t"
+            + np.int32(-1 if date is None else (date.year * 100 + date.month) * 100 + date.day).tobytes()
             + np.int64(
                 -1 if time is None else ((time.hour * 100 + time.minute) * 100 + time.second) * 1000000 + time.microsecond
             ).tobytes()
-        )
+        ]
 
     def read_uuid(self):
-        q = self.read_binary(16)
-        return uuid.UUID(bytes=q)
+        return uuid.UUID(bytes=bytes(self.read_binary(16)))
 
     @staticmethod
     def pack_uuid(obj):
-        return b"u" + obj.bytes
+        return [b"u" + obj.bytes]
 
     def read_zero_terminated_string(self):
-        target = self._blob.find(b"\0", self._pos)
-        data = self._blob[self._pos : target].decode()
-        self._pos = target + 1
+        # search growing windows: memoryview has no find() and these strings are short
+        window = 64
+        while (target := bytes(self._blob[self._pos : self._pos + window]).find(b"\0")) < 0:
+            if self._pos + window >= len(self._blob):
+                raise DataJointError("Invalid blob: unterminated string")
+            window *= 4
+        data = str(self._blob[self._pos : self._pos + target], "utf-8")
+        self._pos += target + 1
         return data
 
     def read_value(self, dtype=None, count=1):
@@ -564,21 +955,79 @@ class Blob:
         return data[0] if count == 1 else data
 
     def read_binary(self, size):
+        """Return the next ``size`` bytes as a memoryview slice (no copy)."""
         self._pos += int(size)
         return self._blob[self._pos - int(size) : self._pos]
 
-    def pack(self, obj, compress):
+    def serialize(self, obj) -> list:
+        """Serialize ``obj`` with its protocol header into a list of bytes-like segments."""
         self.protocol = b"mYm\0"  # will be replaced with dj0 if new features are used
+        self._typesize, self._typed_bytes = 1, 0
         blob = self.pack_blob(obj)  # this may reset the protocol and must precede protocol evaluation
-        blob = self.protocol + blob
-        if compress and len(blob) > 1000:
-            compressed = b"ZL123\0" + len_u64(blob) + zlib.compress(blob)
-            if len(compressed) < len(blob):
-                blob = compressed
+        blob.insert(0, self.protocol)
         return blob
 
+    def compress_chunks(self, blob: list, size: int, compression=None, level=None, threads=None, shuffle=None):
+        """Yield the compressed blob (header, then payload) in chunks of bounded size."""
+        from .settings import config
 
-def pack(obj, compress: bool = True) -> bytes:
+        settings = config.blob
+        compression = settings.compression if compression is None else compression
+        try:
+            prefix, compressobj = compressors[compression]
+        except KeyError:
+            raise DataJointError(f"Unknown blob compression {compression!r}. Available: {', '.join(compressors)}")
+        compressor = compressobj(
+            settings.compression_level if level is None else level,
+            settings.compression_threads if threads is None else threads,
+        )
+        if (settings.shuffle if shuffle is None else shuffle) and self._typesize > 1:
+            yield SHUFFLE_PREFIX + np.uint64(size).tobytes() + bytes([self._typesize]) + prefix
+            blob = _shuffle(blob, size, self._typesize)
+        else:
+            yield prefix + np.uint64(size).tobytes()
+        # compress segment by segment so the uncompressed blob is never assembled (unless shuffled)
+        for segment in blob:
+            for start in range(0, len(segment), STREAM_CHUNK):
+                yield compressor.compress(segment[start : start + STREAM_CHUNK])
+        yield compressor.flush()
+
+    def pack(self, obj, compress, **options):
+        blob = self.serialize(obj)
+        size = _nbytes(blob)
+        if compress and size > 1000:
+            compressed = list(self.compress_chunks(blob, size, **options))
+            if _nbytes(compressed) < size:
+                blob = compressed
+        return b"".join(blob)
+
+    def pack_to(self, obj, fileobj, compress, **options) -> int:
+        blob = self.serialize(obj)
+        size = _nbytes(blob)
+        if compress and size > 1000:
+            start = fileobj.tell() if _seekable(fileobj) else None
+            written = 0
+            for chunk in self.compress_chunks(blob, size, **options):
+                written += fileobj.write(chunk)
+            if written < size or start is None:
+                return written
+            # compression did not pay off: rewrite uncompressed, exactly as pack() would
+            fileobj.seek(start)
+            fileobj.truncate()
+        for segment in blob:
+            fileobj.write(segment)
+        return size
+
+
+def pack(
+    obj,
+    compress: bool = True,
+    *,
+    compression: str | None = None,
+    level: int | None = None,
+    threads: int | None = None,
+    shuffle: bool | None = None,
+) -> bytes:
     """
     Serialize a Python object to binary blob format.
 
@@ -589,7 +1038,19 @@ def pack(obj, compress: bool = True) -> bytes:
         collections (dict, list, tuple, set), datetime objects, UUID,
         Decimal, and MATLAB-compatible MatCell/MatStruct.
     compress : bool, optional
-        If True (default), compress blobs larger than 1000 bytes using zlib.
+        If True (default), compress blobs larger than 1000 bytes when that
+        makes them smaller.
+    compression : str, optional
+        Compression method: ``"zlib"``, ``"zstd"``, ``"lz4"``, or a name added with
+        ``register_compression()``. Default: ``dj.config.blob.compression`` (zlib).
+    level : int, optional
+        Compression level. Default: ``dj.config.blob.compression_level`` (method default).
+    threads : int, optional
+        Compression worker threads (zstd only; 0 compresses in the calling thread).
+        Default: ``dj.config.blob.compression_threads``.
+    shuffle : bool, optional
+        Byte-shuffle the blob by the item size of its largest numeric array before
+        compressing, which helps with smooth numeric data. Default: ``dj.config.blob.shuffle``.
 
     Returns
     -------
@@ -607,19 +1068,65 @@ def pack(obj, compress: bool = True) -> bytes:
     >>> blob = pack(data)
     >>> unpacked = unpack(blob)
     """
-    return Blob().pack(obj, compress=compress)
+    return Blob().pack(obj, compress, compression=compression, level=level, threads=threads, shuffle=shuffle)
+
+
+def pack_to(
+    obj,
+    fileobj: WritableFile,
+    compress: bool = True,
+    *,
+    compression: str | None = None,
+    level: int | None = None,
+    threads: int | None = None,
+    shuffle: bool | None = None,
+) -> int:
+    """
+    Serialize a Python object into a binary file object, incrementally.
+
+    Array data is written (or fed to the compressor) straight from the arrays
+    in bounded chunks, so the serialized blob is never held in memory.
+
+    Parameters
+    ----------
+    obj : any
+        Object to serialize (see ``pack()``).
+    fileobj : binary file object
+        Destination, written from its current position.
+    compress, compression, level, threads, shuffle
+        As in ``pack()``. Byte shuffling needs the whole serialized blob and
+        therefore holds it in memory.
+
+    Returns
+    -------
+    int
+        Number of bytes written.
+
+    Notes
+    -----
+    The output is identical to ``pack()`` if ``fileobj`` is seekable. Otherwise,
+    data that does not shrink under compression is still written compressed.
+    """
+    return Blob().pack_to(obj, fileobj, compress, compression=compression, level=level, threads=threads, shuffle=shuffle)
 
 
-def unpack(blob: bytes, squeeze: bool = False):
+def unpack(blob: bytes | bytearray | memoryview, squeeze: bool = False, writeable: bool = False):
     """
     Deserialize a binary blob to a Python object.
 
+    The blob is read through a ``memoryview`` without copying; numeric arrays
+    share memory with the blob (or with its decompressed buffer).
+
     Parameters
     ----------
-    blob : bytes
+    blob : bytes, bytearray, or memoryview
         Binary data from ``pack()`` or MATLAB mYm serialization.
     squeeze : bool, optional
         If True, remove singleton dimensions from arrays. Default False.
+    writeable : bool, optional
+        If False (default), numeric arrays are read-only views. If True, they
+        are writeable; this copies only arrays over an immutable, uncompressed
+        input buffer.
 
     Returns
     -------
@@ -634,4 +1141,27 @@ def unpack(blob: bytes, squeeze: bool = False):
     [1, 2, 3]
     """
     if blob is not None:
-        return Blob(squeeze=squeeze).unpack(blob)
+        return Blob(squeeze=squeeze, writeable=writeable).unpack(blob)
+
+
+def unpack_from(fileobj: BinaryIO, squeeze: bool = False, writeable: bool = False):
+    """
+    Deserialize a blob from a binary file object, incrementally.
+
+    Compressed blobs are read in chunks and decompressed straight into a single
+    buffer of the uncompressed size, which the unpacked arrays then share, so
+    neither the compressed blob nor an intermediate copy is held in memory.
+
+    Parameters
+    ----------
+    fileobj : binary file object
+        Source positioned at the start of a blob written by ``pack()`` or ``pack_to()``.
+    squeeze, writeable
+        As in ``unpack()``.
+
+    Returns
+    -------
+    any
+        Deserialized Python object.
+    """
+    return Blob(squeeze=squeeze, writeable=writeable).unpack_from(fileobj)
@@ -13,6 +13,7 @@ Built-in Codecs:
     - ``<hash@>``: Hash-addressed storage with MD5 deduplication (store only)
     - ``<object@>``: Schema-addressed storage for files/folders (store only)
     - ``<npy@>``: Store numpy arrays as portable .npy files (store only)
+    - ``<chunked@>``: Store large arrays as chunk grids with partial reads (store only)
     - ``<filepath@store>``: Reference to existing file in store (store only)
 
 Example - Creating a Custom Codec:
@@ -59,6 +60,7 @@ Example - Creating a Custom Codec:
 
 from .attach import AttachCodec
 from .blob import BlobCodec
+from .chunked import ChunkedCodec, ChunkedRef
 from .filepath import FilepathCodec
 from .hash import HashCodec
 from .npy import NpyCodec, NpyRef
@@ -74,4 +76,6 @@ __all__ = [
     "FilepathCodec",
     "NpyCodec",
     "NpyRef",
+    "ChunkedCodec",
+    "ChunkedRef",
 ]
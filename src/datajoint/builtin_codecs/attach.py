@@ -7,6 +7,7 @@ from __future__ import annotations
 from typing import Any
 
 from ..codecs import Codec
+from ..hash_registry import ContentStream
 
 
 class AttachCodec(Codec):
@@ -42,6 +43,9 @@ class AttachCodec(Codec):
     Storage Format (internal):
         The blob contains: ``filename\\0contents``
         - Filename (UTF-8 encoded) + null byte + raw file contents
+
+    In-store attachments are streamed from disk to the store in chunks, so
+    files larger than memory can be attached.
     """
 
     name = "attach"
@@ -50,7 +54,7 @@ class AttachCodec(Codec):
         """Return bytes for in-table, <hash> for in-store storage."""
         return "<hash>" if is_store else "bytes"
 
-    def encode(self, value: Any, *, key: dict | None = None, store_name: str | None = None) -> bytes:
+    def encode(self, value: Any, *, key: dict | None = None, store_name: str | None = None) -> bytes | ContentStream:
         """
         Read file and encode as filename + contents.
 
@@ -61,12 +65,13 @@ class AttachCodec(Codec):
         key : dict, optional
             Primary key values (unused).
         store_name : str, optional
-            Unused for internal storage.
+            Target store for ``<attach@>``; None for in-table storage.
 
         Returns
         -------
-        bytes
-            Filename (UTF-8) + null byte + file contents.
+        bytes or ContentStream
+            Filename (UTF-8) + null byte + file contents. For in-store
+            storage, a ``ContentStream`` that reads the file in chunks.
         """
         from pathlib import Path
 
@@ -76,9 +81,10 @@ class AttachCodec(Codec):
         if path.is_dir():
             raise IsADirectoryError(f"<attach> does not support directories: {path}")
 
-        filename = path.name
-        contents = path.read_bytes()
-        return filename.encode("utf-8") + b"\x00" + contents
+        header = path.name.encode("utf-8") + b"\x00"
+        if store_name is not None:
+            return ContentStream(header, path)
+        return header + path.read_bytes()
 
     def decode(self, stored: bytes, *, key: dict | None = None) -> str:
         """
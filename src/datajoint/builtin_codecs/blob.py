@@ -4,9 +4,17 @@ Blob codec for Python object serialization.
 
 from __future__ import annotations
 
-from typing import Any
+import tempfile
+from typing import TYPE_CHECKING, Any
 
 from ..codecs import Codec
+from ..errors import DataJointError
+
+if TYPE_CHECKING:
+    from ..hash_registry import ContentStream
+
+# In-store values larger than this are streamed through a temporary file
+STREAM_BYTES = 64 * 2**20
 
 
 class BlobCodec(Codec):
@@ -23,9 +31,18 @@ class BlobCodec(Codec):
 
     Format Features:
         - Protocol headers (``mYm`` for MATLAB-compatible, ``dj0`` for Python-native)
-        - Optional zlib compression for data > 1KB
+        - Compression of data > 1KB (zlib by default; zstd, lz4, byte shuffle)
         - Support for nested structures
 
+    Compression is chosen, from highest precedence:
+
+    1. the codec's ``compression`` attribute (per attribute, via a subclass),
+    2. ``blob_compression`` in the store config (for ``<blob@store>``),
+    3. ``dj.config.blob``.
+
+    Each level is a dict with any of the ``dj.config.blob`` keys
+    (``compression``, ``compression_level``, ``compression_threads``, ``shuffle``).
+
     Example::
 
         @schema
@@ -40,19 +57,58 @@ class BlobCodec(Codec):
 
         # Insert any serializable object
         table.insert1({'data_id': 1, 'small_result': {'scores': [0.9, 0.8]}})
+
+        # Per-attribute compression: declare the column as <traces>
+        class TraceCodec(BlobCodec):
+            name = "traces"
+            compression = {"compression": "zstd", "compression_level": 3, "shuffle": True}
     """
 
     name = "blob"
+    compression: dict | None = None  # per-codec compression options, see class docstring
 
     def get_dtype(self, is_store: bool) -> str:
         """Return bytes for in-table, <hash> for in-store storage."""
         return "<hash>" if is_store else "bytes"
 
-    def encode(self, value: Any, *, key: dict | None = None, store_name: str | None = None) -> bytes:
-        """Serialize a Python object to DataJoint's blob format."""
-        from .. import blob
+    def encode(self, value: Any, *, key: dict | None = None, store_name: str | None = None) -> bytes | ContentStream:
+        """
+        Serialize a Python object to DataJoint's blob format.
 
-        return blob.pack(value, compress=True)
+        In-store values larger than ``STREAM_BYTES`` are serialized incrementally to a
+        temporary file and hashed in the same pass, then handed to hash-addressed
+        storage as a ``ContentStream`` that is uploaded in chunks.
+        """
+        from .. import blob
+        from ..hash_registry import DEFAULT_HASH_ALGORITHM, ContentStream, HashingWriter
+
+        spec = None
+        if store_name is not None:
+            config = (key or {}).get("_config")
+            if config is None:
+                from ..settings import config
+            assert config is not None
+            spec = config.get_store_spec(store_name or None)
+        options = self.compression if self.compression is not None else (spec or {}).get("blob_compression") or {}
+        unknown = set(options) - {"compression", "compression_level", "compression_threads", "shuffle"}
+        if unknown:
+            raise DataJointError(f"Unknown blob compression option(s): {', '.join(sorted(unknown))}")
+        options = dict(
+            compression=options.get("compression"),
+            level=options.get("compression_level"),
+            threads=options.get("compression_threads"),
+            shuffle=options.get("shuffle"),
+        )
+        if spec is None:
+            return blob.pack(value, compress=True, **options)
+
+        spool = tempfile.SpooledTemporaryFile(max_size=STREAM_BYTES)
+        writer = HashingWriter(spool, spec.get("hash_algorithm") or DEFAULT_HASH_ALGORITHM)
+        if blob.pack_to(value, writer, compress=True, **options) <= STREAM_BYTES:
+            with spool:
+                spool.seek(0)
+                return spool.read()
+        return ContentStream(spool, hashes={writer.algorithm: writer.content_hash}, temporary=True)
 
     def decode(self, stored: bytes, *, key: dict | None = None) -> Any:
         """Deserialize blob bytes back to a Python object."""
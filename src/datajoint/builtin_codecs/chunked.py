@@ -0,0 +1,490 @@
+"""
+Chunked N-dimensional array codec for partial reads and parallel writes.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any
+
+from ..errors import DataJointError
+from .schema import SchemaCodec
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# Target size of an automatically chosen chunk (uncompressed bytes).
+DEFAULT_CHUNK_BYTES = 8 * 2**20
+
+# Number of concurrent chunk transfers per array.
+DEFAULT_WORKERS = 8
+
+# Per-chunk compression: name -> (compress, decompress)
+chunk_compression = {
+    "zlib": (zlib.compress, zlib.decompress),
+}
+
+
+def _default_chunks(shape: tuple[int, ...], itemsize: int, target: int = DEFAULT_CHUNK_BYTES) -> tuple[int, ...]:
+    """
+    Choose a chunk shape of at most ``target`` bytes by halving the longest axis.
+
+    Parameters
+    ----------
+    shape : tuple[int, ...]
+        Array shape.
+    itemsize : int
+        Bytes per element.
+    target : int, optional
+        Upper bound on the uncompressed chunk size in bytes.
+
+    Returns
+    -------
+    tuple[int, ...]
+        Chunk shape with every extent >= 1.
+    """
+    chunks = [max(1, n) for n in shape]
+    while math.prod(chunks) * itemsize > target and max(chunks, default=1) > 1:
+        axis = chunks.index(max(chunks))
+        chunks[axis] = -(-chunks[axis] // 2)
+    return tuple(chunks)
+
+
+def _chunk_key(index: tuple[int, ...]) -> str:
+    """Storage name of the chunk at grid position ``index`` (e.g. ``"0.3.1"``)."""
+    return ".".join(str(i) for i in index) if index else "0"
+
+
+class ChunkedRef:
+    """
+    Lazy reference to an array stored as a grid of chunks.
+
+    Metadata (shape, dtype, chunk grid) is available without I/O. Indexing
+    with integers, slices, and ``Ellipsis`` downloads only the chunks that the
+    selection touches; any other index loads the full array first.
+
+    Attributes
+    ----------
+    shape : tuple[int, ...]
+        Array shape (from metadata, no I/O).
+    dtype : numpy.dtype
+        Array dtype (from metadata, no I/O).
+    chunks : tuple[int, ...]
+        Chunk shape (from metadata, no I/O).
+    path : str
+        Storage path of the chunk directory within the store.
+    store : str or None
+        Store name (None for default).
+
+    Examples
+    --------
+    ::
+
+        ref = (Scan & key).fetch1('stack')
+        ref.shape, ref.chunks      # no download
+        frame = ref[100]           # downloads only the chunks holding frame 100
+        roi = ref[:, 20:40, 20:40] # downloads only the chunks overlapping the ROI
+        arr = ref.load()           # downloads everything
+    """
+
+    __slots__ = ("_meta", "_backend", "_cached", "_workers")
+
+    def __init__(self, metadata: dict, backend: Any, workers: int = DEFAULT_WORKERS):
+        """
+        Initialize ChunkedRef from metadata and storage backend.
+
+        Parameters
+        ----------
+        metadata : dict
+            JSON metadata containing path, store, dtype, shape, chunks, compression.
+        backend : StorageBackend
+            Storage backend for chunk reads.
+        workers : int, optional
+            Maximum number of concurrent chunk downloads.
+        """
+        self._meta = metadata
+        self._backend = backend
+        self._cached: np.ndarray | None = None
+        self._workers = workers
+
+    @property
+    def shape(self) -> tuple:
+        """Array shape (no I/O required)."""
+        return tuple(self._meta["shape"])
+
+    @property
+    def dtype(self):
+        """Array dtype (no I/O required)."""
+        import numpy as np
+
+        return np.dtype(self._meta["dtype"])
+
+    @property
+    def chunks(self) -> tuple:
+        """Chunk shape (no I/O required)."""
+        return tuple(self._meta["chunks"])
+
+    @property
+    def grid(self) -> tuple:
+        """Number of chunks along each axis (no I/O required)."""
+        return tuple(-(-n // c) for n, c in zip(self.shape, self.chunks))
+
+    @property
+    def ndim(self) -> int:
+        """Number of dimensions (no I/O required)."""
+        return len(self._meta["shape"])
+
+    @property
+    def size(self) -> int:
+        """Total number of elements (no I/O required)."""
+        return math.prod(self._meta["shape"])
+
+    @property
+    def nbytes(self) -> int:
+        """Total uncompressed bytes (no I/O required)."""
+        return self.size * self.dtype.itemsize
+
+    @property
+    def compression(self) -> str | None:
+        """Per-chunk compression name, or None."""
+        return self._meta.get("compression")
+
+    @property
+    def path(self) -> str:
+        """Storage path of the chunk directory within the store."""
+        return self._meta["path"]
+
+    @property
+    def store(self) -> str | None:
+        """Store name (None for default store)."""
+        return self._meta.get("store")
+
+    @property
+    def is_loaded(self) -> bool:
+        """True if the full array has been downloaded and cached."""
+        return self._cached is not None
+
+    def _chunk_shape(self, index: tuple[int, ...]) -> tuple[int, ...]:
+        """Shape of the chunk at grid position ``index`` (edge chunks are partial)."""
+        return tuple(min(c, n - i * c) for i, c, n in zip(index, self.chunks, self.shape))
+
+    def read_chunk(self, index: tuple[int, ...]):
+        """
+        Download and decode a single chunk.
+
+        Parameters
+        ----------
+        index : tuple[int, ...]
+            Position of the chunk in the chunk grid.
+
+        Returns
+        -------
+        numpy.ndarray
+            The chunk data.
+        """
+        import numpy as np
+
+        buffer = self._backend.get_buffer(f"{self.path}/{_chunk_key(index)}")
+        if self.compression:
+            buffer = chunk_compression[self.compression][1](buffer)
+        return np.frombuffer(buffer, dtype=self.dtype).reshape(self._chunk_shape(index))
+
+    def _read_chunks(self, indices: list[tuple[int, ...]]) -> dict:
+        """Download many chunks concurrently, returning ``{index: array}``."""
+        if len(indices) <= 1:
+            return {index: self.read_chunk(index) for index in indices}
+        with ThreadPoolExecutor(max_workers=min(self._workers, len(indices))) as pool:
+            return dict(zip(indices, pool.map(self.read_chunk, indices)))
+
+    def load(self):
+        """
+        Download and return the full array.
+
+        Returns
+        -------
+        numpy.ndarray
+            The array data. Cached after the first call.
+        """
+        import itertools
+
+        import numpy as np
+
+        if self._cached is None:
+            result = np.empty(self.shape, dtype=self.dtype)
+            indices = list(itertools.product(*(range(g) for g in self.grid)))
+            for index, chunk in self._read_chunks(indices).items():
+                result[tuple(slice(i * c, i * c + s) for i, c, s in zip(index, self.chunks, chunk.shape))] = chunk
+            self._cached = result
+        return self._cached
+
+    def _normalize_key(self, key) -> tuple | None:
+        """
+        Expand an index into one int or slice per axis.
+
+        Returns None for indices that are not basic (arrays, booleans, newaxis),
+        which are served by loading the full array.
+        """
+        if not isinstance(key, tuple):
+            key = (key,)
+        if sum(k is Ellipsis for k in key) > 1:
+            return None
+        if any(not (isinstance(k, (int, slice)) or k is Ellipsis) or isinstance(k, bool) for k in key):
+            return None
+        if Ellipsis in key:
+            pos = key.index(Ellipsis)
+            key = key[:pos] + (slice(None),) * (self.ndim - len(key) + 1) + key[pos + 1 :]
+        if len(key) > self.ndim:
+            raise IndexError(f"too many indices for array: array is {self.ndim}-dimensional, but {len(key)} were indexed")
+        return key + (slice(None),) * (self.ndim - len(key))
+
+    def __getitem__(self, key):
+        """Index the array, downloading only the chunks the selection touches."""
+        import itertools
+
+        import numpy as np
+
+        if self._cached is not None or self.ndim == 0:
+            return self.load()[key]
+        normalized = self._normalize_key(key)
+        if normalized is None:
+            return self.load()[key]
+
+        # Global indices selected along each axis
+        selected = []
+        for k, n in zip(normalized, self.shape):
+            if isinstance(k, slice):
+                selected.append(np.arange(*k.indices(n)))
+            else:
+                if not -n <= k < n:
+                    raise IndexError(f"index {k} is out of bounds for axis with size {n}")
+                selected.append(np.array([k % n]))
+        out_shape = tuple(len(s) for s, k in zip(selected, normalized) if isinstance(k, slice))
+        if any(len(s) == 0 for s in selected):
+            return np.empty(out_shape, dtype=self.dtype)
+
+        # Chunks needed along each axis, packed into a compact buffer
+        needed = [np.unique(s // c) for s, c in zip(selected, self.chunks)]
+        extents = [np.minimum(c, n - k * c) for k, c, n in zip(needed, self.chunks, self.shape)]
+        offsets = [np.concatenate(([0], np.cumsum(e)[:-1])) for e in extents]
+        buffer = np.empty(tuple(int(e.sum()) for e in extents), dtype=self.dtype)
+        indices = [tuple(int(i) for i in index) for index in itertools.product(*needed)]
+        axis_position = [{int(k): p for p, k in enumerate(axis_needed)} for axis_needed in needed]
+        for index, chunk in self._read_chunks(indices).items():
+            starts = [int(offsets[axis][axis_position[axis][i]]) for axis, i in enumerate(index)]
+            buffer[tuple(slice(start, start + s) for start, s in zip(starts, chunk.shape))] = chunk
+
+        # Map global indices to positions in the compact buffer
+        local = []
+        for axis, (s, c) in enumerate(zip(selected, self.chunks)):
+            k = s // c
+            position = np.array([axis_position[axis][int(i)] for i in k])
+            local.append(offsets[axis][position] + s - k * c)
+        return buffer[np.ix_(*local)].reshape(out_shape)
+
+    def __array__(self, dtype=None, copy=None):
+        """NumPy array protocol: loads the full array."""
+        arr = self.load()
+        if dtype is not None:
+            return arr.astype(dtype)
+        return arr
+
+    def __len__(self) -> int:
+        """Length of first dimension."""
+        if not self._meta["shape"]:
+            raise TypeError("len() of 0-dimensional array")
+        return self._meta["shape"][0]
+
+    def __repr__(self) -> str:
+        status = "loaded" if self.is_loaded else "not loaded"
+        return f"ChunkedRef(shape={self.shape}, chunks={self.chunks}, dtype={self.dtype}, {status})"
+
+    def __str__(self) -> str:
+        return repr(self)
+
+
+class ChunkedCodec(SchemaCodec):
+    """
+    Schema-addressed storage for large arrays split into fixed-size chunks.
+
+    The ``<chunked@>`` codec stores a numpy array as a directory of chunk files
+    at a schema-addressed path:
+    ``{schema_prefix}/{schema}/{table}/{pk}/{attribute}_{token}.chunks/``.
+    Each chunk is named by its grid position (``0.0.0``, ``0.0.1``, ...) and
+    holds the raw C-ordered bytes of that block, optionally compressed. Chunks
+    are uploaded concurrently, and the chunk grid is recorded in the JSON
+    metadata so that fetches return a lazy :class:`ChunkedRef` that downloads
+    only the chunks a slice touches.
+
+    Store only - requires ``@`` modifier.
+
+    Example::
+
+        @schema
+        class Scan(dj.Imported):
+            definition = '''
+            -> Session
+            ---
+            stack : <chunked@imaging>
+            '''
+
+        # Automatic chunk shape (~8 MiB per chunk)
+        Scan.insert1({**key, 'stack': movie})
+
+        # Explicit chunk shape and per-chunk compression
+        Scan.insert1({**key, 'stack': {'data': movie, 'chunks': (1, 512, 512), 'compression': 'zlib'}})
+
+        ref = (Scan & key).fetch1('stack')
+        frame = ref[100]   # reads one chunk row, not the whole stack
+
+    Storage Details:
+        - Path: ``{schema_prefix}/{schema}/{table}/{pk}/{attribute}_{token}.chunks/{i.j.k}``
+        - Manifest: ``{path}.manifest.json`` sidecar listing every chunk file
+        - Database column: JSON with ``{path, store, dtype, shape, chunks, compression, size, item_count}``
+
+    Deletion: Requires garbage collection via ``dj.gc.GarbageCollector``. The
+    recorded path is the chunk directory, so the default ``referenced_paths()``
+    covers every chunk file under it and the manifest sidecar.
+
+    See Also
+    --------
+    ChunkedRef : The lazy array reference returned on fetch.
+    NpyCodec : Single-file array storage.
+    SchemaCodec : Base class for schema-addressed codecs.
+    """
+
+    name = "chunked"
+
+    def validate(self, value: Any) -> None:
+        """
+        Validate an array, or a dict with ``data`` and optional ``chunks``/``compression``.
+
+        Raises
+        ------
+        DataJointError
+            If the value is not a numpy array of a simple dtype (not object, structured,
+            or void) or the options are invalid.
+        """
+        import numpy as np
+
+        if isinstance(value, dict):
+            unknown = set(value) - {"data", "chunks", "compression"}
+            if "data" not in value or unknown:
+                raise DataJointError("<chunked> dict values take keys 'data', 'chunks', and 'compression'")
+            compression = value.get("compression")
+            if compression is not None and compression not in chunk_compression:
+                raise DataJointError(f"<chunked> unknown compression {compression!r}")
+            chunks = value.get("chunks")
+            data = value["data"]
+            if chunks is not None and isinstance(data, np.ndarray):
+                if len(chunks) != data.ndim or any(int(c) < 1 for c in chunks):
+                    raise DataJointError(f"<chunked> chunks {tuple(chunks)} do not match array with ndim={data.ndim}")
+            value = data
+        if not isinstance(value, np.ndarray):
+            raise DataJointError(f"<chunked> requires numpy.ndarray, got {type(value).__name__}")
+        if value.dtype == object:
+            raise DataJointError("<chunked> does not support object dtype arrays")
+        if value.dtype.kind == "V":
+            # str() of a structured dtype does not round-trip through np.dtype()
+            raise DataJointError(f"<chunked> does not support structured or void dtype arrays, got {value.dtype}")
+
+    def encode(
+        self,
+        value: Any,
+        *,
+        key: dict | None = None,
+        store_name: str | None = None,
+    ) -> dict:
+        """
+        Split the array into chunks and upload them concurrently.
+
+        Parameters
+        ----------
+        value : numpy.ndarray or dict
+            Array to store, or ``{'data': array, 'chunks': shape, 'compression': name}``.
+        key : dict, optional
+            Context dict with ``_schema``, ``_table``, ``_field``,
+            and primary key values for path construction.
+        store_name : str, optional
+            Target store. If None, uses default store.
+
+        Returns
+        -------
+        dict
+            JSON metadata: ``{path, store, dtype, shape, chunks, compression, size, item_count}``.
+        """
+        import itertools
+
+        import numpy as np
+
+        options = value if isinstance(value, dict) else {"data": value}
+        array = np.asarray(options["data"])
+        compression = options.get("compression")
+        chunks = options.get("chunks")
+        chunks = tuple(int(c) for c in chunks) if chunks is not None else _default_chunks(array.shape, array.itemsize)
+
+        schema, table, field, primary_key = self._extract_context(key)
+        config = (key or {}).get("_config")
+        path, _ = self._build_path(schema, table, field, primary_key, ext=".chunks", store_name=store_name, config=config)
+        backend = self._get_backend(store_name, config=config)
+
+        grid = [-(-n // c) for n, c in zip(array.shape, chunks)]
+        indices = list(itertools.product(*(range(g) for g in grid)))
+
+        def upload(index):
+            block = np.ascontiguousarray(array[tuple(slice(i * c, (i + 1) * c) for i, c in zip(index, chunks))])
+            buffer = block.tobytes()
+            if compression:
+                buffer = chunk_compression[compression][0](buffer)
+            name = _chunk_key(index)
+            backend.put_buffer(buffer, f"{path}/{name}")
+            return {"path": name, "size": len(buffer)}
+
+        if len(indices) > 1:
+            with ThreadPoolExecutor(max_workers=min(DEFAULT_WORKERS, len(indices))) as pool:
+                files = list(pool.map(upload, indices))
+        else:
+            files = [upload(index) for index in indices]
+
+        total_size = sum(f["size"] for f in files)
+        manifest = {
+            "files": files,
+            "total_size": total_size,
+            "item_count": len(files),
+            "created": datetime.now(timezone.utc).isoformat(),
+        }
+        backend.put_buffer(json.dumps(manifest, indent=2).encode(), f"{path}.manifest.json")
+
+        return {
+            "path": path,
+            "store": store_name,
+            "dtype": str(array.dtype),
+            "shape": list(array.shape),
+            "chunks": list(chunks),
+            "compression": compression,
+            "size": total_size,
+            "item_count": len(files),
+        }
+
+    def decode(self, stored: dict, *, key: dict | None = None) -> ChunkedRef:
+        """
+        Create lazy ChunkedRef from stored metadata.
+
+        Parameters
+        ----------
+        stored : dict
+            JSON metadata from database.
+        key : dict, optional
+            Primary key values (unused).
+
+        Returns
+        -------
+        ChunkedRef
+            Lazy array reference supporting partial reads.
+        """
+        config = (key or {}).get("_config")
+        backend = self._get_backend(stored.get("store"), config=config)
+        return ChunkedRef(stored, backend)
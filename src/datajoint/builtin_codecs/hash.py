@@ -4,19 +4,23 @@ Hash-addressed storage codec with MD5-based deduplication.
 
 from __future__ import annotations
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from ..codecs import Codec
 from ..errors import DataJointError
 
+if TYPE_CHECKING:
+    from ..hash_registry import ContentStream, PendingHash
+
 
 class HashCodec(Codec):
     """
     Hash-addressed storage with content-addressed deduplication.
 
     The ``<hash@>`` codec stores raw bytes using hash-addressed storage.
-    Data is identified by a 26-character Base32-encoded MD5 digest of the
-    content, and stored at ``{hash_prefix}/{schema}/{hash}`` (``hash_prefix``
+    Data is identified by a 26-character Base32-encoded digest of the
+    content (MD5 unless the store sets ``hash_algorithm``, e.g. ``blake2b``
+    or ``blake2b-tree``), and stored at ``{hash_prefix}/{schema}/{hash}`` (``hash_prefix``
     defaults to ``_hash``). Stores with subfolding configured insert
     additional path segments: ``{hash_prefix}/{schema}/{fold1}/{fold2}/{hash}``.
 
@@ -57,14 +61,16 @@ class HashCodec(Codec):
             raise DataJointError("<hash> requires @ (in-store storage only)")
         return "json"
 
-    def encode(self, value: bytes, *, key: dict | None = None, store_name: str | None = None) -> dict:
+    def encode(
+        self, value: bytes | ContentStream, *, key: dict | None = None, store_name: str | None = None
+    ) -> dict | PendingHash:
         """
         Store content and return metadata.
 
         Parameters
         ----------
-        value : bytes
-            Raw bytes to store.
+        value : bytes or ContentStream
+            Raw bytes to store, or a stream of content read in chunks.
         key : dict, optional
             Context dict with ``_schema`` for path isolation.
         store_name : str, optional
@@ -72,13 +78,18 @@ class HashCodec(Codec):
 
         Returns
         -------
-        dict
-            Metadata dict: ``{hash, path, schema, store, size}``.
+        dict or PendingHash
+            Metadata dict: ``{hash, path, schema, store, size}``. During a
+            batched insert (``_hash_batch`` in the context), a ``PendingHash``
+            whose metadata is filled in when the batch is flushed.
         """
         from ..hash_registry import put_hash
 
         schema_name = (key or {}).get("_schema", "unknown")
         config = (key or {}).get("_config")
+        batch = (key or {}).get("_hash_batch")
+        if batch is not None:
+            return batch.add(value, schema_name, store_name=store_name, config=config)
         return put_hash(value, schema_name=schema_name, store_name=store_name, config=config)
 
     def decode(self, stored: dict, *, key: dict | None = None) -> bytes:
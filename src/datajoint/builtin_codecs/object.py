@@ -119,6 +119,10 @@ class ObjectCodec(SchemaCodec):
         size = None
         item_count = None
 
+        # Local files and file-like objects are streamed to storage, not read into memory
+        content = None
+        source_path = None
+        stream = None
         if isinstance(value, bytes):
             content = value
             size = len(content)
@@ -126,24 +130,18 @@ class ObjectCodec(SchemaCodec):
             # Tuple format: (extension, data) where data is bytes or file-like
             ext, data = value
             if hasattr(data, "read"):
-                content = data.read()
+                stream = data
             else:
                 content = data
-            size = len(content)
+                size = len(content)
         elif isinstance(value, (str, Path)):
             source_path = Path(value)
             if not source_path.exists():
                 raise DataJointError(f"Source path not found: {source_path}")
             is_dir = source_path.is_dir()
             ext = source_path.suffix if not is_dir else None
-            if is_dir:
-                # For directories, we'll upload later
-                content = None
-                # Count items in directory
-                item_count = sum(1 for _ in source_path.rglob("*") if _.is_file())
-            else:
-                content = source_path.read_bytes()
-                size = len(content)
+            if not is_dir:
+                size = source_path.stat().st_size
         else:
             raise TypeError(f"<object> expects bytes or path, got {type(value).__name__}")
 
@@ -155,11 +153,14 @@ class ObjectCodec(SchemaCodec):
 
         # Upload content
         if is_dir:
-            # Upload directory recursively
-            source_path = Path(value)
-            backend.put_folder(str(source_path), path)
-            # Compute size by summing all files
-            size = sum(f.stat().st_size for f in source_path.rglob("*") if f.is_file())
+            # Upload directory recursively; size and count come from the upload manifest
+            manifest = backend.put_folder(str(source_path), path)
+            size = manifest["total_size"]
+            item_count = manifest["item_count"]
+        elif source_path is not None:
+            backend.put_file(str(source_path), path)
+        elif stream is not None:
+            size = backend.put_stream(stream, path)
         else:
             backend.put_buffer(content, path)
 
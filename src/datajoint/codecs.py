@@ -259,6 +259,34 @@ class Codec(ABC):
             return [(value["path"], value.get("store"))]
         return []
 
+    def referenced_paths_sql(self, column: str, adapter: Any) -> tuple[str, str] | None:
+        """
+        Return SQL expressions extracting the referenced path and store from a column.
+
+        Lets garbage collection read references with ``SELECT DISTINCT`` on the
+        server instead of decoding every row through :meth:`referenced_paths`.
+        The default matches the default :meth:`referenced_paths` — the ``path``
+        and ``store`` keys of JSON metadata. Codecs that override
+        :meth:`referenced_paths` get None (per-row discovery) unless they also
+        override this method.
+
+        Parameters
+        ----------
+        column : str
+            Unquoted column name.
+        adapter : DatabaseAdapter
+            Adapter of the connection that will run the query.
+
+        Returns
+        -------
+        tuple[str, str] or None
+            ``(path_expr, store_expr)``; each evaluates to NULL when absent.
+            None if references cannot be extracted in SQL.
+        """
+        if type(self).referenced_paths is not Codec.referenced_paths:
+            return None
+        return adapter.json_text_expr(column, "path"), adapter.json_text_expr(column, "store")
+
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__}(name={self.name!r})>"
 
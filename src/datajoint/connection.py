@@ -9,17 +9,22 @@ import hashlib
 import logging
 import pathlib
 import re
+import threading
+import time
 import warnings
+from collections import Counter, deque
 from contextlib import contextmanager
 from typing import TYPE_CHECKING
 
-from . import errors
+from . import errors, profiling
 from .adapters import get_adapter
 from .blob import pack, unpack
 from .dependencies import Dependencies
+from .query_cache import _sizeof, dropped_schema, tables_in
 from .settings import config
 
 if TYPE_CHECKING:
+    from .query_cache import QueryCache
     from .settings import Config
 from .version import __version__
 
@@ -29,6 +34,8 @@ query_log_max_length = 300
 
 cache_key = "query_cache"  # the key to lookup the query_cache folder in dj.config
 
+_checked_servers = set()  # (host, port) of MySQL servers whose version has been checked
+
 
 def translate_query_error(client_error: Exception, query: str, adapter) -> Exception:
     """
@@ -137,7 +144,7 @@ class EmulatedCursor:
         return self._data
 
     def fetchone(self):
-        return next(self._iter)
+        return next(self._iter, None)
 
     @property
     def rowcount(self):
@@ -170,6 +177,9 @@ class Connection:
         Registered schema objects.
     dependencies : Dependencies
         Foreign key dependency graph.
+    counters : collections.Counter
+        Round trips to the server since the connection was created: ``queries``,
+        ``pings``, and ``connects``. See :meth:`count_round_trips`.
     """
 
     def __init__(
@@ -210,6 +220,10 @@ class Connection:
         self._conn = None
         self._query_cache = None
         self._is_closed = True  # Mark as closed until connect() succeeds
+        self._last_activity = 0.0  # time.monotonic() of the last successful round trip
+        self.counters = Counter()
+        self.result_cache = None
+        self._written_tables = set()  # tables modified in the current transaction
 
         # Select adapter: explicit backend > config backend
         if backend is None:
@@ -233,8 +247,9 @@ class Connection:
                 f"{self.conn_info['user']}@{self.conn_info['host']}:{self.conn_info['port']}{db_str}"
             )
             self.connection_id = self.adapter.get_connection_id(self._conn)
-            if self.adapter.backend == "mysql":
+            if self.adapter.backend == "mysql" and (host, port) not in _checked_servers:
                 _warn_if_mariadb(self.query("SELECT @@version").fetchone()[0])
+                _checked_servers.add((host, port))
         else:
             raise errors.LostConnectionError(
                 f"Connection failed {self.conn_info['user']}@{self.conn_info['host']}:{self.conn_info['port']}"
@@ -287,6 +302,31 @@ class Connection:
                 else:
                     raise
         self._is_closed = False  # Mark as connected after successful connection
+        self._last_activity = time.monotonic()
+        self.counters["connects"] += 1
+
+    def clone(self) -> "Connection":
+        """
+        Open a new connection with the same credentials and configuration.
+
+        A connection must not be shared between threads; worker threads that
+        query concurrently each use their own clone.
+
+        Returns
+        -------
+        Connection
+            A new, independent connection.
+        """
+        return Connection(
+            self.conn_info["host"],
+            self.conn_info["user"],
+            self.conn_info["passwd"],
+            port=self.conn_info["port"],
+            use_tls=self.conn_info.get("ssl_input"),
+            database_name=self.conn_info.get("database_name"),
+            backend=self.adapter.backend,
+            config_override=self._config,
+        )
 
     def set_query_cache(self, query_cache: str | None = None) -> None:
         """
@@ -305,6 +345,25 @@ class Connection:
         """
         self._query_cache = query_cache
 
+    def set_result_cache(self, cache: QueryCache | None = None) -> None:
+        """
+        Cache the results of query expressions in memory, invalidated as tables change.
+
+        Unlike :meth:`set_query_cache`, which freezes results until purged, cached
+        results are dropped whenever a table they read is modified through a connection
+        using the same cache. Queries inside transactions bypass the cache.
+
+        Parameters
+        ----------
+        cache : QueryCache, optional
+            Cache to use, possibly shared with other connections. None disables caching.
+
+        Examples
+        --------
+        >>> conn.set_result_cache(dj.QueryCache(max_bytes=256 * 2**20))
+        """
+        self.result_cache = cache
+
     def purge_query_cache(self) -> None:
         """Delete all cached query results."""
         if isinstance(self._config.get(cache_key), str) and pathlib.Path(self._config[cache_key]).is_dir():
@@ -378,13 +437,20 @@ class Connection:
         Exception
             If the connection is closed.
         """
+        self.counters["pings"] += 1
         self.adapter.ping(self._conn)
+        self._last_activity = time.monotonic()
 
     @property
     def is_connected(self) -> bool:
         """
         Check if connected to the database server.
 
+        A connection that completed a round trip within the last
+        ``dj.config['connection.ping_interval']`` seconds is taken to be alive
+        without pinging the server; a connection lost since then is detected and
+        reconnected by :meth:`query`.
+
         Returns
         -------
         bool
@@ -392,6 +458,8 @@ class Connection:
         """
         if self._is_closed:
             return False
+        if time.monotonic() - self._last_activity < self._config["connection.ping_interval"]:
+            return True
         try:
             self.ping()
         except:
@@ -399,7 +467,31 @@ class Connection:
             return False
         return True
 
+    @contextmanager
+    def count_round_trips(self):
+        """
+        Count the round trips to the server made within a block.
+
+        Yields
+        ------
+        collections.Counter
+            Filled on exit with the numbers of ``queries``, ``pings``, and ``connects``.
+
+        Examples
+        --------
+        >>> with conn.count_round_trips() as trips:
+        ...     Segmentation.populate()
+        >>> trips["queries"], trips["pings"]
+        """
+        start = self.counters.copy()
+        trips = Counter()
+        try:
+            yield trips
+        finally:
+            trips.update(self.counters - start)
+
     def _execute_query(self, cursor, query, args, suppress_warnings):
+        self.counters["queries"] += 1
         try:
             with warnings.catch_warnings():
                 if suppress_warnings:
@@ -408,6 +500,7 @@ class Connection:
                 cursor.execute(query, args)
         except Exception as err:
             raise translate_query_error(err, query, self.adapter)
+        self._last_activity = time.monotonic()
 
     def query(
         self,
@@ -417,6 +510,8 @@ class Connection:
         as_dict: bool = False,
         suppress_warnings: bool = True,
         reconnect: bool | None = None,
+        stream: bool = False,
+        cache: bool = False,
     ):
         """
         Execute a SQL query and return the cursor.
@@ -433,6 +528,13 @@ class Connection:
             If True, suppress SQL library warnings. Default True.
         reconnect : bool, optional
             If True, reconnect if disconnected. None uses config setting.
+        stream : bool, optional
+            If True, use a server-side cursor so rows are streamed rather than
+            buffered on the client. Consume or close the cursor before issuing
+            the next query. Default False.
+        cache : bool, optional
+            If True and a result cache is set (see :meth:`set_result_cache`), serve
+            this read-only query from the cache and cache its result. Default False.
 
         Returns
         -------
@@ -461,10 +563,56 @@ class Connection:
             else:
                 return EmulatedCursor(unpack(buffer))
 
+        result_cache = self.result_cache
+        use_result_cache = cache and result_cache is not None and not stream and not self._in_transaction
+        if use_result_cache:
+            key = result_cache.key(query, args, as_dict)
+            rows = result_cache.get(key)
+            if rows is not None:
+                return EmulatedCursor([dict(row) for row in rows] if as_dict else rows)
+            tables = tables_in(query, self.adapter)
+            snapshot = result_cache.snapshot(tables)
+
         if reconnect is None:
             reconnect = self._config["database.reconnect"]
         logger.debug("Executing SQL:" + query[:query_log_max_length])
-        cursor = self.adapter.get_cursor(self._conn, as_dict=as_dict)
+        event = profiling.before_query(self, query, args) if profiling.enabled() else None
+        start = time.perf_counter()
+        try:
+            cursor = self._run_query(query, args, as_dict, suppress_warnings, reconnect, stream)
+        except Exception as error:
+            if event is not None:
+                event.duration, event.error = time.perf_counter() - start, error
+                profiling.after_query(event)
+            raise
+        duration = time.perf_counter() - start
+        slow_query_threshold = self._config["connection.slow_query_threshold"]
+        if event is not None or slow_query_threshold is not None and duration >= slow_query_threshold:
+            cursor = self._record_query(event, cursor, query, args, duration, stream, slow_query_threshold)
+
+        if use_query_cache:
+            data = cursor.fetchall()
+            cache_path.write_bytes(pack(data))
+            return EmulatedCursor(data)
+
+        if use_result_cache:
+            rows = cursor.fetchall()
+            result_cache.put(key, rows, tables, snapshot)
+            return EmulatedCursor([dict(row) for row in rows] if as_dict else rows)
+        if result_cache is not None and not re.match(r"\s*(SELECT|SHOW)", query, flags=re.I):
+            # a statement that may modify tables: drop results that read them
+            written = tables_in(query, self.adapter)
+            result_cache.invalidate(written)
+            schema = dropped_schema(query, self.adapter)
+            if schema is not None:
+                result_cache.invalidate_schema(schema)
+            if self._in_transaction:
+                self._written_tables |= written
+
+        return cursor
+
+    def _run_query(self, query, args, as_dict, suppress_warnings, reconnect, stream):
+        cursor = self.adapter.get_cursor(self._conn, as_dict=as_dict, server_side=stream)
         try:
             self._execute_query(cursor, query, args, suppress_warnings)
         except errors.LostConnectionError:
@@ -476,14 +624,32 @@ class Connection:
                 self.cancel_transaction()
                 raise errors.LostConnectionError("Connection was lost during a transaction.")
             logger.debug("Re-executing")
-            cursor = self.adapter.get_cursor(self._conn, as_dict=as_dict)
+            cursor = self.adapter.get_cursor(self._conn, as_dict=as_dict, server_side=stream)
             self._execute_query(cursor, query, args, suppress_warnings)
+        return cursor
 
-        if use_query_cache:
-            data = cursor.fetchall()
-            cache_path.write_bytes(pack(data))
-            return EmulatedCursor(data)
-
+    def _record_query(self, event, cursor, query, args, duration, stream, slow_query_threshold):
+        """Measure a completed query for the query hooks and the slow query log."""
+        if stream:
+            rowcount = nbytes = None
+        elif cursor.description is None:  # statement without a result set
+            rowcount, nbytes = cursor.rowcount, len(query) + profiling._args_nbytes(args)
+        else:
+            # buffered rows are already on the client; measuring them requires fetching
+            rows = cursor.fetchall()
+            cursor = EmulatedCursor(rows)
+            rowcount, nbytes = len(rows), _sizeof(rows)
+        if event is not None:
+            event.duration, event.rowcount, event.nbytes = duration, rowcount, nbytes
+            profiling.after_query(event)
+        if slow_query_threshold is not None and duration >= slow_query_threshold:
+            operations = event.operations if event is not None else profiling.current_operations()
+            logger.warning(
+                f"Slow query ({duration:.3f} s, {rowcount} rows"
+                + (f", in {' > '.join(operations)}" if operations else "")
+                + "): "
+                + query[:query_log_max_length]
+            )
         return cursor
 
     def get_user(self) -> str:
@@ -529,15 +695,22 @@ class Connection:
     def cancel_transaction(self) -> None:
         """Cancel the current transaction and roll back all changes."""
         self.query(self.adapter.rollback_sql())
-        self._in_transaction = False
+        self._end_transaction()
         logger.debug("Transaction cancelled. Rolling back ...")
 
     def commit_transaction(self) -> None:
         """Commit all changes and close the transaction."""
         self.query(self.adapter.commit_sql())
-        self._in_transaction = False
+        self._end_transaction()
         logger.debug("Transaction committed and closed.")
 
+    def _end_transaction(self) -> None:
+        self._in_transaction = False
+        # other connections sharing the result cache may have cached the tables as they were before the transaction
+        if self.result_cache is not None:
+            self.result_cache.invalidate(self._written_tables)
+        self._written_tables = set()
+
     # -------- context manager for transactions
     @property
     @contextmanager
@@ -567,3 +740,261 @@ class Connection:
             raise
         else:
             self.commit_transaction()
+
+
+class ConnectionPool:
+    """
+    A pool of reusable connections to one database server.
+
+    A :class:`Connection` must not be shared between threads. In a web service or a
+    thread pool, each task checks out a connection, uses it exclusively, and checks it
+    back in, so that later tasks reuse it instead of paying for a new connection (TLS
+    negotiation, server checks, and a fresh dependency graph). Pooled connections share
+    the schema registry, the foreign key dependency graph, and the result cache of the
+    pool's first connection (or of ``connection``), so these are loaded once per pool.
+
+    Parameters
+    ----------
+    min_size : int, optional
+        Connections kept open while idle. Default 1.
+    max_size : int, optional
+        Maximum number of open connections; checkout waits while all are in use.
+        Default 10.
+    idle_timeout : float or None, optional
+        Seconds after which idle connections beyond ``min_size`` are closed.
+        None keeps them open. Default 300.
+    host : str, optional
+        Database hostname. Default from config.
+    user : str, optional
+        Database username. Default from config.
+    password : str, optional
+        Database password. Default from config.
+    port : int, optional
+        Port number. Default from config.
+    use_tls : bool or dict, optional
+        TLS encryption option. Default from config.
+    connection : Connection, optional
+        Connection whose credentials, configuration, schemas, and dependency graph the
+        pool shares. It is not itself handed out by the pool.
+    health_check_interval : float, optional
+        Seconds a connection may sit idle before checkout pings it (and reconnects if
+        the server dropped it). Connections used more recently are handed out without
+        a round trip. Default 30.
+
+    Examples
+    --------
+    >>> pool = dj.ConnectionPool(min_size=2, max_size=8, idle_timeout=60)
+    >>> with pool.connection() as conn:
+    ...     sessions = dj.FreeTable(conn, "lab.session").fetch()
+    """
+
+    def __init__(
+        self,
+        min_size: int = 1,
+        max_size: int = 10,
+        idle_timeout: float | None = 300.0,
+        *,
+        host: str | None = None,
+        user: str | None = None,
+        password: str | None = None,
+        port: int | None = None,
+        use_tls: bool | dict | None = None,
+        connection: Connection | None = None,
+        health_check_interval: float = 30.0,
+    ) -> None:
+        if max_size < 1 or not 0 <= min_size <= max_size:
+            raise errors.DataJointError("ConnectionPool requires 0 <= min_size <= max_size and max_size >= 1.")
+        self.min_size = min_size
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.health_check_interval = health_check_interval
+        self._available = threading.Condition()
+        self._idle = deque()  # (connection, time of last use), least recently used first
+        self._in_use = {}  # id(connection) -> (connection, connection previously bound to the graph)
+        self._size = 0  # open connections, including those being opened
+        self._closed = False
+        if connection is None:
+            host = host if host is not None else config["database.host"]
+            user = user if user is not None else config["database.user"]
+            password = password if password is not None else config["database.password"]
+            if user is None or password is None:
+                raise errors.DataJointError(
+                    "Database credentials not configured. Set datajoint.config['database.user'] and "
+                    "datajoint.config['database.password'] or pass user= and password= arguments."
+                )
+            use_tls = use_tls if use_tls is not None else config["database.use_tls"]
+            connection = Connection(host, user, password, port, use_tls)
+            self._size = 1
+            self._idle.append((connection, time.monotonic()))
+        self._template = connection
+        while self._size < min_size:
+            self._idle.append((self._open(), time.monotonic()))
+            self._size += 1
+
+    def __repr__(self):
+        info = self._template.conn_info
+        return (
+            f"ConnectionPool({info['user']}@{info['host']}:{info['port']}, "
+            f"{len(self._in_use)} in use, {len(self._idle)} idle, max_size={self.max_size})"
+        )
+
+    @property
+    def size(self) -> int:
+        """Number of open connections, in use or idle."""
+        return self._size
+
+    def _open(self) -> Connection:
+        connection = self._template.clone()
+        connection.schemas = self._template.schemas
+        connection.dependencies = self._template.dependencies
+        return connection
+
+    def _close_expired(self) -> None:
+        """Close connections idle longer than ``idle_timeout``, down to ``min_size``."""
+        if self.idle_timeout is None:
+            return
+        now = time.monotonic()
+        while self._idle and self._size > self.min_size and now - self._idle[0][1] > self.idle_timeout:
+            connection, _ = self._idle.popleft()
+            self._size -= 1
+            connection.close()
+
+    def checkout(self, timeout: float | None = None) -> Connection:
+        """
+        Take a connection from the pool for exclusive use by the calling thread.
+
+        Return it with :meth:`checkin` from the same thread, or use :meth:`connection`.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Seconds to wait for a connection when all ``max_size`` are in use.
+            None waits indefinitely.
+
+        Returns
+        -------
+        Connection
+            An open connection.
+
+        Raises
+        ------
+        DataJointError
+            If the pool is closed or no connection became available within ``timeout``.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._available:
+            while True:
+                if self._closed:
+                    raise errors.DataJointError("The connection pool is closed.")
+                self._close_expired()
+                if self._idle:
+                    # the most recently used connection is the least likely to need a health check
+                    connection, last_used = self._idle.pop()
+                    break
+                if self._size < self.max_size:
+                    connection, last_used = None, None
+                    self._size += 1
+                    break
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise errors.DataJointError(
+                        f"No pooled connection became available within {timeout} s (max_size={self.max_size})."
+                    )
+                self._available.wait(remaining)
+        try:
+            if connection is None:
+                connection = self._open()
+            elif time.monotonic() - last_used > self.health_check_interval:
+                try:
+                    connection.ping()
+                except Exception:
+                    logger.warning("Reconnecting pooled connection to database server.")
+                    connection.connect()
+        except Exception:
+            with self._available:
+                self._size -= 1
+                self._available.notify()
+            raise
+        connection.result_cache = self._template.result_cache
+        with self._available:
+            self._in_use[id(connection)] = (connection, connection.dependencies.bind(connection))
+        return connection
+
+    def checkin(self, connection: Connection) -> None:
+        """
+        Return a checked-out connection to the pool.
+
+        A transaction left open is rolled back. Connections that were closed are
+        discarded and replaced on demand.
+
+        Parameters
+        ----------
+        connection : Connection
+            Connection obtained from :meth:`checkout`.
+
+        Raises
+        ------
+        DataJointError
+            If the connection was not checked out from this pool.
+        """
+        with self._available:
+            if id(connection) not in self._in_use:
+                raise errors.DataJointError("The connection was not checked out from this pool.")
+            _, previous = self._in_use.pop(id(connection))
+        connection.dependencies.bind(previous)
+        if connection._in_transaction and not connection._is_closed:
+            try:
+                connection.cancel_transaction()
+            except Exception:
+                connection.close()
+        with self._available:
+            if self._closed or connection._is_closed:
+                self._size -= 1
+                connection.close()
+            else:
+                self._idle.append((connection, time.monotonic()))
+                self._close_expired()
+            self._available.notify()
+
+    @contextmanager
+    def connection(self, timeout: float | None = None):
+        """
+        Context manager that checks out a connection and checks it back in on exit.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Seconds to wait for a connection. None waits indefinitely.
+
+        Yields
+        ------
+        Connection
+            A connection for exclusive use within the block.
+
+        Examples
+        --------
+        >>> with pool.connection() as conn, conn.transaction:
+        ...     dj.FreeTable(conn, "lab.session").insert1(session)
+        """
+        connection = self.checkout(timeout)
+        try:
+            yield connection
+        finally:
+            self.checkin(connection)
+
+    def close(self) -> None:
+        """Close idle connections now and checked-out ones when they are checked in."""
+        with self._available:
+            self._closed = True
+            while self._idle:
+                connection, _ = self._idle.pop()
+                self._size -= 1
+                connection.close()
+            self._available.notify_all()
+
+    def __enter__(self) -> "ConnectionPool":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
+        self.close()
+        return False
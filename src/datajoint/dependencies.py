@@ -9,6 +9,7 @@ proper ordering of operations like delete and drop.
 from __future__ import annotations
 
 import re
+import threading
 from collections import defaultdict
 
 import networkx as nx
@@ -107,7 +108,8 @@ class Dependencies(nx.MultiDiGraph):
     Attributes
     ----------
     _conn : Connection or None
-        Database connection.
+        Database connection for catalog queries: the one bound to the calling
+        thread (see :meth:`bind`), else the connection the graph was created with.
     _loaded : bool
         Whether dependencies have been loaded from the database.
 
@@ -115,21 +117,60 @@ class Dependencies(nx.MultiDiGraph):
     -----
     Empty constructor use is permitted to facilitate NetworkX algorithms.
     See: https://github.com/datajoint/datajoint-python/pull/443
+
+    A graph shared by the connections of a pool is read and reloaded from several
+    threads. Reloads build a new graph and swap it in, so the node and adjacency
+    dicts being read by another thread never change. Methods that read the graph
+    work on the snapshot returned by :meth:`load`.
     """
 
     def __init__(self, connection=None) -> None:
-        self._conn = connection
+        self._connection = connection
+        self._bound = threading.local()  # per-thread connection of a graph shared by pooled connections
+        self._lock = threading.RLock()  # serializes reloads of a shared graph
         self._loaded = False
-        self._loaded_schemas = set()  # schema names currently represented in the graph
+        self._loaded_schemas: set[str] = set()  # schema names currently represented in the graph
+        self._graph = nx.MultiDiGraph()  # the loaded graph, never modified once swapped in
         super().__init__(self)
 
+    @property
+    def _conn(self):
+        return getattr(self._bound, "connection", None) or self._connection
+
+    def bind(self, connection):
+        """
+        Route the calling thread's catalog queries through ``connection``.
+
+        Used by :class:`~datajoint.connection.ConnectionPool`, whose connections share
+        one graph: each thread loads it through the connection it has checked out.
+
+        Parameters
+        ----------
+        connection : Connection or None
+            Connection for this thread, or None to use the graph's own connection.
+
+        Returns
+        -------
+        Connection or None
+            The connection previously bound to this thread.
+        """
+        previous = getattr(self._bound, "connection", None)
+        self._bound.connection = connection
+        return previous
+
     def clear(self) -> None:
         """Clear the graph and reset loaded state."""
-        self._loaded = False
-        self._loaded_schemas = set()
-        super().clear()
+        with self._lock:
+            self._swap(nx.MultiDiGraph(), set(), loaded=False)
+
+    def _swap(self, graph: nx.MultiDiGraph, schema_names: set[str], loaded: bool) -> None:
+        # replace rather than modify the dicts, which other threads may be iterating
+        self._graph = graph
+        self._node, self._succ, self._pred = graph._node, graph._succ, graph._pred
+        self._loaded_schemas = schema_names
+        self._loaded = loaded
 
-    def load(self, force: bool = True, schema_names: set[str] | None = None) -> None:
+    def load(self, force: bool = True, schema_names: set[str] | None = None) -> nx.MultiDiGraph:
         """
         Load dependencies for the given schemas.
 
@@ -142,21 +183,28 @@ class Dependencies(nx.MultiDiGraph):
             If True (default), reload even if already loaded.
         schema_names : set[str], optional
             Schema names to load. If None, uses all activated schemas.
+
+        Returns
+        -------
+        networkx.MultiDiGraph
+            Snapshot of the loaded graph, unaffected by later reloads.
         """
-        # reload from scratch to prevent duplication of renamed edges
-        if self._loaded and not force:
-            return
+        with self._lock:
+            # reload from scratch to prevent duplication of renamed edges
+            if force or not self._loaded:
+                self._load(schema_names)
+            return self._graph
 
-        self.clear()
+    def _load(self, schema_names: set[str] | None) -> None:
+        graph = nx.MultiDiGraph()
 
         # Get adapter for backend-specific SQL generation
         adapter = self._conn.adapter
 
         # Build schema list for IN clause
-        names = schema_names if schema_names is not None else set(self._conn.schemas)
-        self._loaded_schemas = set(names)
+        names = set(schema_names if schema_names is not None else self._conn.schemas)
         if not names:
-            self._loaded = True
+            self._swap(graph, names, loaded=True)
             return
         schemas_list = ", ".join(adapter.quote_string(s) for s in names)
 
@@ -178,7 +226,7 @@ class Dependencies(nx.MultiDiGraph):
 
         # add nodes to the graph
         for n, pk in pks.items():
-            self.add_node(n, primary_key=pk)
+            graph.add_node(n, primary_key=pk)
 
         # Process foreign keys (same for both backends)
         keys = ({k.lower(): v for k, v in elem.items()} for elem in fk_keys)
@@ -210,18 +258,27 @@ class Dependencies(nx.MultiDiGraph):
                 aliased=any(k != v for k, v in fk["attr_map"].items()),
                 multi=set(fk["attr_map"]) != set(pks[fk["referencing_table"]]),
             )
-            self.add_edge(
+            graph.add_edge(
                 fk["referenced_table"],
                 fk["referencing_table"],
                 key=tuple(fk["attr_map"]),
                 **props,
             )
 
-        if not nx.is_directed_acyclic_graph(self):
+        if not nx.is_directed_acyclic_graph(graph):
             raise DataJointError("DataJoint can only work with acyclic dependencies")
-        self._loaded = True
+        self._swap(graph, names, loaded=True)
 
-    def load_all_downstream(self) -> None:
+    def _load_covering(self, schema_names: set[str]) -> nx.MultiDiGraph:
+        # Skip the expensive rebuild when the graph already contains every needed
+        # schema, so repeated calls within one operation don't reload the whole
+        # dependency tree. See #1493.
+        with self._lock:
+            if not (self._loaded and schema_names <= self._loaded_schemas):
+                self._load(schema_names)
+            return self._graph
+
+    def load_all_downstream(self) -> nx.MultiDiGraph:
         """
         Load dependencies including all downstream schemas reachable via FK chains.
 
@@ -237,12 +294,16 @@ class Dependencies(nx.MultiDiGraph):
 
             conn.dependencies.load_all_downstream()
             dj.Diagram(schema)  # now includes all downstream schemas
+
+        Returns
+        -------
+        networkx.MultiDiGraph
+            Snapshot of the loaded graph, unaffected by later reloads.
         """
         adapter = self._conn.adapter
         known_schemas = set(self._conn.schemas)
         if not known_schemas:
-            self.load()
-            return
+            return self.load()
 
         while True:
             schemas_list = ", ".join(adapter.quote_string(s) for s in known_schemas)
@@ -252,14 +313,9 @@ class Dependencies(nx.MultiDiGraph):
                 break
             known_schemas |= new_schemas
 
-        # Skip the expensive rebuild when the graph already contains every needed
-        # schema, so repeated calls within one operation don't reload the whole
-        # dependency tree. See #1493.
-        if self._loaded and known_schemas <= self._loaded_schemas:
-            return
-        self.load(force=True, schema_names=known_schemas)
+        return self._load_covering(known_schemas)
 
-    def load_all_upstream(self) -> None:
+    def load_all_upstream(self) -> nx.MultiDiGraph:
         """
         Load dependencies including all upstream schemas referenced via FK chains.
 
@@ -271,12 +327,16 @@ class Dependencies(nx.MultiDiGraph):
 
         Called automatically by ``Diagram.trace()``. Symmetric to
         :meth:`load_all_downstream`.
+
+        Returns
+        -------
+        networkx.MultiDiGraph
+            Snapshot of the loaded graph, unaffected by later reloads.
         """
         adapter = self._conn.adapter
         known_schemas = set(self._conn.schemas)
         if not known_schemas:
-            self.load()
-            return
+            return self.load()
 
         while True:
             schemas_list = ", ".join(adapter.quote_string(s) for s in known_schemas)
@@ -286,12 +346,7 @@ class Dependencies(nx.MultiDiGraph):
                 break
             known_schemas |= new_schemas
 
-        # Skip the expensive rebuild when the graph already contains every needed
-        # schema, so repeated Diagram.trace() calls within one populate() don't
-        # reload the whole dependency tree per key. See #1493.
-        if self._loaded and known_schemas <= self._loaded_schemas:
-            return
-        self.load(force=True, schema_names=known_schemas)
+        return self._load_covering(known_schemas)
 
     def topo_sort(self) -> list[str]:
         """
@@ -302,7 +357,7 @@ class Dependencies(nx.MultiDiGraph):
         list[str]
             Table names sorted topologically.
         """
-        return topo_sort(self)
+        return topo_sort(self.load(force=False))
 
     def parents(self, table_name: str, primary: bool | None = None) -> list[tuple[str, dict]]:
         r"""
@@ -324,10 +379,10 @@ class Dependencies(nx.MultiDiGraph):
             A parent may appear more than once when this table has multiple
             (e.g. renamed) foreign keys to it — each is a distinct parallel edge.
         """
-        self.load(force=False)
+        graph = self.load(force=False)
         return [
             (u, props)
-            for u, _, props in self.in_edges(table_name, data=True)
+            for u, _, props in graph.in_edges(table_name, data=True)
             if primary is None or props["primary"] == primary
         ]
 
@@ -351,10 +406,10 @@ class Dependencies(nx.MultiDiGraph):
             A child may appear more than once when it has multiple (e.g. renamed)
             foreign keys to this table — each is a distinct parallel edge.
         """
-        self.load(force=False)
+        graph = self.load(force=False)
         return [
             (v, props)
-            for _, v, props in self.out_edges(table_name, data=True)
+            for _, v, props in graph.out_edges(table_name, data=True)
             if primary is None or props["primary"] == primary
         ]
 
@@ -372,9 +427,8 @@ class Dependencies(nx.MultiDiGraph):
         list[str]
             Dependent tables in topological order. Self is included first.
         """
-        self.load(force=False)
-        nodes = self.subgraph(nx.descendants(self, full_table_name))
-        return [full_table_name] + nodes.topo_sort()
+        graph = self.load(force=False)
+        return [full_table_name] + topo_sort(graph.subgraph(nx.descendants(graph, full_table_name)))
 
     def ancestors(self, full_table_name: str) -> list[str]:
         r"""
@@ -390,6 +444,5 @@ class Dependencies(nx.MultiDiGraph):
         list[str]
             Ancestor tables in reverse topological order. Self is included last.
         """
-        self.load(force=False)
-        nodes = self.subgraph(nx.ancestors(self, full_table_name))
-        return reversed(nodes.topo_sort() + [full_table_name])
+        graph = self.load(force=False)
+        return reversed(topo_sort(graph.subgraph(nx.ancestors(graph, full_table_name))) + [full_table_name])
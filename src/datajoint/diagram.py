@@ -234,8 +234,7 @@ class Diagram(nx.MultiDiGraph):  # noqa: C901
                 raise DataJointError("Could not find database connection in %s" % repr(source))
 
         # initialize graph from dependencies
-        connection.dependencies.load()
-        super().__init__(connection.dependencies)
+        super().__init__(connection.dependencies.load())
         self._connection = connection
         self._cascade_restrictions = {}
         self._restrict_conditions = {}
@@ -454,11 +453,11 @@ class Diagram(nx.MultiDiGraph):  # noqa: C901
         if part_integrity not in ("enforce", "ignore", "cascade"):
             raise ValueError(f"part_integrity must be 'enforce', 'ignore', or 'cascade', got {part_integrity!r}")
         conn = table_expr.connection
-        conn.dependencies.load_all_downstream()
+        graph = conn.dependencies.load_all_downstream()
         node = table_expr.full_table_name
 
         result = cls.__new__(cls)
-        nx.MultiDiGraph.__init__(result, conn.dependencies)
+        nx.MultiDiGraph.__init__(result, graph)
         result._connection = conn
         result.context = {}
         result._cascade_restrictions = {}
@@ -539,11 +538,11 @@ class Diagram(nx.MultiDiGraph):  # noqa: C901
         :meth:`cascade` — the downstream mirror.
         """
         conn = table_expr.connection
-        conn.dependencies.load_all_upstream()
+        graph = conn.dependencies.load_all_upstream()
         node = table_expr.full_table_name
 
         result = cls.__new__(cls)
-        nx.MultiDiGraph.__init__(result, conn.dependencies)
+        nx.MultiDiGraph.__init__(result, graph)
         result._connection = conn
         result.context = {}
         result._cascade_restrictions = {}  # trace uses cascade-shape storage (OR semantics)
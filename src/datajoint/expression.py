@@ -20,6 +20,7 @@ import pandas
 from .errors import DataJointError
 from .codecs import decode_attribute
 from .preview import preview, repr_html
+from .profiling import operation
 
 logger = logging.getLogger(__name__.split(".")[0])
 
@@ -669,6 +670,7 @@ class QueryExpression:
     aggregate = aggr  # alias for aggr
 
     # ---------- Fetch operators --------------------
+    @operation("fetch", fetch=True)
     def fetch(
         self,
         *attrs,
@@ -777,6 +779,7 @@ class QueryExpression:
         # Default: return structured array (legacy behavior)
         return self.to_arrays(order_by=order_by, limit=limit, offset=offset, squeeze=squeeze)
 
+    @operation("fetch1", fetch=True)
     def fetch1(self, *attrs, squeeze=False):
         """
         Fetch exactly one row from the query result.
@@ -866,6 +869,7 @@ class QueryExpression:
             return self.restrict(Top(limit, order_by, offset))
         return self
 
+    @operation("to_dicts", fetch=True)
     def to_dicts(self, order_by=None, limit=None, offset=None, squeeze=False):
         """
         Fetch all rows as a list of dictionaries.
@@ -900,6 +904,7 @@ class QueryExpression:
             for row in cursor
         ]
 
+    @operation("to_pandas", fetch=True)
     def to_pandas(self, order_by=None, limit=None, offset=None, squeeze=False):
         """
         Fetch all rows as a pandas DataFrame with primary key as index.
@@ -926,6 +931,7 @@ class QueryExpression:
             df = df.set_index(self.primary_key)
         return df
 
+    @operation("to_polars", fetch=True)
     def to_polars(self, order_by=None, limit=None, offset=None, squeeze=False):
         """
         Fetch all rows as a polars DataFrame.
@@ -955,6 +961,7 @@ class QueryExpression:
         dicts = self.to_dicts(order_by=order_by, limit=limit, offset=offset, squeeze=squeeze)
         return polars.DataFrame(dicts)
 
+    @operation("to_arrow", fetch=True)
     def to_arrow(self, order_by=None, limit=None, offset=None, squeeze=False):
         """
         Fetch all rows as a PyArrow Table.
@@ -986,6 +993,7 @@ class QueryExpression:
             return pyarrow.table({})
         return pyarrow.Table.from_pylist(dicts)
 
+    @operation("to_arrays", fetch=True)
     def to_arrays(self, *attrs, include_key=False, order_by=None, limit=None, offset=None, squeeze=False):
         """
         Fetch data as numpy arrays.
@@ -1094,6 +1102,7 @@ class QueryExpression:
                 ret[name] = list(map(partial(get, heading[name]), ret[name]))
             return ret
 
+    @operation("keys", fetch=True)
     def keys(self, order_by=None, limit=None, offset=None):
         """
         Fetch primary key values as a list of dictionaries.
@@ -1173,7 +1182,7 @@ class QueryExpression:
             fields = result.heading.as_sql(result.primary_key, include_aliases=False, adapter=adapter)
             query = f"SELECT count(DISTINCT {fields}) FROM {result.from_clause()}{result.where_clause()}"
 
-        return result.connection.query(query).fetchone()[0]
+        return result.connection.query(query, cache=True).fetchone()[0]
 
     def __bool__(self):
         """
@@ -1188,7 +1197,8 @@ class QueryExpression:
         """
         return bool(
             self.connection.query(
-                "SELECT EXISTS(SELECT 1 FROM {from_}{where})".format(from_=self.from_clause(), where=self.where_clause())
+                "SELECT EXISTS(SELECT 1 FROM {from_}{where})".format(from_=self.from_clause(), where=self.where_clause()),
+                cache=True,
             ).fetchone()[0]
         )
 
@@ -1244,7 +1254,7 @@ class QueryExpression:
         """
         sql = self.make_sql()
         logger.debug(sql)
-        return self.connection.query(sql, as_dict=as_dict)
+        return self.connection.query(sql, as_dict=as_dict, cache=True)
 
     def __repr__(self):
         """
@@ -1395,10 +1405,10 @@ class Aggregation(QueryExpression):
 
     def __len__(self):
         alias = self.connection.adapter.quote_identifier(f"${next(self._subquery_alias_count):x}")
-        return self.connection.query(f"SELECT count(1) FROM ({self.make_sql()}) {alias}").fetchone()[0]
+        return self.connection.query(f"SELECT count(1) FROM ({self.make_sql()}) {alias}", cache=True).fetchone()[0]
 
     def __bool__(self):
-        return bool(self.connection.query("SELECT EXISTS({sql})".format(sql=self.make_sql())).fetchone()[0])
+        return bool(self.connection.query("SELECT EXISTS({sql})".format(sql=self.make_sql()), cache=True).fetchone()[0])
 
 
 class Union(QueryExpression):
@@ -1455,10 +1465,10 @@ class Union(QueryExpression):
 
     def __len__(self):
         alias = self.connection.adapter.quote_identifier(f"${next(QueryExpression._subquery_alias_count):x}")
-        return self.connection.query(f"SELECT count(1) FROM ({self.make_sql()}) {alias}").fetchone()[0]
+        return self.connection.query(f"SELECT count(1) FROM ({self.make_sql()}) {alias}", cache=True).fetchone()[0]
 
     def __bool__(self):
-        return bool(self.connection.query("SELECT EXISTS({sql})".format(sql=self.make_sql())).fetchone()[0])
+        return bool(self.connection.query("SELECT EXISTS({sql})".format(sql=self.make_sql()), cache=True).fetchone()[0])
 
 
 class U:
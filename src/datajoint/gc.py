@@ -30,6 +30,11 @@ neither is threaded through each call (the config defaults to the schemas')::
     stats = collector.collect()              # read-only report (dry_run=True default)
     stats = collector.collect(dry_run=False) # actually delete the orphans
 
+With ``schema.enable_gc_journal()``, deletions record the paths their rows
+referenced in a hidden ``~gc_journal`` table, and
+``collector.collect(incremental=True)`` checks only those paths instead of
+scanning every reference and listing the whole store.
+
 Both sections embed the schema name in every path, so garbage collection is
 **per-schema**: each schema is scanned against its own subtree only. Orphan
 detection is therefore confined to the collector's schemas — any subset of the
@@ -43,12 +48,21 @@ datajoint.builtin_codecs : Codec implementations for object storage types.
 
 from __future__ import annotations
 
+import hashlib
+import itertools
+import json
 import logging
 import re
+import time
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from .errors import DataJointError
-from .hash_registry import delete_path, get_store_backend
+from .hash_registry import get_store_backend
+from .storage import DEFAULT_MAX_WORKERS
 
 if TYPE_CHECKING:
     from .schemas import _Schema as Schema
@@ -58,6 +72,11 @@ logger = logging.getLogger(__name__.split(".")[0])
 # Base32 content-hash filename: 26 lowercase alphanumeric chars.
 _BASE32_HASH = re.compile(r"^[a-z2-7]{26}$")
 
+# Rows per multi-row INSERT (into a temporary path table or the journal)
+_INSERT_BATCH = 1000
+# Values per IN (...) list when deleting from the journal
+_IN_LIST_BATCH = 1000
+
 
 def _is_covered(path: str, referenced: set[str]) -> bool:
     """
@@ -85,6 +104,121 @@ def _is_covered(path: str, referenced: set[str]) -> bool:
     return False
 
 
+# ---------------------------------------------------------------------- #
+# Deletion journal — candidates for incremental collection
+# ---------------------------------------------------------------------- #
+JOURNAL_TABLE = "~gc_journal"
+
+# Heading classifications journaled, by the kind recorded in the journal
+_JOURNAL_KINDS = {"hash": "hash_objects", "schema": "schema_objects"}
+
+
+def _journal_table(adapter, database: str) -> str:
+    return adapter.make_full_table_name(database, JOURNAL_TABLE)
+
+
+def ensure_journal_table(connection, database: str) -> None:
+    """
+    Create the ``~gc_journal`` table in the schema if it doesn't exist.
+
+    While the table exists, deletions from the schema's tables record the
+    storage paths their rows referenced (see :func:`record_deletions`), and
+    ``GarbageCollector.collect(incremental=True)`` checks only those paths.
+
+    Parameters
+    ----------
+    connection : Connection
+        A DataJoint connection object.
+    database : str
+        The schema/database name.
+    """
+    adapter = connection.adapter
+    columns = [
+        adapter.format_column_definition("kind", "VARCHAR(8)", nullable=False, comment="hash or schema"),
+        adapter.format_column_definition("path", "VARCHAR(1024)", nullable=False, comment="referenced store path"),
+        adapter.format_column_definition("store", "VARCHAR(64)", nullable=True, comment="store name (NULL: default)"),
+    ]
+    connection.query(
+        f"CREATE TABLE IF NOT EXISTS {_journal_table(adapter, database)} (\n"
+        + ",\n".join(columns)
+        + f"\n) {adapter.table_options_clause()}"
+    )
+
+
+def journal_table_exists(connection, database: str) -> bool:
+    """
+    Check if the ``~gc_journal`` table exists in the schema.
+
+    Parameters
+    ----------
+    connection : Connection
+        A DataJoint connection object.
+    database : str
+        The schema/database name.
+
+    Returns
+    -------
+    bool
+        True if the table exists, False otherwise.
+    """
+    try:
+        return connection.query(connection.adapter.get_table_info_sql(database, JOURNAL_TABLE)).fetchone() is not None
+    except Exception:
+        return False
+
+
+def record_deletions(table) -> int:
+    """
+    Record the storage paths referenced by the rows about to be deleted.
+
+    Writes one journal row per distinct referenced path of each hash- or
+    schema-addressed column of ``table`` (restricted as for the delete).
+    Call inside the transaction that deletes the rows so that the journal and
+    the delete commit or roll back together.
+
+    Parameters
+    ----------
+    table : Table
+        The restricted table whose rows are being deleted.
+
+    Returns
+    -------
+    int
+        Number of journal rows written.
+    """
+    conn = table.connection
+    adapter = conn.adapter
+    journal = _journal_table(adapter, table.database)
+    placeholder = adapter.parameter_placeholder
+    where = table.where_clause()
+    recorded = 0
+    for kind, heading_attr in _JOURNAL_KINDS.items():
+        for attr_name in getattr(table.heading, heading_attr):
+            exprs = GarbageCollector._reference_sql(table, attr_name)
+            if exprs is not None:
+                path_expr, store_expr = exprs
+                not_null = f"{' AND' if where else ' WHERE'} {path_expr} IS NOT NULL"
+                recorded += conn.query(
+                    f"INSERT INTO {journal} (kind, path, store) "
+                    f"SELECT DISTINCT '{kind}', {path_expr}, {store_expr} FROM {table.full_table_name}{where}{not_null}"
+                ).rowcount
+                continue
+            # Codec without SQL reference expressions: discover per row.
+            codec = table.heading.attributes[attr_name].codec
+            refs = sorted(
+                {ref for row in table.proj(attr_name).cursor(as_dict=True) for ref in codec.referenced_paths(row[attr_name])},
+                key=str,
+            )
+            for start in range(0, len(refs), _INSERT_BATCH):
+                batch = refs[start : start + _INSERT_BATCH]
+                values = ",".join([f"('{kind}', {placeholder}, {placeholder})"] * len(batch))
+                conn.query(
+                    f"INSERT INTO {journal} (kind, path, store) VALUES {values}", args=[v for ref in batch for v in ref]
+                )
+                recorded += len(batch)
+    return recorded
+
+
 class GarbageCollector:
     """
     Store-specific garbage collector — one store, a fixed set of schemas.
@@ -107,9 +241,13 @@ class GarbageCollector:
     config : Config, optional
         Config that defines the store. Defaults to the first schema's
         connection config (``schemas[0].connection._config``).
+    checkpoint_dir : str or Path, optional
+        Local directory for listing checkpoints. Each listed subtree is saved
+        there, so a scan interrupted by a crash resumes instead of restarting.
+        Checkpoints are cleared when a scan completes without errors.
     """
 
-    def __init__(self, *schemas: "Schema", store: str | None = None, config=None) -> None:
+    def __init__(self, *schemas: "Schema", store: str | None = None, config=None, checkpoint_dir=None) -> None:
         if not schemas:
             raise DataJointError("At least one schema must be provided")
         self.schemas = schemas
@@ -121,6 +259,11 @@ class GarbageCollector:
         spec = self.config.get_store_spec(store)
         self._hash_prefix = spec["hash_prefix"].strip("/")  # settings applies the "_hash" default
         self._schema_prefix = spec["schema_prefix"].strip("/")  # ... "_schema" default
+        # Concurrent listings (schemas, subtrees) — the store's max_workers setting
+        self._max_workers = spec.get("max_workers") or DEFAULT_MAX_WORKERS
+        self.checkpoint_dir = Path(checkpoint_dir) if checkpoint_dir is not None else None
+        if self.checkpoint_dir is not None:
+            self.checkpoint_dir.mkdir(parents=True, exist_ok=True)
         # Per-collect() scan errors (walk failures in list_*_paths). Non-empty
         # blocks destructive deletion in collect(dry_run=False). Reset at the
         # start of each collect() call.
@@ -158,30 +301,152 @@ class GarbageCollector:
         for schema in self.schemas:
             if verbose:
                 logger.info(f"Scanning schema {schema.database} for {heading_attr}")
-            for table_name in schema.list_tables():
+            for table, attr_name in self._reference_columns(schema, heading_attr):
+                if verbose:
+                    logger.info(f"  Scanning {table.table_name}.{attr_name}")
                 try:
-                    table = schema.get_table(table_name)
-                    # Classification lives on the heading — one source of truth.
-                    for attr_name in getattr(table.heading, heading_attr):
-                        attr = table.heading.attributes[attr_name]
-                        if verbose:
-                            logger.info(f"  Scanning {table_name}.{attr_name}")
-                        # Read raw JSON metadata via cursor — bypasses
-                        # decode_attribute, so we get the stored dict
-                        # (PostgreSQL/JSONB) or JSON string (MySQL). The codec's
-                        # referenced_paths() extracts paths and handles both
-                        # shapes (codec-driven discovery, #1469).
-                        try:
-                            for row in table.proj(attr_name).cursor(as_dict=True):
-                                for path, ref_store in attr.codec.referenced_paths(row[attr_name]):
-                                    if self.store is None or ref_store == self.store:
-                                        referenced.add(path)
-                        except Exception as e:
-                            logger.warning(f"Error scanning {table_name}.{attr_name}: {e}")
+                    for path, ref_store in self._column_references(table, attr_name):
+                        if self.store is None or ref_store == self.store:
+                            referenced.add(path)
                 except Exception as e:
-                    logger.warning(f"Error accessing table {table_name}: {e}")
+                    logger.warning(f"Error scanning {table.table_name}.{attr_name}: {e}")
         return referenced
 
+    def _reference_columns(self, schema: "Schema", heading_attr: str):
+        """Yield ``(table, attr_name)`` for every column of ``schema`` classified by ``heading_attr``."""
+        for table_name in schema.list_tables():
+            try:
+                table = schema.get_table(table_name)
+                # Classification lives on the heading — one source of truth.
+                columns = list(getattr(table.heading, heading_attr))
+            except Exception as e:
+                logger.warning(f"Error accessing table {table_name}: {e}")
+                continue
+            for attr_name in columns:
+                yield table, attr_name
+
+    @staticmethod
+    def _reference_sql(table, attr_name: str) -> tuple[str, str] | None:
+        """The codec's SQL ``(path_expr, store_expr)`` for a JSON column, or None."""
+        attr = table.heading.attributes[attr_name]
+        if not attr.json:
+            return None
+        return attr.codec.referenced_paths_sql(attr_name, table.connection.adapter)
+
+    def _column_references(self, table, attr_name: str):
+        """
+        Yield ``(path, store)`` pairs referenced by one column.
+
+        When the codec advertises SQL expressions for its references, only the
+        distinct ``(path, store)`` pairs are read, streamed through a
+        server-side cursor. Otherwise every row's raw metadata is read and
+        passed to the codec's ``referenced_paths()`` (codec-driven discovery,
+        #1469).
+        """
+        exprs = self._reference_sql(table, attr_name)
+        if exprs is None:
+            # Read raw JSON metadata via cursor — bypasses decode_attribute, so
+            # we get the stored dict (PostgreSQL/JSONB) or JSON string (MySQL).
+            codec = table.heading.attributes[attr_name].codec
+            for row in table.proj(attr_name).cursor(as_dict=True):
+                yield from codec.referenced_paths(row[attr_name])
+            return
+        path_expr, store_expr = exprs
+        cursor = table.connection.query(
+            f"SELECT DISTINCT {path_expr}, {store_expr} FROM {table.full_table_name} WHERE {path_expr} IS NOT NULL",
+            stream=True,
+        )
+        try:
+            for path, ref_store in cursor:
+                yield path, ref_store
+        finally:
+            cursor.close()
+
+    def hash_orphans_in_database(self, schema: "Schema", stored_paths: Iterable[str]) -> tuple[list[str], int]:
+        """
+        Compute one schema's orphaned hash paths with an anti-join on the server.
+
+        The store listing is loaded into a temporary table, the schema's
+        hash-object references are copied into a second one with
+        ``INSERT ... SELECT``, and the orphans are returned by a ``LEFT JOIN``.
+        Reference metadata never leaves the database; only the listing goes up
+        and the orphans come back. Columns whose codec has no SQL reference
+        expression are read per row and uploaded instead.
+
+        Parameters
+        ----------
+        schema : Schema
+            One of this collector's schemas; its connection runs the queries.
+        stored_paths : iterable of str
+            Stored hash paths of that schema (as from :meth:`list_hash_paths`).
+
+        Returns
+        -------
+        tuple[list[str], int]
+            Sorted orphaned paths and the number of distinct referenced paths.
+        """
+        conn = schema.connection
+        placeholder = conn.adapter.parameter_placeholder
+        with self._path_tables(schema, "stored", "referenced") as (stored_table, referenced_table):
+            self._upload_paths(conn, stored_table, stored_paths)
+            for table, attr_name in self._reference_columns(schema, "hash_objects"):
+                exprs = self._reference_sql(table, attr_name)
+                if exprs is None:
+                    self._upload_paths(
+                        conn,
+                        referenced_table,
+                        (
+                            path
+                            for path, ref_store in self._column_references(table, attr_name)
+                            if self.store is None or ref_store == self.store
+                        ),
+                    )
+                    continue
+                path_expr, store_expr = exprs
+                store_filter, args = ("", ()) if self.store is None else (f" AND {store_expr} = {placeholder}", (self.store,))
+                conn.query(
+                    f"INSERT INTO {referenced_table} (path) SELECT DISTINCT {path_expr} "
+                    f"FROM {table.full_table_name} WHERE {path_expr} IS NOT NULL{store_filter}",
+                    args=args,
+                )
+            referenced = conn.query(f"SELECT COUNT(DISTINCT path) FROM {referenced_table}").fetchone()[0]
+            orphans = conn.query(
+                f"SELECT s.path FROM {stored_table} s LEFT JOIN {referenced_table} r ON r.path = s.path WHERE r.path IS NULL"
+            ).fetchall()
+        return sorted(row[0] for row in orphans), referenced
+
+    @staticmethod
+    @contextmanager
+    def _path_tables(schema: "Schema", *labels: str) -> Iterator[list[str]]:
+        """Create one temporary ``(path)`` table per label on the schema's connection; drop them on exit."""
+        import secrets
+
+        conn = schema.connection
+        token = secrets.token_hex(4)
+        created: list[str] = []
+        try:
+            for label in labels:
+                table_name = conn.adapter.temporary_table_name(schema.database, f"_dj_gc_{label}_{token}")
+                conn.query(f"CREATE TEMPORARY TABLE {table_name} (path varchar(1024) NOT NULL)")
+                created.append(table_name)
+            yield created
+        finally:
+            for table_name in created:
+                conn.query(f"DROP TABLE {table_name}")
+
+    @staticmethod
+    def _upload_paths(conn, table_name: str, paths: Iterable[str]) -> None:
+        """Insert ``paths`` into a temporary path table in multi-row INSERTs."""
+        placeholder = conn.adapter.parameter_placeholder
+        batch: list[str] = []
+        for path in itertools.chain(paths, [None]):
+            if path is not None:
+                batch.append(path)
+            if batch and (path is None or len(batch) == _INSERT_BATCH):
+                values = ",".join([f"({placeholder})"] * len(batch))
+                conn.query(f"INSERT INTO {table_name} (path) VALUES {values}", args=batch)
+                batch = []
+
     # ------------------------------------------------------------------ #
     # Stored listings — walk this store, one schema's subtree
     # ------------------------------------------------------------------ #
@@ -198,29 +463,13 @@ class GarbageCollector:
         Returns a dict mapping each object's full relative store path to size.
         """
         hp = self._hash_prefix
-        section = f"{hp}/{schema_name}/" if hp else f"{schema_name}/"
-        full_root = self.backend._full_path("")
-        stored: dict[str, int] = {}
-        try:
-            for root, _dirs, files in self.backend.fs.walk(self.backend._full_path(section)):
-                for filename in files:
-                    if filename.endswith(".manifest.json"):
-                        continue  # folder-object sidecar, not a hash file
-                    if not _BASE32_HASH.match(filename):
-                        continue
-                    file_path = f"{root}/{filename}"
-                    relative_path = file_path[len(full_root) :].lstrip("/")
-                    try:
-                        stored[relative_path] = self.backend.fs.size(file_path)
-                    except Exception as e:
-                        logger.warning(f"Could not size {file_path}: {e}")
-                        stored[relative_path] = 0
-        except FileNotFoundError:
-            pass  # the hash section does not exist yet
-        except Exception as e:
-            logger.warning(f"Error listing stored hashes: {e}")
-            self._scan_errors.append(f"list_hash_paths({schema_name}): {e}")
-        return stored
+        section = f"{hp}/{schema_name}" if hp else schema_name
+
+        def is_hash_file(filename: str) -> bool:
+            # skip folder-object sidecars and anything that is not a hash file
+            return not filename.endswith(".manifest.json") and bool(_BASE32_HASH.match(filename))
+
+        return self._list_section(section, f"list_hash_paths({schema_name})", is_hash_file)
 
     def list_schema_paths(self, schema_name: str) -> dict[str, int]:
         """
@@ -249,28 +498,105 @@ class GarbageCollector:
         """
         sp = self._schema_prefix
         rel = f"{sp}/{schema_name}" if sp else schema_name
+        # Manifest sidecars are INCLUDED: owned by their object and reclaimed
+        # with it. _is_covered() keeps a live object's manifest out of the
+        # orphan set.
+        return self._list_section(rel, f"list_schema_paths({schema_name})", lambda filename: True)
+
+    def _list_section(self, rel: str, label: str, keep: Callable[[str], bool]) -> dict[str, int]:
+        """
+        List the files under one section of the store with their sizes.
+
+        Sizes come from the listing itself (``find(detail=True)``), never from
+        a request per file. The section's immediate subdirectories (tables,
+        subfolds) are listed concurrently; with ``checkpoint_dir`` set, each
+        finished subtree is saved so an interrupted scan resumes where it
+        stopped. Failures are recorded in ``_scan_errors`` under ``label``.
+        """
+        fs = self.backend.fs
         full_root = self.backend._full_path("")
         stored: dict[str, int] = {}
+
+        def add(file_path: str, size: int | None) -> None:
+            if keep(file_path.rsplit("/", 1)[-1]):
+                stored[file_path[len(full_root) :].lstrip("/")] = size or 0
+
         try:
-            for root, _dirs, files in self.backend.fs.walk(self.backend._full_path(rel)):
-                for filename in files:
-                    # Manifest sidecars are INCLUDED: owned by their object and
-                    # reclaimed with it. _is_covered() keeps a live object's
-                    # manifest out of the orphan set.
-                    file_path = f"{root}/{filename}"
-                    relative_path = file_path[len(full_root) :].lstrip("/")
-                    try:
-                        stored[relative_path] = self.backend.fs.size(file_path)
-                    except Exception as e:
-                        logger.warning(f"Could not size {file_path}: {e}")
-                        stored[relative_path] = 0
+            entries = fs.ls(self.backend._full_path(rel), detail=True)
         except FileNotFoundError:
-            pass  # this schema's section does not exist yet
+            return stored  # this section does not exist yet
         except Exception as e:
-            logger.warning(f"Error listing stored schemas: {e}")
-            self._scan_errors.append(f"list_schema_paths({schema_name}): {e}")
+            logger.warning(f"Error listing {rel}: {e}")
+            self._scan_errors.append(f"{label}: {e}")
+            return stored
+
+        subtrees = []
+        for entry in entries:
+            if entry.get("type") == "directory":
+                subtrees.append(entry["name"].rstrip("/"))
+            else:
+                add(entry["name"], entry.get("size"))
+
+        def list_subtree(subtree: str) -> dict[str, int | None]:
+            cached = self._load_checkpoint(subtree)
+            if cached is not None:
+                return cached
+            files = {path: info.get("size") for path, info in fs.find(subtree, detail=True).items()}
+            self._save_checkpoint(subtree, files)
+            return files
+
+        with ThreadPoolExecutor(max_workers=self._max_workers) as pool:
+            futures = {pool.submit(list_subtree, subtree): subtree for subtree in subtrees}
+            for future in as_completed(futures):
+                try:
+                    files = future.result()
+                except Exception as e:
+                    logger.warning(f"Error listing {futures[future]}: {e}")
+                    self._scan_errors.append(f"{label}: {e}")
+                    continue
+                for file_path, size in files.items():
+                    add(file_path, size)
         return stored
 
+    # ------------------------------------------------------------------ #
+    # Listing checkpoints — resume an interrupted scan
+    # ------------------------------------------------------------------ #
+    def _checkpoint_file(self, subtree: str) -> Path | None:
+        if self.checkpoint_dir is None:
+            return None
+        digest = hashlib.md5(f"{self.backend.protocol}:{subtree}".encode()).hexdigest()
+        return self.checkpoint_dir / f"gc-listing-{digest}.json"
+
+    def _load_checkpoint(self, subtree: str) -> dict[str, int | None] | None:
+        checkpoint = self._checkpoint_file(subtree)
+        if checkpoint is None or not checkpoint.exists():
+            return None
+        logger.debug(f"Resuming listing of {subtree} from {checkpoint}")
+        return json.loads(checkpoint.read_text())["files"]
+
+    def _save_checkpoint(self, subtree: str, files: dict[str, int | None]) -> None:
+        checkpoint = self._checkpoint_file(subtree)
+        if checkpoint is None:
+            return
+        temp = checkpoint.with_suffix(".saving")
+        temp.write_text(json.dumps({"subtree": subtree, "files": files}))
+        temp.replace(checkpoint)
+
+    def clear_checkpoints(self) -> int:
+        """
+        Remove saved listing checkpoints so the next scan lists the store afresh.
+
+        Called by :meth:`collect` after a scan completes without errors.
+        Returns the number of checkpoint files removed.
+        """
+        if self.checkpoint_dir is None:
+            return 0
+        removed = 0
+        for checkpoint in self.checkpoint_dir.glob("gc-listing-*.json"):
+            checkpoint.unlink(missing_ok=True)
+            removed += 1
+        return removed
+
     # ------------------------------------------------------------------ #
     # Deletion
     # ------------------------------------------------------------------ #
@@ -289,26 +615,52 @@ class GarbageCollector:
             if self.backend.fs.exists(full_path):
                 self.backend.fs.rm(full_path)
                 logger.debug(f"Deleted schema object: {path}")
-                # Best-effort: prune now-empty parent directories to store root.
-                root = self.backend._full_path("").rstrip("/")
-                parent = full_path.rsplit("/", 1)[0]
-                while parent and parent != root and parent.startswith(root):
-                    try:
-                        if self.backend.fs.ls(parent):
-                            break  # not empty
-                        self.backend.fs.rmdir(parent)
-                    except Exception:
-                        break
-                    parent = parent.rsplit("/", 1)[0]
+                self._prune_empty_dirs([path])
                 return True
         except Exception as e:
             logger.warning(f"Error deleting schema object {path}: {e}")
         return False
 
+    def _prune_empty_dirs(self, paths: Iterable[str]) -> int:
+        """
+        Best-effort removal of directories left empty by deleting ``paths``.
+
+        Every ancestor directory of the deleted paths (up to, never including,
+        the store root) is checked once, deepest first. A non-empty directory
+        keeps all of its ancestors. Returns the number of directories removed.
+        """
+        root = self.backend._full_path("").rstrip("/")
+        candidates: set[str] = set()
+        for path in paths:
+            parent = self.backend._full_path(path).rsplit("/", 1)[0]
+            while parent and parent != root and parent.startswith(root) and parent not in candidates:
+                candidates.add(parent)
+                parent = parent.rsplit("/", 1)[0]
+
+        removed = 0
+        kept: set[str] = set()
+        for directory in sorted(candidates, key=lambda d: d.count("/"), reverse=True):
+            if directory not in kept:
+                try:
+                    if not self.backend.fs.ls(directory):
+                        self.backend.fs.rmdir(directory)
+                        removed += 1
+                        continue
+                except Exception:
+                    pass  # treat as not empty
+            kept.add(directory.rsplit("/", 1)[0])
+        return removed
+
     # ------------------------------------------------------------------ #
     # Orchestration
     # ------------------------------------------------------------------ #
-    def collect(self, dry_run: bool = True, verbose: bool = False) -> dict[str, Any]:
+    def collect(
+        self,
+        dry_run: bool = True,
+        verbose: bool = False,
+        in_database: bool = False,
+        incremental: bool = False,
+    ) -> dict[str, Any]:
         """
         Report — and, unless ``dry_run``, remove — orphaned storage.
 
@@ -324,6 +676,24 @@ class GarbageCollector:
         readable via their metadata paths but are not reclamation candidates
         until the setting is restored.
 
+        With ``in_database=True``, hash-addressed orphans are computed on the
+        database server by :meth:`hash_orphans_in_database` (an anti-join
+        against the loaded store listing) instead of collecting every
+        referenced path in Python.
+
+        Deletion is bulk: orphans are removed in batches of multi-path deletes
+        (:meth:`StorageBackend.remove_many`) spread over the store's
+        ``max_workers``, and directories left empty are pruned once at the end.
+        With ``verbose``, a progress bar tracks the deletion; the elapsed time
+        and rate are logged either way.
+
+        With ``incremental=True``, neither the references nor the store are
+        scanned: only the paths recorded in each schema's deletion journal
+        (see :meth:`Schema.enable_gc_journal`) are checked, so the cost is
+        proportional to what was deleted since the last run. Processed journal
+        entries are cleared unless ``dry_run``. Paths deleted before the
+        journal was enabled still need a full collection.
+
         Returns a dict with per-section stats and the deletion outcome:
 
         - hash_paths_referenced / hash_paths_stored / hash_paths_orphaned / hash_paths_orphaned_bytes
@@ -333,65 +703,64 @@ class GarbageCollector:
           / schema_paths_orphaned_bytes
         - orphaned_schema_paths: orphaned schema files as full relative store paths
         - hash_paths_deleted / schema_paths_deleted / deleted / bytes_freed (0 when
-          dry_run) / errors / dry_run
+          dry_run) / errors / delete_seconds / dry_run / incremental
+
+        An incremental run reports ``candidates`` / ``candidates_referenced``
+        (journaled paths, and those still referenced) in place of the
+        ``*_referenced`` and ``*_stored`` counts.
         """
         self._scan_errors = []  # reset per-call; populated by list_*_paths below
+        if incremental:
+            return self._collect_incremental(dry_run=dry_run, verbose=verbose)
         # References can be gathered across all schemas at once: because paths
         # embed the schema, a file under schema X is only ever covered by an X
         # reference, so combined coverage equals per-schema coverage.
-        hash_paths_referenced = self.hash_references(verbose=verbose)
         schema_paths_referenced = self.schema_references(verbose=verbose)
 
         hash_paths_stored: dict[str, int] = {}
         schema_paths_stored: dict[str, int] = {}
-        for schema in self.schemas:
-            hash_paths_stored.update(self.list_hash_paths(schema.database))
-            schema_paths_stored.update(self.list_schema_paths(schema.database))
-
-        orphaned_hash_paths = sorted(set(hash_paths_stored.keys()) - hash_paths_referenced)
+        orphaned_hash_paths: list[str] = []
+        hash_paths_referenced_count = 0
+        # List every schema's sections concurrently (each listing also fans out
+        # over its subtrees).
+        with ThreadPoolExecutor(max_workers=self._max_workers) as pool:
+            hash_listings = list(pool.map(lambda schema: self.list_hash_paths(schema.database), self.schemas))
+            schema_listings = list(pool.map(lambda schema: self.list_schema_paths(schema.database), self.schemas))
+        for schema, schema_hash_paths, schema_schema_paths in zip(self.schemas, hash_listings, schema_listings):
+            hash_paths_stored.update(schema_hash_paths)
+            schema_paths_stored.update(schema_schema_paths)
+            if in_database:
+                if verbose:
+                    logger.info(f"Computing orphaned hash paths of {schema.database} in the database")
+                orphans, referenced = self.hash_orphans_in_database(schema, schema_hash_paths)
+                orphaned_hash_paths.extend(orphans)
+                hash_paths_referenced_count += referenced
+
+        if not in_database:
+            hash_paths_referenced = self.hash_references(verbose=verbose)
+            hash_paths_referenced_count = len(hash_paths_referenced)
+            orphaned_hash_paths = sorted(set(hash_paths_stored.keys()) - hash_paths_referenced)
         # Coverage, not exact set difference: a referenced path may be a
         # directory-valued object (many files + a manifest sidecar).
         orphaned_schema_paths = sorted(p for p in schema_paths_stored if not _is_covered(p, schema_paths_referenced))
-
-        hash_paths_deleted = 0
-        schema_paths_deleted = 0
-        bytes_freed = 0
-        errors = 0
-
-        if not dry_run:
-            if self._scan_errors:
-                raise DataJointError(
-                    f"Refusing to delete: {len(self._scan_errors)} scan error(s) — "
-                    f"partial listing risks classifying live files as orphaned. "
-                    f"Errors: {self._scan_errors}"
-                )
-            # The size maps from the scan above are reused for the byte tally —
-            # no second listing pass.
-            for path in orphaned_hash_paths:
-                try:
-                    if delete_path(path, self.store, config=self.config):
-                        hash_paths_deleted += 1
-                        bytes_freed += hash_paths_stored.get(path, 0)
-                        if verbose:
-                            logger.info(f"Deleted: {path} ({hash_paths_stored.get(path, 0)} bytes)")
-                except Exception as e:
-                    errors += 1
-                    logger.warning(f"Failed to delete {path}: {e}")
-
-            for path in orphaned_schema_paths:
-                try:
-                    if self.delete_schema_path(path):
-                        schema_paths_deleted += 1
-                        bytes_freed += schema_paths_stored.get(path, 0)
-                        if verbose:
-                            logger.info(f"Deleted schema path: {path} ({schema_paths_stored.get(path, 0)} bytes)")
-                except Exception as e:
-                    errors += 1
-                    logger.warning(f"Failed to delete schema path {path}: {e}")
+        if not self._scan_errors:
+            self.clear_checkpoints()  # the scan is complete; the next one lists afresh
+
+        if not dry_run and self._scan_errors:
+            raise DataJointError(
+                f"Refusing to delete: {len(self._scan_errors)} scan error(s) — "
+                f"partial listing risks classifying live files as orphaned. "
+                f"Errors: {self._scan_errors}"
+            )
+        # The size maps from the scan above are reused for the byte tally —
+        # no second listing pass.
+        outcome = self._delete_orphans(
+            orphaned_hash_paths, orphaned_schema_paths, {**hash_paths_stored, **schema_paths_stored}, dry_run, verbose
+        )
 
         return {
             # Hash-addressed storage stats
-            "hash_paths_referenced": len(hash_paths_referenced),
+            "hash_paths_referenced": hash_paths_referenced_count,
             "hash_paths_stored": len(hash_paths_stored),
             "hash_paths_orphaned": len(orphaned_hash_paths),
             "hash_paths_orphaned_bytes": sum(hash_paths_stored.get(h, 0) for h in orphaned_hash_paths),
@@ -403,11 +772,218 @@ class GarbageCollector:
             "schema_paths_orphaned_bytes": sum(schema_paths_stored.get(p, 0) for p in orphaned_schema_paths),
             "orphaned_schema_paths": orphaned_schema_paths,
             # Deletion outcome (all zero when dry_run)
-            "hash_paths_deleted": hash_paths_deleted,
-            "schema_paths_deleted": schema_paths_deleted,
-            "deleted": hash_paths_deleted + schema_paths_deleted,
-            "bytes_freed": bytes_freed,
-            "errors": errors,
+            **{k: v for k, v in outcome.items() if k != "failed"},
             "scan_errors": list(self._scan_errors),
             "dry_run": dry_run,
+            "incremental": False,
+        }
+
+    def _delete_orphans(
+        self,
+        hash_paths: list[str],
+        schema_paths: list[str],
+        sizes: dict[str, int],
+        dry_run: bool,
+        verbose: bool,
+    ) -> dict[str, Any]:
+        """
+        Remove orphaned paths in bulk and return the deletion outcome.
+
+        Both sections go through :meth:`StorageBackend.remove_many` (batched
+        multi-path deletes over the store's ``max_workers``), then directories
+        left empty by the schema section are pruned once. Nothing is removed
+        when ``dry_run``. The outcome's ``failed`` entry holds the paths that
+        could not be removed.
+        """
+        outcome: dict[str, Any] = {
+            "hash_paths_deleted": 0,
+            "schema_paths_deleted": 0,
+            "deleted": 0,
+            "bytes_freed": 0,
+            "errors": 0,
+            "delete_seconds": 0.0,
+            "failed": {},
         }
+        if dry_run:
+            return outcome
+
+        from tqdm import tqdm
+
+        start = time.monotonic()
+        progress = tqdm(desc="Deleting orphans", unit="file", total=len(hash_paths) + len(schema_paths), disable=not verbose)
+        try:
+            missing: set[str] = set()  # removed by someone else since the listing
+            failed = self.backend.remove_many(
+                hash_paths, max_workers=self._max_workers, callback=progress.update, missing=missing
+            )
+            failed_schema = self.backend.remove_many(
+                schema_paths, max_workers=self._max_workers, callback=progress.update, missing=missing
+            )
+        finally:
+            progress.close()
+        failed.update(failed_schema)
+        for path, e in failed.items():
+            logger.warning(f"Failed to delete {path}: {e}")
+        deleted_hash_paths = [p for p in hash_paths if p not in failed and p not in missing]
+        deleted_schema_paths = [p for p in schema_paths if p not in failed and p not in missing]
+        self._prune_empty_dirs(deleted_schema_paths + [p for p in schema_paths if p in missing])
+
+        deleted = len(deleted_hash_paths) + len(deleted_schema_paths)
+        outcome.update(
+            hash_paths_deleted=len(deleted_hash_paths),
+            schema_paths_deleted=len(deleted_schema_paths),
+            deleted=deleted,
+            bytes_freed=sum(sizes.get(p, 0) for p in itertools.chain(deleted_hash_paths, deleted_schema_paths)),
+            errors=len(failed),
+            delete_seconds=time.monotonic() - start,
+            failed=failed,
+        )
+        logger.info(
+            f"Deleted {deleted} orphaned paths ({outcome['bytes_freed']} bytes) in {outcome['delete_seconds']:.1f}s "
+            f"({deleted / max(outcome['delete_seconds'], 1e-9):.0f} paths/s, {len(failed)} errors)"
+        )
+        return outcome
+
+    # ------------------------------------------------------------------ #
+    # Incremental collection — driven by the deletion journal
+    # ------------------------------------------------------------------ #
+    def _collect_incremental(self, dry_run: bool, verbose: bool) -> dict[str, Any]:
+        """Collect only the journaled candidates of each schema; see :meth:`collect`."""
+        journals = {}
+        for schema in self.schemas:
+            if not journal_table_exists(schema.connection, schema.database):
+                raise DataJointError(
+                    f"Schema `{schema.database}` has no deletion journal. Enable it with "
+                    f"schema.enable_gc_journal() and run a full collect() once."
+                )
+            journals[schema.database] = self._journal_candidates(schema)
+
+        orphans: dict[str, dict[str, list[str]]] = {"hash": {}, "schema": {}}  # kind -> candidate -> files
+        sizes: dict[str, int] = {}
+        candidates = referenced = 0
+        for schema in self.schemas:
+            for kind, paths in journals[schema.database].items():
+                candidates += len(paths)
+                live = self._referenced_among(schema, _JOURNAL_KINDS[kind], paths)
+                referenced += len(live)
+                for path in sorted(paths - live):
+                    files = self._stored_files(path, kind)
+                    if files is not None:
+                        sizes.update(files)
+                        orphans[kind][path] = sorted(files)
+                if verbose:
+                    logger.info(f"{schema.database}: {len(paths)} {kind} candidates, {len(live)} still referenced")
+
+        if not dry_run and self._scan_errors:
+            raise DataJointError(
+                f"Refusing to delete: {len(self._scan_errors)} scan error(s) — "
+                f"partial listing risks leaving the journal inconsistent. Errors: {self._scan_errors}"
+            )
+        orphaned_hash_paths = sorted(itertools.chain.from_iterable(orphans["hash"].values()))
+        orphaned_schema_paths = sorted(itertools.chain.from_iterable(orphans["schema"].values()))
+        outcome = self._delete_orphans(orphaned_hash_paths, orphaned_schema_paths, sizes, dry_run, verbose)
+
+        if not dry_run:
+            # Clear every processed candidate except those with a file left behind.
+            failed = outcome["failed"]
+            for schema in self.schemas:
+                done = {
+                    path
+                    for kind, paths in journals[schema.database].items()
+                    for path in paths
+                    if not any(f in failed for f in orphans[kind].get(path, ()))
+                }
+                self._clear_journal(schema, done)
+
+        return {
+            "candidates": candidates,
+            "candidates_referenced": referenced,
+            "hash_paths_orphaned": len(orphaned_hash_paths),
+            "hash_paths_orphaned_bytes": sum(sizes.get(p, 0) for p in orphaned_hash_paths),
+            "orphaned_hash_paths": orphaned_hash_paths,
+            "schema_paths_orphaned": len(orphaned_schema_paths),
+            "schema_paths_orphaned_bytes": sum(sizes.get(p, 0) for p in orphaned_schema_paths),
+            "orphaned_schema_paths": orphaned_schema_paths,
+            **{k: v for k, v in outcome.items() if k != "failed"},
+            "scan_errors": list(self._scan_errors),
+            "dry_run": dry_run,
+            "incremental": True,
+        }
+
+    def _journal_candidates(self, schema: "Schema") -> dict[str, set[str]]:
+        """Distinct journaled paths of this collector's store, by kind."""
+        conn = schema.connection
+        placeholder = conn.adapter.parameter_placeholder
+        store_filter, args = ("", ()) if self.store is None else (f" WHERE store = {placeholder}", (self.store,))
+        rows = conn.query(
+            f"SELECT DISTINCT kind, path FROM {_journal_table(conn.adapter, schema.database)}{store_filter}", args=args
+        ).fetchall()
+        candidates: dict[str, set[str]] = {kind: set() for kind in _JOURNAL_KINDS}
+        for kind, path in rows:
+            if kind in candidates:
+                candidates[kind].add(path)
+        return candidates
+
+    def _referenced_among(self, schema: "Schema", heading_attr: str, paths: set[str]) -> set[str]:
+        """
+        The subset of ``paths`` still referenced by a live row of ``schema``.
+
+        The candidates are loaded into a temporary table and semi-joined with
+        each referencing table, so every table is scanned once however many
+        candidates there are.
+        """
+        if not paths:
+            return set()
+        live: set[str] = set()
+        conn = schema.connection
+        with self._path_tables(schema, "candidates") as (candidates,):
+            self._upload_paths(conn, candidates, sorted(paths))
+            for table, attr_name in self._reference_columns(schema, heading_attr):
+                exprs = self._reference_sql(table, attr_name)
+                if exprs is None:
+                    live.update(path for path, _store in self._column_references(table, attr_name) if path in paths)
+                    continue
+                path_expr, _store_expr = exprs
+                cursor = conn.query(
+                    f"SELECT DISTINCT {path_expr} FROM {table.full_table_name} "
+                    f"WHERE {path_expr} IN (SELECT path FROM {candidates})"
+                )
+                live.update(row[0] for row in cursor)
+        return live
+
+    def _stored_files(self, path: str, kind: str) -> dict[str, int] | None:
+        """
+        The stored files of one candidate object, with sizes.
+
+        A hash-addressed path is a single file. A schema-addressed path may be
+        a file or a directory-valued object, plus its ``.manifest.json``
+        sidecar. Returns None (and records a scan error) if listing fails.
+        """
+        fs = self.backend.fs
+        full_root = self.backend._full_path("")
+        full_path = self.backend._full_path(path)
+        try:
+            found = fs.find(full_path, detail=True)
+            if kind == "schema":
+                manifest = f"{full_path}.manifest.json"
+                if fs.exists(manifest):
+                    found[manifest] = fs.info(manifest)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.warning(f"Error listing {path}: {e}")
+            self._scan_errors.append(f"journal({path}): {e}")
+            return None
+        return {name[len(full_root) :].lstrip("/"): info.get("size") or 0 for name, info in found.items()}
+
+    def _clear_journal(self, schema: "Schema", paths: set[str]) -> None:
+        """Remove processed candidates of this store from the schema's deletion journal."""
+        conn = schema.connection
+        journal = _journal_table(conn.adapter, schema.database)
+        placeholder = conn.adapter.parameter_placeholder
+        store_filter, store_args = ("", []) if self.store is None else (f" AND store = {placeholder}", [self.store])
+        ordered = sorted(paths)
+        for start in range(0, len(ordered), _IN_LIST_BATCH):
+            batch = ordered[start : start + _IN_LIST_BATCH]
+            in_list = ",".join([placeholder] * len(batch))
+            conn.query(f"DELETE FROM {journal} WHERE path IN ({in_list}){store_filter}", args=batch + store_args)
@@ -2,7 +2,8 @@
 Hash-addressed storage registry for DataJoint.
 
 This module provides hash-addressed storage with deduplication for the ``<hash>``
-codec. Content is identified by a Base32-encoded MD5 hash and stored with
+codec. Content is identified by a Base32-encoded 128-bit digest (MD5 by
+default; configurable per store with ``hash_algorithm``) and stored with
 per-schema isolation::
 
     {hash_prefix}/{schema}/{hash}          (hash_prefix defaults to _hash)
@@ -37,10 +38,15 @@ from __future__ import annotations
 import base64
 import hashlib
 import logging
-from typing import TYPE_CHECKING, Any
+import os
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any, Protocol
 
 from .errors import DataJointError
-from .storage import StorageBackend
+from .storage import DEFAULT_MAX_WORKERS, StorageBackend
 
 if TYPE_CHECKING:
     from .settings import Config
@@ -48,23 +54,310 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__.split(".")[0])
 
 
-def compute_hash(data: bytes) -> str:
+# Read size when streaming local files into a hash or an upload
+STREAM_CHUNK_SIZE = 8 * 2**20
+
+# Pending bytes a HashBatch holds before storing them early
+HASH_BATCH_BYTES = 256 * 2**20
+
+# Algorithm for stores without ``hash_algorithm`` and for metadata without ``algorithm``
+DEFAULT_HASH_ALGORITHM = "md5"
+
+# Leaf size of the blake2b-tree hash
+TREE_LEAF_SIZE = 4 * 2**20
+
+
+class ContentStream:
     """
-    Compute Base32-encoded MD5 hash of content.
+    Re-iterable content assembled from byte strings and local files.
+
+    Lets codecs hand large payloads to hash-addressed storage without reading
+    them into memory: the content is iterated once to compute the hash and once
+    more to upload it, reading files in chunks each time. Hashes computed while
+    the content was produced can be passed in to skip the hashing pass.
 
     Parameters
     ----------
-    data : bytes
-        Content bytes.
+    *parts : bytes or str or Path or binary file object
+        Content parts in order. Byte strings are used as-is; paths and open
+        (seekable) binary files are read in chunks of ``chunk_size`` bytes.
+    chunk_size : int, optional
+        Read size for file parts. Default 8 MiB.
+    hashes : dict[str, str], optional
+        Precomputed content hashes keyed by algorithm (see :class:`HashingWriter`).
+    temporary : bool, optional
+        If True, the file object parts are temporary files owned by the stream:
+        :func:`put_hash` and :func:`put_hashes` close them once the content is
+        stored. Default False.
+
+    Examples
+    --------
+    >>> stream = ContentStream(b"header\\0", "/data/recording.bin")
+    >>> stream.size  # from stat, no file content is read
+    1048582
+    """
+
+    def __init__(
+        self,
+        *parts: bytes | str | Path | IO[bytes],
+        chunk_size: int = STREAM_CHUNK_SIZE,
+        hashes: dict[str, str] | None = None,
+        temporary: bool = False,
+    ) -> None:
+        # paths given as str are normalized, so each part is bytes, a Path, or an open file
+        self.parts: list[bytes | Path | IO[bytes]] = [Path(p) if isinstance(p, str) else p for p in parts]
+        self.chunk_size = chunk_size
+        self.hashes = dict(hashes or {})
+        self.temporary = temporary
+
+    @property
+    def size(self) -> int:
+        """Total content size in bytes (file sizes from ``stat`` or seeking to the end)."""
+        size = 0
+        for part in self.parts:
+            if isinstance(part, bytes):
+                size += len(part)
+            elif isinstance(part, Path):
+                size += part.stat().st_size
+            else:
+                size += part.seek(0, os.SEEK_END)
+        return size
+
+    def __iter__(self) -> Iterator[bytes]:
+        for part in self.parts:
+            if isinstance(part, bytes):
+                if part:
+                    yield part
+            elif isinstance(part, Path):
+                with open(part, "rb") as f:
+                    while chunk := f.read(self.chunk_size):
+                        yield chunk
+            else:
+                part.seek(0)
+                while chunk := part.read(self.chunk_size):
+                    yield chunk
+
+    def close(self) -> None:
+        """Close the file object parts."""
+        for part in self.parts:
+            if not isinstance(part, (bytes, Path)):
+                part.close()
+
+
+def _close_temporary(data: bytes | ContentStream) -> None:
+    if isinstance(data, ContentStream) and data.temporary:
+        data.close()
+
+
+class HashingWriter:
+    """
+    Binary file wrapper that hashes the content written through it.
+
+    Lets a producer write a large payload to a (temporary) file and obtain its
+    content hash in the same pass, for a :class:`ContentStream` with ``hashes``.
+
+    Parameters
+    ----------
+    fileobj : binary file object
+        Destination file, written from the start.
+    algorithm : str, optional
+        Registered hash algorithm. Default ``"md5"``.
+    """
+
+    def __init__(self, fileobj: IO[bytes], algorithm: str = DEFAULT_HASH_ALGORITHM) -> None:
+        self.fileobj = fileobj
+        self.algorithm = algorithm
+        self._hasher = new_hasher(algorithm)
+
+    def write(self, data: bytes | bytearray | memoryview) -> int:
+        self._hasher.update(data)
+        return self.fileobj.write(data)
+
+    def tell(self) -> int:
+        return self.fileobj.tell()
+
+    def seekable(self) -> bool:
+        return self.fileobj.seekable()
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        """Rewind to the start (discarding the hash state); other positions are not supported."""
+        if (offset, whence) != (0, os.SEEK_SET):
+            raise DataJointError("HashingWriter can only seek back to the start")
+        self._hasher = new_hasher(self.algorithm)
+        return self.fileobj.seek(0)
+
+    def truncate(self, size: int | None = None) -> int:
+        return self.fileobj.truncate(size)
+
+    @property
+    def content_hash(self) -> str:
+        """Base32-encoded hash of the content written so far."""
+        return _encode_digest(self._hasher.digest())
+
+
+class Hasher(Protocol):
+    """Incremental hash object (the ``hashlib`` interface used here)."""
+
+    def update(self, data: bytes | bytearray | memoryview, /) -> None: ...
+
+    def digest(self) -> bytes: ...
+
+
+def _hash_leaf(leaf: bytes, index: int, leaf_size: int) -> bytes:
+    return hashlib.blake2b(
+        leaf, digest_size=32, fanout=0, depth=2, leaf_size=leaf_size, node_offset=index, node_depth=0, inner_size=32
+    ).digest()
+
+
+class TreeHasher:
+    """
+    Parallel tree hash: BLAKE2b over fixed-size leaves, combined by a BLAKE2b root.
+
+    Leaves are hashed in a thread pool as data arrives (``hashlib`` releases
+    the GIL for large inputs), so hashing very large objects scales with
+    cores. At most ``2 * max_workers`` leaves are buffered at a time.
+
+    Parameters
+    ----------
+    leaf_size : int, optional
+        Leaf size in bytes. Default 4 MiB. Part of the hash definition:
+        changing it changes every digest.
+    max_workers : int, optional
+        Hashing threads. Defaults to the number of CPUs.
+    """
+
+    def __init__(self, leaf_size: int = TREE_LEAF_SIZE, max_workers: int | None = None) -> None:
+        self.leaf_size = leaf_size
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self._buffer = bytearray()
+        self._pending: deque[Future[bytes]] = deque()
+        self._leaf_digests: list[bytes] = []
+        self._leaf_count = 0
+        self._pool: ThreadPoolExecutor | None = None
+        self._digest: bytes | None = None
+
+    def _submit(self, leaf: bytes) -> None:
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self.max_workers)
+        if len(self._pending) >= 2 * self.max_workers:
+            self._leaf_digests.append(self._pending.popleft().result())
+        self._pending.append(self._pool.submit(_hash_leaf, leaf, self._leaf_count, self.leaf_size))
+        self._leaf_count += 1
+
+    def update(self, data: bytes | bytearray | memoryview, /) -> None:
+        if self._digest is not None:
+            raise DataJointError("TreeHasher cannot be updated after digest()")
+        self._buffer += data
+        while len(self._buffer) >= self.leaf_size:
+            self._submit(bytes(self._buffer[: self.leaf_size]))
+            del self._buffer[: self.leaf_size]
+
+    def digest(self) -> bytes:
+        if self._digest is None:
+            if self._buffer or not self._leaf_count:
+                self._submit(bytes(self._buffer))
+                self._buffer.clear()
+            try:
+                self._leaf_digests.extend(future.result() for future in self._pending)
+            finally:
+                assert self._pool is not None
+                self._pool.shutdown()
+            root = hashlib.blake2b(
+                digest_size=16,
+                fanout=0,
+                depth=2,
+                leaf_size=self.leaf_size,
+                node_depth=1,
+                inner_size=32,
+                last_node=True,
+            )
+            for leaf_digest in self._leaf_digests:
+                root.update(leaf_digest)
+            self._digest = root.digest()
+        return self._digest
+
+
+# Registered content hash algorithms, selected per store with ``hash_algorithm``.
+# Each factory returns a Hasher with a 16-byte digest (26 Base32 characters).
+HASH_ALGORITHMS: dict[str, Callable[[], Hasher]] = {
+    "md5": hashlib.md5,
+    "blake2b": lambda: hashlib.blake2b(digest_size=16),
+    "blake2b-tree": TreeHasher,
+}
+
+
+def new_hasher(algorithm: str = DEFAULT_HASH_ALGORITHM) -> Hasher:
+    """
+    Create an incremental hasher for a registered algorithm.
+
+    Parameters
+    ----------
+    algorithm : str, optional
+        Key of ``HASH_ALGORITHMS``. Default ``"md5"``.
+
+    Returns
+    -------
+    Hasher
+        Object with ``update(bytes)`` and ``digest()``.
+
+    Raises
+    ------
+    DataJointError
+        If the algorithm is not registered.
+    """
+    try:
+        factory = HASH_ALGORITHMS[algorithm]
+    except KeyError:
+        raise DataJointError(
+            f"Unknown hash algorithm '{algorithm}'. Registered: {', '.join(sorted(HASH_ALGORITHMS))}"
+        ) from None
+    return factory()
+
+
+def _encode_digest(digest: bytes) -> str:
+    """Base32 encode a digest, remove padding, lowercase for filesystem compatibility."""
+    return base64.b32encode(digest).decode("ascii").rstrip("=").lower()
+
+
+def compute_hash(
+    data: bytes | os.PathLike[str] | Iterable[bytes],
+    algorithm: str = DEFAULT_HASH_ALGORITHM,
+) -> str:
+    """
+    Compute Base32-encoded hash of content.
+
+    Parameters
+    ----------
+    data : bytes, path-like, or iterable of bytes
+        Content bytes, a local file given as a ``Path`` (read in chunks), or an
+        iterable of chunks such as a ``ContentStream``. A ``str`` is ambiguous
+        between text and a file name and is rejected.
+    algorithm : str, optional
+        Registered hash algorithm (see ``HASH_ALGORITHMS``). Default ``"md5"``.
 
     Returns
     -------
     str
         Base32-encoded hash (26 lowercase characters, no padding).
+
+    Raises
+    ------
+    DataJointError
+        If ``data`` is a ``str``.
     """
-    md5_digest = hashlib.md5(data).digest()
-    # Base32 encode, remove padding, lowercase for filesystem compatibility
-    return base64.b32encode(md5_digest).decode("ascii").rstrip("=").lower()
+    if isinstance(data, str):
+        raise DataJointError("compute_hash() does not accept str: pass text encoded as bytes, or a file path as pathlib.Path")
+    hasher = new_hasher(algorithm)
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        hasher.update(data)
+    elif isinstance(data, os.PathLike):
+        with open(data, "rb") as f:
+            while chunk := f.read(STREAM_CHUNK_SIZE):
+                hasher.update(chunk)
+    else:
+        for chunk in data:
+            hasher.update(chunk)
+    return _encode_digest(hasher.digest())
 
 
 def _subfold(name: str, folds: tuple[int, ...]) -> tuple[str, ...]:
@@ -193,8 +486,34 @@ def get_store_subfolding(store_name: str | None = None, config: Config | None =
     return None
 
 
+def _hash_content(data: bytes | ContentStream, algorithm: str) -> tuple[str, int]:
+    """Return the content hash and size of bytes or a ContentStream."""
+    if isinstance(data, ContentStream):
+        return data.hashes.get(algorithm) or compute_hash(data, algorithm), data.size
+    return compute_hash(data, algorithm), len(data)
+
+
+def _hash_path(content_hash: str, schema_name: str, spec: dict[str, Any]) -> str:
+    """Build the hash path for a validated store spec."""
+    subfolding = tuple(spec["subfolding"]) if spec.get("subfolding") else None
+    return build_hash_path(
+        content_hash,
+        schema_name,
+        subfolding,
+        hash_prefix=spec["hash_prefix"],  # always present: settings applies the default
+    )
+
+
+def _upload(backend: StorageBackend, data: bytes | ContentStream, path: str) -> None:
+    """Write bytes or a ContentStream to a hash path."""
+    if isinstance(data, ContentStream):
+        backend.put_stream(data, path)
+    else:
+        backend.put_buffer(data, path)
+
+
 def put_hash(
-    data: bytes,
+    data: bytes | ContentStream,
     schema_name: str,
     store_name: str | None = None,
     config: Config | None = None,
@@ -208,10 +527,13 @@ def put_hash(
     The path is always stored in metadata and used for retrieval, protecting
     against configuration changes (e.g., subfolding) affecting existing data.
 
+    A :class:`ContentStream` is hashed and uploaded in chunks, so payloads
+    larger than memory can be stored.
+
     Parameters
     ----------
-    data : bytes
-        Content bytes to store.
+    data : bytes or ContentStream
+        Content to store.
     schema_name : str
         Database/schema name for path isolation.
     store_name : str, optional
@@ -222,39 +544,171 @@ def put_hash(
     Returns
     -------
     dict[str, Any]
-        Metadata dict with keys: hash, path, schema, store, size.
+        Metadata dict with keys: hash, path, schema, store, size, algorithm.
+        The algorithm is the store's ``hash_algorithm`` (default ``"md5"``).
     """
-    content_hash = compute_hash(data)
     if config is None:
         from .settings import config  # type: ignore[assignment]
     assert config is not None
     spec = config.get_store_spec(store_name)
-    subfolding = tuple(spec["subfolding"]) if spec.get("subfolding") else None
-    path = build_hash_path(
-        content_hash,
-        schema_name,
-        subfolding,
-        hash_prefix=spec["hash_prefix"],  # always present: settings applies the default
-    )
+    algorithm = spec.get("hash_algorithm") or DEFAULT_HASH_ALGORITHM
+    content_hash, size = _hash_content(data, algorithm)
+    path = _hash_path(content_hash, schema_name, spec)
 
     backend = get_store_backend(store_name, config=config)
 
     # Check if content already exists (deduplication within schema)
-    if not backend.exists(path):
-        backend.put_buffer(data, path)
-        logger.debug(f"Stored new hash: {content_hash} ({len(data)} bytes)")
-    else:
-        logger.debug(f"Hash already exists: {content_hash}")
+    try:
+        if not backend.exists(path):
+            _upload(backend, data, path)
+            logger.debug(f"Stored new hash: {content_hash} ({size} bytes)")
+        else:
+            logger.debug(f"Hash already exists: {content_hash}")
+    finally:
+        _close_temporary(data)
 
     return {
         "hash": content_hash,
         "path": path,  # Always stored for retrieval
         "schema": schema_name,
         "store": store_name,
-        "size": len(data),
+        "size": size,
+        "algorithm": algorithm,
     }
 
 
+def put_hashes(
+    items: Iterable[tuple[bytes | ContentStream, str]],
+    store_name: str | None = None,
+    config: Config | None = None,
+) -> list[dict[str, Any]]:
+    """
+    Store many values in hash-addressed storage with batched round trips.
+
+    All hashes are computed first and duplicates within the batch are
+    collapsed. Existence of the distinct paths is then checked concurrently,
+    and only the missing objects are uploaded, in parallel. Compared to
+    calling :func:`put_hash` per value, this replaces two sequential round
+    trips per value with a few concurrent ones per batch.
+
+    Parameters
+    ----------
+    items : iterable of (bytes or ContentStream, str)
+        ``(data, schema_name)`` pairs to store.
+    store_name : str, optional
+        Name of the store. If None, uses default store.
+    config : Config, optional
+        Config instance. If None, falls back to global settings.config.
+
+    Returns
+    -------
+    list[dict[str, Any]]
+        Metadata dicts (as returned by :func:`put_hash`) in input order.
+    """
+    if config is None:
+        from .settings import config  # type: ignore[assignment]
+    assert config is not None
+    spec = config.get_store_spec(store_name)
+    algorithm = spec.get("hash_algorithm") or DEFAULT_HASH_ALGORITHM
+
+    results = []
+    distinct: dict[str, bytes | ContentStream] = {}
+    stored: list[bytes | ContentStream] = []  # temporary streams are closed once stored
+    try:
+        for data, schema_name in items:
+            stored.append(data)
+            content_hash, size = _hash_content(data, algorithm)
+            path = _hash_path(content_hash, schema_name, spec)
+            distinct.setdefault(path, data)
+            results.append(
+                {
+                    "hash": content_hash,
+                    "path": path,
+                    "schema": schema_name,
+                    "store": store_name,
+                    "size": size,
+                    "algorithm": algorithm,
+                }
+            )
+        if not distinct:
+            return results
+
+        backend = get_store_backend(store_name, config=config)
+        existing = backend.exists_many(distinct)
+        missing = [path for path in distinct if path not in existing]
+        if missing:
+            max_workers = spec.get("max_workers") or DEFAULT_MAX_WORKERS
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(missing))) as pool:
+                list(pool.map(lambda path: _upload(backend, distinct[path], path), missing))
+    finally:
+        for data in stored:
+            _close_temporary(data)
+    logger.debug(f"put_hashes: {len(results)} values, {len(distinct)} distinct, {len(missing)} uploaded")
+    return results
+
+
+class PendingHash:
+    """
+    Placeholder for a value queued in a :class:`HashBatch`.
+
+    ``metadata`` holds the :func:`put_hash` metadata once the batch is flushed.
+    """
+
+    __slots__ = ("metadata",)
+
+    def __init__(self) -> None:
+        self.metadata: dict[str, Any] | None = None
+
+
+class HashBatch:
+    """
+    Collect hash-addressed values during an insert and store them together.
+
+    ``Table.insert`` passes a batch to the ``<hash>`` codec through the
+    ``_hash_batch`` context key. The codec queues each value and returns a
+    :class:`PendingHash`; the batch is flushed with :func:`put_hashes` (one
+    call per store) before the rows are sent to the database. Queued bytes
+    are flushed early once they exceed ``max_bytes`` to bound memory.
+
+    Parameters
+    ----------
+    max_bytes : int, optional
+        Pending bytes that trigger an early flush. Default 256 MiB.
+    """
+
+    def __init__(self, max_bytes: int = HASH_BATCH_BYTES) -> None:
+        self.max_bytes = max_bytes
+        self._pending: dict[str | None, list[tuple[bytes | ContentStream, str, PendingHash]]] = {}
+        self._configs: dict[str | None, Config | None] = {}
+        self._pending_bytes = 0
+
+    def add(
+        self,
+        data: bytes | ContentStream,
+        schema_name: str,
+        store_name: str | None = None,
+        config: Config | None = None,
+    ) -> PendingHash:
+        """Queue a value for storage and return its placeholder."""
+        pending = PendingHash()
+        self._pending.setdefault(store_name, []).append((data, schema_name, pending))
+        self._configs.setdefault(store_name, config)
+        if isinstance(data, bytes):
+            self._pending_bytes += len(data)
+            if self._pending_bytes >= self.max_bytes:
+                self.flush()
+        return pending
+
+    def flush(self) -> None:
+        """Store all queued values and fill in their placeholders."""
+        for store_name, queued in self._pending.items():
+            results = put_hashes(((data, schema) for data, schema, _ in queued), store_name, self._configs[store_name])
+            for (_, _, pending), metadata in zip(queued, results):
+                pending.metadata = metadata
+        self._pending.clear()
+        self._pending_bytes = 0
+
+
 def get_hash(metadata: dict[str, Any], config: Config | None = None) -> bytes:
     """
     Retrieve content using stored metadata.
@@ -265,7 +719,8 @@ def get_hash(metadata: dict[str, Any], config: Config | None = None) -> bytes:
     Parameters
     ----------
     metadata : dict
-        Metadata dict with keys: path, hash, store (optional).
+        Metadata dict with keys: path, hash, store (optional), algorithm
+        (optional; metadata written before algorithms were configurable is MD5).
     config : Config, optional
         Config instance. If None, falls back to global settings.config.
 
@@ -289,7 +744,7 @@ def get_hash(metadata: dict[str, Any], config: Config | None = None) -> bytes:
     data = backend.get_buffer(path)
 
     # Verify hash for integrity
-    actual_hash = compute_hash(data)
+    actual_hash = compute_hash(data, metadata.get("algorithm") or DEFAULT_HASH_ALGORITHM)
     if actual_hash != expected_hash:
         raise DataJointError(f"Hash mismatch: expected {expected_hash}, got {actual_hash}. Data at {path} may be corrupted.")
 
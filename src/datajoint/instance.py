@@ -10,7 +10,7 @@ from __future__ import annotations
 import os
 from typing import TYPE_CHECKING, Any, Literal
 
-from .connection import Connection
+from .connection import Connection, ConnectionPool
 from .errors import ThreadSafetyError
 from .settings import Config, _create_config, config as _settings_config
 
@@ -182,6 +182,37 @@ class Instance:
 
         return FreeTable(self.connection, full_table_name)
 
+    def pool(self, min_size: int = 1, max_size: int = 10, idle_timeout: float | None = 300.0, **kwargs: Any) -> ConnectionPool:
+        """
+        Create a pool of connections with this instance's credentials and config.
+
+        Pooled connections share this instance's schemas and dependency graph.
+
+        Parameters
+        ----------
+        min_size : int, optional
+            Connections kept open while idle. Default 1.
+        max_size : int, optional
+            Maximum number of open connections. Default 10.
+        idle_timeout : float or None, optional
+            Seconds after which idle connections beyond ``min_size`` are closed.
+            Default 300.
+        **kwargs : Any
+            Further :class:`~datajoint.connection.ConnectionPool` options.
+
+        Returns
+        -------
+        ConnectionPool
+            A pool for concurrent use of this instance's database.
+
+        Examples
+        --------
+        >>> pool = inst.pool(max_size=8)
+        >>> with pool.connection() as conn:  # in each worker thread
+        ...     rows = dj.FreeTable(conn, "lab.session").fetch()
+        """
+        return ConnectionPool(min_size, max_size, idle_timeout, connection=self.connection, **kwargs)
+
     def __repr__(self) -> str:
         return f"Instance({self.connection!r})"
 
@@ -19,9 +19,16 @@ or "in-store storage" (specific to the @ modifier).
 
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
+import math
 import re
+import threading
+import time
 import warnings
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 from packaging.version import Version
@@ -744,6 +751,369 @@ def add_job_metadata_columns(target, dry_run: bool = True) -> dict:
     return result
 
 
+# =============================================================================
+# Resumable Batch Processing
+# =============================================================================
+
+# Rows per keyset batch in resumable migrations
+MIGRATION_BATCH_SIZE = 1000
+
+# Concurrent storage operations (existence checks, file copies)
+MIGRATION_WORKERS = 8
+
+# Hidden per-schema table holding the progress of resumable migrations
+MIGRATION_STATE_TABLE = "~migration_state"
+
+
+def _encode_key(key) -> str:
+    """JSON-encode a primary-key tuple; bytes (e.g. UUID keys) are hex-tagged."""
+    return json.dumps([{"hex": v.hex()} if isinstance(v, (bytes, bytearray)) else v for v in key], default=str)
+
+
+def _decode_key(text: str) -> tuple:
+    return tuple(bytes.fromhex(v["hex"]) if isinstance(v, dict) else v for v in json.loads(text))
+
+
+def _primary_key(connection, database: str, table_name: str) -> list[str]:
+    """Primary-key columns of a table, in key order."""
+    rows = connection.query(
+        """
+        SELECT COLUMN_NAME FROM information_schema.KEY_COLUMN_USAGE
+        WHERE TABLE_SCHEMA = %s AND TABLE_NAME = %s AND CONSTRAINT_NAME = 'PRIMARY'
+        ORDER BY ORDINAL_POSITION
+        """,
+        args=(database, table_name),
+    ).fetchall()
+    if not rows:
+        raise DataJointError(f"Table `{database}`.`{table_name}` has no primary key; it cannot be processed in batches.")
+    return [row[0] for row in rows]
+
+
+def _estimated_rows(connection, database: str, table_name: str) -> int | None:
+    """Row estimate from the catalog (no table scan), used for ETAs."""
+    row = connection.query(
+        "SELECT TABLE_ROWS FROM information_schema.TABLES WHERE TABLE_SCHEMA = %s AND TABLE_NAME = %s",
+        args=(database, table_name),
+    ).fetchone()
+    return row[0] if row else None
+
+
+def _key_range(
+    pk: list[str], lower: tuple | None, upper: tuple | None, alias: str = "t", quote=lambda name: f"`{name}`"
+) -> tuple[str, list]:
+    """SQL condition ``lower < (pk) <= upper`` (row-constructor comparison) and its args; either bound may be None."""
+    columns = ", ".join(f"{alias}.{quote(c)}" for c in pk)
+    placeholders = ", ".join(["%s"] * len(pk))
+    conditions, args = [], []
+    if lower is not None:
+        conditions.append(f"({columns}) > ({placeholders})")
+        args.extend(lower)
+    if upper is not None:
+        conditions.append(f"({columns}) <= ({placeholders})")
+        args.extend(upper)
+    return " AND ".join(conditions) or "TRUE", args
+
+
+def _key_batches(
+    connection,
+    from_clause: str,
+    pk: list[str],
+    columns: list[str] | None = None,
+    where: str | None = None,
+    after: tuple | None = None,
+    batch_size: int = MIGRATION_BATCH_SIZE,
+):
+    """
+    Yield rows in primary-key order, ``batch_size`` at a time (keyset pagination).
+
+    ``from_clause`` names the table as ``t`` (plus any joins); each row starts
+    with the ``pk`` values followed by ``columns``. Each batch is read with an
+    index range scan starting after the last key of the previous one, so no
+    batch rescans rows already processed. Pass ``after`` to resume.
+    """
+    quote = connection.adapter.quote_identifier
+    pk_sql = ", ".join(f"t.{quote(c)}" for c in pk)
+    select = ", ".join([pk_sql] + (columns or []))
+    while True:
+        conditions, args = ([where] if where else []), []
+        if after is not None:
+            conditions.append(f"({pk_sql}) > ({', '.join(['%s'] * len(pk))})")
+            args.extend(after)
+        where_sql = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        rows = connection.query(
+            f"SELECT {select} FROM {from_clause}{where_sql} ORDER BY {pk_sql} LIMIT {int(batch_size)}", args=args
+        ).fetchall()
+        if not rows:
+            return
+        yield rows
+        after = tuple(rows[-1][: len(pk)])
+        if len(rows) < batch_size:
+            return
+
+
+class _MigrationCheckpoint:
+    """
+    Progress of one resumable migration task.
+
+    Stored as one row of the schema's hidden ``~migration_state`` table: the
+    last primary key processed, running counters, and task-specific state.
+    The table is created on the first save, so read-only runs that never save
+    leave the schema untouched.
+    """
+
+    def __init__(self, connection, database: str, task: str, resume: bool = True) -> None:
+        self.connection = connection
+        self.table = f"`{database}`.`{MIGRATION_STATE_TABLE}`"
+        self.task = task
+        self.last_key: tuple | None = None
+        self.done = False
+        self.objects = 0
+        self.bytes = 0
+        self.state: dict = {}
+        self.resumed = False
+        # errors other than a missing state table (lost connection, access) propagate
+        self._created = bool(
+            connection.query(
+                "SELECT COUNT(*) FROM information_schema.TABLES WHERE TABLE_SCHEMA = %s AND TABLE_NAME = %s",
+                args=(database, MIGRATION_STATE_TABLE),
+            ).fetchone()[0]
+        )
+        if not resume:
+            self.reset()
+            return
+        row = None
+        if self._created:
+            row = connection.query(
+                f"SELECT last_key, done, objects, bytes, state FROM {self.table} WHERE task = %s", args=(task,)
+            ).fetchone()
+        if row is not None:
+            self.last_key = _decode_key(row[0]) if row[0] else None
+            self.done = bool(row[1])
+            self.objects, self.bytes = int(row[2]), int(row[3])
+            self.state = json.loads(row[4]) if row[4] else {}
+            self.resumed = not self.done
+            if self.resumed:
+                logger.info(f"Resuming {task} after {self.objects} objects")
+
+    def save(self, last_key: tuple | None = None, done: bool = False) -> None:
+        """Record progress; call after each batch has been fully processed."""
+        if not self._created:
+            self.connection.query(
+                f"""
+                CREATE TABLE IF NOT EXISTS {self.table} (
+                    task varchar(255) NOT NULL,
+                    last_key text,
+                    done tinyint NOT NULL DEFAULT 0,
+                    objects bigint NOT NULL DEFAULT 0,
+                    bytes bigint NOT NULL DEFAULT 0,
+                    state longtext,
+                    updated timestamp NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+                    PRIMARY KEY (task)
+                ) ENGINE=InnoDB COMMENT "progress of resumable migrations"
+                """
+            )
+            self._created = True
+        if last_key is not None:
+            self.last_key = tuple(last_key)
+        self.done = done
+        self.connection.query(
+            f"""
+            INSERT INTO {self.table} (task, last_key, done, objects, bytes, state)
+            VALUES (%s, %s, %s, %s, %s, %s)
+            ON DUPLICATE KEY UPDATE last_key = VALUES(last_key), done = VALUES(done),
+                objects = VALUES(objects), bytes = VALUES(bytes), state = VALUES(state)
+            """,
+            args=(
+                self.task,
+                _encode_key(self.last_key) if self.last_key is not None else None,
+                int(done),
+                self.objects,
+                self.bytes,
+                json.dumps(self.state, default=str),
+            ),
+        )
+
+    def reset(self) -> None:
+        """Forget any saved progress so the task starts over."""
+        if self._created:
+            self.connection.query(f"DELETE FROM {self.table} WHERE task = %s", args=(self.task,))
+        self.last_key, self.done, self.objects, self.bytes, self.state = None, False, 0, 0, {}
+        self.resumed = False
+
+
+class _FileCheckpoint:
+    """
+    Progress of a read-only check, kept in a local directory rather than the database.
+
+    ``<name>.json`` holds the last primary key and the counters and is replaced
+    after each batch; entries found so far are appended to ``<name>.jsonl``, so
+    each save writes only the batch's new entries.
+    """
+
+    def __init__(self, directory, name: str, resume: bool = True) -> None:
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        self.file = directory / f"{name}.json"
+        self.entries_file = directory / f"{name}.jsonl"
+        self.last_key: tuple | None = None
+        self.state: dict = {}
+        self.entries: list = []
+        if resume and self.file.exists():
+            saved = json.loads(self.file.read_text())
+            self.last_key = _decode_key(saved["last_key"]) if saved["last_key"] else None
+            self.state = saved["state"]
+            if self.entries_file.exists():
+                # entries appended after the last save belong to a batch that is checked again
+                with self.entries_file.open() as f:
+                    self.entries = [json.loads(line) for line, _ in zip(f, range(saved["entries"]))]
+            logger.info(f"Resuming {name} after {self.state}")
+        else:
+            self.file.unlink(missing_ok=True)
+        self.entries_file.write_text("".join(json.dumps(entry) + "\n" for entry in self.entries))
+
+    def save(self, last_key: tuple, entries: list, state: dict) -> None:
+        """Record a completed batch and the entries it found."""
+        if entries:
+            with self.entries_file.open("a") as f:
+                f.writelines(json.dumps(entry) + "\n" for entry in entries)
+        self.entries.extend(entries)
+        self.last_key, self.state = tuple(last_key), state
+        temp = self.file.with_suffix(".saving")
+        temp.write_text(json.dumps({"last_key": _encode_key(self.last_key), "entries": len(self.entries), "state": state}))
+        temp.replace(self.file)
+
+    def clear(self) -> None:
+        """Remove the saved progress once the check has completed."""
+        self.file.unlink(missing_ok=True)
+        self.entries_file.unlink(missing_ok=True)
+
+
+class _Throughput:
+    """
+    Throughput of a running migration: objects/s, bytes/s and ETA.
+
+    Rates cover this run only (a resumed run does not count earlier work);
+    totals include the work done before resuming. A progress line is logged
+    at most every ``interval`` seconds. Worker threads may add concurrently.
+    """
+
+    def __init__(self, label: str, total: int | None = None, interval: float = 10.0) -> None:
+        self.label = label
+        self.total = total
+        self.interval = interval
+        self.objects = 0
+        self.bytes = 0
+        self._run_objects = 0
+        self._run_bytes = 0
+        self._start = self._last_log = time.monotonic()
+        self._lock = threading.Lock()
+
+    def resume(self, objects: int, nbytes: int = 0) -> None:
+        """Account for work completed by an earlier, interrupted run."""
+        with self._lock:
+            self.objects += objects
+            self.bytes += nbytes
+
+    def add(self, objects: int, nbytes: int = 0) -> None:
+        with self._lock:
+            self.objects += objects
+            self.bytes += nbytes
+            self._run_objects += objects
+            self._run_bytes += nbytes
+            now = time.monotonic()
+            log = now - self._last_log >= self.interval
+            if log:
+                self._last_log = now
+        if log:
+            m = self.metrics()
+            eta = f", ETA {m['eta_s']:.0f}s" if m["eta_s"] is not None else ""
+            logger.info(
+                f"{self.label}: {self.objects} objects, {self.bytes} bytes "
+                f"({m['objects_per_s']:.1f} objects/s, {m['bytes_per_s'] / 2**20:.1f} MiB/s{eta})"
+            )
+
+    def metrics(self) -> dict:
+        """Counters and rates as a dict (included in migration results)."""
+        with self._lock:
+            objects, nbytes, run_objects, run_bytes = self.objects, self.bytes, self._run_objects, self._run_bytes
+        elapsed = time.monotonic() - self._start
+        objects_per_s = run_objects / elapsed if elapsed > 0 else 0.0
+        remaining = None if self.total is None else max(self.total - objects, 0)
+        eta = remaining / objects_per_s if remaining is not None and objects_per_s > 0 else None
+        return {
+            "objects": objects,
+            "bytes": nbytes,
+            "elapsed_s": elapsed,
+            "objects_per_s": objects_per_s,
+            "bytes_per_s": run_bytes / elapsed if elapsed > 0 else 0.0,
+            "eta_s": eta,
+        }
+
+
+def _batched_update(
+    connection,
+    database: str,
+    table_name: str,
+    update_sql: str,
+    checkpoint: _MigrationCheckpoint,
+    throughput: _Throughput,
+    batch_size: int = MIGRATION_BATCH_SIZE,
+) -> int:
+    """
+    Run ``update_sql`` over a table one primary-key range at a time.
+
+    ``update_sql`` is an UPDATE naming the table ``t`` and ending in a WHERE
+    clause; each batch appends its key-range condition. Progress is saved
+    after every batch, so the update resumes after the last completed range.
+    Returns the number of rows updated (including earlier runs).
+    """
+    pk = _primary_key(connection, database, table_name)
+    lower = checkpoint.last_key
+    for rows in _key_batches(connection, f"`{database}`.`{table_name}` t", pk, after=lower, batch_size=batch_size):
+        upper = tuple(rows[-1])
+        condition, args = _key_range(pk, lower, upper)
+        updated = connection.query(f"{update_sql} AND {condition}", args=args).rowcount
+        checkpoint.state["rows"] = checkpoint.state.get("rows", 0) + updated
+        checkpoint.objects += len(rows)
+        checkpoint.save(last_key=upper)
+        throughput.add(len(rows))
+        lower = upper
+    checkpoint.save(done=True)
+    return checkpoint.state.get("rows", 0)
+
+
+def _add_json_column(connection, database: str, table_name: str, column: str, comment: str, task: str) -> _MigrationCheckpoint:
+    """
+    Add the JSON column a migration fills, recording the task's checkpoint first.
+
+    The checkpoint row is saved before the ALTER, so a run interrupted between
+    the ALTER and its first batch is resumed on the next run instead of the new
+    column being taken as already migrated.
+    """
+    checkpoint = _MigrationCheckpoint(connection, database, task, resume=False)
+    checkpoint.save()
+    connection.query(f"ALTER TABLE `{database}`.`{table_name}` ADD COLUMN `{column}` JSON COMMENT '{comment}'")
+    return checkpoint
+
+
+def _update_from_values(connection, full_table_name: str, pk: list[str], column: str, updates: list[tuple]) -> int:
+    """
+    Set ``column`` for many rows in one statement.
+
+    ``updates`` holds ``(key, value)`` pairs; the table is joined with the
+    values as a derived table. Returns the number of rows updated.
+    """
+    if not updates:
+        return 0
+    select = ", ".join([f"%s AS `{c}`" for c in pk] + ["%s AS `value`"])
+    values = " UNION ALL ".join(f"SELECT {select}" for _ in updates)
+    on = " AND ".join(f"t.`{c}` = v.`{c}`" for c in pk)
+    return connection.query(
+        f"UPDATE {full_table_name} t JOIN ({values}) v ON {on} SET t.`{column}` = v.`value`",
+        args=[arg for key, value in updates for arg in (*key, value)],
+    ).rowcount
+
+
 # =============================================================================
 # External Storage Migration (Phase 6)
 # =============================================================================
@@ -870,6 +1240,8 @@ def migrate_external(
     schema: Schema,
     dry_run: bool = True,
     finalize: bool = False,
+    batch_size: int = MIGRATION_BATCH_SIZE,
+    resume: bool = True,
 ) -> dict:
     """
     Migrate external storage columns from 0.x to 2.0 format.
@@ -897,6 +1269,12 @@ def migrate_external(
     finalize : bool, optional
         If True, rename migrated columns to original names and drop old columns.
         Only run after verifying migration succeeded. Default False.
+    batch_size : int, optional
+        Rows converted per UPDATE (primary-key range). Default 1000.
+    resume : bool, optional
+        If True (default), continue an interrupted run from its last completed
+        batch (tracked in the schema's ``~migration_state`` table). If False,
+        refill an interrupted column from its first row.
 
     Returns
     -------
@@ -907,6 +1285,7 @@ def migrate_external(
         - columns_migrated: Number of columns processed
         - rows_migrated: Number of rows with data converted
         - details: Per-column migration details
+        - throughput: rows scanned, rows/s and ETA
 
     Examples
     --------
@@ -935,12 +1314,14 @@ def migrate_external(
     columns = _find_external_columns(schema)
     connection = schema.connection
     database = schema.database
+    throughput = _Throughput(f"migrate_external({database})")
 
     result = {
         "columns_found": len(columns),
         "columns_migrated": 0,
         "rows_migrated": 0,
         "details": [],
+        "throughput": throughput.metrics(),
     }
 
     if not columns:
@@ -1021,7 +1402,11 @@ def migrate_external(
                 args=(database, table_name, new_column),
             ).fetchone()
 
-            if existing:
+            task = f"migrate_external:{table_name}.{column_name}"
+            checkpoint = None
+            if existing and not dry_run:
+                checkpoint = _MigrationCheckpoint(connection, database, task)
+            if existing and not (checkpoint and checkpoint.resumed):
                 detail["status"] = "already_migrated"
                 logger.info(f"Column {new_column} already exists, skipping")
                 result["details"].append(detail)
@@ -1039,13 +1424,13 @@ def migrate_external(
                 logger.info(f"Would migrate {database}.{table_name}.{column_name}: " f"{count} rows, store={store_name}")
             else:
                 try:
-                    # Add new JSON column
-                    sql = (
-                        f"ALTER TABLE `{database}`.`{table_name}` "
-                        f"ADD COLUMN `{new_column}` JSON "
-                        f"COMMENT '{new_comment}'"
-                    )
-                    connection.query(sql)
+                    if not existing:
+                        checkpoint = _add_json_column(connection, database, table_name, new_column, new_comment, task)
+                    elif not resume:
+                        checkpoint.reset()  # refill the partially migrated column from the first row
+                    detail["resumed"] = checkpoint.resumed
+                    throughput.total = (throughput.total or 0) + (_estimated_rows(connection, database, table_name) or 0)
+                    throughput.resume(checkpoint.objects)
 
                     # Copy and convert data from old column
                     # Query the external table for metadata
@@ -1058,7 +1443,8 @@ def migrate_external(
                     protocol = store_config.get("protocol", "file")
                     location = store_config.get("location", "")
 
-                    # Update rows with JSON metadata
+                    # Update rows with JSON metadata, one primary-key range per
+                    # statement; the row count comes from the UPDATEs themselves.
                     update_sql = f"""
                         UPDATE `{database}`.`{table_name}` t
                         JOIN `{database}`.`{external_table}` e
@@ -1070,14 +1456,9 @@ def migrate_external(
                         )
                         WHERE t.`{column_name}` IS NOT NULL
                     """
-                    connection.query(update_sql)
-
-                    # Count migrated rows
-                    count_sql = f"""
-                        SELECT COUNT(*) FROM `{database}`.`{table_name}`
-                        WHERE `{new_column}` IS NOT NULL
-                    """
-                    count = connection.query(count_sql).fetchone()[0]
+                    count = _batched_update(
+                        connection, database, table_name, update_sql, checkpoint, throughput, batch_size=batch_size
+                    )
                     detail["rows"] = count
                     detail["status"] = "migrated"
                     result["columns_migrated"] += 1
@@ -1092,6 +1473,218 @@ def migrate_external(
 
         result["details"].append(detail)
 
+    result["throughput"] = throughput.metrics()
+    return result
+
+
+# =============================================================================
+# In-Table Blob Offloading
+# =============================================================================
+
+
+def migrate_blob_to_store(
+    schema: Schema,
+    table: str,
+    column: str,
+    store: str | None = None,
+    dry_run: bool = True,
+    batch_size: int = MIGRATION_BATCH_SIZE,
+    resume: bool = True,
+    drop_inline: bool = False,
+) -> dict:
+    """
+    Move an in-table ``<blob>`` column to hash-addressed storage (``<blob@store>``).
+
+    The migration runs online, in primary-key batches:
+
+    1. A JSON column ``<column>_store`` is added, with a trigger that clears it
+       whenever the row's blob is changed, so replaced blobs are moved again.
+    2. Each batch's serialized blobs are uploaded with :func:`~datajoint.hash_registry.put_hashes`
+       (hashing, existence checks and uploads run concurrently, using the
+       store's ``max_workers``). The bytes are stored as they are, without
+       unpacking and repacking.
+    3. The hash metadata is written to the new column with one UPDATE per batch.
+    4. A final pass catches rows inserted or changed meanwhile. A last pass,
+       a check that every blob has been moved, and the swap then run under
+       ``LOCK TABLES ... WRITE``, so no row can be written in between. The
+       swap is a single ALTER TABLE: the blob column becomes
+       ``<column>_inline`` (or is dropped if ``drop_inline``) and
+       ``<column>_store`` takes its name as ``<blob@store>``.
+
+    Progress is saved after every batch in ``~migration_state``; an
+    interrupted migration resumes after the last completed batch.
+
+    Parameters
+    ----------
+    schema : Schema
+        The DataJoint schema containing the table.
+    table : str
+        Table name as in the database (e.g. ``'__recording'``).
+    column : str
+        In-table blob column to move.
+    store : str, optional
+        Target store. If None, uses the default store (``<blob@>``).
+    dry_run : bool, optional
+        If True (default), only count the rows and bytes to move.
+    batch_size : int, optional
+        Rows per batch. Default 1000.
+    resume : bool, optional
+        If True (default), continue an interrupted migration.
+    drop_inline : bool, optional
+        If True, drop the blob column when swapping instead of keeping it as
+        ``<column>_inline``. Space is returned to the server only after the
+        column is dropped and the table is rebuilt (``OPTIMIZE TABLE``).
+
+    Returns
+    -------
+    dict
+        - status: ``"dry_run"``, ``"migrated"`` or ``"already_migrated"``
+        - rows: rows moved (including earlier runs when resumed)
+        - bytes: bytes moved
+        - resumed: whether an interrupted migration was continued
+        - throughput: rows and bytes per second, ETA
+
+    Raises
+    ------
+    DataJointError
+        If the column is not an in-table blob, the store is not configured, or
+        blobs remain unmoved at the swap (the table is then left unchanged).
+
+    Examples
+    --------
+    >>> result = migrate_blob_to_store(schema, '__spike_sorting', 'waveforms', store='raw', dry_run=False)
+    >>> print(result['throughput'])
+
+    Notes
+    -----
+    Clients holding the table's previous definition keep writing to the blob
+    column until the swap; their rows are picked up by the final passes.
+    Writes wait for the table lock during the last pass and the swap. The
+    trigger requires the ``TRIGGER`` privilege. After the swap, update the
+    table definition to ``<blob@store>`` and reload the schema in running
+    processes.
+    """
+    from .hash_registry import put_hashes
+    from .settings import config
+
+    connection = schema.connection
+    database = schema.database
+    full_table_name = f"`{database}`.`{table}`"
+    new_column = f"{column}_store"
+    codec = f"<blob@{store or ''}>"
+
+    info = connection.query(
+        """
+        SELECT COLUMN_NAME, COLUMN_TYPE, COLUMN_COMMENT, IS_NULLABLE FROM information_schema.COLUMNS
+        WHERE TABLE_SCHEMA = %s AND TABLE_NAME = %s AND COLUMN_NAME IN (%s, %s)
+        """,
+        args=(database, table, column, new_column),
+    ).fetchall()
+    columns = {name: (column_type, comment or "", nullable == "YES") for name, column_type, comment, nullable in info}
+    if column not in columns:
+        raise DataJointError(f"Column {column} not found in {database}.{table}")
+    column_type, comment, nullable = columns[column]
+    result = {"status": "pending", "rows": 0, "bytes": 0, "resumed": False}
+    if comment.startswith(f":{codec}:"):
+        result["status"] = "already_migrated"
+        return result
+    match = re.match(r":(<[^>]*>|\w+):", comment)  # codec or core type tag, e.g. :<blob>: or :bytes:
+    if "blob" not in column_type.lower() or (match and match.group(1) not in ("<blob>", "<djblob>")):
+        raise DataJointError(f"{database}.{table}.{column} is not an in-table <blob> column")
+    config.get_store_spec(store)  # fails early if the store is not configured
+    user_comment = comment[match.end() :] if match else comment
+
+    if dry_run:
+        count, size = connection.query(
+            f"SELECT COUNT(*), COALESCE(SUM(LENGTH(`{column}`)), 0) FROM {full_table_name} WHERE `{column}` IS NOT NULL"
+        ).fetchone()
+        result.update(status="dry_run", rows=count, bytes=int(size))
+        logger.info(f"Would move {count} blobs ({int(size)} bytes) of {database}.{table}.{column} to {codec}")
+        return result
+
+    pk = _primary_key(connection, database, table)
+    checkpoint = _MigrationCheckpoint(connection, database, f"migrate_blob_to_store:{table}.{column}", resume=resume)
+    if new_column not in columns:
+        connection.query(
+            f"ALTER TABLE {full_table_name} ADD COLUMN `{new_column}` JSON DEFAULT NULL "
+            f"COMMENT 'migration of {column} to {codec} in progress'"
+        )
+        checkpoint.reset()
+    # a blob changed after it was moved is moved again
+    trigger_name = f"{table}__{column}__to_store"[:64]
+    trigger = f"`{database}`.`{trigger_name}`"
+    if not connection.query(
+        "SELECT COUNT(*) FROM information_schema.TRIGGERS WHERE TRIGGER_SCHEMA = %s AND TRIGGER_NAME = %s",
+        args=(database, trigger_name),
+    ).fetchone()[0]:
+        connection.query(
+            f"CREATE TRIGGER {trigger} BEFORE UPDATE ON {full_table_name} FOR EACH ROW "
+            f"SET NEW.`{new_column}` = IF(NEW.`{column}` <=> OLD.`{column}`, NEW.`{new_column}`, NULL)"
+        )
+    result["resumed"] = checkpoint.resumed
+    throughput = _Throughput(
+        f"migrate_blob_to_store({database}.{table}.{column})", total=_estimated_rows(connection, database, table)
+    )
+    throughput.resume(checkpoint.objects, checkpoint.bytes)
+
+    def move(after, save):
+        """Upload and record every blob not yet moved, in key order after ``after``."""
+        batches = _key_batches(
+            connection,
+            f"{full_table_name} t",
+            pk,
+            columns=[f"t.`{column}`"],
+            where=f"t.`{column}` IS NOT NULL AND t.`{new_column}` IS NULL",
+            after=after,
+            batch_size=batch_size,
+        )
+        n = len(pk)
+        for rows in batches:
+            metadata = put_hashes(((row[n], database) for row in rows), store_name=store)
+            _update_from_values(
+                connection, full_table_name, pk, new_column, [(row[:n], json.dumps(m)) for row, m in zip(rows, metadata)]
+            )
+            nbytes = sum(m["size"] for m in metadata)
+            checkpoint.objects += len(rows)
+            checkpoint.bytes += nbytes
+            if save:
+                checkpoint.save(last_key=rows[-1][:n])
+            throughput.add(len(rows), nbytes)
+
+    if not checkpoint.done:
+        move(checkpoint.last_key, save=True)
+        checkpoint.save(done=True)
+    move(None, save=False)  # rows written since their range was processed
+
+    new_comment = f":{codec}:{user_comment}".replace("\\", "\\\\").replace("'", "\\'")
+    inline = (
+        f"DROP COLUMN `{column}`"
+        if drop_inline
+        else f"CHANGE COLUMN `{column}` `{column}_inline` {column_type} NULL COMMENT 'in-table copy before {codec}'"
+    )
+    # nothing is written between the last pass, the check, and the swap (batch queries use the alias t)
+    connection.query(f"LOCK TABLES {full_table_name} WRITE, {full_table_name} AS t WRITE")
+    try:
+        move(None, save=False)
+        unmoved = connection.query(
+            f"SELECT COUNT(*) FROM {full_table_name} WHERE `{column}` IS NOT NULL AND `{new_column}` IS NULL"
+        ).fetchone()[0]
+        if unmoved:
+            raise DataJointError(
+                f"{unmoved} blobs of {database}.{table}.{column} were not moved; the columns were not swapped. "
+                "Run the migration again."
+            )
+        connection.query(f"DROP TRIGGER {trigger}")
+        connection.query(
+            f"ALTER TABLE {full_table_name} {inline}, "
+            f"CHANGE COLUMN `{new_column}` `{column}` JSON{'' if nullable else ' NOT NULL'} COMMENT '{new_comment}'"
+        )
+    finally:
+        connection.query("UNLOCK TABLES")
+    checkpoint.save(done=True)
+    logger.info(f"Moved {checkpoint.objects} blobs of {database}.{table}.{column} to {codec}")
+
+    result.update(status="migrated", rows=checkpoint.objects, bytes=checkpoint.bytes, throughput=throughput.metrics())
     return result
 
 
@@ -1220,12 +1813,24 @@ def check_store_configuration(schema: Schema) -> dict:
     return result
 
 
-def verify_external_integrity(schema: Schema, store_name: str = None) -> dict:
+def verify_external_integrity(
+    schema: Schema,
+    store_name: str = None,
+    workers: int = MIGRATION_WORKERS,
+    batch_size: int = MIGRATION_BATCH_SIZE,
+    checkpoint_dir=None,
+    resume: bool = True,
+) -> dict:
     """
     Check that all external references point to existing files.
 
     Verifies integrity of external storage by checking that each
     reference in the ~external_* tables points to an accessible file.
+    Entries are read in batches of ``batch_size`` (ordered by hash) and each
+    batch's files are checked concurrently by ``workers`` threads. The check
+    does not write to the database; with ``checkpoint_dir`` set, progress is
+    saved there after every batch, so an interrupted check resumes where it
+    stopped.
 
     Parameters
     ----------
@@ -1233,6 +1838,16 @@ def verify_external_integrity(schema: Schema, store_name: str = None) -> dict:
         The DataJoint schema to check.
     store_name : str, optional
         Specific store to check. If None, checks all stores.
+    workers : int, optional
+        Concurrent existence checks for remote stores. Default 8.
+    batch_size : int, optional
+        Entries per batch (and per checkpoint). Default 1000.
+    checkpoint_dir : str or Path, optional
+        Local directory for progress files. If None (default), no progress is saved.
+        Progress of a store is removed once its check completes.
+    resume : bool, optional
+        If True (default), continue an interrupted check saved in ``checkpoint_dir``.
+        If False, start over.
 
     Returns
     -------
@@ -1243,11 +1858,12 @@ def verify_external_integrity(schema: Schema, store_name: str = None) -> dict:
         - valid: count with accessible files
         - missing: list of entries with inaccessible files
         - stores_checked: list of store names checked
+        - throughput: entries checked, entries/s and ETA
 
     Examples
     --------
     >>> from datajoint.migrate import verify_external_integrity
-    >>> result = verify_external_integrity(schema)
+    >>> result = verify_external_integrity(schema, workers=32)
     >>> if result['missing']:
     ...     print(f"Missing files: {len(result['missing'])}")
     ...     for entry in result['missing'][:5]:
@@ -1255,11 +1871,12 @@ def verify_external_integrity(schema: Schema, store_name: str = None) -> dict:
 
     Notes
     -----
-    For S3/MinIO stores, this function does not verify file existence
-    (would require network calls). Only local file stores are fully verified.
+    Stores are accessed through their configuration in ``dj.config.stores``;
+    an unconfigured store is checked as a local path relative to the
+    working directory.
     """
     from .settings import config
-    import os
+    from .storage import StorageBackend
 
     result = {
         "total_references": 0,
@@ -1269,7 +1886,9 @@ def verify_external_integrity(schema: Schema, store_name: str = None) -> dict:
     }
 
     connection = schema.connection
+    database = schema.database
     stores_config = config.get("stores", {})
+    throughput = _Throughput(f"verify_external_integrity({database})")
 
     # Find ~external_* tables
     if store_name:
@@ -1281,7 +1900,7 @@ def verify_external_integrity(schema: Schema, store_name: str = None) -> dict:
             WHERE TABLE_SCHEMA = %s
             AND TABLE_NAME LIKE '~external_%%'
         """
-        external_tables = connection.query(tables_query, args=(schema.database,)).fetchall()
+        external_tables = connection.query(tables_query, args=(database,)).fetchall()
 
     for (table_name,) in external_tables:
         # Extract store name
@@ -1289,47 +1908,60 @@ def verify_external_integrity(schema: Schema, store_name: str = None) -> dict:
         result["stores_checked"].append(current_store)
 
         store_config = stores_config.get(current_store, {})
-        protocol = store_config.get("protocol", "file")
-        location = store_config.get("location", "")
-
-        # Only verify local files
-        if protocol != "file":
-            logger.info(f"Skipping {current_store}: non-local protocol ({protocol})")
-            continue
-
-        # Query external table for all entries
         try:
-            entries_query = f"""
-                SELECT HEX(hash), filepath, size
-                FROM `{schema.database}`.`{table_name}`
-            """
-            entries = connection.query(entries_query).fetchall()
+            backend = StorageBackend({"protocol": "file", "location": "", **store_config})
         except Exception as e:
-            logger.warning(f"Could not read {table_name}: {e}")
+            logger.warning(f"Skipping {current_store}: store is not accessible ({e})")
             continue
 
-        for hash_hex, filepath, size in entries:
-            result["total_references"] += 1
-
-            # Build full path
-            if location:
-                full_path = os.path.join(location, filepath)
-            else:
-                full_path = filepath
-
-            if os.path.exists(full_path):
-                result["valid"] += 1
-            else:
-                result["missing"].append(
+        progress = None
+        total = valid = 0
+        missing: list[dict] = []
+        if checkpoint_dir is not None:
+            progress = _FileCheckpoint(checkpoint_dir, f"verify_external_integrity-{database}-{current_store}", resume)
+            total, valid, missing = progress.state.get("total", 0), progress.state.get("valid", 0), progress.entries
+        throughput.resume(total)
+        try:
+            throughput.total = (throughput.total or 0) + (_estimated_rows(connection, database, table_name) or 0)
+            batches = _key_batches(
+                connection,
+                f"`{database}`.`{table_name}` t",
+                ["hash"],
+                columns=["t.filepath", "t.size"],
+                after=progress.last_key if progress is not None else None,
+                batch_size=batch_size,
+            )
+            for rows in batches:
+                found = backend.exists_many((filepath for _, filepath, _ in rows), max_workers=workers)
+                batch_missing = [
                     {
                         "store": current_store,
-                        "hash": hash_hex,
+                        "hash": hash_bytes.hex().upper(),
                         "filepath": filepath,
-                        "full_path": full_path,
+                        "full_path": backend._full_path(filepath),
                         "expected_size": size,
                     }
-                )
+                    for hash_bytes, filepath, size in rows
+                    if filepath not in found
+                ]
+                total += len(rows)
+                valid += len(rows) - len(batch_missing)
+                if progress is not None:
+                    progress.save(rows[-1][:1], batch_missing, {"total": total, "valid": valid})
+                else:
+                    missing.extend(batch_missing)
+                throughput.add(len(rows), sum(size or 0 for _, _, size in rows))
+        except Exception as e:
+            logger.warning(f"Could not read {table_name}: {e}")
+            continue
+        if progress is not None:
+            progress.clear()
 
+        result["total_references"] += total
+        result["valid"] += valid
+        result["missing"].extend(missing)
+
+    result["throughput"] = throughput.metrics()
     return result
 
 
@@ -1470,6 +2102,8 @@ def migrate_filepath(
     schema: Schema,
     dry_run: bool = True,
     finalize: bool = False,
+    batch_size: int = MIGRATION_BATCH_SIZE,
+    resume: bool = True,
 ) -> dict:
     """
     Migrate filepath columns from 0.x to 2.0 format.
@@ -1488,6 +2122,11 @@ def migrate_filepath(
         If True, only preview changes. Default True.
     finalize : bool, optional
         If True, finalize migration. Default False.
+    batch_size : int, optional
+        Rows converted per UPDATE (primary-key range). Default 1000.
+    resume : bool, optional
+        If True (default), continue an interrupted run from its last completed
+        batch. If False, refill an interrupted column from its first row.
 
     Returns
     -------
@@ -1510,12 +2149,14 @@ def migrate_filepath(
     columns = _find_filepath_columns(schema)
     connection = schema.connection
     database = schema.database
+    throughput = _Throughput(f"migrate_filepath({database})")
 
     result = {
         "columns_found": len(columns),
         "columns_migrated": 0,
         "rows_migrated": 0,
         "details": [],
+        "throughput": throughput.metrics(),
     }
 
     if not columns:
@@ -1586,7 +2227,11 @@ def migrate_filepath(
                 args=(database, table_name, new_column),
             ).fetchone()
 
-            if existing:
+            task = f"migrate_filepath:{table_name}.{column_name}"
+            checkpoint = None
+            if existing and not dry_run:
+                checkpoint = _MigrationCheckpoint(connection, database, task)
+            if existing and not (checkpoint and checkpoint.resumed):
                 detail["status"] = "already_migrated"
                 result["details"].append(detail)
                 continue
@@ -1609,29 +2254,25 @@ def migrate_filepath(
                     protocol = store_config.get("protocol", "file")
                     location = store_config.get("location", "")
 
-                    # Add new JSON column
-                    sql = (
-                        f"ALTER TABLE `{database}`.`{table_name}` "
-                        f"ADD COLUMN `{new_column}` JSON "
-                        f"COMMENT '{new_comment}'"
-                    )
-                    connection.query(sql)
+                    if not existing:
+                        checkpoint = _add_json_column(connection, database, table_name, new_column, new_comment, task)
+                    elif not resume:
+                        checkpoint.reset()  # refill the partially migrated column from the first row
+                    detail["resumed"] = checkpoint.resumed
+                    throughput.total = (throughput.total or 0) + (_estimated_rows(connection, database, table_name) or 0)
+                    throughput.resume(checkpoint.objects)
 
-                    # Convert filepath to JSON with URL
+                    # Convert filepath to JSON with URL, one primary-key range per statement
                     update_sql = f"""
-                        UPDATE `{database}`.`{table_name}`
-                        SET `{new_column}` = JSON_OBJECT(
-                            'url', CONCAT('{protocol}://', '{location}/', `{column_name}`)
+                        UPDATE `{database}`.`{table_name}` t
+                        SET t.`{new_column}` = JSON_OBJECT(
+                            'url', CONCAT('{protocol}://', '{location}/', t.`{column_name}`)
                         )
-                        WHERE `{column_name}` IS NOT NULL
-                    """
-                    connection.query(update_sql)
-
-                    count_sql = f"""
-                        SELECT COUNT(*) FROM `{database}`.`{table_name}`
-                        WHERE `{new_column}` IS NOT NULL
+                        WHERE t.`{column_name}` IS NOT NULL
                     """
-                    count = connection.query(count_sql).fetchone()[0]
+                    count = _batched_update(
+                        connection, database, table_name, update_sql, checkpoint, throughput, batch_size=batch_size
+                    )
                     detail["rows"] = count
                     detail["status"] = "migrated"
                     result["columns_migrated"] += 1
@@ -1646,6 +2287,7 @@ def migrate_filepath(
 
         result["details"].append(detail)
 
+    result["throughput"] = throughput.metrics()
     return result
 
 
@@ -1654,17 +2296,120 @@ def migrate_filepath(
 # =============================================================================
 
 
+def _dependency_levels(connection, database: str, tables: list[str]) -> list[list[str]]:
+    """
+    Group tables into levels such that each table's parents (foreign keys within
+    the schema) are in earlier levels. Tables within a level are independent.
+    """
+    adapter = connection.adapter
+    names = {adapter.make_full_table_name(database, table): table for table in tables}
+    parents: dict[str, set[str]] = {table: set() for table in tables}
+    # hidden tables are included: 0.x external columns reference ~external_* tables
+    query = adapter.load_foreign_keys_sql(adapter.quote_string(database), "''")
+    for row in connection.query(query, as_dict=True).fetchall():
+        row = {k.lower(): v for k, v in row.items()}
+        child, parent = names.get(row["referencing_table"]), names.get(row["referenced_table"])
+        if child is not None and parent is not None and child != parent:
+            parents[child].add(parent)
+    levels = []
+    remaining = dict(parents)
+    while remaining:
+        level = sorted(t for t, deps in remaining.items() if not deps & remaining.keys())
+        if not level:  # a cycle; cannot be ordered
+            level = sorted(remaining)
+        levels.append(level)
+        for table in level:
+            del remaining[table]
+    return levels
+
+
+def _run_levels(connection, levels: list[list[str]], task, workers: int = 1) -> dict:
+    """
+    Run ``task(table, connection)`` for all tables, one dependency level after another.
+
+    A level starts only when all tables of the previous level are complete;
+    tables within a level run concurrently, each worker thread on its own
+    connection. Returns the task's result per table.
+    """
+    results = {}
+    if workers <= 1:
+        for level in levels:
+            for table in level:
+                results[table] = task(table, connection)
+        return results
+
+    local = threading.local()
+    opened = []
+
+    def run(table):
+        if not hasattr(local, "connection"):
+            local.connection = connection.clone()
+            opened.append(local.connection)
+        return task(table, local.connection)
+
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for level in levels:
+                results.update(zip(level, pool.map(run, level)))
+    finally:
+        for conn in opened:
+            conn.close()
+    return results
+
+
+def _copy_tables(
+    connection,
+    source: str,
+    dest: str,
+    tables: list[str],
+    workers: int = 1,
+    batch_size: int = MIGRATION_BATCH_SIZE,
+    resume: bool = True,
+) -> dict[str, int]:
+    """
+    Copy the data of ``tables`` from ``source`` to ``dest`` in dependency order.
+
+    Parents are copied before their children; independent tables are copied
+    concurrently, each worker on its own connection. When resuming, tables whose
+    copy completed in an earlier run are skipped. Returns rows copied per table.
+    """
+    throughput = _Throughput(f"copy {source} → {dest}", total=len(tables))
+    copied: dict[str, int] = {}
+    if resume:
+        for table in tables:
+            checkpoint = _MigrationCheckpoint(connection, dest, _copy_task(source, table))
+            if checkpoint.done:
+                copied[table] = checkpoint.objects
+                throughput.add(1)
+    remaining = [table for table in tables if table not in copied]
+
+    def copy(table, conn):
+        rows = copy_table_data(source, dest, table, connection=conn, batch_size=batch_size, resume=resume)["rows_copied"]
+        throughput.add(1)
+        return rows
+
+    copied.update(_run_levels(connection, _dependency_levels(connection, source, remaining), copy, workers))
+    return copied
+
+
 def create_parallel_schema(
     source: str,
     dest: str,
     copy_data: bool = False,
     connection=None,
+    workers: int = MIGRATION_WORKERS,
+    batch_size: int = MIGRATION_BATCH_SIZE,
+    resume: bool = True,
+    overwrite: bool = False,
 ) -> dict:
     """
     Create a parallel _v20 schema for migration testing.
 
     This creates a copy of a production schema (source) into a test schema (dest)
     for safely testing DataJoint 2.0 migration without affecting production.
+    Tables are created in dependency order. Data is copied with
+    :func:`copy_table_data` in primary-key chunks; tables whose parents have
+    been copied are copied concurrently by ``workers`` connections.
 
     Parameters
     ----------
@@ -1676,13 +2421,25 @@ def create_parallel_schema(
         If True, copy all table data. If False (default), create empty tables.
     connection : Connection, optional
         Database connection. If None, uses default connection.
+    workers : int, optional
+        Tables copied concurrently, each on its own connection. Default 8.
+    batch_size : int, optional
+        Rows per chunk (one transaction per chunk). Default 1000.
+    resume : bool, optional
+        If True (default), tables that already exist in ``dest`` are kept and
+        an interrupted copy continues after the last committed chunk of each
+        table. A copy that completed is not resumed: rerunning it raises
+        unless ``overwrite`` is set.
+    overwrite : bool, optional
+        If True, drop ``dest`` and copy it again from scratch. Default False.
 
     Returns
     -------
     dict
-        - tables_created: int - number of tables created
+        - tables_created: int - number of tables created (tables kept when resuming are not counted)
         - data_copied: bool - whether data was copied
-        - tables: list - list of table names created
+        - tables: list - names of the tables in ``dest``, created or kept
+        - rows_copied: int - rows copied (counted from the chunks)
 
     Examples
     --------
@@ -1701,48 +2458,72 @@ def create_parallel_schema(
 
     logger.info(f"Creating parallel schema: {source} → {dest}")
 
+    task = f"create_parallel_schema:{source}"
+    if overwrite:
+        connection.query(f"DROP DATABASE IF EXISTS `{dest}`")
+    elif copy_data and resume and _MigrationCheckpoint(connection, dest, task).done:
+        raise DataJointError(
+            f"`{dest}` already holds a completed copy of `{source}`, which may be out of date. "
+            "Pass overwrite=True to copy it again."
+        )
+
     # Create destination schema if not exists
     connection.query(f"CREATE DATABASE IF NOT EXISTS `{dest}`")
 
-    # Get all tables from source schema
+    # Get all tables from source schema (except migration progress, which belongs to each schema)
     tables_query = """
         SELECT TABLE_NAME
         FROM information_schema.TABLES
-        WHERE TABLE_SCHEMA = %s
+        WHERE TABLE_SCHEMA = %s AND TABLE_NAME != %s
         ORDER BY TABLE_NAME
     """
-    tables = [row[0] for row in connection.query(tables_query, args=(source,)).fetchall()]
+    tables = [row[0] for row in connection.query(tables_query, args=(source, MIGRATION_STATE_TABLE)).fetchall()]
+    existing = {row[0] for row in connection.query(tables_query, args=(dest, MIGRATION_STATE_TABLE)).fetchall()}
 
     result = {
         "tables_created": 0,
         "data_copied": copy_data,
         "tables": [],
+        "rows_copied": 0,
     }
 
-    for table in tables:
-        # Get CREATE TABLE statement from source
-        create_stmt = connection.query(f"SHOW CREATE TABLE `{source}`.`{table}`").fetchone()[1]
-
-        # Replace schema name in CREATE statement
-        create_stmt = create_stmt.replace(f"CREATE TABLE `{table}`", f"CREATE TABLE `{dest}`.`{table}`")
+    for level in _dependency_levels(connection, source, tables):
+        for table in level:
+            if resume and table in existing:
+                logger.info(f"{dest}.{table} already exists")
+            else:
+                # Get CREATE TABLE statement from source
+                create_stmt = connection.query(f"SHOW CREATE TABLE `{source}`.`{table}`").fetchone()[1]
 
-        # Create table in destination
-        connection.query(create_stmt)
+                # Replace schema name in CREATE statement
+                create_stmt = create_stmt.replace(f"CREATE TABLE `{table}`", f"CREATE TABLE `{dest}`.`{table}`")
 
-        result["tables_created"] += 1
-        result["tables"].append(table)
+                # Create table in destination
+                connection.query(create_stmt)
+                logger.info(f"Created {dest}.{table}")
+                result["tables_created"] += 1
 
-        # Copy data if requested
-        if copy_data:
-            connection.query(f"INSERT INTO `{dest}`.`{table}` SELECT * FROM `{source}`.`{table}`")
+            result["tables"].append(table)
 
-        logger.info(f"Created {dest}.{table}")
+    # Copy data if requested
+    if copy_data:
+        rows = _copy_tables(connection, source, dest, tables, workers=workers, batch_size=batch_size, resume=resume)
+        result["rows_copied"] = sum(rows.values())
+        _MigrationCheckpoint(connection, dest, task, resume=False).save(done=True)
 
     logger.info(f"Created {result['tables_created']} tables in {dest}")
 
     return result
 
 
+def _copy_task(source_schema: str, table: str, where_clause: str | None = None, limit: int | None = None) -> str:
+    """Name of the checkpoint of a copy; a filtered copy is a different task from a full copy of the same table."""
+    task = f"copy_table_data:{source_schema}.{table}"
+    if where_clause or limit:
+        task += ":" + hashlib.md5(f"{where_clause}|{limit}".encode()).hexdigest()[:12]
+    return task
+
+
 def copy_table_data(
     source_schema: str,
     dest_schema: str,
@@ -1750,10 +2531,19 @@ def copy_table_data(
     limit: int | None = None,
     where_clause: str | None = None,
     connection=None,
+    batch_size: int = MIGRATION_BATCH_SIZE,
+    resume: bool = True,
 ) -> dict:
     """
     Copy data from production table to test table.
 
+    Rows are copied in primary-key ranges of ``batch_size`` rows (keyset
+    chunks), each committed in its own transaction together with the copy's
+    progress in the destination's ``~migration_state`` table. Locks and undo
+    are therefore bounded by one chunk, and an interrupted copy resumes after
+    the last committed chunk. Tables without a primary key are copied in a
+    single statement.
+
     Parameters
     ----------
     source_schema : str
@@ -1768,12 +2558,19 @@ def copy_table_data(
         SQL WHERE clause for filtering (without 'WHERE' keyword)
     connection : Connection, optional
         Database connection. If None, uses default connection.
+    batch_size : int, optional
+        Rows per chunk. Default 1000.
+    resume : bool, optional
+        If True (default), continue an interrupted copy. A completed copy is
+        not resumed and raises DataJointError. If False, copy from the first row.
 
     Returns
     -------
     dict
-        - rows_copied: int - number of rows copied
+        - rows_copied: int - number of rows copied (including earlier runs when resumed)
         - time_taken: float - seconds elapsed
+        - resumed: bool - whether an interrupted copy was continued
+        - throughput: dict - rows copied, rows/s and ETA
 
     Examples
     --------
@@ -1787,29 +2584,60 @@ def copy_table_data(
     ...     where_clause="session_date >= '2024-01-01'"
     ... )
     """
-    import time
     from . import conn as get_conn
 
     if connection is None:
         connection = get_conn()
 
     start_time = time.time()
+    source = f"`{source_schema}`.`{table}`"
+    dest = f"`{dest_schema}`.`{table}`"
+    throughput = _Throughput(f"copy {source_schema}.{table}", total=limit or _estimated_rows(connection, source_schema, table))
 
-    # Build query
-    query = f"INSERT INTO `{dest_schema}`.`{table}` SELECT * FROM `{source_schema}`.`{table}`"
-
-    if where_clause:
-        query += f" WHERE {where_clause}"
-
-    if limit:
-        query += f" LIMIT {limit}"
-
-    # Execute copy
-    connection.query(query)
-
-    # Get row count
-    count_query = f"SELECT COUNT(*) FROM `{dest_schema}`.`{table}`"
-    rows_copied = connection.query(count_query).fetchone()[0]
+    try:
+        pk = _primary_key(connection, source_schema, table)
+    except DataJointError:
+        # No key to chunk by: copy in one statement
+        query = f"INSERT INTO {dest} SELECT * FROM {source}"
+        if where_clause:
+            query += f" WHERE {where_clause}"
+        if limit:
+            query += f" LIMIT {limit}"
+        rows_copied = connection.query(query).rowcount
+        throughput.add(rows_copied)
+        resumed = False
+    else:
+        task = _copy_task(source_schema, table, where_clause, limit)
+        checkpoint = _MigrationCheckpoint(connection, dest_schema, task, resume=resume)
+        if checkpoint.done:
+            raise DataJointError(
+                f"{dest_schema}.{table} was already copied and may be out of date. "
+                "Empty it and pass resume=False to copy it again."
+            )
+        resumed = checkpoint.resumed
+        rows_copied = checkpoint.objects
+        throughput.resume(rows_copied)
+        checkpoint.save()  # create the progress table outside of the chunk transactions
+        lower = checkpoint.last_key
+        where = f"({where_clause})" if where_clause else None
+        for rows in _key_batches(connection, f"{source} t", pk, where=where, after=lower, batch_size=batch_size):
+            if limit:
+                if rows_copied >= limit:
+                    break
+                rows = rows[: limit - rows_copied]
+            upper = tuple(rows[-1])
+            condition, args = _key_range(pk, lower, upper)
+            with connection.transaction:
+                copied = connection.query(
+                    f"INSERT INTO {dest} SELECT t.* FROM {source} t WHERE {condition}" + (f" AND {where}" if where else ""),
+                    args=args,
+                ).rowcount
+                rows_copied += copied
+                checkpoint.objects = rows_copied
+                checkpoint.save(last_key=upper)
+            throughput.add(copied)
+            lower = upper
+        checkpoint.save(done=True)
 
     time_taken = time.time() - start_time
 
@@ -1818,19 +2646,177 @@ def copy_table_data(
     return {
         "rows_copied": rows_copied,
         "time_taken": time_taken,
+        "resumed": resumed,
+        "throughput": throughput.metrics(),
     }
 
 
+# Column types compared within the tolerance; all others must match exactly
+_APPROXIMATE_TYPES = {"float", "double", "decimal", "real", "double precision", "numeric"}
+
+
+class _TableComparison:
+    """
+    Server-side comparison of one table in two schemas.
+
+    Each primary-key range is summarized in the database by its row count,
+    the sums (and sums of absolute values) of its approximate numeric columns,
+    and the sum of 32-bit hashes of each row's key and exact-valued columns.
+    Ranges whose summaries differ are split and summarized again; ranges
+    small enough are fetched and compared row by row with NumPy.
+    """
+
+    def __init__(self, connection, prod_schema: str, test_schema: str, table: str, tolerance: float) -> None:
+        adapter = connection.adapter
+        self.connection = connection
+        self.quote = adapter.quote_identifier
+        self.postgres = adapter.backend == "postgresql"
+        self.tolerance = tolerance
+        self.tables = [adapter.make_full_table_name(prod_schema, table), adapter.make_full_table_name(test_schema, table)]
+        columns = connection.query(
+            """
+            SELECT COLUMN_NAME, DATA_TYPE FROM information_schema.COLUMNS
+            WHERE TABLE_SCHEMA = %s AND TABLE_NAME = %s ORDER BY ORDINAL_POSITION
+            """,
+            args=(prod_schema, table),
+        ).fetchall()
+        if not columns:
+            raise DataJointError(f"Table {prod_schema}.{table} not found")
+        self.columns = [name for name, _ in columns]
+        self.approximate = [name for name, data_type in columns if data_type.lower() in _APPROXIMATE_TYPES]
+        self.pk = [
+            row[0]
+            for row in connection.query(
+                """
+                SELECT kcu.COLUMN_NAME FROM information_schema.TABLE_CONSTRAINTS tc
+                JOIN information_schema.KEY_COLUMN_USAGE kcu
+                  ON kcu.CONSTRAINT_NAME = tc.CONSTRAINT_NAME AND kcu.TABLE_SCHEMA = tc.TABLE_SCHEMA
+                 AND kcu.TABLE_NAME = tc.TABLE_NAME
+                WHERE tc.TABLE_SCHEMA = %s AND tc.TABLE_NAME = %s AND tc.CONSTRAINT_TYPE = 'PRIMARY KEY'
+                ORDER BY kcu.ORDINAL_POSITION
+                """,
+                args=(prod_schema, table),
+            ).fetchall()
+        ] or self.columns  # without a primary key, rows are identified by all their values
+        exact = [c for c in self.columns if c not in self.approximate or c in self.pk]
+        self.summary_sql = ", ".join(
+            ["COUNT(*)", self._hash_sum(exact)]
+            + [f"SUM(t.{self.quote(c)}), SUM(ABS(t.{self.quote(c)}))" for c in self.approximate]
+        )
+        self.chunks_compared = 0
+        self.rows_fetched = 0
+
+    def _hash_sum(self, columns: list[str]) -> str:
+        """Sum of per-row 32-bit hashes of ``columns`` (order-independent); NULLs are flagged separately."""
+        quoted = [f"t.{self.quote(c)}" for c in columns]
+        if self.postgres:
+            nulls = " || ".join(f"({c} IS NULL)::int::text" for c in quoted)
+            values = ", ".join(f"{c}::text" for c in quoted)
+            return f"SUM(('x' || SUBSTR(MD5(CONCAT_WS('|', {nulls}, {values})), 1, 8))::bit(32)::bigint)"
+        nulls = ", ".join(f"ISNULL({c})" for c in quoted)
+        values = ", ".join(f"CAST({c} AS BINARY)" for c in quoted)
+        return f"SUM(CRC32(CONCAT_WS('|', CONCAT({nulls}), {values})))"
+
+    def _range(self, lower, upper):
+        return _key_range(self.pk, lower, upper, quote=self.quote)
+
+    def summaries(self, lower, upper, boundaries: list[tuple]) -> list[list[tuple]]:
+        """Summaries of the sub-ranges of ``(lower, upper]`` split at ``boundaries``, for both tables."""
+        condition, args = self._range(lower, upper)
+        key = ", ".join(f"t.{self.quote(c)}" for c in self.pk)
+        placeholders = ", ".join(["%s"] * len(self.pk))
+        whens = " ".join(f"WHEN ({key}) <= ({placeholders}) THEN {i}" for i in range(len(boundaries)))
+        bucket = f"CASE {whens} ELSE {len(boundaries)} END" if boundaries else "0"
+        bucket_args = [v for boundary in boundaries for v in boundary]
+        result = []
+        for table in self.tables:
+            rows = self.connection.query(
+                f"SELECT {bucket} AS bucket, {self.summary_sql} FROM {table} t WHERE {condition} GROUP BY bucket",
+                args=bucket_args + args,
+            ).fetchall()
+            found = {row[0]: tuple(row[1:]) for row in rows}
+            result.append([found.get(i, (0,)) for i in range(len(boundaries) + 1)])
+        return result
+
+    def same(self, prod: tuple, test: tuple) -> bool:
+        """Whether two range summaries agree (sums within the tolerance)."""
+        if prod[0] != test[0] or not prod[0]:
+            return prod[0] == test[0]
+        if (prod[1] or 0) != (test[1] or 0):
+            return False
+        slack = self.tolerance * prod[0]
+        return all(math.isclose(float(p or 0), float(q or 0), rel_tol=1e-9, abs_tol=slack) for p, q in zip(prod[2:], test[2:]))
+
+    def split(self, lower, upper, count: int, side: int, fanout: int) -> list[tuple]:
+        """Keys dividing ``(lower, upper]`` of one table into about ``fanout`` equal ranges."""
+        condition, args = self._range(lower, upper)
+        key = ", ".join(f"t.{self.quote(c)}" for c in self.pk)
+        outer = ", ".join(f"s.{self.quote(c)}" for c in self.pk)
+        step = max(1, -(-count // fanout))
+        rows = self.connection.query(
+            f"SELECT {outer} FROM (SELECT {key}, ROW_NUMBER() OVER (ORDER BY {key}) AS rn "
+            f"FROM {self.tables[side]} t WHERE {condition}) s WHERE MOD(s.rn, %s) = 0 ORDER BY {outer}",
+            args=args + [step],
+        ).fetchall()
+        return [tuple(row) for row in rows if upper is None or tuple(row) != tuple(upper)]
+
+    def compare_rows(self, lower, upper, discrepancies: list, limit: int) -> None:
+        """Fetch a range from both tables and compare it column by column."""
+        import numpy as np
+
+        condition, args = self._range(lower, upper)
+        select = ", ".join(f"t.{self.quote(c)}" for c in self.columns)
+        key_positions = [self.columns.index(c) for c in self.pk]
+        fetched = []
+        for table in self.tables:
+            rows = self.connection.query(f"SELECT {select} FROM {table} t WHERE {condition}", args=args).fetchall()
+            self.rows_fetched += len(rows)
+            fetched.append({tuple(row[i] for i in key_positions): row for row in rows})
+        prod, test = fetched
+        for key in sorted(prod.keys() ^ test.keys(), key=repr):
+            side = "test" if key in prod else "prod"
+            discrepancies.append(f"Key {dict(zip(self.pk, key))}: missing in {side}")
+        keys = [key for key in prod if key in test]
+        if not keys:
+            return
+        for j, column in enumerate(self.columns):
+            a = np.array([prod[key][j] for key in keys], dtype=object)
+            b = np.array([test[key][j] for key in keys], dtype=object)
+            a_null, b_null = np.equal(a, None), np.equal(b, None)
+            if column in self.approximate:
+                x = np.where(a_null, np.nan, a).astype(float)
+                y = np.where(b_null, np.nan, b).astype(float)
+                differ = (a_null != b_null) | ~np.isclose(x, y, rtol=0, atol=self.tolerance, equal_nan=True)
+            else:
+                differ = (a_null != b_null) | (~a_null & ~b_null & np.not_equal(a, b))
+            for i in np.flatnonzero(differ):
+                discrepancies.append(f"Key {dict(zip(self.pk, keys[i]))}, {column}: {a[i]!r} != {b[i]!r}")
+                if len(discrepancies) >= limit:
+                    return
+
+
 def compare_query_results(
     prod_schema: str,
     test_schema: str,
     table: str,
     tolerance: float = 1e-6,
     connection=None,
+    chunk_rows: int = 10_000,
+    fanout: int = 16,
+    max_discrepancies: int = 100,
 ) -> dict:
     """
     Compare query results between production and test schemas.
 
+    The comparison runs in the database: each table is summarized by row
+    count, sums of its floating-point and decimal columns, and a hash sum of
+    its key and other columns. Primary-key ranges whose summaries differ are
+    split into ``fanout`` sub-ranges and summarized again, so only the ranges
+    that contain differences are ever fetched. Ranges of at most
+    ``chunk_rows`` rows are fetched from both schemas and compared with NumPy:
+    floating-point and decimal columns within ``tolerance``, all others exactly.
+    Works on MySQL and PostgreSQL.
+
     Parameters
     ----------
     prod_schema : str
@@ -1843,98 +2829,89 @@ def compare_query_results(
         Tolerance for floating-point comparison. Default 1e-6.
     connection : Connection, optional
         Database connection. If None, uses default connection.
+    chunk_rows : int, optional
+        Largest range compared row by row. Default 10,000.
+    fanout : int, optional
+        Sub-ranges per differing range. Default 16.
+    max_discrepancies : int, optional
+        Stop after this many discrepancies. Default 100.
 
     Returns
     -------
     dict
         - match: bool - whether all rows match
-        - row_count: int - number of rows compared
-        - discrepancies: list - list of mismatches (if any)
+        - row_count: int - number of rows in the production table
+        - discrepancies: list - list of mismatches (if any), by primary key
+        - chunks_compared: int - ranges summarized
+        - rows_fetched: int - rows fetched for row-by-row comparison
 
     Examples
     --------
     >>> result = compare_query_results('my_pipeline', 'my_pipeline_v20', 'neuron')
     >>> if result['match']:
     ...     print(f"✓ All {result['row_count']} rows match")
+
+    Notes
+    -----
+    Range summaries screen for differences: approximate columns are compared
+    through their sums, allowing ``tolerance`` per row. Differences larger than
+    the tolerance that cancel exactly within a range can go unnoticed.
     """
     from . import conn as get_conn
 
     if connection is None:
         connection = get_conn()
 
-    # Get row counts
-    prod_count = connection.query(f"SELECT COUNT(*) FROM `{prod_schema}`.`{table}`").fetchone()[0]
-    test_count = connection.query(f"SELECT COUNT(*) FROM `{test_schema}`.`{table}`").fetchone()[0]
+    comparison = _TableComparison(connection, prod_schema, test_schema, table, tolerance)
+    discrepancies = []
+    (prod,), (test,) = comparison.summaries(None, None, [])
+    comparison.chunks_compared = 1
+
+    def drill(lower, upper, prod, test):
+        if len(discrepancies) >= max_discrepancies or comparison.same(prod, test):
+            return
+        count, side = max((prod[0], 0), (test[0], 1))
+        boundaries = comparison.split(lower, upper, count, side, fanout) if count > chunk_rows else []
+        if not boundaries:
+            comparison.compare_rows(lower, upper, discrepancies, max_discrepancies)
+            return
+        prod_parts, test_parts = comparison.summaries(lower, upper, boundaries)
+        comparison.chunks_compared += len(prod_parts)
+        bounds = [lower, *boundaries, upper]
+        for i, (p, t) in enumerate(zip(prod_parts, test_parts)):
+            drill(bounds[i], bounds[i + 1], p, t)
+
+    if prod[0] != test[0]:
+        discrepancies.append(f"Row count mismatch: prod={prod[0]}, test={test[0]}")
+    drill(None, None, prod, test)
 
-    result = {
-        "match": True,
-        "row_count": prod_count,
-        "discrepancies": [],
+    return {
+        "match": not discrepancies,
+        "row_count": prod[0],
+        "discrepancies": discrepancies[:max_discrepancies],
+        "chunks_compared": comparison.chunks_compared,
+        "rows_fetched": comparison.rows_fetched,
     }
 
-    if prod_count != test_count:
-        result["match"] = False
-        result["discrepancies"].append(f"Row count mismatch: prod={prod_count}, test={test_count}")
-        return result
-
-    # Get column info
-    columns_query = """
-        SELECT COLUMN_NAME, DATA_TYPE
-        FROM information_schema.COLUMNS
-        WHERE TABLE_SCHEMA = %s AND TABLE_NAME = %s
-        ORDER BY ORDINAL_POSITION
-    """
-    columns = connection.query(columns_query, args=(prod_schema, table)).fetchall()
-
-    # Compare data row by row (for small tables) or checksums (for large tables)
-    if prod_count <= 10000:
-        # Row-by-row comparison for small tables
-        prod_data = connection.query(f"SELECT * FROM `{prod_schema}`.`{table}` ORDER BY 1").fetchall()
-        test_data = connection.query(f"SELECT * FROM `{test_schema}`.`{table}` ORDER BY 1").fetchall()
-
-        for i, (prod_row, test_row) in enumerate(zip(prod_data, test_data)):
-            for j, (col_name, col_type) in enumerate(columns):
-                prod_val = prod_row[j]
-                test_val = test_row[j]
-
-                # Handle NULL
-                if prod_val is None and test_val is None:
-                    continue
-                if prod_val is None or test_val is None:
-                    result["match"] = False
-                    result["discrepancies"].append(f"Row {i}, {col_name}: NULL mismatch")
-                    continue
-
-                # Handle floating-point comparison
-                if col_type in ("float", "double", "decimal"):
-                    if abs(float(prod_val) - float(test_val)) > tolerance:
-                        result["match"] = False
-                        result["discrepancies"].append(f"Row {i}, {col_name}: {prod_val} != {test_val} (diff > {tolerance})")
-                else:
-                    if prod_val != test_val:
-                        result["match"] = False
-                        result["discrepancies"].append(f"Row {i}, {col_name}: {prod_val} != {test_val}")
-    else:
-        # Checksum comparison for large tables
-        checksum_query = f"CHECKSUM TABLE `{{schema}}`.`{table}`"
-        prod_checksum = connection.query(checksum_query.format(schema=prod_schema)).fetchone()[1]
-        test_checksum = connection.query(checksum_query.format(schema=test_schema)).fetchone()[1]
-
-        if prod_checksum != test_checksum:
-            result["match"] = False
-            result["discrepancies"].append(f"Checksum mismatch: prod={prod_checksum}, test={test_checksum}")
-
-    return result
-
 
 def backup_schema(
     schema: str,
     backup_name: str,
     connection=None,
+    workers: int = MIGRATION_WORKERS,
+    batch_size: int = MIGRATION_BATCH_SIZE,
+    resume: bool = True,
+    overwrite: bool = False,
 ) -> dict:
     """
     Create full backup of a schema.
 
+    Tables are copied in primary-key chunks, independent tables concurrently
+    (see :func:`create_parallel_schema`). Row counts come from the copied
+    chunks; the backup is not scanned again. Rerunning an interrupted backup
+    continues where it stopped; refreshing a completed backup requires
+    ``overwrite=True``.
+
     Parameters
     ----------
     schema : str
@@ -1943,6 +2920,14 @@ def backup_schema(
         Backup schema name (e.g., 'my_pipeline_backup_20250114')
     connection : Connection, optional
         Database connection. If None, uses default connection.
+    workers : int, optional
+        Tables copied concurrently. Default 8.
+    batch_size : int, optional
+        Rows per chunk. Default 1000.
+    resume : bool, optional
+        If True (default), continue an interrupted backup.
+    overwrite : bool, optional
+        If True, drop ``backup_name`` and back up again from scratch. Default False.
 
     Returns
     -------
@@ -1961,22 +2946,15 @@ def backup_schema(
         dest=backup_name,
         copy_data=True,
         connection=connection,
+        workers=workers,
+        batch_size=batch_size,
+        resume=resume,
+        overwrite=overwrite,
     )
 
-    # Count total rows
-    from . import conn as get_conn
-
-    if connection is None:
-        connection = get_conn()
-
-    total_rows = 0
-    for table in result["tables"]:
-        count = connection.query(f"SELECT COUNT(*) FROM `{backup_name}`.`{table}`").fetchone()[0]
-        total_rows += count
-
     return {
-        "tables_backed_up": result["tables_created"],
-        "rows_backed_up": total_rows,
+        "tables_backed_up": len(result["tables"]),
+        "rows_backed_up": result["rows_copied"],
         "backup_location": backup_name,
     }
 
@@ -1985,10 +2963,16 @@ def restore_schema(
     backup: str,
     dest: str,
     connection=None,
+    workers: int = MIGRATION_WORKERS,
+    batch_size: int = MIGRATION_BATCH_SIZE,
 ) -> dict:
     """
     Restore schema from backup.
 
+    The destination is dropped and recreated, then filled like
+    :func:`backup_schema`: chunked, concurrent, with row counts taken from
+    the copied chunks.
+
     Parameters
     ----------
     backup : str
@@ -1997,6 +2981,10 @@ def restore_schema(
         Destination schema name
     connection : Connection, optional
         Database connection. If None, uses default connection.
+    workers : int, optional
+        Tables copied concurrently. Default 8.
+    batch_size : int, optional
+        Rows per chunk. Default 1000.
 
     Returns
     -------
@@ -2022,17 +3010,13 @@ def restore_schema(
         dest=dest,
         copy_data=True,
         connection=connection,
+        workers=workers,
+        batch_size=batch_size,
     )
 
-    # Count total rows
-    total_rows = 0
-    for table in result["tables"]:
-        count = connection.query(f"SELECT COUNT(*) FROM `{dest}`.`{table}`").fetchone()[0]
-        total_rows += count
-
     return {
         "tables_restored": result["tables_created"],
-        "rows_restored": total_rows,
+        "rows_restored": result["rows_copied"],
     }
 
 
@@ -2115,6 +3099,9 @@ def migrate_external_pointers_v2(
     dest_store: str,
     copy_files: bool = False,
     connection=None,
+    workers: int = MIGRATION_WORKERS,
+    batch_size: int = MIGRATION_BATCH_SIZE,
+    resume: bool = True,
 ) -> dict:
     """
     Migrate external storage pointers from 0.14.6 to 2.0 format.
@@ -2142,13 +3129,21 @@ def migrate_external_pointers_v2(
         If False (default), JSON points to existing files.
     connection : Connection, optional
         Database connection. If None, uses default connection.
+    workers : int, optional
+        Concurrent file copies when ``copy_files`` is True. Default 8.
+    batch_size : int, optional
+        Rows per batch (one UPDATE and one checkpoint per batch). Default 1000.
+    resume : bool, optional
+        If True (default), continue an interrupted migration. If False,
+        discard saved progress; rows already converted are still skipped.
 
     Returns
     -------
     dict
         - rows_migrated: int - number of pointers migrated
         - files_copied: int - number of files copied (if copy_files=True)
-        - errors: list - any errors encountered
+        - errors: list - any errors encountered, including those of an earlier, interrupted run
+        - throughput: dict - rows processed, rows/s, bytes/s and ETA
 
     Examples
     --------
@@ -2165,12 +3160,12 @@ def migrate_external_pointers_v2(
 
     Notes
     -----
-    This function:
-    1. Reads BINARY(16) UUID from table column
-    2. Looks up file in ~external_{source_store} table
-    3. Creates JSON metadata with file path
-    4. Optionally copies file to new store location
-    5. Updates column with JSON metadata
+    This function processes the table in primary-key batches:
+    1. Reads BINARY(16) UUIDs joined with ~external_{source_store}
+    2. Creates JSON metadata with file path
+    3. Optionally copies the files to the new store, concurrently
+    4. Updates the batch's rows with a single UPDATE
+    5. Saves progress in ~migration_state, so a rerun resumes after the last batch
 
     The JSON format is:
     {
@@ -2179,10 +3174,11 @@ def migrate_external_pointers_v2(
       "hash": null,
       "ext": ".dat",
       "is_dir": false,
-      "timestamp": "2025-01-14T10:30:00+00:00"
+      "timestamp": "2025-01-14T10:30:00+00:00",
+      "store": "raw"
     }
     """
-    import json
+    import os
     from datetime import datetime, timezone
     from . import conn as get_conn
 
@@ -2214,108 +3210,110 @@ def migrate_external_pointers_v2(
         "errors": [],
     }
 
-    # Query rows with external attributes
-    query = f"""
-        SELECT * FROM `{schema}`.`{table}`
-        WHERE `{attribute}` IS NOT NULL
-    """
+    if copy_files:
+        from .hash_registry import get_store_backend
 
-    rows = connection.query(query).fetchall()
+        source_backend = get_store_backend(source_store)
+        dest_backend = get_store_backend(dest_store)
 
-    # Get column info to identify UUID column
-    col_query = """
-        SELECT ORDINAL_POSITION, COLUMN_NAME
-        FROM information_schema.COLUMNS
-        WHERE TABLE_SCHEMA = %s AND TABLE_NAME = %s
-        ORDER BY ORDINAL_POSITION
+    pk = _primary_key(connection, schema, table)
+    columns_query = """
+        SELECT COUNT(*) FROM information_schema.COLUMNS
+        WHERE TABLE_SCHEMA = %s AND TABLE_NAME = %s AND COLUMN_NAME = %s
     """
-    columns = connection.query(col_query, args=(schema, table)).fetchall()
-    col_names = [col[1] for col in columns]
-
-    # Find attribute column index
-    try:
-        attr_idx = col_names.index(attribute)
-    except ValueError:
+    if not connection.query(columns_query, args=(schema, table, attribute)).fetchone()[0]:
         raise DataJointError(f"Attribute {attribute} not found in {schema}.{table}")
 
-    for row in rows:
-        uuid_bytes = row[attr_idx]
-
-        if uuid_bytes is None:
-            continue
-
-        # Look up file info in external tracking table
-        lookup_query = f"""
-            SELECT hash, size, timestamp, filepath
-            FROM `{schema}`.`{external_table}`
-            WHERE hash = %s
-        """
-
-        file_info = connection.query(lookup_query, args=(uuid_bytes,)).fetchone()
-
-        if file_info is None:
-            result["errors"].append(f"External file not found for UUID: {uuid_bytes.hex()}")
-            continue
-
-        hash_hex, size, timestamp, filepath = file_info
-
-        # Build JSON metadata
-        # Extract extension from filepath
-        import os
-
-        ext = os.path.splitext(filepath)[1] if filepath else ""
-
-        metadata = {
-            "path": filepath,
-            "size": size,
-            "hash": hash_hex.hex() if hash_hex else None,
-            "ext": ext,
-            "is_dir": False,
-            "timestamp": timestamp.isoformat() if timestamp else datetime.now(timezone.utc).isoformat(),
-        }
-
-        # Update row with JSON metadata
-        # Build WHERE clause from primary keys
-        pk_columns = []
-        pk_values = []
-
-        # Get primary key info
-        pk_query = """
-            SELECT COLUMN_NAME
-            FROM information_schema.KEY_COLUMN_USAGE
-            WHERE TABLE_SCHEMA = %s
-              AND TABLE_NAME = %s
-              AND CONSTRAINT_NAME = 'PRIMARY'
-            ORDER BY ORDINAL_POSITION
-        """
-        pk_cols = connection.query(pk_query, args=(schema, table)).fetchall()
-
-        for pk_col in pk_cols:
-            pk_name = pk_col[0]
-            pk_idx = col_names.index(pk_name)
-            pk_columns.append(pk_name)
-            pk_values.append(row[pk_idx])
-
-        # Build UPDATE statement
-        where_parts = [f"`{col}` = %s" for col in pk_columns]
-        where_clause = " AND ".join(where_parts)
-
-        update_query = f"""
-            UPDATE `{schema}`.`{table}`
-            SET `{attribute}` = %s
-            WHERE {where_clause}
-        """
-
-        connection.query(update_query, args=(json.dumps(metadata), *pk_values))
-
-        result["rows_migrated"] += 1
+    from_clause = f"`{schema}`.`{table}` t LEFT JOIN `{schema}`.`{external_table}` e ON t.`{attribute}` = e.hash"
+    unconverted = f"t.`{attribute}` IS NOT NULL AND NOT JSON_VALID(t.`{attribute}`)"
+
+    checkpoint = _MigrationCheckpoint(connection, schema, f"migrate_external_pointers_v2:{table}.{attribute}", resume=resume)
+    result["rows_migrated"] = checkpoint.state.get("rows", 0)
+    result["files_copied"] = checkpoint.state.get("files", 0)
+    if checkpoint.done or checkpoint.last_key is not None:
+        # Rows an earlier run could not convert are still unconverted behind its last key
+        condition, args = _key_range(pk, None, None if checkpoint.done else checkpoint.last_key)
+        pk_sql = ", ".join(f"t.`{c}`" for c in pk)
+        for row in connection.query(
+            f"SELECT {pk_sql}, t.`{attribute}`, e.filepath FROM {from_clause} WHERE {unconverted} AND {condition}", args=args
+        ).fetchall():
+            key, (uuid_bytes, filepath) = row[: len(pk)], row[len(pk) :]
+            if filepath is None:
+                result["errors"].append(f"External file not found for UUID: {uuid_bytes.hex()}")
+            else:
+                result["errors"].append(f"Could not copy for key {key} in an earlier run")
+    if checkpoint.done:
+        logger.info(f"{schema}.{table}.{attribute} already migrated")
+        return result
+    throughput = _Throughput(
+        f"migrate_external_pointers_v2({schema}.{table}.{attribute})", total=_estimated_rows(connection, schema, table)
+    )
+    throughput.resume(checkpoint.objects, checkpoint.bytes)
+
+    # Rows whose attribute is still a BINARY(16) UUID are joined with their
+    # ~external entry; rows already holding JSON (from an earlier run) are skipped.
+    batches = _key_batches(
+        connection,
+        from_clause,
+        pk,
+        columns=[f"t.`{attribute}`", "e.size", "e.timestamp", "e.filepath"],
+        where=unconverted,
+        after=checkpoint.last_key,
+        batch_size=batch_size,
+    )
+    n = len(pk)
+    for rows in batches:
+        updates = []
+        for row in rows:
+            uuid_bytes, size, timestamp, filepath = row[n:]
+            if filepath is None:
+                result["errors"].append(f"External file not found for UUID: {uuid_bytes.hex()}")
+                continue
+            metadata = {
+                "path": filepath,
+                "size": size,
+                "hash": uuid_bytes.hex(),
+                "ext": os.path.splitext(filepath)[1],
+                "is_dir": False,
+                "timestamp": timestamp.isoformat() if timestamp else datetime.now(timezone.utc).isoformat(),
+                "store": dest_store,
+            }
+            updates.append((row[:n], metadata))
+
+        if copy_files and updates:
+
+            def copy(path):
+                with source_backend.open(path, "rb") as f:
+                    dest_backend.put_stream(f, path)
+
+            with ThreadPoolExecutor(max_workers=max(1, min(workers, len(updates)))) as pool:
+                futures = {pool.submit(copy, metadata["path"]): key for key, metadata in updates}
+            failed = set()
+            for future, key in futures.items():
+                if future.exception() is not None:
+                    failed.add(key)
+                    result["errors"].append(f"Could not copy for key {key}: {future.exception()}")
+            updates = [(key, metadata) for key, metadata in updates if key not in failed]
+            result["files_copied"] += len(updates)
+
+        # One UPDATE per batch
+        _update_from_values(
+            connection,
+            f"`{schema}`.`{table}`",
+            pk,
+            attribute,
+            [(key, json.dumps(metadata)) for key, metadata in updates],
+        )
+        result["rows_migrated"] += len(updates)
 
-        # Copy file if requested
-        if copy_files:
-            # TODO: Implement file copying using fsspec
-            # This requires knowing source and dest store locations
-            logger.warning("File copying not yet implemented in migrate_external_pointers_v2")
+        checkpoint.objects += len(rows)
+        checkpoint.bytes += sum(metadata["size"] or 0 for _, metadata in updates)
+        checkpoint.state = {"rows": result["rows_migrated"], "files": result["files_copied"]}
+        checkpoint.save(last_key=rows[-1][:n])
+        throughput.add(len(rows), sum(metadata["size"] or 0 for _, metadata in updates))
+    checkpoint.save(done=True)
 
+    result["throughput"] = throughput.metrics()
     logger.info(f"Migrated {result['rows_migrated']} external pointers for {schema}.{table}.{attribute}")
 
     return result
@@ -7,16 +7,17 @@ access and direct fsspec-based file operations.
 """
 
 import json
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import IO, Iterator
+from typing import IO, Iterable, Iterator
 
 import fsspec
 
-from .errors import DataJointError
-from .hash_registry import compute_hash
-from .storage import StorageBackend
+from .errors import DataJointError, MissingExternalFile
+from .hash_registry import DEFAULT_HASH_ALGORITHM, compute_hash
+from .storage import DEFAULT_MAX_WORKERS, STREAM_CHUNK_SIZE, StorageBackend
 
 
 class IntegrityError(DataJointError):
@@ -333,8 +334,10 @@ class ObjectRef:
         """
         Verify object integrity.
 
-        For files: checks size matches, and hash if available.
-        For folders: validates manifest (all files exist with correct sizes).
+        For files: checks size matches, and hash if available. The hash is
+        computed from a streaming read (``algorithm:digest``; md5 if no prefix).
+        For folders: validates manifest (all files exist with correct sizes)
+        against a single detailed listing of the folder.
 
         Returns
         -------
@@ -354,50 +357,51 @@ class ObjectRef:
             return self._verify_file()
 
     def _verify_file(self) -> bool:
-        """Verify a single file."""
-        # Check existence
-        if not self._backend.exists(self.path):
-            raise IntegrityError(f"File does not exist: {self.path}")
+        """Verify a single file: one metadata request, then a streaming hash."""
+        full_path = self._backend._full_path(self.path)
+        try:
+            info = self._backend.fs.info(full_path)
+        except FileNotFoundError:
+            raise IntegrityError(f"File does not exist: {self.path}") from None
 
         # Check size if available
-        if self.size is not None:
-            actual_size = self._backend.size(self.path)
-            if actual_size != self.size:
-                raise IntegrityError(f"Size mismatch for {self.path}: expected {self.size}, got {actual_size}")
+        if self.size is not None and info.get("size") != self.size:
+            raise IntegrityError(f"Size mismatch for {self.path}: expected {self.size}, got {info.get('size')}")
 
-        # Check hash if available
+        # Check hash if available — read in chunks, never the whole object at once
         if self.hash:
-            content = self._backend.get_buffer(self.path)
-            actual_hash = compute_hash(content)
-            if actual_hash != self.hash:
-                raise IntegrityError(f"Hash mismatch for {self.path}: expected {self.hash}, got {actual_hash}")
+            algorithm, _, expected = self.hash.rpartition(":")
+            with self._backend.open(self.path, "rb") as f:
+                actual_hash = compute_hash(iter(lambda: f.read(STREAM_CHUNK_SIZE), b""), algorithm or DEFAULT_HASH_ALGORITHM)
+            if actual_hash != expected:
+                raise IntegrityError(f"Hash mismatch for {self.path}: expected {expected}, got {actual_hash}")
 
         return True
 
     def _verify_folder(self) -> bool:
-        """Verify a folder using its manifest."""
-        manifest_path = f"{self.path}.manifest.json"
-
-        if not self._backend.exists(manifest_path):
+        """Verify a folder against its manifest using a single detailed listing."""
+        try:
+            manifest = json.loads(self._backend.get_buffer(f"{self.path}.manifest.json"))
+        except MissingExternalFile:
             # Directory was stored without a manifest — treat as unverified but valid
             return True
 
-        # Read manifest
-        manifest_data = self._backend.get_buffer(manifest_path)
-        manifest = json.loads(manifest_data)
+        # One listing with sizes for the whole folder, compared in memory
+        full_path = self._backend._full_path(self.path).rstrip("/")
+        try:
+            listing = self._backend.fs.find(full_path, detail=True)
+        except FileNotFoundError:
+            listing = {}
+        stored = {name[len(full_path) :].lstrip("/"): info.get("size") for name, info in listing.items()}
 
-        # Verify each file in manifest
         errors = []
         for file_info in manifest.get("files", []):
-            file_path = f"{self.path}/{file_info['path']}"
+            rel_path = file_info["path"]
             expected_size = file_info["size"]
-
-            if not self._backend.exists(file_path):
-                errors.append(f"Missing file: {file_info['path']}")
-            else:
-                actual_size = self._backend.size(file_path)
-                if actual_size != expected_size:
-                    errors.append(f"Size mismatch for {file_info['path']}: expected {expected_size}, got {actual_size}")
+            if rel_path not in stored:
+                errors.append(f"Missing file: {rel_path}")
+            elif stored[rel_path] != expected_size:
+                errors.append(f"Size mismatch for {rel_path}: expected {expected_size}, got {stored[rel_path]}")
 
         if errors:
             raise IntegrityError("Folder verification failed:\n" + "\n".join(errors))
@@ -410,3 +414,40 @@ class ObjectRef:
 
     def __str__(self) -> str:
         return self.path
+
+
+def verify_many(refs: Iterable[ObjectRef], workers: int = DEFAULT_MAX_WORKERS) -> dict[str, Exception]:
+    """
+    Verify many objects in parallel, e.g. to audit every object of a table.
+
+    Parameters
+    ----------
+    refs : iterable of ObjectRef
+        Objects to verify, such as ``table.to_arrays("field")``.
+    workers : int, optional
+        Objects verified concurrently. Default 8.
+
+    Returns
+    -------
+    dict[str, Exception]
+        Failed objects, keyed by path: an ``IntegrityError`` for objects that are
+        missing or corrupt, or the storage or network error that prevented the
+        check. Empty if every object verified.
+
+    Examples
+    --------
+    >>> failures = dj.verify_many(Recording.to_arrays("raw_data"), workers=32)
+    >>> assert not failures, failures
+    """
+
+    def check(ref: ObjectRef) -> Exception | None:
+        try:
+            ref.verify()
+        except Exception as e:  # one unreachable object must not abort the audit
+            return e
+        return None
+
+    refs = [ref for ref in refs if ref is not None]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = pool.map(check, refs)
+        return {ref.path: error for ref, error in zip(refs, results) if error is not None}
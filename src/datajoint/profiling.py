@@ -0,0 +1,352 @@
+"""
+Query instrumentation: hooks around database round trips, operation tags, and profiles.
+
+Every query sent by :meth:`Connection.query <datajoint.connection.Connection.query>`
+is described by a :class:`QueryEvent` with its SQL, duration, row count, and size,
+and the DataJoint operations it was issued for, such as ``insert``, ``to_pandas``,
+``populate.make``, or ``delete.cascade``. Functions registered with
+:func:`add_query_hook` receive each event before and after the round trip, and
+:func:`profile` aggregates the events into a per-operation report.
+
+Instrumentation costs nothing beyond a flag check while no hooks or profiles are active.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import dataclasses
+import functools
+import threading
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from typing import Any, Callable
+
+_before_hooks: list[Callable] = []
+_after_hooks: list[Callable] = []
+_profiles: list[Profile] = []
+
+# stack of the operations being run in the current thread or task, outermost first
+_operations: contextvars.ContextVar[tuple] = contextvars.ContextVar("datajoint_operations", default=())
+# tokens to restore _operations on leaving each active ``operation`` block, innermost last;
+# None for blocks that did not push a frame
+_tokens: contextvars.ContextVar[tuple[contextvars.Token[tuple] | None, ...]] = contextvars.ContextVar(
+    "datajoint_operation_tokens", default=()
+)
+
+
+class _Frame:
+    __slots__ = ("name", "fetch", "start", "totals")
+
+    def __init__(self, name, fetch):
+        self.name = name
+        self.fetch = fetch
+        self.start = time.perf_counter()
+        self.totals = None  # Counter of the queries recorded while profiling
+
+
+@dataclasses.dataclass
+class QueryEvent:
+    """
+    One query sent to the database server.
+
+    Attributes
+    ----------
+    sql : str
+        SQL statement.
+    args : tuple
+        Statement arguments.
+    connection : Connection
+        Connection the query was sent on.
+    operations : tuple of str
+        DataJoint operations being run, outermost first, e.g.
+        ``("populate", "populate.make", "insert")``.
+    start : float
+        Time the query was sent, as ``time.time()``.
+    duration : float or None
+        Seconds to the server's response. None before the query returns.
+    rowcount : int or None
+        Rows returned by a query or affected by a statement. None for streamed queries.
+    nbytes : int or None
+        Approximate size of the returned rows, or of the statement and its arguments
+        for statements that return no rows. None for streamed queries.
+    error : Exception or None
+        Error raised by the query, if any.
+    """
+
+    sql: str
+    args: tuple
+    connection: Any
+    operations: tuple[str, ...]
+    start: float
+    duration: float | None = None
+    rowcount: int | None = None
+    nbytes: int | None = None
+    error: Exception | None = None
+
+    @property
+    def operation(self) -> str | None:
+        """Innermost operation, or None for queries issued outside DataJoint operations."""
+        return self.operations[-1] if self.operations else None
+
+
+def add_query_hook(before: Callable | None = None, after: Callable | None = None) -> None:
+    """
+    Register functions to call with a :class:`QueryEvent` around every query.
+
+    Hooks run in the thread issuing the query, so they should be fast. Exceptions
+    raised by a hook propagate to the caller; a ``before`` hook can veto a query
+    this way.
+
+    Parameters
+    ----------
+    before : callable, optional
+        Called with the event before the query is sent.
+    after : callable, optional
+        Called with the event after the query returns or fails, with ``duration``,
+        ``rowcount``, ``nbytes``, and ``error`` set.
+
+    Examples
+    --------
+    >>> def record(event):
+    ...     metrics.histogram("dj.query", event.duration, tags={"operation": event.operation})
+    >>> dj.add_query_hook(after=record)
+    """
+    if before is not None:
+        _before_hooks.append(before)
+    if after is not None:
+        _after_hooks.append(after)
+
+
+def remove_query_hook(before: Callable | None = None, after: Callable | None = None) -> None:
+    """
+    Unregister functions registered with :func:`add_query_hook`.
+
+    Parameters
+    ----------
+    before : callable, optional
+        ``before`` hook to remove.
+    after : callable, optional
+        ``after`` hook to remove.
+    """
+    if before is not None:
+        _before_hooks.remove(before)
+    if after is not None:
+        _after_hooks.remove(after)
+
+
+def enabled() -> bool:
+    """True if any hooks or profiles are active."""
+    return bool(_before_hooks or _after_hooks or _profiles)
+
+
+class operation:
+    """
+    Tag the queries issued within a block with a DataJoint operation.
+
+    Use as a context manager or as a decorator. Operations nest: an ``insert`` within
+    ``populate.make`` is reported as both. One instance may be entered recursively
+    and from several threads at once, since its state is kept per thread or task.
+
+    Parameters
+    ----------
+    name : str
+        Operation name, e.g. ``"insert"`` or ``"populate.make"``.
+    fetch : bool, optional
+        True for fetch methods. A fetch called by another fetch (``to_dicts`` by
+        ``to_pandas``) is reported as part of the outer one only. Default False.
+    """
+
+    __slots__ = ("name", "fetch")
+
+    def __init__(self, name: str, fetch: bool = False) -> None:
+        self.name = name
+        self.fetch = fetch
+
+    def __enter__(self) -> None:
+        stack = _operations.get()
+        if self.fetch and stack and stack[-1].fetch:
+            token = None
+        else:
+            token = _operations.set(stack + (_Frame(self.name, self.fetch),))
+        _tokens.set(_tokens.get() + (token,))
+
+    def __exit__(self, *exc_info) -> None:
+        tokens = _tokens.get()
+        token = tokens[-1]
+        _tokens.set(tokens[:-1])
+        if token is None:
+            return
+        frame = _operations.get()[-1]
+        _operations.reset(token)
+        if _profiles:
+            seconds = time.perf_counter() - frame.start
+            for profile in list(_profiles):
+                profile._add_operation(frame, seconds)
+
+    def __call__(self, func: Callable) -> Callable:
+        name, fetch = self.name, self.fetch
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with operation(name, fetch):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+
+def current_operations() -> tuple[str, ...]:
+    """Names of the operations being run in the current thread or task, outermost first."""
+    return tuple(frame.name for frame in _operations.get())
+
+
+def _args_nbytes(args) -> int:
+    return sum(len(arg) if isinstance(arg, (bytes, str)) else 8 for arg in args or ())
+
+
+def before_query(connection, sql: str, args) -> QueryEvent:
+    """Create the event for a query about to be sent and call the ``before`` hooks."""
+    event = QueryEvent(sql, args, connection, current_operations(), time.time())
+    for hook in list(_before_hooks):
+        hook(event)
+    return event
+
+
+def after_query(event: QueryEvent) -> None:
+    """Call the ``after`` hooks with a completed event and add it to active profiles."""
+    if _profiles:
+        for frame in _operations.get():
+            if frame.totals is None:
+                frame.totals = Counter()
+            frame.totals.update(queries=1, database_seconds=event.duration, rows=event.rowcount or 0, nbytes=event.nbytes or 0)
+        for profile in list(_profiles):
+            profile._add_query(event)
+    for hook in list(_after_hooks):
+        hook(event)
+
+
+class Profile:
+    """
+    Queries and operations recorded by :func:`profile`.
+
+    Attributes
+    ----------
+    queries : list of QueryEvent
+        Every query, in order, without its arguments.
+    operations : dict
+        Totals per operation name: ``calls``, ``seconds`` (wall time, including
+        nested operations), ``database_seconds``, ``queries``, ``rows``, and
+        ``nbytes``. Queries issued outside any operation are totaled under None.
+    seconds : float
+        Wall time of the profiled block.
+    """
+
+    def __init__(self) -> None:
+        self.queries: list[QueryEvent] = []
+        self.operations: defaultdict[str | None, Counter] = defaultdict(Counter)
+        self.seconds = 0.0
+        self._lock = threading.Lock()  # queries may come from several threads
+
+    def __repr__(self) -> str:
+        database_seconds = sum(event.duration or 0.0 for event in self.queries)
+        return f"Profile({len(self.queries)} queries, {database_seconds:.3f} s of {self.seconds:.3f} s in the database)"
+
+    def __str__(self) -> str:
+        return self.report()
+
+    def _add_query(self, event: QueryEvent) -> None:
+        with self._lock:
+            self.queries.append(dataclasses.replace(event, args=()))
+            if event.operations:
+                return
+            totals: dict[str, Any] = dict(
+                calls=1,
+                seconds=event.duration,
+                database_seconds=event.duration,
+                queries=1,
+                rows=event.rowcount or 0,
+                nbytes=event.nbytes or 0,
+            )
+            self.operations[None].update(totals)
+
+    def _add_operation(self, frame: _Frame, seconds: float) -> None:
+        with self._lock:
+            totals = self.operations[frame.name]
+            totals.update(frame.totals or {})
+            totals.update({"calls": 1, "seconds": seconds})
+
+    def slowest(self, n: int = 10) -> list[QueryEvent]:
+        """
+        The ``n`` slowest queries, slowest first.
+
+        Parameters
+        ----------
+        n : int, optional
+            Number of queries. Default 10.
+
+        Returns
+        -------
+        list of QueryEvent
+        """
+        return sorted(self.queries, key=lambda event: event.duration or 0.0, reverse=True)[:n]
+
+    def report(self, slowest: int = 5) -> str:
+        """
+        Tabulate time, queries, rows, and bytes per operation, slowest first.
+
+        ``client s`` is the operation's time outside the database: decoding, object
+        stores, and computation in ``make``.
+
+        Parameters
+        ----------
+        slowest : int, optional
+            Number of slowest queries to list below the table. Default 5.
+
+        Returns
+        -------
+        str
+        """
+        header = f"{'operation':<24}{'calls':>8}{'total s':>10}{'database s':>12}{'client s':>10}"
+        lines = [header + f"{'queries':>9}{'rows':>10}{'MB':>9}", "-" * 92]
+        for name, totals in sorted(self.operations.items(), key=lambda item: -item[1]["seconds"]):
+            lines.append(
+                f"{name or '(no operation)':<24}{totals['calls']:>8}{totals['seconds']:>10.3f}"
+                f"{totals['database_seconds']:>12.3f}{totals['seconds'] - totals['database_seconds']:>10.3f}"
+                f"{totals['queries']:>9}{totals['rows']:>10}{totals['nbytes'] / 2**20:>9.2f}"
+            )
+        lines.append(f"{len(self.queries)} queries in {self.seconds:.3f} s")
+        if slowest and self.queries:
+            lines.append("slowest queries:")
+            for event in self.slowest(slowest):
+                lines.append(f"  {event.duration:8.4f} s  {event.operation or '-':<16} {' '.join(event.sql.split())[:60]}")
+        return "\n".join(lines)
+
+
+@contextmanager
+def profile():
+    """
+    Record the queries and operations run within the block.
+
+    Queries from all threads of the process are recorded, including those of pooled
+    connections. Queries run by ``populate(processes=n)`` workers in other processes
+    are not.
+
+    Yields
+    ------
+    Profile
+        Filled in as the block runs.
+
+    Examples
+    --------
+    >>> with dj.profile() as p:
+    ...     Session.populate()
+    >>> print(p.report())
+    """
+    result = Profile()
+    start = time.perf_counter()
+    _profiles.append(result)
+    try:
+        yield result
+    finally:
+        _profiles.remove(result)
+        result.seconds = time.perf_counter() - start
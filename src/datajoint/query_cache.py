@@ -0,0 +1,325 @@
+"""
+In-process cache of query results with automatic invalidation.
+
+A :class:`QueryCache` keeps the rows of recent queries in memory, bounded by bytes and
+evicted least recently used first, with an optional disk tier for evicted results.
+Each entry is tagged with the tables its query reads. Every statement that modifies
+a table through a connection using the cache (insert, delete, update, alter, drop)
+bumps that table's version and drops the entries tagged with it; dropping a schema
+does so for all of its tables.
+
+Enable it on a connection with :meth:`Connection.set_result_cache
+<datajoint.connection.Connection.set_result_cache>`. One cache may serve several
+connections, such as those of a :class:`~datajoint.connection.ConnectionPool`.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import pathlib
+import pickle
+import re
+import sys
+import threading
+import time
+from collections import Counter, OrderedDict, defaultdict, namedtuple
+
+# full table names as quoted by the MySQL and PostgreSQL adapters
+_TABLE_NAMES = {"`": re.compile(r"`[^`]+`\.`[^`]+`"), '"': re.compile(r'"[^"]+"\."[^"]+"')}
+# schema quoted as by the adapters in DROP DATABASE (MySQL) or DROP SCHEMA (PostgreSQL)
+_DROPPED_SCHEMA = {q: re.compile(rf"\s*DROP\s+(?:DATABASE|SCHEMA)\s+(?:IF\s+EXISTS\s+)?({q}[^{q}]+{q})", re.I) for q in '`"'}
+
+_Entry = namedtuple("_Entry", "rows tables nbytes expires")  # rows is None for entries on disk
+
+
+def tables_in(query: str, adapter) -> frozenset[str]:
+    """
+    Full names of the tables a SQL statement refers to.
+
+    These are the tables in the FROM clause of a query expression (its support) and
+    in the subqueries of its restrictions, or the tables a statement modifies.
+
+    Parameters
+    ----------
+    query : str
+        SQL statement.
+    adapter : DatabaseAdapter
+        Adapter of the connection, which determines identifier quoting.
+
+    Returns
+    -------
+    frozenset of str
+        Full table names, quoted as in ``Table.full_table_name``.
+    """
+    return frozenset(_TABLE_NAMES[adapter.quote_identifier("x")[0]].findall(query))
+
+
+def dropped_schema(query: str, adapter) -> str | None:
+    """
+    Schema dropped by a SQL statement.
+
+    Parameters
+    ----------
+    query : str
+        SQL statement.
+    adapter : DatabaseAdapter
+        Adapter of the connection, which determines identifier quoting.
+
+    Returns
+    -------
+    str or None
+        Quoted schema name if ``query`` drops a schema, else None.
+    """
+    match = _DROPPED_SCHEMA[adapter.quote_identifier("x")[0]].match(query)
+    return match.group(1) if match else None
+
+
+def _schema_of(table: str) -> str:
+    """Quoted schema name of a quoted full table name."""
+    quote = table[0]
+    return table[: table.index(quote + "." + quote) + 1]
+
+
+def _sizeof(rows) -> int:
+    """Approximate memory held by fetched rows."""
+    size = sys.getsizeof(rows)
+    for row in rows:
+        size += sys.getsizeof(row) + sum(map(sys.getsizeof, row.values() if isinstance(row, dict) else row))
+    return size
+
+
+class QueryCache:
+    """
+    Cache of query results in memory, with an optional disk tier, invalidated per table.
+
+    Parameters
+    ----------
+    max_bytes : int, optional
+        Memory budget. Least recently used results beyond it are evicted, to the disk
+        tier if there is one. Default 64 MiB.
+    path : str or Path, optional
+        Directory for the disk tier. Results left there by earlier sessions are
+        removed, since changes made in the meantime cannot be tracked. Default None
+        (memory only).
+    disk_max_bytes : int, optional
+        Disk budget. Default 1 GiB.
+    ttl : float, optional
+        Seconds after which results expire. Tables modified outside connections using
+        this cache (other processes, other clients) are not tracked; ``ttl`` bounds
+        how stale their cached results can get. Default None (no expiry).
+
+    Attributes
+    ----------
+    stats : collections.Counter
+        Numbers of ``hits``, ``disk_hits``, ``misses``, ``evictions``, and
+        ``invalidations``.
+
+    Examples
+    --------
+    >>> conn.set_result_cache(dj.QueryCache(max_bytes=256 * 2**20, ttl=60))
+    >>> (Session & key).to_dicts()  # queries the database
+    >>> (Session & key).to_dicts()  # served from the cache until Session changes
+    """
+
+    suffix = ".djqc"
+
+    def __init__(
+        self,
+        max_bytes: int = 64 * 2**20,
+        path: str | pathlib.Path | None = None,
+        disk_max_bytes: int = 2**30,
+        ttl: float | None = None,
+    ) -> None:
+        self.max_bytes = max_bytes
+        self.disk_max_bytes = disk_max_bytes
+        self.ttl = ttl
+        self.path = None if path is None else pathlib.Path(path)
+        self.stats: Counter[str] = Counter()
+        self._memory: OrderedDict[str, _Entry] = OrderedDict()  # key -> _Entry, least recently used first
+        self._disk: OrderedDict[str, _Entry] = OrderedDict()
+        self._memory_bytes = self._disk_bytes = 0
+        self._tagged: defaultdict[str, set[str]] = defaultdict(set)  # table -> keys of the entries that read it
+        self._versions: Counter[str] = Counter()  # table or schema -> number of changes
+        self._lock = threading.RLock()
+        if self.path is not None:
+            self.path.mkdir(parents=True, exist_ok=True)
+            for stale in self.path.glob("*" + self.suffix):
+                stale.unlink()
+
+    def __len__(self) -> int:
+        return len(self._memory) + len(self._disk)
+
+    def __repr__(self) -> str:
+        disk = f", {len(self._disk)} on disk ({self._disk_bytes} bytes)" if self.path is not None else ""
+        return f"QueryCache({len(self._memory)} in memory ({self._memory_bytes} bytes){disk})"
+
+    @staticmethod
+    def key(query: str, args=(), as_dict: bool = False) -> str:
+        """Cache key of a query with its arguments and row format."""
+        return hashlib.md5(query.encode() + pickle.dumps(args) + bytes([as_dict])).hexdigest()
+
+    def snapshot(self, tables) -> tuple:
+        """
+        Versions of ``tables``, taken before running a query whose result goes to :meth:`put`.
+
+        Parameters
+        ----------
+        tables : iterable of str
+            Full names of the tables the query reads.
+
+        Returns
+        -------
+        tuple
+            Opaque token for :meth:`put`.
+        """
+        with self._lock:
+            return tuple((self._versions[table], self._versions[_schema_of(table)]) for table in sorted(tables))
+
+    def get(self, key: str):
+        """
+        Return the cached rows for ``key``, or None.
+
+        Parameters
+        ----------
+        key : str
+            Key from :meth:`key`.
+
+        Returns
+        -------
+        tuple or list or None
+            Rows as fetched from the cursor, or None on a miss.
+        """
+        with self._lock:
+            entry = self._memory.get(key)
+            tier = "hits"
+            if entry is None:
+                entry = self._disk.get(key)
+                tier = "disk_hits"
+            if entry is None or entry.expires is not None and entry.expires < time.monotonic():
+                if entry is not None:
+                    self._remove(key)
+                self.stats["misses"] += 1
+                return None
+            self.stats[tier] += 1
+            if entry.rows is not None:
+                self._memory.move_to_end(key)
+                return entry.rows
+            # promote from disk to memory
+            rows = pickle.loads(self._file(key).read_bytes())
+            self._remove(key)
+            self._add(key, _Entry(rows, entry.tables, _sizeof(rows), entry.expires))
+            return rows
+
+    def put(self, key: str, rows, tables, snapshot: tuple) -> None:
+        """
+        Cache the rows of a query unless the tables it read changed while it ran.
+
+        Parameters
+        ----------
+        key : str
+            Key from :meth:`key`.
+        rows : tuple or list
+            Rows fetched from the cursor.
+        tables : iterable of str
+            Full names of the tables the query reads.
+        snapshot : tuple
+            Token from :meth:`snapshot` taken before the query was run.
+        """
+        tables = frozenset(tables)
+        nbytes = _sizeof(rows)
+        with self._lock:
+            if snapshot != self.snapshot(tables) or nbytes > self.max_bytes:
+                return
+            self._remove(key)
+            self._add(key, _Entry(rows, tables, nbytes, None if self.ttl is None else time.monotonic() + self.ttl))
+
+    def invalidate(self, tables) -> None:
+        """
+        Drop the results that read any of ``tables`` and bump their versions.
+
+        Called automatically for statements that modify tables through a connection
+        using this cache. Call it for tables modified by other means.
+
+        Parameters
+        ----------
+        tables : str or iterable of str
+            Full table names, e.g. ``Session.full_table_name``.
+        """
+        if isinstance(tables, str):
+            tables = [tables]
+        with self._lock:
+            for table in tables:
+                self._versions[table] += 1
+                for key in list(self._tagged.get(table, ())):
+                    self._remove(key)
+                    self.stats["invalidations"] += 1
+
+    def invalidate_schema(self, schema: str) -> None:
+        """
+        Drop the results that read any table of ``schema`` and bump its version.
+
+        Called automatically when a connection using this cache drops a schema.
+
+        Parameters
+        ----------
+        schema : str
+            Quoted schema name, e.g. ```` `lab` ````.
+        """
+        with self._lock:
+            self._versions[schema] += 1
+            for table in [table for table in self._tagged if _schema_of(table) == schema]:
+                for key in list(self._tagged.get(table, ())):
+                    self._remove(key)
+                    self.stats["invalidations"] += 1
+
+    def clear(self) -> None:
+        """Drop all cached results."""
+        with self._lock:
+            for key in list(self._memory) + list(self._disk):
+                self._remove(key)
+
+    def _file(self, key: str) -> pathlib.Path:
+        assert self.path is not None, "no disk tier"
+        return self.path / (key + self.suffix)
+
+    def _add(self, key: str, entry: _Entry) -> None:
+        self._memory[key] = entry
+        self._memory_bytes += entry.nbytes
+        for table in entry.tables:
+            self._tagged[table].add(key)
+        while self._memory_bytes > self.max_bytes:
+            key, entry = self._memory.popitem(last=False)
+            self._memory_bytes -= entry.nbytes
+            self.stats["evictions"] += 1
+            if self.path is None:
+                self._untag(key, entry)
+                continue
+            try:
+                blob = pickle.dumps(entry.rows, protocol=pickle.HIGHEST_PROTOCOL)
+            except (pickle.PicklingError, TypeError, AttributeError):
+                self._untag(key, entry)  # values that cannot be stored on disk are dropped
+                continue
+            self._file(key).write_bytes(blob)
+            self._disk[key] = _Entry(None, entry.tables, len(blob), entry.expires)
+            self._disk_bytes += len(blob)
+            while self._disk_bytes > self.disk_max_bytes:
+                self._remove(next(iter(self._disk)))
+
+    def _remove(self, key: str) -> None:
+        entry = self._memory.pop(key, None)
+        if entry is not None:
+            self._memory_bytes -= entry.nbytes
+        else:
+            entry = self._disk.pop(key, None)
+            if entry is None:
+                return
+            self._disk_bytes -= entry.nbytes
+            self._file(key).unlink(missing_ok=True)
+        self._untag(key, entry)
+
+    def _untag(self, key: str, entry: _Entry) -> None:
+        for table in entry.tables:
+            keys = self._tagged[table]
+            keys.discard(key)
+            if not keys:
+                del self._tagged[table]
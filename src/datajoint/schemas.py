@@ -14,6 +14,7 @@ import types
 import warnings
 from typing import TYPE_CHECKING, Any
 
+from .dependencies import topo_sort
 from .errors import AccessError, DataJointError
 from .instance import _get_singleton_connection
 
@@ -499,6 +500,49 @@ class _Schema:
         self._assert_exists()
         rebuild_schema_lineage(self.connection, self.database)
 
+    @property
+    def gc_journal_enabled(self) -> bool:
+        """
+        Check if deletions from this schema are journaled for garbage collection.
+
+        Returns
+        -------
+        bool
+            True if the ``~gc_journal`` table exists.
+        """
+        from .gc import journal_table_exists
+
+        self._assert_exists()
+        return journal_table_exists(self.connection, self.database)
+
+    def enable_gc_journal(self) -> None:
+        """
+        Journal deletions from this schema for incremental garbage collection.
+
+        Creates the ``~gc_journal`` table. From then on, deleting rows with
+        hash- or schema-addressed columns records their storage paths, and
+        ``GarbageCollector.collect(incremental=True)`` checks only those paths.
+        Objects orphaned before the journal was enabled are found only by a
+        full ``collect()``.
+        """
+        from .gc import ensure_journal_table
+
+        self._assert_exists()
+        ensure_journal_table(self.connection, self.database)
+
+    def disable_gc_journal(self) -> None:
+        """
+        Stop journaling deletions from this schema and drop the ``~gc_journal`` table.
+
+        Journaled candidates that have not been collected are discarded; run a
+        full ``collect()`` to reclaim them.
+        """
+        from .gc import JOURNAL_TABLE
+
+        self._assert_exists()
+        adapter = self.connection.adapter
+        self.connection.query(adapter.drop_table_sql(adapter.make_full_table_name(self.database, JOURNAL_TABLE)))
+
     @property
     def jobs(self) -> list[Job]:
         """
@@ -551,13 +595,10 @@ class _Schema:
         list[str]
             Table names in topological order.
         """
-        self.connection.dependencies.load()
+        graph = self.connection.dependencies.load()
         return [
             t
-            for d, t in (
-                self.connection.adapter.split_full_table_name(table_name)
-                for table_name in self.connection.dependencies.topo_sort()
-            )
+            for d, t in (self.connection.adapter.split_full_table_name(table_name) for table_name in topo_sort(graph))
             if d == self.database
         ]
 
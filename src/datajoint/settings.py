@@ -237,6 +237,16 @@ class ConnectionSettings(BaseSettings):
     model_config = SettingsConfigDict(extra="forbid", validate_assignment=True)
 
     charset: str = ""  # pymysql uses '' as default
+    ping_interval: float = Field(
+        default=60.0,
+        ge=0,
+        description="Seconds without a successful query after which Connection.is_connected pings the server",
+    )
+    slow_query_threshold: float | None = Field(
+        default=None,
+        ge=0,
+        description="Log queries taking at least this many seconds as warnings, with their DataJoint operation",
+    )
 
 
 class DisplaySettings(BaseSettings):
@@ -262,6 +272,27 @@ class DisplaySettings(BaseSettings):
     )
 
 
+class BlobSettings(BaseSettings):
+    """Compression settings for ``<blob>`` serialization."""
+
+    model_config = SettingsConfigDict(
+        env_prefix="DJ_BLOB_",
+        case_sensitive=False,
+        extra="forbid",
+        validate_assignment=True,
+    )
+
+    compression: str = Field(
+        default="zlib",
+        description="Compression method for blobs over 1 KB: 'zlib', 'zstd', 'lz4', or a registered name",
+    )
+    compression_level: int | None = Field(default=None, description="Compression level (None uses the method default)")
+    compression_threads: int = Field(
+        default=0, ge=0, description="Worker threads for compression (zstd only; 0 compresses in the calling thread)"
+    )
+    shuffle: bool = Field(default=False, description="Byte-shuffle numeric data before compression")
+
+
 class StoresSettings(BaseSettings):
     """
     Unified object storage configuration.
@@ -348,6 +379,7 @@ class Config(BaseSettings):
     connection: ConnectionSettings = Field(default_factory=ConnectionSettings)
     display: DisplaySettings = Field(default_factory=DisplaySettings)
     jobs: JobsSettings = Field(default_factory=JobsSettings)
+    blob: BlobSettings = Field(default_factory=BlobSettings)
 
     # Unified stores configuration (replaces external and object_storage)
     # ``validation_alias`` redirects pydantic-settings' env source away from the
@@ -496,6 +528,9 @@ class Config(BaseSettings):
                 "schema_prefix",
                 "filepath_prefix",
                 "stage",
+                "max_workers",
+                "hash_algorithm",
+                "blob_compression",
             ),
             "s3": (
                 "protocol",
@@ -512,6 +547,9 @@ class Config(BaseSettings):
                 "schema_prefix",
                 "filepath_prefix",
                 "stage",
+                "max_workers",
+                "hash_algorithm",
+                "blob_compression",
                 "proxy_server",
             ),
             "gcs": (
@@ -527,6 +565,9 @@ class Config(BaseSettings):
                 "schema_prefix",
                 "filepath_prefix",
                 "stage",
+                "max_workers",
+                "hash_algorithm",
+                "blob_compression",
             ),
             "azure": (
                 "protocol",
@@ -542,6 +583,9 @@ class Config(BaseSettings):
                 "schema_prefix",
                 "filepath_prefix",
                 "stage",
+                "max_workers",
+                "hash_algorithm",
+                "blob_compression",
             ),
         }
 
@@ -907,12 +951,20 @@ class Config(BaseSettings):
                 },
                 "connection": {
                     "charset": "",
+                    "ping_interval": 60.0,
+                    "slow_query_threshold": None,
                 },
                 "display": {
                     "limit": 12,
                     "width": 14,
                     "show_tuple_count": True,
                 },
+                "blob": {
+                    "compression": "zlib",
+                    "compression_level": None,
+                    "compression_threads": 0,
+                    "shuffle": False,
+                },
                 "stores": {
                     "default": "main",
                     "filepath_default": "raw_data",
@@ -9,11 +9,14 @@ from __future__ import annotations
 
 import json
 import logging
+import os
 import secrets
+import time
 import urllib.parse
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, as_completed, wait
 from datetime import datetime, timezone
 from pathlib import Path, PurePosixPath
-from typing import Any
+from typing import IO, Any, Callable, Iterable, Iterator
 
 import fsspec
 
@@ -27,6 +30,18 @@ TOKEN_ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789
 # Supported URL protocols
 URL_PROTOCOLS = ("file://", "s3://", "gs://", "gcs://", "az://", "abfs://", "http://", "https://")
 
+# Read size for streaming uploads (put_stream, remote-to-remote copies)
+STREAM_CHUNK_SIZE = 8 * 2**20
+
+# Concurrent transfers per folder upload (override with the store's ``max_workers``)
+DEFAULT_MAX_WORKERS = 8
+
+# Attempts per file before a folder upload fails
+UPLOAD_RETRIES = 3
+
+# Paths per bulk delete request (the S3 DeleteObjects limit)
+DELETE_BATCH_SIZE = 1000
+
 
 def is_url(path: str) -> bool:
     """
@@ -563,6 +578,61 @@ class StorageBackend:
         else:
             self.fs.pipe_file(full_path, buffer)
 
+    def put_stream(
+        self,
+        stream: IO[bytes] | Iterable[bytes],
+        remote_path: str | PurePosixPath,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+    ) -> int:
+        """
+        Write a stream of bytes to storage without holding it in memory.
+
+        Data is copied in chunks of ``chunk_size`` bytes. Local stores write to a
+        temporary file that is renamed into place on success; remote stores write
+        through an fsspec file handle, which uploads in parts (e.g. S3 multipart).
+
+        Parameters
+        ----------
+        stream : file-like or iterable of bytes
+            Binary file object (anything with ``read``) or an iterable of chunks.
+        remote_path : str or PurePosixPath
+            Destination path in storage.
+        chunk_size : int, optional
+            Read size for file-like sources. Default 8 MiB.
+
+        Returns
+        -------
+        int
+            Number of bytes written.
+        """
+        full_path = self._full_path(remote_path)
+        logger.debug(f"put_stream: -> {self.protocol}:{full_path}")
+
+        if hasattr(stream, "read"):
+            chunks = iter(lambda: stream.read(chunk_size), b"")
+        else:
+            chunks = iter(stream)
+
+        size = 0
+        if self.protocol == "file":
+            dest = Path(full_path)
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            temp_file = dest.with_suffix(dest.suffix + ".saving")
+            try:
+                with open(temp_file, "wb") as f:
+                    for chunk in chunks:
+                        f.write(chunk)
+                        size += len(chunk)
+                temp_file.replace(dest)
+            finally:
+                temp_file.unlink(missing_ok=True)
+        else:
+            with self.fs.open(full_path, "wb") as f:
+                for chunk in chunks:
+                    f.write(chunk)
+                    size += len(chunk)
+        return size
+
     def get_buffer(self, remote_path: str | PurePosixPath) -> bytes:
         """
         Read bytes from storage.
@@ -611,6 +681,35 @@ class StorageBackend:
         logger.debug(f"exists: {self.protocol}:{full_path}")
         return self.fs.exists(full_path)
 
+    def exists_many(self, remote_paths: Iterable[str], max_workers: int | None = None) -> set[str]:
+        """
+        Check which of several paths exist in storage.
+
+        Local stores are checked directly; remote stores issue the existence
+        checks concurrently instead of one round trip after another.
+
+        Parameters
+        ----------
+        remote_paths : iterable of str
+            Paths in storage.
+        max_workers : int, optional
+            Concurrent checks for remote stores. Defaults to the store's
+            ``max_workers`` setting, or 8.
+
+        Returns
+        -------
+        set[str]
+            The subset of ``remote_paths`` that exist.
+        """
+        remote_paths = list(remote_paths)
+        logger.debug(f"exists_many: {len(remote_paths)} paths in {self.protocol}")
+        if self.protocol == "file" or len(remote_paths) < 2:
+            return {p for p in remote_paths if self.fs.exists(self._full_path(p))}
+        max_workers = max_workers or self.spec.get("max_workers") or DEFAULT_MAX_WORKERS
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(remote_paths))) as pool:
+            found = pool.map(lambda p: self.fs.exists(self._full_path(p)), remote_paths)
+            return {p for p, exists in zip(remote_paths, found) if exists}
+
     def isdir(self, remote_path: str | PurePosixPath) -> bool:
         """
         Check if a path refers to a directory in storage.
@@ -648,6 +747,85 @@ class StorageBackend:
         except FileNotFoundError:
             pass  # Already gone
 
+    def remove_many(
+        self,
+        remote_paths: Iterable[str],
+        max_workers: int | None = None,
+        batch_size: int = DELETE_BATCH_SIZE,
+        callback: Callable[[int], None] | None = None,
+        missing: set[str] | None = None,
+    ) -> dict[str, Exception]:
+        """
+        Remove many files from storage in bulk.
+
+        Paths are grouped into batches of ``batch_size`` and each batch is
+        removed with a single multi-path ``rm`` (one DeleteObjects request on
+        S3); batches run concurrently. If a batch fails, its paths are retried
+        one at a time so that only the offending paths are reported.
+
+        Parameters
+        ----------
+        remote_paths : iterable of str
+            Paths in storage. Missing paths are not an error.
+        max_workers : int, optional
+            Concurrent batches. Defaults to the store's ``max_workers``
+            setting, or 8.
+        batch_size : int, optional
+            Paths per request. Default 1000.
+        callback : callable, optional
+            Called with the number of paths processed after each batch.
+        missing : set of str, optional
+            If given, receives the paths that were already gone. Object stores
+            whose bulk deletes ignore missing keys (S3) cannot report them.
+
+        Returns
+        -------
+        dict[str, Exception]
+            Paths that could not be removed, mapped to their error.
+        """
+        remote_paths = list(remote_paths)
+        logger.debug(f"remove_many: {len(remote_paths)} paths in {self.protocol}")
+        batches = [remote_paths[i : i + batch_size] for i in range(0, len(remote_paths), batch_size)]
+        failed: dict[str, Exception] = {}
+
+        def remove_batch(batch: list[str]) -> tuple[dict[str, Exception], list[str]]:
+            if self.protocol != "file":
+                try:
+                    self.fs.rm([self._full_path(p) for p in batch])
+                    return {}, []
+                except FileNotFoundError:
+                    pass  # some paths already gone: settle them one by one
+                except Exception as e:
+                    logger.debug(f"remove_many: batch of {len(batch)} failed ({e}), retrying per path")
+            errors = {}
+            gone = []
+            for path in batch:
+                full_path = self._full_path(path)
+                try:
+                    if self.protocol == "file":
+                        Path(full_path).unlink()
+                    else:
+                        self.fs.rm(full_path)
+                except FileNotFoundError:
+                    gone.append(path)
+                except Exception as e:
+                    errors[path] = e
+            return errors, gone
+
+        if not batches:
+            return failed
+        max_workers = max_workers or self.spec.get("max_workers") or DEFAULT_MAX_WORKERS
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(batches))) as pool:
+            futures = {pool.submit(remove_batch, batch): len(batch) for batch in batches}
+            for future in as_completed(futures):
+                errors, gone = future.result()
+                failed.update(errors)
+                if missing is not None:
+                    missing.update(gone)
+                if callback is not None:
+                    callback(futures[future])
+        return failed
+
     def size(self, remote_path: str | PurePosixPath) -> int:
         """
         Get file size in bytes.
@@ -693,59 +871,83 @@ class StorageBackend:
 
         return self.fs.open(full_path, mode)
 
-    def put_folder(self, local_path: str | Path, remote_path: str | PurePosixPath) -> dict:
+    def put_folder(
+        self,
+        local_path: str | Path,
+        remote_path: str | PurePosixPath,
+        max_workers: int | None = None,
+        retries: int = UPLOAD_RETRIES,
+        display_progress: bool = False,
+    ) -> dict:
         """
         Upload a folder to storage.
 
+        The folder is walked once; each file is submitted to a pool of upload
+        workers as soon as it is found, and the manifest is assembled from the
+        same pass. Failed file transfers are retried with exponential backoff.
+
         Parameters
         ----------
         local_path : str or Path
             Path to local folder.
         remote_path : str or PurePosixPath
             Destination path in storage.
+        max_workers : int, optional
+            Concurrent file transfers. Defaults to the store's ``max_workers``
+            setting, or 8.
+        retries : int, optional
+            Attempts per file before the upload fails. Default 3.
+        display_progress : bool, optional
+            Show a progress bar of uploaded files. Default False.
 
         Returns
         -------
         dict
             Manifest with keys ``'files'``, ``'total_size'``, ``'item_count'``,
             ``'created'``.
+
+        Raises
+        ------
+        DataJointError
+            If ``local_path`` is not a directory or a file fails to upload
+            after ``retries`` attempts.
         """
         local_path = Path(local_path)
         if not local_path.is_dir():
             raise errors.DataJointError(f"Not a directory: {local_path}")
 
         full_path = self._full_path(remote_path)
-        logger.debug(f"put_folder: {local_path} -> {self.protocol}:{full_path}")
+        max_workers = max_workers or self.spec.get("max_workers") or DEFAULT_MAX_WORKERS
+        logger.debug(f"put_folder: {local_path} -> {self.protocol}:{full_path} ({max_workers} workers)")
 
-        # Collect file info for manifest
-        files = []
-        total_size = 0
+        if self.protocol == "file":
+            Path(full_path).mkdir(parents=True, exist_ok=True)
 
-        # Use os.walk for Python 3.10 compatibility (Path.walk() requires 3.12+)
-        import os
+        from tqdm import tqdm
 
-        for root, dirs, filenames in os.walk(local_path):
-            root_path = Path(root)
-            for filename in filenames:
-                file_path = root_path / filename
-                rel_path = file_path.relative_to(local_path).as_posix()
-                file_size = file_path.stat().st_size
+        files = []
+        total_size = 0
+        start = time.monotonic()
+        progress = tqdm(desc=f"Uploading {local_path.name}", unit="file", total=0, disable=not display_progress)
+        pool = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            futures = []
+            for file_path, rel_path, file_size in self._walk_folder(local_path, full_path):
                 files.append({"path": rel_path, "size": file_size})
                 total_size += file_size
-
-        # Upload folder contents
-        if self.protocol == "file":
-            import shutil
-
-            dest = Path(full_path)
-            dest.mkdir(parents=True, exist_ok=True)
-            for item in local_path.iterdir():
-                if item.is_file():
-                    shutil.copy2(item, dest / item.name)
-                else:
-                    shutil.copytree(item, dest / item.name, dirs_exist_ok=True)
-        else:
-            self.fs.put(str(local_path), full_path, recursive=True)
+                future = pool.submit(self._upload_with_retry, file_path, f"{full_path}/{rel_path}", retries)
+                future.add_done_callback(lambda _: progress.update())
+                futures.append(future)
+                progress.total = len(futures)
+            done, _ = wait(futures, return_when=FIRST_EXCEPTION)
+            for future in done:
+                future.result()
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+            progress.close()
+
+        elapsed = time.monotonic() - start
+        logger.debug(f"put_folder: uploaded {len(files)} files ({total_size} bytes) in {elapsed:.1f}s")
 
         # Build manifest
         manifest = {
@@ -761,6 +963,47 @@ class StorageBackend:
 
         return manifest
 
+    def _walk_folder(self, local_path: Path, full_path: str) -> Iterator[tuple[str, str, int]]:
+        """
+        Yield ``(file_path, rel_path, size)`` for every file under ``local_path``.
+
+        For local stores, destination directories (including empty ones) are
+        created as they are walked so that upload workers never race on them.
+        As with ``os.walk``, symbolic links to directories are not followed, so
+        they are skipped; symbolic links to files are uploaded as files.
+        """
+        stack = [(str(local_path), "")]
+        while stack:
+            directory, prefix = stack.pop()
+            with os.scandir(directory) as entries:
+                for entry in sorted(entries, key=lambda e: e.name):
+                    rel_path = f"{prefix}{entry.name}"
+                    if entry.is_dir(follow_symlinks=False):
+                        if self.protocol == "file":
+                            Path(full_path, rel_path).mkdir(exist_ok=True)
+                        stack.append((entry.path, f"{rel_path}/"))
+                    elif entry.is_dir():
+                        continue  # a symbolic link to a directory, which may lead back to an ancestor
+                    else:
+                        yield entry.path, rel_path, entry.stat().st_size
+
+    def _upload_with_retry(self, file_path: str, dest: str, retries: int) -> None:
+        """Copy one local file to a full storage path, retrying transient failures."""
+        for attempt in range(1, retries + 1):
+            try:
+                if self.protocol == "file":
+                    import shutil
+
+                    shutil.copy2(file_path, dest)
+                else:
+                    self.fs.put_file(file_path, dest)
+                return
+            except Exception as e:
+                if attempt == retries:
+                    raise errors.DataJointError(f"Failed to upload {file_path} after {retries} attempts: {e}") from e
+                logger.warning(f"Upload of {file_path} failed (attempt {attempt}/{retries}): {e}")
+                time.sleep(0.5 * 2 ** (attempt - 1))
+
     def remove_folder(self, remote_path: str | PurePosixPath) -> None:
         """
         Remove a folder and its manifest from storage.
@@ -841,9 +1084,7 @@ class StorageBackend:
         else:
             # Remote-to-remote copy via streaming
             with source_fs.open(source_path, "rb") as src:
-                content = src.read()
-            self.fs.pipe_file(full_dest, content)
-            return len(content)
+                return self.put_stream(src, dest_path)
 
     def _copy_folder_from_url(
         self, source_fs: fsspec.AbstractFileSystem, source_path: str, dest_path: str | PurePosixPath
@@ -889,8 +1130,7 @@ class StorageBackend:
                     source_fs.get_file(src_file, dest_file)
                 else:
                     with source_fs.open(src_file, "rb") as src:
-                        content = src.read()
-                    self.fs.pipe_file(dest_file, content)
+                        self.put_stream(src, f"{dest_path}/{rel_path}")
 
         # Build manifest
         manifest = {
@@ -68,6 +68,9 @@ _COMMON_STORE_KEYS = frozenset(
         "schema_prefix",
         "filepath_prefix",
         "stage",
+        "max_workers",
+        "hash_algorithm",
+        "blob_compression",
     }
 )
 
@@ -23,7 +23,9 @@ from .errors import (
     UnknownAttributeError,
 )
 from .expression import QueryExpression
+from .hash_registry import HashBatch, PendingHash
 from .heading import Heading
+from .profiling import operation
 from .staged_insert import staged_insert1 as _staged_insert1
 from .utils import is_camel_case, user_choice
 
@@ -466,8 +468,8 @@ class Table(QueryExpression):
         list
             List of part table names or table objects.
         """
-        self.connection.dependencies.load(force=False)
-        nodes = [node for node in self.connection.dependencies.nodes if node.startswith(self.full_table_name[:-1] + "__")]
+        graph = self.connection.dependencies.load(force=False)
+        nodes = [node for node in graph.nodes if node.startswith(self.full_table_name[:-1] + "__")]
         return [FreeTable(self.connection, c) for c in nodes] if as_objects else nodes
 
     @property
@@ -746,6 +748,7 @@ class Table(QueryExpression):
         """
         return _staged_insert1(self)
 
+    @operation("insert")
     def insert(
         self,
         rows,
@@ -878,7 +881,13 @@ class Table(QueryExpression):
         """
         # collects the field list from first row (passed by reference)
         field_list = []
-        rows = list(self.__make_row_to_insert(row, field_list, ignore_extra_fields) for row in rows)
+        # hash-addressed values are stored together once all rows are encoded
+        hash_batch = HashBatch()
+        rows = list(self.__make_row_to_insert(row, field_list, ignore_extra_fields, hash_batch) for row in rows)
+        hash_batch.flush()
+        for row in rows:
+            if any(isinstance(v, PendingHash) for v in row["values"]):
+                row["values"] = [json.dumps(v.metadata) if isinstance(v, PendingHash) else v for v in row["values"]]
         if rows:
             try:
                 # Handle empty field_list (all-defaults insert)
@@ -988,17 +997,41 @@ class Table(QueryExpression):
                 f"Use index_as_pk=False to ignore index, or reset_index() first."
             )
 
+    @operation("delete_quick")
     def delete_quick(self, get_count=False):
         """
         Deletes the table without cascading and without user prompt.
         If this table has populated dependent tables, this will fail.
+
+        If the schema has a deletion journal (``schema.enable_gc_journal()``)
+        and the table has hash- or schema-addressed columns, the storage paths
+        of the deleted rows are journaled in the same transaction.
         """
+        from .gc import journal_table_exists, record_deletions
+
         query = "DELETE FROM " + self.full_table_name + self.where_clause()
-        cursor = self.connection.query(query)
+        conn = self.connection
+        heading = self.heading
+        if (heading.hash_objects or heading.schema_objects) and journal_table_exists(conn, self.database):
+            own_transaction = not conn.in_transaction
+            if own_transaction:
+                conn.start_transaction()
+            try:
+                record_deletions(self)
+                cursor = conn.query(query)
+            except Exception:
+                if own_transaction:
+                    conn.cancel_transaction()
+                raise
+            if own_transaction:
+                conn.commit_transaction()
+        else:
+            cursor = conn.query(query)
         # Use cursor.rowcount (DB-API 2.0 standard, works for both MySQL and PostgreSQL)
         count = cursor.rowcount if get_count else None
         return count
 
+    @operation("delete")
     def delete(
         self,
         transaction: bool = True,
@@ -1072,13 +1105,14 @@ class Table(QueryExpression):
         root_count = 0
         deleted_tables = set()
         try:
-            for ft in reversed(diagram):
-                count = ft.delete_quick(get_count=True)
-                if count > 0:
-                    deleted_tables.add(ft.full_table_name)
-                logger.info("Deleting {count} rows from {table}".format(count=count, table=ft.full_table_name))
-                if ft.full_table_name == self.full_table_name:
-                    root_count = count
+            with operation("delete.cascade"):
+                for ft in reversed(diagram):
+                    count = ft.delete_quick(get_count=True)
+                    if count > 0:
+                        deleted_tables.add(ft.full_table_name)
+                    logger.info("Deleting {count} rows from {table}".format(count=count, table=ft.full_table_name))
+                    if ft.full_table_name == self.full_table_name:
+                        root_count = count
         except IntegrityError as error:
             if transaction:
                 conn.cancel_transaction()
@@ -1169,6 +1203,7 @@ class Table(QueryExpression):
         else:
             logger.info("Nothing to drop: table %s is not declared" % self.full_table_name)
 
+    @operation("drop")
     def drop(self, prompt: bool | None = None, part_integrity: str = "enforce"):
         """
         Drop the table and all tables that reference it, recursively.
@@ -1322,7 +1357,7 @@ class Table(QueryExpression):
         return definition
 
     # --- private helper functions ----
-    def __make_placeholder(self, name, value, ignore_extra_fields=False, row=None):
+    def __make_placeholder(self, name, value, ignore_extra_fields=False, row=None, hash_batch=None):
         """
         Return processed value or placeholder for an attribute.
 
@@ -1347,6 +1382,9 @@ class Table(QueryExpression):
             If True, return None for unknown fields.
         row : dict, optional
             The full row dict (used for context in codec encoding).
+        hash_batch : HashBatch, optional
+            Batch collecting hash-addressed values. If given, ``<hash>``
+            values are queued and returned as ``PendingHash`` placeholders.
 
         Returns
         -------
@@ -1379,6 +1417,8 @@ class Table(QueryExpression):
                 "_field": name,
                 "_config": self.connection._config,
             }
+            if hash_batch is not None:
+                context["_hash_batch"] = hash_batch
             # Add primary key values from row if available
             if row is not None:
                 for pk_name in self.primary_key:
@@ -1396,6 +1436,10 @@ class Table(QueryExpression):
                 else:
                     value = attr_type.encode(value, key=context)
 
+            # Serialized once the hash batch is flushed (see _insert_rows)
+            if isinstance(value, PendingHash):
+                return name, "%s", value
+
         # Handle NULL values
         if value is None or (attr.numeric and (value == "" or np.isnan(float(value)))):
             placeholder, value = "DEFAULT", None
@@ -1419,7 +1463,7 @@ class Table(QueryExpression):
 
         return name, placeholder, value
 
-    def __make_row_to_insert(self, row, field_list, ignore_extra_fields):
+    def __make_row_to_insert(self, row, field_list, ignore_extra_fields, hash_batch=None):
         """
         Helper function for insert and update.
 
@@ -1431,6 +1475,8 @@ class Table(QueryExpression):
             List to be populated with field names from the first row.
         ignore_extra_fields : bool
             If True, ignore fields not in the heading.
+        hash_batch : HashBatch, optional
+            Batch collecting hash-addressed values for deferred storage.
 
         Returns
         -------
@@ -1461,7 +1507,7 @@ class Table(QueryExpression):
             check_fields(row.dtype.fields)
             row_dict = {name: row[name] for name in row.dtype.fields}
             attributes = [
-                self.__make_placeholder(name, row[name], ignore_extra_fields, row=row_dict)
+                self.__make_placeholder(name, row[name], ignore_extra_fields, row=row_dict, hash_batch=hash_batch)
                 for name in self.heading
                 if name in row.dtype.fields
             ]
@@ -1469,7 +1515,7 @@ class Table(QueryExpression):
             check_fields(row)
             row_dict = dict(row)
             attributes = [
-                self.__make_placeholder(name, row[name], ignore_extra_fields, row=row_dict)
+                self.__make_placeholder(name, row[name], ignore_extra_fields, row=row_dict, hash_batch=hash_batch)
                 for name in self.heading
                 if name in row
             ]
@@ -1492,7 +1538,7 @@ class Table(QueryExpression):
             else:
                 row_dict = dict(zip(self.heading.names, row))
                 attributes = [
-                    self.__make_placeholder(name, value, ignore_extra_fields, row=row_dict)
+                    self.__make_placeholder(name, value, ignore_extra_fields, row=row_dict, hash_batch=hash_batch)
                     for name, value in zip(self.heading, row)
                 ]
         if ignore_extra_fields:
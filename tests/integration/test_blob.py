@@ -1,4 +1,6 @@
+import io
 import timeit
+import tracemalloc
 import uuid
 from datetime import datetime
 from decimal import Decimal
@@ -242,3 +244,196 @@ def test_datetime_serialization_speed():
 
     # The time savings were much greater (x1000) but use x10 for testing
     assert optimized_exe_time * 10 < baseline_exe_time
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_unpack_memoryview(compress):
+    x = {"array": np.arange(5000.0).reshape(50, 100), "name": "neuron", "raw": b"\x00\x01", "id": uuid.uuid4()}
+    blob = pack(x, compress=compress)
+    for buffer in (blob, bytearray(blob), memoryview(blob)):
+        y = unpack(buffer)
+        assert_array_equal(x["array"], y["array"])
+        assert (y["name"], y["raw"], y["id"]) == (x["name"], x["raw"], x["id"])
+        assert type(y["raw"]) is bytes
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_unpack_writeable_policy(compress):
+    x = np.arange(10_000, dtype=np.int32)
+    blob = pack(x, compress=compress)
+    y = unpack(blob)
+    assert not y.flags.writeable
+    with pytest.raises(ValueError):
+        y[0] = 1
+    y = unpack(blob, writeable=True)
+    assert y.flags.writeable
+    y[0] = -1
+    # writing to an unpacked array never modifies the blob
+    assert_array_equal(unpack(blob), x)
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_unpack_memory_usage(compress):
+    # peak memory of unpacking a 32 MB array: zero-copy views over an uncompressed blob,
+    # a single decompressed buffer (plus bounded zlib chunks) for a compressed one
+    x = np.random.default_rng(0).integers(0, 4, size=2**22).astype(np.float64)
+    blob = memoryview(pack(x, compress=compress))
+    tracemalloc.start()
+    try:
+        y = unpack(blob)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert_array_equal(x, y)
+    print(f"compress={compress} peak={peak / x.nbytes:.3f} x array size")
+    assert peak < (1.25 if compress else 0.01) * x.nbytes
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_pack_memory_usage(compress):
+    # packing a dict of Fortran-ordered arrays (32 MB total) writes the array data straight
+    # into the result: no per-array copies and no re-copying at each nesting level
+    rng = np.random.default_rng(0)
+    x = {"trace": {f"a{i}": rng.integers(0, 4, size=(8, 2**16)).astype(np.float64).T for i in range(8)}}
+    nbytes = sum(a.nbytes for a in x["trace"].values())
+    tracemalloc.start()
+    try:
+        blob = pack(x, compress=compress)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    y = unpack(blob)
+    for k, a in x["trace"].items():
+        assert_array_equal(a, y["trace"][k])
+    print(f"compress={compress} peak={peak / nbytes:.3f} x data size")
+    assert peak < (0.5 if compress else 1.05) * nbytes
+
+
+@pytest.mark.parametrize("compression", ["zlib", "zstd", "lz4"])
+@pytest.mark.parametrize("shuffle", [False, True])
+def test_pack_compression_methods(compression, shuffle):
+    if compression != "zlib":
+        pytest.importorskip({"zstd": "zstandard", "lz4": "lz4"}[compression])
+    x = {"trace": (np.arange(8000) % 100).reshape(500, 16).astype(np.float32), "unit": "mV"}
+    blob = pack(x, compression=compression, shuffle=shuffle)
+    prefix = b"SH123\0" if shuffle else dj.blob.compressors[compression][0]
+    assert blob.startswith(prefix)
+    y = unpack(blob)
+    assert_array_equal(x["trace"], y["trace"])
+    assert y["unit"] == "mV"
+    y = unpack(memoryview(blob), writeable=True)
+    y["trace"][0, 0] = 0
+
+
+def test_compression_config_and_registry():
+    x = np.arange(10_000, dtype=np.int64)
+    with dj.config.override(blob__shuffle=True, blob__compression_level=1):
+        assert pack(x).startswith(b"SH123\0")
+    assert pack(x) == pack(x, compression="zlib", shuffle=False)
+    with pytest.raises(dj.DataJointError, match="Unknown blob compression"):
+        pack(x, compression="snappy")
+    with pytest.raises(dj.DataJointError, match="already in use"):
+        dj.blob.register_compression("zlib2", b"ZL123\0", None, None)
+    with pytest.raises(dj.DataJointError, match="six bytes"):
+        dj.blob.register_compression("bad", b"BAD", None, None)
+
+
+def test_blob_codec_compression_options(tmp_path):
+    from datajoint.builtin_codecs import BlobCodec
+
+    x = np.arange(10_000, dtype=np.float64)
+    codec = BlobCodec()
+    with dj.config.override(
+        stores={"cold": {"protocol": "file", "location": str(tmp_path), "blob_compression": {"shuffle": True}}}
+    ):
+        assert codec.encode(x, store_name=None).startswith(b"ZL123\0")
+        assert codec.encode(x, store_name="cold").startswith(b"SH123\0")
+        codec.compression = {"compression_level": 9}
+        assert codec.encode(x, store_name="cold").startswith(b"ZL123\0")
+        codec.compression = {"level": 9}
+        with pytest.raises(dj.DataJointError, match="Unknown blob compression option"):
+            codec.encode(x, store_name=None)
+    assert_array_equal(codec.decode(pack(x, shuffle=True)), x)
+
+
+class _Unseekable(io.RawIOBase):
+    """Pipe-like binary stream over a BytesIO."""
+
+    def __init__(self, buffer):
+        self._buffer = buffer
+
+    def readable(self):
+        return True
+
+    def writable(self):
+        return True
+
+    def read(self, size=-1):
+        return self._buffer.read(size)
+
+    def write(self, data):
+        return self._buffer.write(data)
+
+
+@pytest.mark.parametrize("options", [{}, {"compress": False}, {"shuffle": True}])
+def test_pack_to_unpack_from(options):
+    x = {"trace": np.asfortranarray((np.arange(60_000) % 70).reshape(300, 200)), "noise": np.random.default_rng(0).random(500)}
+    for obj in (x, x["noise"], "short"):
+        f = io.BytesIO()
+        assert dj.blob.pack_to(obj, f, **options) == len(f.getvalue())
+        assert f.getvalue() == pack(obj, **options)
+        f.seek(0)
+        y = dj.blob.unpack_from(f)
+        pipe = io.BytesIO()
+        dj.blob.pack_to(obj, _Unseekable(pipe), **options)
+        pipe.seek(0)
+        z = dj.blob.unpack_from(_Unseekable(pipe))
+        if isinstance(obj, dict):
+            assert_array_equal(y["trace"], x["trace"])
+            assert_array_equal(z["noise"], x["noise"])
+        else:
+            assert_array_equal(y, obj)
+            assert_array_equal(z, obj)
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_pack_to_unpack_from_memory_usage(tmp_path, compress):
+    # pack_to holds neither the serialized nor the compressed blob; unpack_from holds
+    # only the (decompressed) payload that the unpacked array shares
+    x = np.asfortranarray(np.random.default_rng(0).integers(0, 4, size=(2**11, 2**11)).astype(np.float64))
+    with open(tmp_path / "x.blob", "wb") as f:
+        tracemalloc.start()
+        try:
+            dj.blob.pack_to(x, f, compress=compress)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    print(f"pack_to peak={peak / x.nbytes:.3f} x array size")
+    assert peak < 0.05 * x.nbytes
+    with open(tmp_path / "x.blob", "rb") as f:
+        tracemalloc.start()
+        try:
+            y = dj.blob.unpack_from(f)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    print(f"unpack_from peak={peak / x.nbytes:.3f} x array size")
+    assert peak < 1.2 * x.nbytes
+    assert_array_equal(y, x)
+
+
+def test_blob_codec_streams_large_values(tmp_path, monkeypatch):
+    from datajoint.builtin_codecs import BlobCodec, blob as blob_codec
+    from datajoint.hash_registry import ContentStream, compute_hash, get_hash, put_hash
+
+    monkeypatch.setattr(blob_codec, "STREAM_BYTES", 10_000)
+    x = np.random.default_rng(0).random(20_000).astype(np.float32)
+    codec = BlobCodec()
+    with dj.config.override(stores={"main": {"protocol": "file", "location": str(tmp_path)}}):
+        assert isinstance(codec.encode(x[:100], store_name="main"), bytes)
+        stream = codec.encode(x, store_name="main")
+        assert isinstance(stream, ContentStream)
+        assert stream.hashes == {"md5": compute_hash(pack(x))}
+        assert stream.size == len(pack(x))
+        metadata = put_hash(stream, "lab", "main")
+        assert_array_equal(codec.decode(get_hash(metadata)), x)
@@ -0,0 +1,192 @@
+"""
+Benchmark and regression suite for blob serialization.
+
+``pack`` and ``unpack`` sit under every ``<blob>`` insert and fetch, so a slowdown there
+slows down every pipeline. Each case is timed against a reference operation on the same
+data and machine (a memory copy, zlib, pickle, or a direct ``unpack``), and the
+thresholds bound the ratio rather than absolute speed, so they hold on slow CI runners
+while still catching a several-fold regression. Operations that take microseconds are
+only held to an absolute floor, since their ratios are dominated by timer noise. Peak memory is measured with tracemalloc
+relative to the payload size.
+
+The benchmarks are deselected by default. Run them with
+``pytest tests/integration/test_blob_benchmark.py -m benchmark -s`` to print the
+measurements. No database is required.
+"""
+
+import pickle
+import timeit
+import tracemalloc
+import zlib
+
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+import datajoint as dj
+from datajoint.blob import pack, unpack
+from datajoint.codecs import decode_attribute
+from datajoint.heading import Attribute, default_attribute_properties
+
+from tests.integration.test_blob_matlab import _trial_struct
+
+pytestmark = pytest.mark.benchmark
+
+REPEAT = 5  # timings are the best of REPEAT runs
+MIN_SECONDS = 2e-4  # timings below this are too noisy to compare with a reference
+
+
+def _time(fn, repeat=REPEAT):
+    return min(timeit.repeat(fn, number=1, repeat=repeat))
+
+
+def _peak(fn):
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def _array(kind):
+    """A 4 MB array with realistic (partly compressible) content."""
+    x = np.random.default_rng(0).integers(0, 256, size=(512, 1024)).astype(np.float64)
+    if kind == "F":
+        return np.asfortranarray(x)
+    if kind == "complex":
+        return x[:, :512] + 1j * x[:, 512:]
+    return x
+
+
+def _nested():
+    """A deeply nested dict/list payload of many small values, like a session's metadata."""
+    return {
+        "sessions": [
+            {
+                "id": i,
+                "name": f"session{i}",
+                "params": {"gain": 1.5 * i, "tags": ["a", "b"], "window": (0, i), "notes": None},
+                "trace": np.arange(16.0),
+            }
+            for i in range(5000)
+        ]
+    }
+
+
+def _trials(n, ragged=False):
+    """A MATLAB struct array of n trials and a cell array of their positions."""
+    trials = _trial_struct(n, ragged=ragged)
+    cells = np.empty((1, n), dtype=object)
+    for i, position in enumerate(trials["position"].flat):
+        cells[0, i] = position
+    return trials, cells.view(dj.MatCell)
+
+
+def _report(case, **ratios):
+    print(f"{case}: " + ", ".join(f"{name}={value:.3g}" for name, value in ratios.items()))
+
+
+# (pack, unpack) time limits relative to serializing the array with ndarray.tobytes (raw)
+# or compressing/decompressing those bytes with zlib (compressed). Uncompressed real
+# arrays unpack as views of the blob, well below the cost of one copy.
+ARRAY_LIMITS = {
+    ("C", False): (2.5, 0.5),
+    ("F", False): (2.5, 0.5),
+    ("complex", False): (5.0, 2.5),
+    ("C", True): (2.0, 2.5),
+    ("F", True): (2.0, 2.5),
+    ("complex", True): (2.0, 3.0),
+}
+
+
+@pytest.mark.parametrize("compress", [False, True])
+@pytest.mark.parametrize("kind", ["C", "F", "complex"])
+def test_numeric_array_throughput(kind, compress):
+    x = _array(kind)
+    blob = pack(x, compress=compress)
+    assert_array_equal(unpack(blob), x)
+    repeat = 3 if compress else REPEAT
+    if compress:
+        raw = x.tobytes(order="F")
+        compressed = zlib.compress(raw)
+        pack_ref = _time(lambda: zlib.compress(raw), repeat)
+        unpack_ref = _time(lambda: zlib.decompress(compressed), repeat)
+    else:
+        pack_ref = unpack_ref = _time(lambda: x.tobytes(order="F"))
+    pack_time = _time(lambda: pack(x, compress=compress), repeat)
+    unpack_time = _time(lambda: unpack(blob), repeat)
+    _report(
+        f"{kind} array compress={compress}",
+        MB_per_s=x.nbytes / 2**20 / pack_time,
+        pack=pack_time / pack_ref,
+        unpack=unpack_time / unpack_ref,
+    )
+    pack_limit, unpack_limit = ARRAY_LIMITS[kind, compress]
+    assert pack_time < max(pack_limit * pack_ref, MIN_SECONDS)
+    assert unpack_time < max(unpack_limit * unpack_ref, MIN_SECONDS)
+
+
+# (pack, unpack) peak memory limits as multiples of the array size; decompression adds
+# bounded zlib chunks on top of the output buffer
+ARRAY_MEMORY_LIMITS = {
+    ("C", False): (2.1, 0.01),
+    ("F", False): (1.05, 0.01),
+    ("complex", False): (2.1, 1.1),
+    ("C", True): (1.6, 2.0),
+    ("F", True): (0.5, 2.0),
+    ("complex", True): (1.6, 2.5),
+}
+
+
+@pytest.mark.parametrize("compress", [False, True])
+@pytest.mark.parametrize("kind", ["C", "F", "complex"])
+def test_numeric_array_memory(kind, compress):
+    x = _array(kind)
+    blob = pack(x, compress=compress)
+    pack_peak = _peak(lambda: pack(x, compress=compress)) / x.nbytes
+    unpack_peak = _peak(lambda: unpack(blob)) / x.nbytes
+    _report(f"{kind} array compress={compress} peak memory", pack=pack_peak, unpack=unpack_peak)
+    pack_limit, unpack_limit = ARRAY_MEMORY_LIMITS[kind, compress]
+    assert pack_peak < pack_limit
+    assert unpack_peak < unpack_limit
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_nested_payload_throughput(compress):
+    x = _nested()
+    blob, pickled = pack(x, compress=compress), pickle.dumps(x)
+    assert unpack(blob)["sessions"][-1]["params"]["window"] == x["sessions"][-1]["params"]["window"]
+    pack_ratio = _time(lambda: pack(x, compress=compress)) / _time(lambda: pickle.dumps(x))
+    unpack_ratio = _time(lambda: unpack(blob)) / _time(lambda: pickle.loads(pickled))
+    _report(f"nested payload compress={compress} vs pickle", pack=pack_ratio, unpack=unpack_ratio)
+    assert pack_ratio < (100 if compress else 70)
+    assert unpack_ratio < 120
+
+
+@pytest.mark.parametrize("ragged", [False, True])
+def test_matlab_struct_and_cell_throughput(ragged):
+    trials, cells = _trials(20_000, ragged=ragged)
+    for name, x in (("struct", trials), ("cell", cells)):
+        blob, pickled = pack(x), pickle.dumps(x)
+        pack_ratio = _time(lambda: pack(x), repeat=3) / _time(lambda: pickle.dumps(x), repeat=3)
+        unpack_ratio = _time(lambda: unpack(blob), repeat=3) / _time(lambda: pickle.loads(pickled), repeat=3)
+        _report(f"MATLAB {name} ragged={ragged} vs pickle", pack=pack_ratio, unpack=unpack_ratio)
+        assert pack_ratio < 10
+        # fixed-layout struct and cell arrays decode with strided views
+        assert unpack_ratio < (30 if ragged else 1)
+
+
+def test_decode_attribute_overhead():
+    # fetch decodes each <blob> value through decode_attribute; its overhead over unpack
+    # matters for queries returning many small blobs
+    attr = Attribute(**dict(default_attribute_properties, name="data", type="longblob", codec=dj.get_codec("blob")))
+    small = [pack({"trace": np.arange(1.0 + i % 10), "label": "cell"}) for i in range(10_000)]
+    large = pack(_array("F"))
+    assert_array_equal(decode_attribute(attr, large), _array("F"))
+    small_ratio = _time(lambda: [decode_attribute(attr, b) for b in small]) / _time(lambda: [unpack(b) for b in small])
+    large_ratio = _time(lambda: decode_attribute(attr, large)) / _time(lambda: unpack(large))
+    _report("decode_attribute vs unpack", small=small_ratio, large=large_ratio)
+    assert small_ratio < 1.5
+    assert large_ratio < 2
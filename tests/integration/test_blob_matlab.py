@@ -1,3 +1,5 @@
+import timeit
+
 import numpy as np
 import pytest
 from numpy.testing import assert_array_equal
@@ -228,3 +230,72 @@ def test_cell_array_mixed_empty_nonempty():
     assert_array_equal(unpacked[0, 0], np.array([1, 2]))
     assert unpacked[1, 0].size == 0
     assert_array_equal(unpacked[2, 0], np.array([3, 4, 5]))
+
+
+def _trial_struct(n, ragged=False):
+    """
+    A struct array of n trials with scalar, vector, and string fields, as saved by MATLAB.
+
+    With ``ragged``, the ``position`` vectors vary in length from trial to trial.
+    """
+    trials = np.empty((n, 1), dtype=[("onset", object), ("rt", object), ("position", object), ("stim", object)])
+    for i in range(n):
+        trials[i, 0] = (
+            np.array([[i * 0.5]]),
+            np.array([[0.3 + i % 7]], dtype=np.float32),
+            np.arange(1.0 + i % 5).reshape(1, -1) if ragged else np.array([[i, -i, 1.0]]),
+            np.frombuffer(b"grating", dtype="c").reshape(1, -1),  # MATLAB char row
+        )
+    return trials.view(dj.MatStruct)
+
+
+def _unpack_generic(blob, **kwargs):
+    """Unpack with the fixed-layout fast path disabled."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(dj.blob.Blob, "read_fixed_records", lambda self, n_elem, n_fields: None)
+        return unpack(blob, **kwargs)
+
+
+def _assert_same(x, y):
+    assert type(x) is type(y)
+    if isinstance(x, np.ndarray):
+        assert (x.shape, x.dtype) == (y.shape, y.dtype)
+        if x.dtype.names:
+            for name in x.dtype.names:
+                _assert_same(x[name], y[name])
+        elif x.dtype == object:
+            for a, b in zip(x.flat, y.flat):
+                _assert_same(a, b)
+        else:
+            assert x.flags.writeable == y.flags.writeable
+            assert_array_equal(x, y)
+    else:
+        assert x == y
+
+
+@pytest.mark.parametrize("squeeze", [False, True])
+@pytest.mark.parametrize("writeable", [False, True])
+def test_fixed_layout_struct_and_cell_decode(squeeze, writeable):
+    ragged = np.empty((1, 6), dtype=object)
+    ragged[0, :] = [np.arange(k + 1.0) for k in range(6)]
+    uniform = np.empty((1, 6), dtype=object)
+    uniform[0, :] = [np.array([[k, 2.0 * k]]) for k in range(6)]
+    nested = np.empty((2, 1), dtype=[("trial", object)])
+    nested[0, 0], nested[1, 0] = (_trial_struct(3),), (_trial_struct(3),)
+    for obj in (_trial_struct(40), ragged.view(dj.MatCell), uniform.view(dj.MatCell), nested.view(dj.MatStruct)):
+        for compress in (False, True):
+            blob = pack(obj, compress=compress)
+            _assert_same(
+                unpack(blob, squeeze=squeeze, writeable=writeable), _unpack_generic(blob, squeeze=squeeze, writeable=writeable)
+            )
+
+
+@pytest.mark.benchmark
+def test_fixed_layout_struct_decode_speed():
+    # typical mYm payload: a struct array of 10^5 trials with small numeric and string fields
+    blob = pack(_trial_struct(100_000))
+    assert blob.startswith(b"ZL123\0")
+    fast = timeit.timeit(lambda: unpack(blob), number=1)
+    generic = timeit.timeit(lambda: _unpack_generic(blob), number=1)
+    print(f"struct decode: {100_000 / fast:.0f} elements/s, generic {100_000 / generic:.0f} elements/s")
+    assert fast * 5 < generic
@@ -0,0 +1,173 @@
+"""
+Tests for the ChunkedCodec - schema-addressed chunked array storage.
+
+These tests verify:
+- Automatic chunk shape selection
+- Encode/decode roundtrip with and without per-chunk compression
+- Partial reads download only the chunks a selection touches
+- Chunk grid and manifest layout compatible with garbage collection
+"""
+
+import json
+
+import numpy as np
+import pytest
+
+import datajoint as dj
+from datajoint.builtin_codecs import ChunkedCodec, ChunkedRef, SchemaCodec
+from datajoint.builtin_codecs.chunked import _default_chunks
+from datajoint.errors import DataJointError
+from datajoint.gc import _is_covered
+
+
+@pytest.fixture
+def local_store(tmp_path):
+    """Register a local file store for direct codec calls (no database)."""
+    original_stores = dj.config.stores.copy()
+    dj.config.stores["chunk_store"] = {"protocol": "file", "location": str(tmp_path)}
+    yield "chunk_store"
+    dj.config.stores.clear()
+    dj.config.stores.update(original_stores)
+
+
+def _key(**pk):
+    return {"_schema": "lab", "_table": "scan", "_field": "stack", **pk}
+
+
+class CountingBackend:
+    """Wraps a backend and records chunk reads."""
+
+    def __init__(self, backend):
+        self._backend = backend
+        self.reads = []
+
+    def get_buffer(self, path):
+        self.reads.append(path.rsplit("/", 1)[-1])
+        return self._backend.get_buffer(path)
+
+
+class TestChunkedCodecUnit:
+    """Unit tests for ChunkedCodec without database."""
+
+    def test_registered(self):
+        codec = dj.get_codec("chunked")
+        assert isinstance(codec, ChunkedCodec)
+        assert isinstance(codec, SchemaCodec)
+        assert codec.get_dtype(is_store=True) == "json"
+        with pytest.raises(DataJointError, match="requires @"):
+            codec.get_dtype(is_store=False)
+
+    def test_default_chunks_bounded(self):
+        chunks = _default_chunks((1000, 512, 512), 2, target=2**20)
+        assert np.prod(chunks) * 2 <= 2**20
+        assert chunks == (125, 64, 64)
+        assert _default_chunks((10,), 8) == (10,)
+        assert _default_chunks((0, 5), 8) == (1, 5)
+
+    def test_validate(self):
+        codec = ChunkedCodec()
+        codec.validate(np.zeros((3, 4)))
+        codec.validate({"data": np.zeros((3, 4)), "chunks": (2, 2), "compression": "zlib"})
+        with pytest.raises(DataJointError, match="requires numpy"):
+            codec.validate([1, 2, 3])
+        with pytest.raises(DataJointError, match="object dtype"):
+            codec.validate(np.array([1, "a"], dtype=object))
+        with pytest.raises(DataJointError, match="structured or void"):
+            codec.validate(np.zeros(3, dtype=[("x", "f8"), ("y", "i4")]))
+        with pytest.raises(DataJointError, match="structured or void"):
+            codec.validate(np.zeros(3, dtype="V8"))
+        with pytest.raises(DataJointError, match="do not match"):
+            codec.validate({"data": np.zeros((3, 4)), "chunks": (2,)})
+        with pytest.raises(DataJointError, match="unknown compression"):
+            codec.validate({"data": np.zeros(3), "compression": "nope"})
+
+    @pytest.mark.parametrize("compression", [None, "zlib"])
+    def test_roundtrip(self, local_store, compression):
+        codec = ChunkedCodec()
+        array = np.arange(7 * 11 * 5, dtype=np.float32).reshape(7, 11, 5)
+        meta = codec.encode(
+            {"data": array, "chunks": (3, 4, 5), "compression": compression},
+            key=_key(scan_id=1),
+            store_name=local_store,
+        )
+        assert meta["shape"] == [7, 11, 5]
+        assert meta["chunks"] == [3, 4, 5]
+        assert meta["item_count"] == 3 * 3 * 1
+        assert meta["path"].endswith(".chunks")
+        assert "scan_id=1" in meta["path"]
+
+        ref = codec.decode(json.loads(json.dumps(meta)))
+        assert isinstance(ref, ChunkedRef)
+        assert ref.grid == (3, 3, 1)
+        assert ref.is_loaded is False
+        np.testing.assert_array_equal(ref.load(), array)
+        np.testing.assert_array_equal(np.asarray(ref), array)
+
+    @pytest.mark.parametrize(
+        "index",
+        [
+            5,
+            -1,
+            (slice(2, 5), 3),
+            (Ellipsis, 2),
+            (slice(None, None, 3), slice(1, 10, 4)),
+            (slice(None, None, -2),),
+            (slice(4, 4),),
+            (1, 2, 3),
+        ],
+    )
+    def test_partial_reads_match_numpy(self, local_store, index):
+        codec = ChunkedCodec()
+        array = np.random.default_rng(0).standard_normal((9, 10, 4))
+        meta = codec.encode({"data": array, "chunks": (2, 3, 4)}, key=_key(scan_id=2), store_name=local_store)
+        ref = codec.decode(meta)
+        np.testing.assert_array_equal(ref[index], array[index])
+        assert ref.is_loaded is False
+
+    def test_partial_read_fetches_only_touched_chunks(self, local_store):
+        codec = ChunkedCodec()
+        array = np.arange(100 * 8, dtype=np.int16).reshape(100, 8)
+        meta = codec.encode({"data": array, "chunks": (10, 8)}, key=_key(scan_id=3), store_name=local_store)
+        backend = CountingBackend(codec._get_backend(local_store))
+        ref = ChunkedRef(meta, backend)
+        np.testing.assert_array_equal(ref[42], array[42])
+        assert backend.reads == ["4.0"]
+        backend.reads.clear()
+        np.testing.assert_array_equal(ref[15:25], array[15:25])
+        assert sorted(backend.reads) == ["1.0", "2.0"]
+
+    def test_fancy_index_falls_back_to_load(self, local_store):
+        codec = ChunkedCodec()
+        array = np.arange(20).reshape(4, 5)
+        meta = codec.encode({"data": array, "chunks": (2, 2)}, key=_key(scan_id=4), store_name=local_store)
+        ref = codec.decode(meta)
+        np.testing.assert_array_equal(ref[[0, 3]], array[[0, 3]])
+        assert ref.is_loaded is True
+
+    def test_scalar_and_empty_arrays(self, local_store):
+        codec = ChunkedCodec()
+        meta = codec.encode(np.array(3.5), key=_key(scan_id=5), store_name=local_store)
+        assert codec.decode(meta).load() == 3.5
+        meta = codec.encode(np.zeros((0, 3)), key=_key(scan_id=6), store_name=local_store)
+        assert meta["item_count"] == 0
+        assert codec.decode(meta).load().shape == (0, 3)
+
+    def test_manifest_and_gc_coverage(self, local_store, tmp_path):
+        codec = ChunkedCodec()
+        meta = codec.encode({"data": np.ones((4, 4)), "chunks": (2, 4)}, key=_key(scan_id=7), store_name=local_store)
+        manifest = json.loads((tmp_path / f"{meta['path']}.manifest.json").read_text())
+        assert sorted(f["path"] for f in manifest["files"]) == ["0.0", "1.0"]
+        assert manifest["total_size"] == meta["size"]
+
+        (path, store) = codec.referenced_paths(meta)[0]
+        assert store == local_store
+        referenced = {path}
+        assert _is_covered(f"{path}/0.0", referenced)
+        assert _is_covered(f"{path}.manifest.json", referenced)
+        assert not _is_covered(f"{path}x/0.0", referenced)
+
+    def test_repr(self):
+        ref = ChunkedRef({"path": "p", "dtype": "uint8", "shape": [10, 10], "chunks": [5, 10]}, backend=None)
+        assert repr(ref) == "ChunkedRef(shape=(10, 10), chunks=(5, 10), dtype=uint8, not loaded)"
+        assert len(ref) == 10
+        assert ref.nbytes == 100
@@ -2,6 +2,8 @@
 Collection of test cases to test connection module.
 """
 
+import threading
+
 import numpy as np
 import pytest
 
@@ -136,3 +138,26 @@ def test_cancel(schema_tx, connection_test):
     connection_test.cancel_transaction()
     assert len(Subjects()) == 1, "Length is not 1. Expected because rollback should have happened."
     assert len(Subjects & "subject_id = 2") == 0, "Length is not 0. Expected because rollback should have happened."
+
+
+def test_connection_pool(schema_tx, connection_test):
+    """Pooled connections serve concurrent threads and share the dependency graph"""
+    with dj.ConnectionPool(min_size=1, max_size=3, connection=connection_test) as pool:
+        ids, loaded = [], []
+
+        def task():
+            with pool.connection() as conn:
+                ids.append(conn.query("SELECT CONNECTION_ID()").fetchone()[0])
+                conn.dependencies.load()
+                loaded.append(Subjects.full_table_name in conn.dependencies)
+
+        threads = [threading.Thread(target=task) for _ in range(6)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert len(ids) == 6 and all(loaded)
+        assert connection_test.connection_id not in ids
+        assert 1 <= len(set(ids)) <= 3
+        assert pool.size <= 3
+        assert connection_test.dependencies._conn is connection_test
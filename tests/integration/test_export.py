@@ -0,0 +1,136 @@
+"""
+Tests for portable schema export/import (datajoint.export).
+"""
+
+import datetime
+import json
+import uuid
+
+import numpy as np
+import pytest
+
+import datajoint as dj
+from datajoint import DataJointError
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+
+class ExportSubject(dj.Manual):
+    definition = """
+    subject_id : uuid
+    ---
+    name : varchar(32)
+    weight = null : float64
+    birth : date
+    """
+
+
+class ExportSession(dj.Manual):
+    definition = """
+    -> ExportSubject
+    session : int16
+    ---
+    started : datetime
+    signal : <blob>
+    notes = null : json
+    """
+
+
+@pytest.fixture
+def schema_export(connection_test, prefix):
+    schema = dj.Schema(
+        f"{prefix}_test_export",
+        context={"ExportSubject": ExportSubject, "ExportSession": ExportSession},
+        connection=connection_test,
+    )
+    schema(ExportSubject)
+    schema(ExportSession)
+    subjects = [uuid.UUID(int=i) for i in range(3)]
+    ExportSubject.insert(
+        {"subject_id": s, "name": f"s{i}", "weight": None if i == 2 else 20.5 + i, "birth": datetime.date(2024, 1, i + 1)}
+        for i, s in enumerate(subjects)
+    )
+    ExportSession.insert(
+        {
+            "subject_id": s,
+            "session": k,
+            "started": datetime.datetime(2025, 5, 1, 12, k),
+            "signal": np.arange(k + 3) * 1.5,
+            "notes": {"k": k} if k else None,
+        }
+        for s in subjects
+        for k in range(4)
+    )
+    yield schema
+    schema.drop(prompt=False)
+
+
+@pytest.fixture
+def schema_restored(connection_test, prefix):
+    name = f"{prefix}_test_export_restored"
+    yield name
+    connection_test.query(f"DROP DATABASE IF EXISTS `{name}`")
+
+
+@pytest.mark.parametrize("fmt", ["parquet", "arrow"])
+def test_roundtrip(schema_export, schema_restored, connection_test, tmp_path, fmt):
+    manifest = dj.export_schema(schema_export, tmp_path / "dump", format=fmt, batch_size=5, workers=2)
+    assert [t["name"] for t in manifest["tables"]] == ["export_subject", "export_session"]
+    assert [t["rows"] for t in manifest["tables"]] == [3, 12]
+    assert manifest["levels"] == [["export_subject"], ["export_session"]]
+    assert json.loads((tmp_path / "dump" / "manifest.json").read_text())["schema"] == schema_export.database
+
+    result = dj.import_schema(tmp_path / "dump", schema_restored, connection=connection_test, batch_size=4, workers=2)
+    assert result["rows"] == {"export_subject": 3, "export_session": 12}
+
+    restored = dj.VirtualModule("restored", schema_restored, connection=connection_test)
+    original = ExportSession.to_dicts(order_by="KEY")
+    copied = restored.ExportSession.to_dicts(order_by="KEY")
+    assert len(copied) == len(original)
+    for a, b in zip(original, copied):
+        np.testing.assert_array_equal(a.pop("signal"), b.pop("signal"))
+        assert a == b
+    assert ExportSubject.to_dicts(order_by="KEY") == restored.ExportSubject.to_dicts(order_by="KEY")
+
+
+def test_parquet_row_groups(schema_export, tmp_path):
+    dj.export_schema(schema_export, tmp_path, batch_size=5, workers=1)
+    metadata = pq.ParquetFile(tmp_path / "export_session.parquet").metadata
+    assert metadata.num_rows == 12
+    assert metadata.num_row_groups == 3
+    assert metadata.row_group(0).column(1).statistics.has_min_max
+    heading = json.loads(pq.read_schema(tmp_path / "export_session.parquet").field("signal").metadata[b"datajoint"])
+    assert heading["codec"] == "blob"
+
+
+def test_arrow_batches_are_read_one_at_a_time(tmp_path):
+    from datajoint.export import _ipc_batches
+
+    file = tmp_path / "table.arrow"
+    with pa.ipc.new_file(str(file), pa.schema([("x", pa.int64())]), options=pa.ipc.IpcWriteOptions(compression="zstd")) as w:
+        for k in range(3):
+            w.write_table(pa.table({"x": list(range(10 * k, 10 * k + 10))}))
+    batches = list(_ipc_batches(pa, file, batch_size=4))
+    assert [b.num_rows for b in batches] == [4, 4, 2] * 3
+    assert [x for b in batches for x in b.column("x").to_pylist()] == list(range(30))
+
+
+def test_import_is_rerunnable(schema_export, schema_restored, connection_test, tmp_path):
+    dj.export_schema(schema_export, tmp_path)
+    first = dj.import_schema(tmp_path, schema_restored, connection=connection_test)
+    assert first["rows_imported"] == 15
+    again = dj.import_schema(tmp_path, schema_restored, connection=connection_test)
+    assert again["rows_imported"] == 0  # every row is already present
+    count = connection_test.query(f"SELECT COUNT(*) FROM `{schema_restored}`.`export_session`").fetchone()[0]
+    assert count == 12
+
+
+def test_export_errors(schema_export, tmp_path):
+    with pytest.raises(DataJointError, match="Unknown export format"):
+        dj.export_schema(schema_export, tmp_path, format="csv")
+    dj.export_schema(schema_export, tmp_path)
+    with pytest.raises(DataJointError, match="already contains"):
+        dj.export_schema(schema_export, tmp_path)
+    with pytest.raises(DataJointError, match="No export manifest"):
+        dj.import_schema(tmp_path / "missing", "whatever")
@@ -287,6 +287,35 @@ def test_query_caching(schema_any):
     shutil.rmtree(os.path.expanduser("~/dj_query_cache"), ignore_errors=True)
 
 
+def test_result_cache(schema_any):
+    """Cached results are served without queries and dropped when their tables change"""
+    conn = schema.TTest3.connection
+    table = schema.TTest3()
+    table.insert([dict(key=700 + i, value=900 + i) for i in range(2)])
+    conn.set_result_cache(dj.QueryCache())
+    try:
+        restricted = table & "key >= 700"
+        first = restricted.to_dicts(order_by="key")
+        with conn.count_round_trips() as trips:
+            assert restricted.to_dicts(order_by="key") == first
+            assert len(restricted) == 2 and restricted
+        assert trips["queries"] == 2  # len and bool, once each
+        with conn.count_round_trips() as trips:
+            assert len(restricted) == 2
+        assert trips["queries"] == 0
+
+        table.insert1(dict(key=702, value=902))
+        assert len(restricted.to_dicts()) == len(restricted) == 3
+        with conn.transaction:
+            (table & "key = 702").delete_quick()
+            assert len(restricted) == 2  # transactions bypass the cache
+        assert len(restricted) == 2
+        assert conn.result_cache.stats["invalidations"] >= 3
+    finally:
+        conn.set_result_cache()
+        (table & "key >= 700").delete_quick()
+
+
 def test_fetch_group_by(schema_any):
     """
     https://github.com/datajoint/datajoint-python/issues/914
@@ -221,12 +221,12 @@ class TestCollect:
         with ExitStack() as es:
             for p in self._patch_data():
                 es.enter_context(p)
-            mock_delete = es.enter_context(patch("datajoint.gc.delete_path"))
-            stats = _mock_collector().collect()  # dry_run defaults True
+            collector = _mock_collector()
+            stats = collector.collect()  # dry_run defaults True
 
         assert stats["dry_run"] is True
         assert stats["deleted"] == 0 and stats["bytes_freed"] == 0
-        mock_delete.assert_not_called()
+        collector.backend.remove_many.assert_not_called()
         # full report is present
         assert stats["hash_paths_orphaned"] == 1 and stats["orphaned_hash_paths"] == ["_hash/s/path3"]
         assert stats["hash_paths_orphaned_bytes"] == 200
@@ -241,18 +241,34 @@ class TestCollect:
         with ExitStack() as es:
             for p in self._patch_data():
                 es.enter_context(p)
-            mock_delete_hash = es.enter_context(patch("datajoint.gc.delete_path", return_value=True))
-            mock_delete_schema = es.enter_context(patch.object(gc.GarbageCollector, "delete_schema_path", return_value=True))
+            mock_prune = es.enter_context(patch.object(gc.GarbageCollector, "_prune_empty_dirs", return_value=0))
             collector = _mock_collector()
+            collector.backend.remove_many.return_value = {}
             stats = collector.collect(dry_run=False)
 
         assert stats["hash_paths_deleted"] == 1 and stats["schema_paths_deleted"] == 1
         assert stats["deleted"] == 2
         assert stats["bytes_freed"] == 500  # 200 (hash path3) + 300 (schema pk2)
         assert stats["dry_run"] is False
-        # hash deleted via the collector's own store/config (not threaded params)
-        mock_delete_hash.assert_called_once_with("_hash/s/path3", collector.store, config=collector.config)
-        mock_delete_schema.assert_called_once_with("s/t/pk2/f")
+        # both sections deleted in bulk via the collector's own backend
+        removed = [c.args[0] for c in collector.backend.remove_many.call_args_list]
+        assert removed == [["_hash/s/path3"], ["s/t/pk2/f"]]
+        # empty directories pruned once, for the deleted schema paths
+        mock_prune.assert_called_once_with(["s/t/pk2/f"])
+
+    def test_delete_failures_are_counted_not_freed(self):
+        """Paths the backend could not remove count as errors, not bytes freed."""
+        with ExitStack() as es:
+            for p in self._patch_data():
+                es.enter_context(p)
+            es.enter_context(patch.object(gc.GarbageCollector, "_prune_empty_dirs", return_value=0))
+            collector = _mock_collector()
+            collector.backend.remove_many.side_effect = [{"_hash/s/path3": PermissionError("denied")}, {}]
+            stats = collector.collect(dry_run=False)
+
+        assert stats["errors"] == 1
+        assert stats["hash_paths_deleted"] == 0 and stats["schema_paths_deleted"] == 1
+        assert stats["bytes_freed"] == 300
 
 
 class TestScanWithLiveData:
@@ -777,7 +793,6 @@ class TestScanErrorGuard:
         with ExitStack() as es:
             for p in TestCollect._patch_data(TestCollect):
                 es.enter_context(p)
-            es.enter_context(patch("datajoint.gc.delete_path"))
             collector = _mock_collector()
             # Simulate a leftover error from a previous run.
             collector._scan_errors = ["stale error from previous call"]
@@ -791,27 +806,26 @@ class TestScanErrorGuard:
         """collect(dry_run=False) must refuse to delete when list_*_paths hit a
         non-FileNotFoundError walk failure — partial listing means live files
         could be misclassified as orphans."""
-        # Real walk failure: mock fs.walk on list_hash_paths to raise a
+        # Real walk failure: mock fs.ls on list_hash_paths to raise a
         # non-FileNotFoundError, exercising the outer except that records the
         # scan error.
         with ExitStack() as es:
             es.enter_context(patch.object(gc.GarbageCollector, "hash_references", return_value=set()))
             es.enter_context(patch.object(gc.GarbageCollector, "schema_references", return_value=set()))
 
-            # Real list_hash_paths runs and hits fs.walk failure; list_schema_paths
+            # Real list_hash_paths runs and hits an fs.ls failure; list_schema_paths
             # is stubbed to a clean empty listing so only the hash walk errors.
             es.enter_context(patch.object(gc.GarbageCollector, "list_schema_paths", return_value={}))
 
             collector = _mock_collector()
-            collector.backend.fs.walk.side_effect = PermissionError("s3 access denied")
+            collector.backend.fs.ls.side_effect = PermissionError("s3 access denied")
             collector.backend._full_path.return_value = "/root"
 
-            mock_delete = es.enter_context(patch("datajoint.gc.delete_path"))
             with pytest.raises(DataJointError, match="Refusing to delete"):
                 collector.collect(dry_run=False)
 
             # And no deletion happened.
-            mock_delete.assert_not_called()
+            collector.backend.remove_many.assert_not_called()
 
     def test_scan_errors_in_stats_dict(self):
         """The returned stats dict always includes a 'scan_errors' key: empty
@@ -821,7 +835,6 @@ class TestScanErrorGuard:
         with ExitStack() as es:
             for p in TestCollect._patch_data(TestCollect):
                 es.enter_context(p)
-            es.enter_context(patch("datajoint.gc.delete_path"))
             stats = _mock_collector().collect()
 
         assert "scan_errors" in stats
@@ -835,7 +848,7 @@ class TestScanErrorGuard:
 
             collector = _mock_collector()
             collector.schemas[0].database = "s"
-            collector.backend.fs.walk.side_effect = PermissionError("s3 access denied")
+            collector.backend.fs.ls.side_effect = PermissionError("s3 access denied")
             collector.backend._full_path.return_value = "/root"
 
             stats = collector.collect()  # dry_run=True → returns rather than raising
@@ -948,3 +961,63 @@ class TestDeleteSchemaPathPruning:
             f"pruning walk must stop at store root; root itself was removed at {store_root} — "
             f"the `parent != root and parent.startswith(root)` boundary in gc.py:295 owns this"
         )
+
+
+class TestIncrementalCollect:
+    """collect(incremental=True) checks only paths journaled by deletions."""
+
+    @pytest.fixture
+    def schema_journal(self, connection_test, prefix, mock_stores):
+        schema = dj.Schema(
+            f"{prefix}_test_gc_journal",
+            context={"GcBlobTest": GcBlobTest, "GcObjectTest": GcObjectTest},
+            connection=connection_test,
+        )
+        schema(GcBlobTest)
+        schema(GcObjectTest)
+        schema.enable_gc_journal()
+        yield schema
+        schema.drop()
+
+    @pytest.fixture
+    def schema_blob_free(self, connection_test, prefix, mock_stores):
+        schema = dj.Schema(f"{prefix}_test_gc_nojournal", context={"GcBlobTest": GcBlobTest}, connection=connection_test)
+        schema(GcBlobTest)
+        yield schema
+        schema.drop()
+
+    def test_requires_journal(self, schema_blob_free):
+        """Incremental collection needs every schema's journal."""
+        with pytest.raises(DataJointError, match="no deletion journal"):
+            _gc(schema_blob_free).collect(incremental=True)
+
+    def test_deleted_rows_are_journaled_and_collected(self, schema_journal):
+        shared = np.arange(16, dtype="uint8")
+        GcBlobTest.insert([{"rid": 1, "payload": shared}, {"rid": 2, "payload": shared}, {"rid": 3, "payload": np.ones(8)}])
+        GcObjectTest.insert1({"rid": 1, "results": b"orphan-me"})
+        assert schema_journal.gc_journal_enabled
+
+        (GcBlobTest & "rid in (1, 3)").delete(prompt=False)
+        (GcObjectTest & {"rid": 1}).delete(prompt=False)
+
+        collector = _gc(schema_journal)
+        stats = collector.collect(incremental=True)
+        assert stats["incremental"] is True
+        assert stats["candidates"] == 3  # two distinct blobs + one object
+        assert stats["candidates_referenced"] == 1  # the shared blob is still used by rid=2
+        assert stats["hash_paths_orphaned"] == 1 and stats["schema_paths_orphaned"] == 1
+
+        stats = collector.collect(incremental=True, dry_run=False)
+        assert stats["deleted"] == 2
+        assert collector.collect(incremental=True)["candidates"] == 0  # journal cleared
+        np.testing.assert_array_equal((GcBlobTest & {"rid": 2}).fetch1("payload"), shared)
+        # A full collection agrees that nothing is left to reclaim.
+        assert collector.collect()["hash_paths_orphaned"] == 0
+
+    def test_rolled_back_delete_is_not_journaled(self, schema_journal):
+        GcBlobTest.insert1({"rid": 1, "payload": np.arange(4)})
+        conn = schema_journal.connection
+        conn.start_transaction()
+        (GcBlobTest & {"rid": 1}).delete_quick()
+        conn.cancel_transaction()
+        assert _gc(schema_journal).collect(incremental=True)["candidates"] == 0
@@ -8,11 +8,17 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from datajoint.hash_registry import (
+    HASH_ALGORITHMS,
+    ContentStream,
+    HashBatch,
+    PendingHash,
+    TreeHasher,
     build_hash_path,
     compute_hash,
     delete_path,
     get_hash,
     put_hash,
+    put_hashes,
 )
 from datajoint.errors import DataJointError
 
@@ -51,6 +57,42 @@ class TestComputeHash:
         hash2 = compute_hash(data)
         assert hash1 == hash2
 
+    @pytest.mark.parametrize("algorithm", sorted(HASH_ALGORITHMS))
+    def test_streaming_matches_bytes(self, algorithm, tmp_path):
+        """Test that chunks and files hash the same as the whole payload."""
+        data = bytes(range(256)) * 1000
+        path = tmp_path / "data.bin"
+        path.write_bytes(data)
+        expected = compute_hash(data, algorithm)
+        assert BASE32_PATTERN.match(expected)
+        assert compute_hash(iter([data[:1000], data[1000:]]), algorithm) == expected
+        assert compute_hash(path, algorithm) == expected
+        with pytest.raises(DataJointError, match="does not accept str"):
+            compute_hash(str(path), algorithm)  # text or a file name: ambiguous
+
+    def test_md5_is_default(self):
+        """Test that the default algorithm keeps existing MD5 hashes."""
+        assert compute_hash(b"abc") == compute_hash(b"abc", "md5") != compute_hash(b"abc", "blake2b")
+
+    def test_tree_hash_independent_of_chunking(self):
+        """Test that the tree hash depends only on content and leaf size."""
+        data = bytes(range(256)) * 40
+
+        def tree_digest(step, leaf_size=1024):
+            hasher = TreeHasher(leaf_size=leaf_size, max_workers=3)
+            for i in range(0, len(data), step):
+                hasher.update(data[i : i + step])
+            return hasher.digest()
+
+        assert tree_digest(1) == tree_digest(333) == tree_digest(len(data))
+        assert tree_digest(333) != tree_digest(333, leaf_size=2048)
+        assert TreeHasher(leaf_size=1024).digest() != TreeHasher(leaf_size=2048).digest()
+
+    def test_unknown_algorithm(self):
+        """Test that an unregistered algorithm raises."""
+        with pytest.raises(DataJointError, match="Unknown hash algorithm"):
+            compute_hash(b"abc", "sha3")
+
 
 class TestBuildHashPath:
     """Tests for build_hash_path function."""
@@ -157,6 +199,180 @@ class TestPutHash:
         mock_backend.put_buffer.assert_not_called()
 
 
+class TestPutHashes:
+    """Tests for batched hash-addressed storage."""
+
+    @pytest.fixture
+    def test_store(self):
+        import datajoint as dj
+
+        original_stores = dj.config.stores.copy()
+        dj.config.stores["test_store"] = {"protocol": "file", "location": "/tmp/test_hash_store"}
+        yield "test_store"
+        dj.config.stores.clear()
+        dj.config.stores.update(original_stores)
+
+    @patch("datajoint.hash_registry.get_store_backend")
+    def test_dedupes_and_uploads_only_missing(self, mock_get_backend, test_store):
+        """Test that duplicates upload once and existing content is skipped."""
+        existing_path = f"_hash/s1/{compute_hash(b'old')}"
+        mock_backend = MagicMock()
+        mock_backend.exists_many.return_value = {existing_path}
+        mock_get_backend.return_value = mock_backend
+
+        items = [(b"new", "s1"), (b"old", "s1"), (b"new", "s1"), (b"new", "s2")]
+        results = put_hashes(items, store_name=test_store)
+
+        assert [r["hash"] for r in results] == [compute_hash(d) for d, _ in items]
+        assert [r["schema"] for r in results] == ["s1", "s1", "s1", "s2"]
+        assert results[0]["path"] == results[2]["path"] != results[3]["path"]
+        checked = mock_backend.exists_many.call_args[0][0]
+        assert len(checked) == 3
+        uploaded = sorted(call.args[1] for call in mock_backend.put_buffer.call_args_list)
+        assert uploaded == sorted([results[0]["path"], results[3]["path"]])
+
+    @patch("datajoint.hash_registry.get_store_backend")
+    def test_empty_batch(self, mock_get_backend, test_store):
+        """Test that an empty batch makes no storage calls."""
+        assert put_hashes([], store_name=test_store) == []
+        mock_get_backend.assert_not_called()
+
+    @patch("datajoint.hash_registry.get_store_backend")
+    def test_hash_batch_defers_until_flush(self, mock_get_backend, test_store):
+        """Test that the <hash> codec queues values in a batch from the insert context."""
+        import datajoint as dj
+
+        mock_backend = MagicMock()
+        mock_backend.exists_many.return_value = set()
+        mock_get_backend.return_value = mock_backend
+
+        batch = HashBatch()
+        key = {"_schema": "s1", "_hash_batch": batch}
+        pending = [dj.get_codec("hash").encode(data, key=key, store_name=test_store) for data in (b"a", b"b", b"a")]
+        assert all(isinstance(p, PendingHash) and p.metadata is None for p in pending)
+        mock_backend.put_buffer.assert_not_called()
+
+        batch.flush()
+        assert [p.metadata["hash"] for p in pending] == [compute_hash(b"a"), compute_hash(b"b"), compute_hash(b"a")]
+        assert mock_backend.put_buffer.call_count == 2
+
+    @patch("datajoint.hash_registry.get_store_backend")
+    def test_hash_batch_flushes_early_when_full(self, mock_get_backend, test_store):
+        """Test that queued bytes beyond max_bytes are stored before the final flush."""
+        mock_backend = MagicMock()
+        mock_backend.exists_many.return_value = set()
+        mock_get_backend.return_value = mock_backend
+
+        batch = HashBatch(max_bytes=10)
+        first = batch.add(b"x" * 6, "s1", store_name=test_store)
+        assert first.metadata is None
+        second = batch.add(b"y" * 6, "s1", store_name=test_store)
+        assert first.metadata is not None and second.metadata is not None
+        assert mock_backend.put_buffer.call_count == 2
+
+    def test_exists_many(self, tmp_path):
+        """Test StorageBackend.exists_many on a local store."""
+        from datajoint.storage import StorageBackend
+
+        backend = StorageBackend({"protocol": "file", "location": str(tmp_path)})
+        backend.put_buffer(b"1", "a/x")
+        backend.put_buffer(b"2", "b/y")
+        assert backend.exists_many(["a/x", "a/missing", "b/y", "c/z"]) == {"a/x", "b/y"}
+
+
+class TestContentStream:
+    """Tests for streaming content into hash-addressed storage."""
+
+    @pytest.fixture
+    def file_store(self, tmp_path):
+        import datajoint as dj
+
+        original_stores = dj.config.stores.copy()
+        dj.config.stores["stream_store"] = {"protocol": "file", "location": str(tmp_path)}
+        yield "stream_store"
+        dj.config.stores.clear()
+        dj.config.stores.update(original_stores)
+
+    def test_iterates_parts_in_chunks(self, tmp_path):
+        """Test that file parts are read in chunks and the stream can be re-iterated."""
+        source = tmp_path / "data.bin"
+        source.write_bytes(bytes(range(256)) * 10)
+        stream = ContentStream(b"head\x00", source, chunk_size=1000)
+
+        chunks = list(stream)
+        assert [len(c) for c in chunks] == [5, 1000, 1000, 560]
+        assert b"".join(stream) == b"head\x00" + source.read_bytes()
+        assert stream.size == 5 + 2560
+
+    def test_put_hash_streams_same_hash_as_bytes(self, tmp_path, file_store):
+        """Test that streamed content is stored at the same hash as its bytes."""
+        import datajoint as dj
+
+        source = tmp_path / "data.bin"
+        source.write_bytes(b"x" * 5000)
+        stream = ContentStream(b"data.bin\x00", source, chunk_size=1024)
+
+        result = put_hash(stream, schema_name="test_schema", store_name=file_store)
+        expected = b"data.bin\x00" + source.read_bytes()
+        assert result["hash"] == compute_hash(expected)
+        assert result["size"] == len(expected)
+        assert get_hash(result, config=dj.config) == expected
+
+    def test_temporary_streams_are_closed_after_storing(self, tmp_path, file_store):
+        """Test that temporary file parts are closed once stored and others are left open."""
+        import tempfile
+
+        spools = [tempfile.SpooledTemporaryFile() for _ in range(3)]
+        for i, spool in enumerate(spools):
+            spool.write(b"spooled %d" % i)
+            spool.seek(0)
+        source = tmp_path / "data.bin"
+        source.write_bytes(b"file content")
+
+        put_hash(ContentStream(spools[0], temporary=True), schema_name="test_schema", store_name=file_store)
+        assert spools[0].closed
+        put_hashes(
+            [(ContentStream(spool, temporary=True), "test_schema") for spool in spools[1:]],
+            store_name=file_store,
+        )
+        assert all(spool.closed for spool in spools)
+
+        with open(source, "rb") as f:
+            stream = ContentStream(f, str(source))
+            assert isinstance(stream.parts[1], type(source))
+            put_hash(stream, schema_name="test_schema", store_name=file_store)
+            assert not f.closed
+
+    def test_store_hash_algorithm(self, tmp_path, file_store):
+        """Test that the store's hash algorithm is used and recorded in metadata."""
+        import datajoint as dj
+
+        dj.config.stores[file_store]["hash_algorithm"] = "blake2b"
+        result = put_hash(b"payload", schema_name="test_schema", store_name=file_store)
+        assert result["algorithm"] == "blake2b"
+        assert result["hash"] == compute_hash(b"payload", "blake2b")
+        assert get_hash(result) == b"payload"
+
+        # metadata written before algorithms were configurable is verified as MD5
+        del dj.config.stores[file_store]["hash_algorithm"]
+        legacy = put_hash(b"payload", schema_name="test_schema", store_name=file_store)
+        del legacy["algorithm"]
+        assert get_hash(legacy) == b"payload"
+
+    def test_attach_in_store_streams(self, tmp_path, file_store):
+        """Test that in-store attachments are streamed rather than read into memory."""
+        import datajoint as dj
+
+        source = tmp_path / "notes.txt"
+        source.write_bytes(b"attachment body")
+        encoded = dj.get_codec("attach").encode(source, store_name=file_store)
+        assert isinstance(encoded, ContentStream)
+        assert dj.get_codec("attach").encode(source) == b"notes.txt\x00attachment body"
+
+        metadata = dj.get_codec("hash").encode(encoded, key={"_schema": "test_schema"}, store_name=file_store)
+        assert get_hash(metadata) == b"notes.txt\x00attachment body"
+
+
 class TestGetHash:
     """Tests for get_hash function."""
 
@@ -0,0 +1,327 @@
+"""
+Tests for the resumable, batched migrations in datajoint.migrate.
+"""
+
+import uuid
+
+import numpy as np
+import pytest
+
+import datajoint as dj
+from datajoint import DataJointError, migrate
+from datajoint.storage import StorageBackend
+
+N_ROWS = 5
+
+
+def _table_exists(connection, database, table_name):
+    return connection.query(
+        "SELECT COUNT(*) FROM information_schema.TABLES WHERE TABLE_SCHEMA = %s AND TABLE_NAME = %s",
+        args=(database, table_name),
+    ).fetchone()[0]
+
+
+@pytest.fixture
+def schema_legacy(connection_test, prefix):
+    """A schema with 0.x external references: ``recording.signal`` points into ``~external_raw``."""
+    schema = dj.Schema(f"{prefix}_test_migrate", connection=connection_test)
+    db = schema.database
+    connection_test.query(
+        f"""
+        CREATE TABLE `{db}`.`~external_raw` (
+            hash binary(16) NOT NULL,
+            size bigint unsigned NOT NULL,
+            filepath varchar(1000),
+            timestamp timestamp NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (hash)
+        )
+        """
+    )
+    connection_test.query(
+        f"""
+        CREATE TABLE `{db}`.`recording` (
+            recording_id int NOT NULL,
+            signal binary(16) COMMENT ':blob@raw:signal',
+            PRIMARY KEY (recording_id)
+        )
+        """
+    )
+    hashes = [uuid.UUID(int=i + 1).bytes for i in range(N_ROWS)]
+    for i, h in enumerate(hashes):
+        connection_test.query(
+            f"INSERT INTO `{db}`.`~external_raw` (hash, size, filepath) VALUES (%s, %s, %s)",
+            args=(h, 100 + i, f"{db}/recording/{i}.dat"),
+        )
+        connection_test.query(f"INSERT INTO `{db}`.`recording` VALUES (%s, %s)", args=(i, h))
+    yield schema
+    schema.drop(prompt=False)
+
+
+def test_migrate_external_resumes_after_interrupted_first_batch(schema_legacy, monkeypatch):
+    connection, db = schema_legacy.connection, schema_legacy.database
+
+    def crash(*args, **kwargs):
+        raise RuntimeError("interrupted")
+
+    # the run dies right after adding the new column, before any row is converted
+    with monkeypatch.context() as m:
+        m.setattr(migrate, "_batched_update", crash)
+        with pytest.raises(DataJointError):
+            migrate.migrate_external(schema_legacy, dry_run=False)
+
+    result = migrate.migrate_external(schema_legacy, dry_run=False, batch_size=2)
+    (detail,) = result["details"]
+    assert detail["status"] == "migrated" and detail["resumed"]
+    assert result["rows_migrated"] == N_ROWS
+    assert connection.query(f"SELECT COUNT(*) FROM `{db}`.`recording` WHERE signal_v2 IS NOT NULL").fetchone()[0] == N_ROWS
+
+    again = migrate.migrate_external(schema_legacy, dry_run=False)
+    assert again["details"][0]["status"] == "already_migrated"
+
+
+def test_verify_external_integrity_is_read_only(schema_legacy, tmp_path, monkeypatch):
+    connection, db = schema_legacy.connection, schema_legacy.database
+
+    result = migrate.verify_external_integrity(schema_legacy, store_name="raw", batch_size=2)
+    assert (result["total_references"], result["valid"], len(result["missing"])) == (N_ROWS, 0, N_ROWS)
+    assert not _table_exists(connection, db, migrate.MIGRATION_STATE_TABLE)
+
+    # interrupted after the first batch: progress is kept in checkpoint_dir only
+    exists_many, calls = StorageBackend.exists_many, []
+
+    def fail_second_batch(self, paths, **kwargs):
+        calls.append(1)
+        if len(calls) == 2:
+            raise ConnectionError("store unreachable")
+        return exists_many(self, paths, **kwargs)
+
+    with monkeypatch.context() as m:
+        m.setattr(StorageBackend, "exists_many", fail_second_batch)
+        migrate.verify_external_integrity(schema_legacy, store_name="raw", batch_size=2, checkpoint_dir=tmp_path)
+    assert list(tmp_path.glob("*.json"))
+
+    resumed = migrate.verify_external_integrity(schema_legacy, store_name="raw", batch_size=2, checkpoint_dir=tmp_path)
+    assert resumed["total_references"] == N_ROWS
+    assert sorted(entry["filepath"] for entry in resumed["missing"]) == sorted(
+        entry["filepath"] for entry in result["missing"]
+    )
+    assert not list(tmp_path.iterdir())  # cleared once complete
+    assert not _table_exists(connection, db, migrate.MIGRATION_STATE_TABLE)
+
+
+def test_migrate_external_pointers_keeps_errors_across_resume(schema_legacy, monkeypatch):
+    connection, db = schema_legacy.connection, schema_legacy.database
+    # pointers are rewritten in place, so the column must hold JSON once converted
+    connection.query(f"ALTER TABLE `{db}`.`recording` MODIFY signal longblob")
+    orphan = uuid.UUID(int=999).bytes
+    connection.query(f"UPDATE `{db}`.`recording` SET signal = %s WHERE recording_id = 0", args=(orphan,))
+
+    update, calls = migrate._update_from_values, []
+
+    def crash_second_batch(*args, **kwargs):
+        calls.append(1)
+        if len(calls) == 2:
+            raise RuntimeError("interrupted")
+        return update(*args, **kwargs)
+
+    with monkeypatch.context() as m:
+        m.setattr(migrate, "_update_from_values", crash_second_batch)
+        with pytest.raises(RuntimeError):
+            migrate.migrate_external_pointers_v2(db, "recording", "signal", "raw", "raw", connection=connection, batch_size=2)
+
+    result = migrate.migrate_external_pointers_v2(db, "recording", "signal", "raw", "raw", connection=connection, batch_size=2)
+    assert result["rows_migrated"] == N_ROWS - 1
+    assert result["errors"] == [f"External file not found for UUID: {orphan.hex()}"]
+
+    done = migrate.migrate_external_pointers_v2(db, "recording", "signal", "raw", "raw", connection=connection)
+    assert done["errors"] == result["errors"]
+
+
+@pytest.fixture
+def schema_copy(schema_legacy):
+    connection = schema_legacy.connection
+    dest = f"{schema_legacy.database}_copy"
+    yield dest
+    connection.query(f"DROP DATABASE IF EXISTS `{dest}`")
+
+
+def test_create_parallel_schema_counts_created_tables(schema_legacy, schema_copy):
+    connection, db = schema_legacy.connection, schema_legacy.database
+    result = migrate.create_parallel_schema(db, schema_copy, copy_data=True, connection=connection, workers=2, batch_size=2)
+    assert {"recording", "~external_raw"} <= set(result["tables"])
+    assert result["tables_created"] == len(result["tables"])
+    assert result["rows_copied"] == 2 * N_ROWS
+
+    rerun = migrate.create_parallel_schema(db, schema_copy, connection=connection, workers=2)
+    assert rerun["tables_created"] == 0 and rerun["tables"] == result["tables"]
+
+
+def test_backup_again_requires_overwrite(schema_legacy, schema_copy):
+    connection, db = schema_legacy.connection, schema_legacy.database
+    backup = migrate.backup_schema(db, schema_copy, connection=connection, workers=2)
+    assert backup["rows_backed_up"] == 2 * N_ROWS
+
+    connection.query(f"INSERT INTO `{db}`.`recording` VALUES (%s, NULL)", args=(N_ROWS,))
+    # a completed backup is not silently reported as current
+    with pytest.raises(DataJointError, match="overwrite"):
+        migrate.backup_schema(db, schema_copy, connection=connection)
+    with pytest.raises(DataJointError, match="already copied"):
+        migrate.copy_table_data(db, schema_copy, "recording", connection=connection)
+
+    again = migrate.backup_schema(db, schema_copy, connection=connection, overwrite=True)
+    assert again["rows_backed_up"] == 2 * N_ROWS + 1
+    assert connection.query(f"SELECT COUNT(*) FROM `{schema_copy}`.`recording`").fetchone()[0] == N_ROWS + 1
+
+
+def test_backup_resumes_interrupted_copy(schema_legacy, schema_copy, monkeypatch):
+    connection, db = schema_legacy.connection, schema_legacy.database
+    copy, calls = migrate.copy_table_data, []
+
+    def crash_second_table(*args, **kwargs):
+        calls.append(1)
+        if len(calls) == 2:
+            raise RuntimeError("interrupted")
+        return copy(*args, **kwargs)
+
+    with monkeypatch.context() as m:
+        m.setattr(migrate, "copy_table_data", crash_second_table)
+        with pytest.raises(RuntimeError):
+            migrate.backup_schema(db, schema_copy, connection=connection, workers=1)
+
+    backup = migrate.backup_schema(db, schema_copy, connection=connection, workers=1)
+    assert backup["rows_backed_up"] == 2 * N_ROWS
+    assert connection.query(f"SELECT COUNT(*) FROM `{schema_copy}`.`recording`").fetchone()[0] == N_ROWS
+
+
+@pytest.fixture
+def comparison_schemas(connection_test, prefix):
+    """Two copies of a 200-row table, in a "production" and a "test" schema."""
+    prod, test = f"{prefix}_test_compare_prod", f"{prefix}_test_compare_v20"
+    rows = [(i, i * 0.5, f"label{i}") for i in range(200)]
+    for db in (prod, test):
+        connection_test.query(f"CREATE DATABASE IF NOT EXISTS `{db}`")
+        connection_test.query(
+            f"CREATE TABLE `{db}`.`measurement` (id int NOT NULL, value double, label varchar(16), PRIMARY KEY (id))"
+        )
+        connection_test.query(
+            f"INSERT INTO `{db}`.`measurement` VALUES {', '.join(['(%s, %s, %s)'] * len(rows))}",
+            args=tuple(v for row in rows for v in row),
+        )
+    yield prod, test
+    for db in (prod, test):
+        connection_test.query(f"DROP DATABASE IF EXISTS `{db}`")
+
+
+def _compare(connection, schemas, **kwargs):
+    return migrate.compare_query_results(*schemas, "measurement", connection=connection, chunk_rows=10, fanout=4, **kwargs)
+
+
+def test_compare_identical_tables(connection_test, comparison_schemas):
+    result = _compare(connection_test, comparison_schemas)
+    assert result["match"] and result["row_count"] == 200
+    assert result["discrepancies"] == [] and result["rows_fetched"] == 0
+
+
+def test_compare_finds_single_differing_row(connection_test, comparison_schemas):
+    _, test = comparison_schemas
+    connection_test.query(f"UPDATE `{test}`.`measurement` SET label = 'changed' WHERE id = 123")
+    result = _compare(connection_test, comparison_schemas)
+    assert not result["match"]
+    assert result["discrepancies"] == ["Key {'id': 123}, label: 'label123' != 'changed'"]
+    assert 0 < result["rows_fetched"] < 2 * 50  # only ranges around the difference are fetched
+
+
+def test_compare_finds_missing_row(connection_test, comparison_schemas):
+    _, test = comparison_schemas
+    connection_test.query(f"DELETE FROM `{test}`.`measurement` WHERE id = 57")
+    result = _compare(connection_test, comparison_schemas)
+    assert not result["match"]
+    assert result["discrepancies"] == ["Row count mismatch: prod=200, test=199", "Key {'id': 57}: missing in test"]
+
+
+def test_compare_float_tolerance(connection_test, comparison_schemas):
+    _, test = comparison_schemas
+    connection_test.query(f"UPDATE `{test}`.`measurement` SET value = value + 1e-9 WHERE id = 42")
+    assert _compare(connection_test, comparison_schemas)["match"]
+
+    connection_test.query(f"UPDATE `{test}`.`measurement` SET value = value + 1e-3 WHERE id = 42")
+    result = _compare(connection_test, comparison_schemas, tolerance=1e-6)
+    assert not result["match"]
+    assert [d.split(",")[0] for d in result["discrepancies"]] == ["Key {'id': 42}"]
+
+
+class BlobRecording(dj.Manual):
+    definition = """
+    recording_id : int32
+    ---
+    signal : <blob>
+    raw = null : bytes
+    """
+
+
+@pytest.fixture
+def schema_blob(connection_test, prefix, tmp_path):
+    with dj.config.override(stores={"main": {"protocol": "file", "location": str(tmp_path)}}):
+        schema = dj.Schema(f"{prefix}_test_migrate_blob", context={"BlobRecording": BlobRecording}, connection=connection_test)
+        schema(BlobRecording)
+        BlobRecording.insert({"recording_id": i, "signal": np.arange(i + 1)} for i in range(N_ROWS))
+        yield schema
+        schema.drop(prompt=False)
+
+
+def _migrate_signal(schema, **kwargs):
+    return migrate.migrate_blob_to_store(schema, "blob_recording", "signal", store="main", **kwargs)
+
+
+def _signals(schema):
+    rows = dj.FreeTable(schema.connection, BlobRecording.full_table_name).to_dicts(order_by="recording_id")
+    return [row["signal"] for row in rows]
+
+
+def test_migrate_blob_to_store(schema_blob):
+    connection, db = schema_blob.connection, schema_blob.database
+    dry = _migrate_signal(schema_blob)
+    assert (dry["status"], dry["rows"]) == ("dry_run", N_ROWS)
+
+    result = _migrate_signal(schema_blob, dry_run=False, batch_size=2)
+    assert (result["status"], result["rows"]) == ("migrated", N_ROWS)
+    comment, nullable = connection.query(
+        "SELECT COLUMN_COMMENT, IS_NULLABLE FROM information_schema.COLUMNS "
+        "WHERE TABLE_SCHEMA = %s AND TABLE_NAME = 'blob_recording' AND COLUMN_NAME = 'signal'",
+        args=(db,),
+    ).fetchone()
+    assert comment.startswith(":<blob@main>:") and nullable == "NO"
+    assert not connection.query(
+        "SELECT COUNT(*) FROM information_schema.TRIGGERS WHERE TRIGGER_SCHEMA = %s", args=(db,)
+    ).fetchone()[0]
+    for i, signal in enumerate(_signals(schema_blob)):
+        np.testing.assert_array_equal(signal, np.arange(i + 1))
+    assert _migrate_signal(schema_blob, dry_run=False)["status"] == "already_migrated"
+
+
+def test_migrate_blob_to_store_moves_blobs_replaced_after_their_batch(schema_blob, monkeypatch):
+    from datajoint import hash_registry
+
+    put_hashes, calls = hash_registry.put_hashes, []
+
+    def fail_third_batch(*args, **kwargs):
+        calls.append(1)
+        if len(calls) == 3:
+            raise ConnectionError("store unreachable")
+        return put_hashes(*args, **kwargs)
+
+    with monkeypatch.context() as m:
+        m.setattr(hash_registry, "put_hashes", fail_third_batch)
+        with pytest.raises(ConnectionError):
+            _migrate_signal(schema_blob, dry_run=False, batch_size=2)
+
+    BlobRecording.update1({"recording_id": 0, "signal": np.full(3, 7.0)})  # already moved
+    assert _migrate_signal(schema_blob, dry_run=False, batch_size=2)["resumed"]
+    np.testing.assert_array_equal(_signals(schema_blob)[0], np.full(3, 7.0))
+
+
+def test_migrate_blob_to_store_rejects_other_columns(schema_blob):
+    with pytest.raises(DataJointError, match="not an in-table <blob>"):
+        migrate.migrate_blob_to_store(schema_blob, "blob_recording", "raw", store="main")
+    with pytest.raises(DataJointError, match="not found"):
+        migrate.migrate_blob_to_store(schema_blob, "blob_recording", "nothing", store="main")
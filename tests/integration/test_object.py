@@ -19,7 +19,7 @@ import pytest
 
 import datajoint as dj
 from datajoint.objectref import ObjectRef
-from datajoint.storage import build_object_path, generate_token, encode_pk_value
+from datajoint.storage import StorageBackend, build_object_path, generate_token, encode_pk_value
 
 from tests.schema_object import ObjectFile, ObjectFolder, ObjectMultiple, ObjectWithOther
 
@@ -298,6 +298,121 @@ class TestObjectRef:
         assert str(obj) == "my/path/to/data.dat"
 
 
+class TestStreamingUpload:
+    """Tests for StorageBackend.put_stream (no database)."""
+
+    def test_put_stream_file_like(self, tmp_path):
+        """Test streaming a file object in chunks to a local store."""
+        backend = StorageBackend({"protocol": "file", "location": str(tmp_path)})
+        data = os.urandom(10_000)
+        size = backend.put_stream(io.BytesIO(data), "a/b/data.bin", chunk_size=4096)
+        assert size == len(data)
+        assert (tmp_path / "a/b/data.bin").read_bytes() == data
+        assert not (tmp_path / "a/b/data.bin.saving").exists()
+
+    def test_put_stream_iterable(self, tmp_path):
+        """Test streaming an iterable of chunks."""
+        backend = StorageBackend({"protocol": "file", "location": str(tmp_path)})
+        assert backend.put_stream(iter([b"abc", b"", b"def"]), "data.bin") == 6
+        assert backend.get_buffer("data.bin") == b"abcdef"
+
+    def test_put_stream_failure_leaves_no_partial_file(self, tmp_path):
+        """Test that a failed stream does not leave a partial object behind."""
+        backend = StorageBackend({"protocol": "file", "location": str(tmp_path)})
+
+        def chunks():
+            yield b"partial"
+            raise OSError("source went away")
+
+        with pytest.raises(OSError):
+            backend.put_stream(chunks(), "data.bin")
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestPutFolder:
+    """Tests for concurrent folder upload (no database)."""
+
+    @pytest.fixture
+    def source(self, tmp_path):
+        src = tmp_path / "src"
+        (src / "a" / "b").mkdir(parents=True)
+        (src / "empty").mkdir()
+        for i in range(20):
+            (src / "a" / f"{i}.bin").write_bytes(b"x" * i)
+        (src / "a" / "b" / "deep.txt").write_text("deep")
+        (src / "top.txt").write_text("top")
+        return src
+
+    def test_manifest_from_upload(self, source, tmp_path):
+        """Test that the manifest lists every uploaded file with its size."""
+        (tmp_path / "store").mkdir()
+        backend = StorageBackend({"protocol": "file", "location": str(tmp_path / "store")})
+        manifest = backend.put_folder(source, "obj/data", max_workers=4)
+
+        expected = {p.relative_to(source).as_posix(): p.stat().st_size for p in source.rglob("*") if p.is_file()}
+        assert {f["path"]: f["size"] for f in manifest["files"]} == expected
+        assert manifest["item_count"] == 22
+        assert manifest["total_size"] == sum(expected.values())
+        dest = tmp_path / "store" / "obj" / "data"
+        for rel_path in expected:
+            assert (dest / rel_path).read_bytes() == (source / rel_path).read_bytes()
+        assert (dest / "empty").is_dir()
+        assert json.loads((tmp_path / "store" / "obj" / "data.manifest.json").read_text()) == manifest
+
+    def test_symlinks(self, source, tmp_path):
+        """Test that symlinked directories are not followed, so a cycle does not recurse."""
+        (source / "a" / "b" / "loop").symlink_to(source, target_is_directory=True)
+        (source / "link.txt").symlink_to(source / "top.txt")
+        (tmp_path / "store").mkdir()
+        backend = StorageBackend({"protocol": "file", "location": str(tmp_path / "store")})
+        manifest = backend.put_folder(source, "data", max_workers=2)
+
+        paths = {f["path"] for f in manifest["files"]}
+        assert "link.txt" in paths and not any(path.startswith("a/b/loop") for path in paths)
+        assert manifest["item_count"] == 23
+        assert not (tmp_path / "store" / "data" / "a" / "b" / "loop").exists()
+        assert (tmp_path / "store" / "data" / "link.txt").read_text() == "top"
+
+    def test_retries_failed_files(self, source, tmp_path, monkeypatch):
+        """Test that a transient failure is retried per file."""
+        import shutil
+
+        (tmp_path / "store").mkdir()
+        backend = StorageBackend({"protocol": "file", "location": str(tmp_path / "store"), "max_workers": 2})
+        monkeypatch.setattr("datajoint.storage.time.sleep", lambda _: None)
+        copy2 = shutil.copy2
+        failed = []
+
+        def flaky_copy(src, dst):
+            if src.endswith("top.txt") and not failed:
+                failed.append(src)
+                raise OSError("transient")
+            return copy2(src, dst)
+
+        monkeypatch.setattr(shutil, "copy2", flaky_copy)
+        manifest = backend.put_folder(source, "data")
+        assert failed and manifest["item_count"] == 22
+        assert (tmp_path / "store" / "data" / "top.txt").read_text() == "top"
+
+    def test_gives_up_after_retries(self, source, tmp_path, monkeypatch):
+        """Test that a persistent failure raises after the configured attempts."""
+        import shutil
+
+        (tmp_path / "store").mkdir()
+        backend = StorageBackend({"protocol": "file", "location": str(tmp_path / "store")})
+        monkeypatch.setattr("datajoint.storage.time.sleep", lambda _: None)
+        attempts = []
+
+        def failing_copy(src, dst):
+            attempts.append(src)
+            raise OSError("disk full")
+
+        monkeypatch.setattr(shutil, "copy2", failing_copy)
+        with pytest.raises(dj.DataJointError, match="after 2 attempts"):
+            backend.put_folder(source, "data", max_workers=1, retries=2)
+        assert not (tmp_path / "store" / "data.manifest.json").exists()
+
+
 class TestObjectInsertFile:
     """Tests for inserting files with object type."""
 
@@ -725,6 +840,77 @@ class TestObjectVerify:
         table.delete()
 
 
+class TestVerifyWithoutDatabase:
+    """Tests for listing-based and streaming verification (no database)."""
+
+    @pytest.fixture
+    def backend(self, tmp_path):
+        return StorageBackend({"protocol": "file", "location": str(tmp_path)})
+
+    def _ref(self, backend, path, **kwargs):
+        return ObjectRef(path=path, ext=None, timestamp=None, _backend=backend, **kwargs)
+
+    def test_verify_file_streams_hash(self, backend, monkeypatch):
+        from datajoint.hash_registry import compute_hash
+
+        data = os.urandom(5000)
+        backend.put_buffer(data, "obj/file.dat")
+        monkeypatch.setattr(backend, "get_buffer", lambda path: pytest.fail("whole-object download"))
+        assert self._ref(backend, "obj/file.dat", size=5000, hash=compute_hash(data), is_dir=False).verify()
+        tree_hash = "blake2b-tree:" + compute_hash(data, "blake2b-tree")
+        assert self._ref(backend, "obj/file.dat", size=5000, hash=tree_hash, is_dir=False).verify()
+        with pytest.raises(dj.errors.DataJointError, match="Hash mismatch"):
+            self._ref(backend, "obj/file.dat", size=5000, hash=compute_hash(b"other"), is_dir=False).verify()
+        with pytest.raises(dj.errors.DataJointError, match="Size mismatch"):
+            self._ref(backend, "obj/file.dat", size=1, hash=None, is_dir=False).verify()
+        with pytest.raises(dj.errors.DataJointError, match="does not exist"):
+            self._ref(backend, "obj/missing.dat", size=1, hash=None, is_dir=False).verify()
+
+    def test_verify_folder_lists_once(self, backend, tmp_path, monkeypatch):
+        source = tmp_path / "src"
+        (source / "sub").mkdir(parents=True)
+        (source / "a.bin").write_bytes(b"aaa")
+        (source / "sub" / "b.bin").write_bytes(b"bb")
+        backend.put_folder(source, "obj/folder")
+        ref = self._ref(backend, "obj/folder", size=5, hash=None, is_dir=True)
+        monkeypatch.setattr(backend, "exists", lambda path: pytest.fail("per-file exists"))
+        monkeypatch.setattr(backend, "size", lambda path: pytest.fail("per-file size"))
+        assert ref.verify() is True
+
+        (tmp_path / "obj/folder/sub/b.bin").unlink()
+        (tmp_path / "obj/folder/a.bin").write_bytes(b"changed")
+        with pytest.raises(dj.errors.DataJointError, match="Missing file: sub/b.bin") as excinfo:
+            ref.verify()
+        assert "Size mismatch for a.bin: expected 3, got 7" in str(excinfo.value)
+
+    def test_verify_many(self, backend):
+        backend.put_buffer(b"good", "good.dat")
+        refs = [
+            self._ref(backend, "good.dat", size=4, hash=None, is_dir=False),
+            self._ref(backend, "gone.dat", size=4, hash=None, is_dir=False),
+            None,
+        ]
+        failures = dj.verify_many(refs, workers=2)
+        assert list(failures) == ["gone.dat"]
+        assert isinstance(failures["gone.dat"], dj.errors.DataJointError)
+
+    def test_verify_many_reports_storage_errors(self, backend, monkeypatch):
+        backend.put_buffer(b"good", "good.dat")
+        backend.put_buffer(b"flaky", "flaky.dat")
+        info = backend.fs.info
+
+        def flaky_info(path, **kwargs):
+            if path.endswith("flaky.dat"):
+                raise ConnectionError("connection reset")
+            return info(path, **kwargs)
+
+        monkeypatch.setattr(backend.fs, "info", flaky_info)
+        refs = [self._ref(backend, path, size=None, hash=None, is_dir=False) for path in ("good.dat", "flaky.dat")]
+        failures = dj.verify_many(refs)
+        assert list(failures) == ["flaky.dat"]
+        assert isinstance(failures["flaky.dat"], ConnectionError)
+
+
 class TestStagedInsert:
     """Tests for staged insert operations."""
 
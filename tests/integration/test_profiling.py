@@ -0,0 +1,49 @@
+"""Tests for query instrumentation against a live database."""
+
+import logging
+
+import pytest
+
+import datajoint as dj
+
+from tests import schema
+
+
+def test_profile_operations(schema_any):
+    table = schema.TTest3()
+    with dj.profile() as p:
+        table.insert([dict(key=800 + i, value="x" * 100) for i in range(5)])
+        df = (table & "key >= 800").to_pandas()
+        (table & "key >= 800").delete_quick()
+    assert len(df) == 5
+    by_operation = {event.operation for event in p.queries}
+    assert {"insert", "to_pandas", "delete_quick"} <= by_operation
+    assert "to_dicts" not in p.operations  # reported as part of to_pandas
+    fetch = p.operations["to_pandas"]
+    assert fetch["rows"] >= 5 and fetch["nbytes"] >= 500
+    assert fetch["seconds"] >= fetch["database_seconds"] > 0
+    insert = next(event for event in p.queries if event.operation == "insert" and event.sql.startswith("INSERT"))
+    assert insert.rowcount == 5 and insert.nbytes >= 500
+    assert "to_pandas" in p.report()
+
+
+def test_query_hooks_see_errors(connection_test):
+    events = []
+    dj.add_query_hook(after=events.append)
+    try:
+        with pytest.raises(dj.DataJointError):
+            connection_test.query("SELECT * FROM no_such_schema.no_such_table")
+    finally:
+        dj.remove_query_hook(after=events.append)
+    assert isinstance(events[-1].error, dj.DataJointError)
+    assert events[-1].duration is not None
+
+
+def test_slow_query_log(connection_test, caplog):
+    with dj.config.override(connection__slow_query_threshold=0), caplog.at_level(logging.WARNING, logger="datajoint"):
+        assert connection_test.query("SELECT 1").fetchall()
+    assert "Slow query" in caplog.text and "1 rows" in caplog.text
+    caplog.clear()
+    with caplog.at_level(logging.WARNING, logger="datajoint"):
+        connection_test.query("SELECT 1").fetchall()
+    assert "Slow query" not in caplog.text
@@ -31,3 +31,26 @@ def test_reconnect_throws_error_in_transaction(conn):
     with conn.transaction, pytest.raises(DataJointError):
         conn.close()
         conn.query("SHOW DATABASES;", reconnect=True).fetchall()
+
+
+def test_liveness_without_ping(conn):
+    """Recently used connections report liveness and transaction state without pinging"""
+    with conn.count_round_trips() as trips:
+        with conn.transaction:
+            for _ in range(10):
+                assert conn.in_transaction and conn.is_connected
+            conn.query("SELECT 1").fetchall()
+    assert trips["pings"] == 0
+    assert trips["queries"] == 3  # start, SELECT, commit
+
+
+def test_ping_after_idle(conn):
+    with dj.config.override(connection__ping_interval=0):
+        with conn.count_round_trips() as trips:
+            assert conn.is_connected
+        assert trips["pings"] == 1
+        conn._conn.close()  # lost without DataJoint noticing
+        assert not conn.is_connected
+    conn.query("SHOW DATABASES;", reconnect=True).fetchall()
+    assert conn.is_connected
+    assert conn.counters["connects"] >= 2
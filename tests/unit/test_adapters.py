@@ -181,6 +181,15 @@ class TestMySQLAdapter:
         result = adapter.json_path_expr("data", "value", "decimal(10,2)")
         assert result == "json_value(`data`, _utf8mb4'$.value' returning decimal(10,2))"
 
+    def test_json_text_expr(self, adapter):
+        """Test unbounded JSON text extraction (JSON null becomes SQL NULL)."""
+        result = adapter.json_text_expr("meta", "path")
+        assert result == "json_unquote(nullif(json_extract(`meta`, _utf8mb4'$.path'), cast('null' as json)))"
+
+    def test_temporary_table_name(self, adapter):
+        """Test that temporary tables are schema-qualified."""
+        assert adapter.temporary_table_name("lab", "_tmp") == "`lab`.`_tmp`"
+
     def test_transaction_sql(self, adapter):
         """Test transaction statements."""
         assert "START TRANSACTION" in adapter.start_transaction_sql()
@@ -326,6 +335,14 @@ class TestPostgreSQLAdapter:
         result = adapter.json_path_expr("data", "nested.field")
         assert result == "jsonb_extract_path_text(\"data\", 'nested', 'field')"
 
+    def test_json_text_expr(self, adapter):
+        """Test JSON text extraction with ->>."""
+        assert adapter.json_text_expr("meta", "path") == "(\"meta\" ->> 'path')"
+
+    def test_temporary_table_name(self, adapter):
+        """Test that temporary tables are not schema-qualified."""
+        assert adapter.temporary_table_name("lab", "_tmp") == '"_tmp"'
+
     def test_transaction_sql(self, adapter):
         """Test transaction statements."""
         assert adapter.start_transaction_sql() == "BEGIN"
@@ -0,0 +1,224 @@
+"""Unit tests for ConnectionPool checkout/checkin, sizing, and health checks."""
+
+import sys
+import threading
+import time
+
+import pytest
+
+from datajoint.connection import ConnectionPool
+from datajoint.dependencies import Dependencies
+from datajoint.errors import DataJointError
+
+
+class FakeConnection:
+    """Stands in for Connection: records pings, reconnects, and rollbacks."""
+
+    def __init__(self):
+        self.conn_info = dict(user="user", host="db", port=3306)
+        self.schemas = {}
+        self.dependencies = Dependencies(self)
+        self.result_cache = None
+        self.clones = []
+        self.pings = self.reconnects = self.rollbacks = 0
+        self.alive = True
+        self._is_closed = False
+        self._in_transaction = False
+
+    def clone(self):
+        self.clones.append(FakeConnection())
+        return self.clones[-1]
+
+    def ping(self):
+        self.pings += 1
+        if not self.alive or self._is_closed:
+            raise ConnectionError("server has gone away")
+
+    def connect(self):
+        self.reconnects += 1
+        self.alive, self._is_closed = True, False
+
+    def cancel_transaction(self):
+        self.rollbacks += 1
+        self._in_transaction = False
+
+    def close(self):
+        self._is_closed = True
+
+
+@pytest.fixture
+def template():
+    return FakeConnection()
+
+
+def test_checkout_reuses_connections(template):
+    template.result_cache = object()
+    pool = ConnectionPool(min_size=1, max_size=3, connection=template)
+    assert pool.size == 1
+    with pool.connection() as first:
+        pass
+    with pool.connection() as again:
+        assert again is first
+        with pool.connection() as second:
+            assert second is not first
+    assert len(template.clones) == 2
+    assert pool.size == 2
+    # pooled connections share the template's schema registry, dependency graph, and result cache
+    assert all(c.schemas is template.schemas and c.dependencies is template.dependencies for c in template.clones)
+    assert all(c.result_cache is template.result_cache for c in template.clones)
+    assert "2 idle" in repr(pool)
+
+
+def test_max_size_and_timeout(template):
+    pool = ConnectionPool(min_size=0, max_size=2, connection=template)
+    held = [pool.checkout(), pool.checkout()]
+    with pytest.raises(DataJointError, match="within 0.05 s"):
+        pool.checkout(timeout=0.05)
+    threading.Timer(0.05, pool.checkin, args=(held[0],)).start()
+    assert pool.checkout(timeout=5) is held[0]
+    with pytest.raises(DataJointError, match="not checked out"):
+        pool.checkin(FakeConnection())
+
+
+def test_health_check_only_after_idle_interval(template):
+    pool = ConnectionPool(min_size=1, max_size=1, connection=template, health_check_interval=0.05)
+    connection = template.clones[0]
+    for _ in range(10):
+        with pool.connection():
+            pass
+    assert connection.pings == 0
+    time.sleep(0.1)
+    connection.alive = False
+    with pool.connection() as c:
+        assert c is connection
+    assert (connection.pings, connection.reconnects) == (1, 1)
+
+
+def test_idle_timeout_closes_extra_connections(template):
+    pool = ConnectionPool(min_size=1, max_size=4, idle_timeout=0.05, connection=template)
+    held = [pool.checkout() for _ in range(3)]
+    for c in held:
+        pool.checkin(c)
+    assert pool.size == 3
+    time.sleep(0.1)
+    with pool.connection():
+        assert pool.size == 1
+    assert sum(c._is_closed for c in held) == 2
+
+
+def test_checkin_resets_connection(template):
+    pool = ConnectionPool(min_size=0, max_size=2, connection=template)
+    with pool.connection() as c:
+        c._in_transaction = True
+    assert c.rollbacks == 1
+    with pool.connection() as c:
+        c.close()
+    assert pool.size == 0
+    with pool.connection() as fresh:
+        assert fresh is not c
+
+
+def test_dependencies_query_through_checked_out_connection(template):
+    pool = ConnectionPool(min_size=0, max_size=4, connection=template)
+    graph = template.dependencies
+    seen = {}
+
+    def task(i):
+        with pool.connection() as c:
+            seen[i] = graph._conn is c
+            time.sleep(0.01)
+
+    threads = [threading.Thread(target=task, args=(i,)) for i in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert all(seen.values()) and len(seen) == 8
+    assert graph._conn is template
+    assert pool.size <= 4
+
+
+def test_close(template):
+    pool = ConnectionPool(min_size=2, max_size=2, connection=template)
+    c = pool.checkout()
+    pool.close()
+    assert pool.size == 1
+    pool.checkin(c)
+    assert pool.size == 0 and c._is_closed
+    with pytest.raises(DataJointError, match="closed"):
+        pool.checkout()
+
+
+def test_invalid_sizes(template):
+    with pytest.raises(DataJointError):
+        ConnectionPool(min_size=3, max_size=2, connection=template)
+
+
+class CatalogConnection:
+    """Serves the catalog of a chain of tables, each referencing the previous one."""
+
+    class adapter:
+        @staticmethod
+        def quote_string(value):
+            return f"'{value}'"
+
+        @staticmethod
+        def load_primary_keys_sql(schemas_list, like_pattern):
+            return "primary keys"
+
+        @staticmethod
+        def load_foreign_keys_sql(schemas_list, like_pattern):
+            return "foreign keys"
+
+    tables = [f"`lab`.`t{i}`" for i in range(50)]
+
+    def __init__(self):
+        self.schemas = {"lab": None}
+
+    def query(self, sql, as_dict=False):
+        if sql == "primary keys":
+            return [(table, "id") for table in self.tables]
+        return [
+            dict(
+                constraint_name=f"fk{i}",
+                referencing_table=child,
+                referenced_table=parent,
+                column_name="id",
+                referenced_column_name="id",
+            )
+            for i, (parent, child) in enumerate(zip(self.tables, self.tables[1:]))
+        ]
+
+
+def test_dependencies_read_during_reload():
+    connection = CatalogConnection()
+    graph = Dependencies(connection)
+    stop = threading.Event()
+    results, errors = [], []
+
+    def reload():
+        while not stop.is_set():
+            graph.clear()
+            graph.load()
+
+    def read():
+        try:
+            for _ in range(200):
+                results.append(graph.descendants(connection.tables[0]))
+        except Exception as e:
+            errors.append(e)
+        finally:
+            stop.set()
+
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)  # switch threads often, so reads interleave with reloads
+    try:
+        threads = [threading.Thread(target=reload), threading.Thread(target=read)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+    finally:
+        sys.setswitchinterval(interval)
+    assert not errors
+    assert len(results) == 200 and all(result == connection.tables for result in results)
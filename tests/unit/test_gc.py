@@ -33,3 +33,266 @@ def test_delete_schema_path_prunes_parent_dir(monkeypatch, path_cls, location):
     assert collector.delete_schema_path("schema/ab/cd/hash123") is True
     backend.fs.rm.assert_called_once_with("data/blobs/schema/ab/cd/hash123")
     backend.fs.rmdir.assert_called_once_with("data/blobs/schema/ab/cd")
+
+
+def _fake_table(adapter, codec, rows=()):
+    """A table stand-in with one JSON reference column named ``ref``."""
+    from types import SimpleNamespace
+
+    table = MagicMock()
+    table.table_name = "scan"
+    table.full_table_name = adapter.make_full_table_name("lab", "scan")
+    table.heading.attributes = {"ref": SimpleNamespace(json=True, codec=codec)}
+    table.heading.hash_objects = ["ref"]
+    table.connection.adapter = adapter
+    table.connection.query.return_value = MagicMock(__iter__=lambda self: iter(rows))
+    return table
+
+
+def test_column_references_streams_distinct_paths_in_sql():
+    """Standard metadata codecs are scanned with SELECT DISTINCT on a server-side cursor."""
+    import datajoint as dj
+    from datajoint.adapters import get_adapter
+
+    table = _fake_table(get_adapter("mysql"), dj.get_codec("hash"), rows=[("_hash/lab/a", "main"), ("_hash/lab/b", None)])
+    collector = GarbageCollector.__new__(GarbageCollector)
+    assert list(collector._column_references(table, "ref")) == [("_hash/lab/a", "main"), ("_hash/lab/b", None)]
+
+    (sql,), kwargs = table.connection.query.call_args
+    assert sql.startswith("SELECT DISTINCT json_unquote(nullif(json_extract(`ref`, _utf8mb4'$.path')")
+    assert "FROM `lab`.`scan` WHERE" in sql
+    assert kwargs == {"stream": True}
+    table.proj.assert_not_called()
+
+
+def test_column_references_falls_back_for_custom_reference_shape():
+    """A codec overriding referenced_paths() is scanned row by row."""
+    from datajoint.adapters import get_adapter
+    from datajoint.codecs import Codec, _codec_registry
+
+    class MultiRefCodec(Codec):
+        name = "test_gc_multi_ref"
+
+        def get_dtype(self, is_store):
+            return "json"
+
+        def encode(self, value, *, key=None, store_name=None):
+            return value
+
+        def decode(self, stored, *, key=None):
+            return stored
+
+        def referenced_paths(self, stored):
+            return [(p, "main") for p in stored["parts"]]
+
+    codec = _codec_registry.pop("test_gc_multi_ref")
+    assert codec.referenced_paths_sql("ref", get_adapter("mysql")) is None
+    table = _fake_table(get_adapter("mysql"), codec)
+    table.proj.return_value.cursor.return_value = [{"ref": {"parts": ["x/1", "x/2"]}}]
+    collector = GarbageCollector.__new__(GarbageCollector)
+    assert list(collector._column_references(table, "ref")) == [("x/1", "main"), ("x/2", "main")]
+    table.connection.query.assert_not_called()
+
+
+def test_hash_orphans_in_database():
+    """The orphan set is an anti-join between temporary tables; they are dropped afterwards."""
+    import datajoint as dj
+    from datajoint.adapters import get_adapter
+
+    adapter = get_adapter("mysql")
+    table = _fake_table(adapter, dj.get_codec("hash"))
+    schema = MagicMock()
+    schema.database = "lab"
+    schema.list_tables.return_value = ["scan"]
+    schema.get_table.return_value = table
+    schema.connection = table.connection
+    table.connection.query.return_value.fetchone.return_value = (3,)
+    table.connection.query.return_value.fetchall.return_value = [("_hash/lab/z",), ("_hash/lab/y",)]
+
+    collector = GarbageCollector.__new__(GarbageCollector)
+    collector.store = "main"
+    stored = [f"_hash/lab/{i}" for i in range(1500)]
+    orphans, referenced = collector.hash_orphans_in_database(schema, stored)
+    assert orphans == ["_hash/lab/y", "_hash/lab/z"]
+    assert referenced == 3
+
+    calls = [(c.args[0], c.kwargs.get("args")) for c in table.connection.query.call_args_list]
+    sqls = [sql for sql, _ in calls]
+    assert sum(sql.startswith("CREATE TEMPORARY TABLE") for sql in sqls) == 2
+    uploads = [args for sql, args in calls if "VALUES" in sql]
+    assert [len(args) for args in uploads] == [1000, 500]
+    (select_sql, select_args) = next((sql, args) for sql, args in calls if "SELECT DISTINCT" in sql)
+    assert select_sql.startswith("INSERT INTO") and select_args == ("main",)
+    assert "LEFT JOIN" in sqls[-3]
+    assert all(sql.startswith("DROP TABLE") for sql in sqls[-2:])
+
+
+def _local_collector(tmp_path, checkpoint_dir=None):
+    """A collector over a real local store rooted at ``tmp_path / "store"``."""
+    location = tmp_path / "store"
+    location.mkdir()
+    collector = GarbageCollector.__new__(GarbageCollector)
+    collector.backend = StorageBackend({"protocol": "file", "location": str(location)})
+    collector._hash_prefix = "_hash"
+    collector._schema_prefix = "_schema"
+    collector._max_workers = 4
+    collector._scan_errors = []
+    collector.checkpoint_dir = checkpoint_dir
+    return collector, location
+
+
+def test_list_schema_paths_sizes_from_single_listing(tmp_path, monkeypatch):
+    """Sizes come from the listing; no per-file size request is made."""
+    collector, location = _local_collector(tmp_path)
+    (location / "_schema/lab/scan/id=1").mkdir(parents=True)
+    (location / "_schema/lab/scan/id=1/a.npy").write_bytes(b"x" * 5)
+    (location / "_schema/lab/top.bin").write_bytes(b"y" * 3)
+    monkeypatch.setattr(type(collector.backend.fs), "size", MagicMock(side_effect=AssertionError("per-file size")))
+
+    stored = collector.list_schema_paths("lab")
+    assert stored == {"_schema/lab/scan/id=1/a.npy": 5, "_schema/lab/top.bin": 3}
+    assert collector.list_schema_paths("missing") == {}
+    assert collector._scan_errors == []
+
+
+def test_listing_resumes_from_checkpoints(tmp_path):
+    """Finished subtrees are checkpointed and not listed again until cleared."""
+    collector, location = _local_collector(tmp_path, checkpoint_dir=tmp_path / "checkpoints")
+    collector.checkpoint_dir.mkdir()
+    (location / "_schema/lab/scan").mkdir(parents=True)
+    (location / "_schema/lab/scan/a.npy").write_bytes(b"abc")
+    first = collector.list_schema_paths("lab")
+    assert len(list(collector.checkpoint_dir.glob("gc-listing-*.json"))) == 1
+
+    (location / "_schema/lab/scan/b.npy").write_bytes(b"new")
+    assert collector.list_schema_paths("lab") == first  # resumed from the checkpoint
+
+    assert collector.clear_checkpoints() == 1
+    assert "_schema/lab/scan/b.npy" in collector.list_schema_paths("lab")
+
+
+def test_remove_many_batches_remote_deletes():
+    """Remote stores remove paths with one multi-path rm per batch."""
+    backend = StorageBackend.__new__(StorageBackend)
+    backend.spec = {"protocol": "s3", "bucket": "b", "location": "loc"}
+    backend.protocol = "s3"
+    backend._fs = MagicMock()
+    done = []
+    failed = backend.remove_many([f"p{i}" for i in range(5)], batch_size=2, callback=done.append)
+    assert failed == {}
+    assert sorted(len(c.args[0]) for c in backend.fs.rm.call_args_list) == [1, 2, 2]
+    assert sum(done) == 5
+
+
+def test_remove_many_retries_failed_batch_per_path():
+    """A failed batch is retried path by path so only the bad path is reported."""
+    backend = StorageBackend.__new__(StorageBackend)
+    backend.spec = {"protocol": "s3", "bucket": "b"}
+    backend.protocol = "s3"
+    backend._fs = MagicMock()
+
+    def rm(paths):
+        if isinstance(paths, list) or paths == "b/bad":
+            raise PermissionError("denied")
+
+    backend.fs.rm.side_effect = rm
+    failed = backend.remove_many(["good", "bad"])
+    assert list(failed) == ["bad"]
+
+
+def test_remove_many_reports_missing_paths(tmp_path):
+    """Paths that were already gone are reported apart from the removed ones."""
+    collector, location = _local_collector(tmp_path)
+    (location / "present").write_bytes(b"data")
+    missing = set()
+    assert collector.backend.remove_many(["present", "gone"], missing=missing) == {}
+    assert missing == {"gone"} and not (location / "present").exists()
+
+    backend = StorageBackend.__new__(StorageBackend)
+    backend.spec = {"protocol": "s3", "bucket": "b"}
+    backend.protocol = "s3"
+    backend._fs = MagicMock()
+
+    def rm(paths):
+        if isinstance(paths, list) or paths == "b/gone":
+            raise FileNotFoundError(paths)
+
+    backend.fs.rm.side_effect = rm
+    missing = set()
+    assert backend.remove_many(["kept", "gone"], missing=missing) == {}
+    assert missing == {"gone"}
+
+
+def test_delete_orphans_counts_only_existing_paths(tmp_path):
+    """Orphans deleted by someone else since the listing are not counted or sized."""
+    collector, location = _local_collector(tmp_path)
+    (location / "_hash/lab").mkdir(parents=True)
+    (location / "_hash/lab/aaa").write_bytes(b"data")
+    sizes = {"_hash/lab/aaa": 4, "_hash/lab/bbb": 5}
+    outcome = collector._delete_orphans(["_hash/lab/aaa", "_hash/lab/bbb"], [], sizes, dry_run=False, verbose=False)
+    assert (outcome["deleted"], outcome["hash_paths_deleted"], outcome["bytes_freed"], outcome["errors"]) == (1, 1, 4, 0)
+
+
+def test_bulk_delete_prunes_emptied_dirs_once(tmp_path):
+    """Orphans are removed and emptied directories pruned, stopping at live content."""
+    collector, location = _local_collector(tmp_path)
+    for rel in ("_schema/lab/scan/id=1/a.npy", "_schema/lab/scan/id=1/b.npy", "_schema/lab/scan/id=2/c.npy"):
+        (location / rel).parent.mkdir(parents=True, exist_ok=True)
+        (location / rel).write_bytes(b"data")
+    deleted = ["_schema/lab/scan/id=1/a.npy", "_schema/lab/scan/id=1/b.npy"]
+    assert collector.backend.remove_many(deleted) == {}
+    assert collector._prune_empty_dirs(deleted) == 1
+    assert not (location / "_schema/lab/scan/id=1").exists()
+    assert (location / "_schema/lab/scan/id=2/c.npy").exists()
+
+
+def test_record_deletions_copies_references_in_sql():
+    """Deleted rows' references are journaled with one INSERT ... SELECT per column."""
+    import datajoint as dj
+    from datajoint.adapters import get_adapter
+    from datajoint.gc import record_deletions
+
+    table = _fake_table(get_adapter("mysql"), dj.get_codec("hash"))
+    table.database = "lab"
+    table.heading.schema_objects = []
+    table.where_clause.return_value = " WHERE (`id`=1)"
+    table.connection.query.return_value.rowcount = 2
+    assert record_deletions(table) == 2
+    sql = table.connection.query.call_args.args[0]
+    assert sql.startswith("INSERT INTO `lab`.`~gc_journal` (kind, path, store) SELECT DISTINCT 'hash', ")
+    assert sql.endswith(" WHERE (`id`=1) AND " + get_adapter("mysql").json_text_expr("ref", "path") + " IS NOT NULL")
+
+
+def test_incremental_collect_checks_only_journaled_paths(tmp_path, monkeypatch):
+    """Only unreferenced journal candidates are deleted; processed entries are cleared."""
+    from datajoint import gc
+
+    collector, location = _local_collector(tmp_path)
+    collector.schemas = (MagicMock(database="lab"),)
+    collector.store = None
+    for rel in (
+        "_hash/lab/orphan",
+        "_hash/lab/live",
+        "_schema/lab/scan/id=1/obj/a",
+        "_schema/lab/scan/id=1/obj.manifest.json",
+    ):
+        (location / rel).parent.mkdir(parents=True, exist_ok=True)
+        (location / rel).write_bytes(b"1234")
+    monkeypatch.setattr(gc, "journal_table_exists", lambda conn, db: True)
+    candidates = {"hash": {"_hash/lab/orphan", "_hash/lab/live"}, "schema": {"_schema/lab/scan/id=1/obj"}}
+    monkeypatch.setattr(GarbageCollector, "_journal_candidates", lambda self, schema: candidates)
+    monkeypatch.setattr(GarbageCollector, "_referenced_among", lambda self, schema, attr, paths: paths & {"_hash/lab/live"})
+    cleared = []
+    monkeypatch.setattr(GarbageCollector, "_clear_journal", lambda self, schema, paths: cleared.append(paths))
+
+    stats = collector.collect(incremental=True)
+    assert stats["candidates"] == 3 and stats["candidates_referenced"] == 1
+    assert stats["orphaned_hash_paths"] == ["_hash/lab/orphan"]
+    assert stats["orphaned_schema_paths"] == ["_schema/lab/scan/id=1/obj.manifest.json", "_schema/lab/scan/id=1/obj/a"]
+    assert cleared == []  # dry run keeps the journal
+
+    stats = collector.collect(incremental=True, dry_run=False)
+    assert stats["deleted"] == 3 and stats["bytes_freed"] == 12
+    assert (location / "_hash/lab/live").exists()
+    assert not (location / "_schema/lab/scan").exists()  # emptied directories pruned
+    assert cleared == [candidates["hash"] | candidates["schema"]]
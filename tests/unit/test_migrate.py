@@ -0,0 +1,98 @@
+"""Unit tests for the migration helpers that need no database."""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from datajoint.adapters import get_adapter
+from datajoint.migrate import _dependency_levels, _MigrationCheckpoint, _run_levels, _Throughput
+
+
+class FakeConnection:
+    """Answers the foreign-key query with fixed (child, parent) pairs."""
+
+    adapter = get_adapter("mysql")
+
+    def __init__(self, edges):
+        self.edges = edges
+
+        self.clones = []
+        self.closed = False
+
+    def clone(self):
+        self.clones.append(FakeConnection(self.edges))
+        return self.clones[-1]
+
+    def close(self):
+        self.closed = True
+
+    def query(self, sql, args=None, as_dict=False):
+        rows = [{"REFERENCING_TABLE": f"`lab`.`{c}`", "REFERENCED_TABLE": f"`lab`.`{p}`"} for c, p in self.edges]
+        return type("Cursor", (), {"fetchall": lambda self: rows})()
+
+
+def test_dependency_levels():
+    connection = FakeConnection([("session", "subject"), ("trial", "session"), ("session", "~external_raw"), ("note", "note")])
+    tables = ["trial", "session", "subject", "~external_raw", "note"]
+    assert _dependency_levels(connection, "lab", tables) == [["note", "subject", "~external_raw"], ["session"], ["trial"]]
+
+
+def test_run_levels_uses_clones():
+    connection = FakeConnection([])
+    levels = [["subject", "note"], ["session"], ["trial"]]
+    used, lock = {}, threading.Lock()
+
+    def task(table, conn):
+        with lock:
+            used[table] = conn
+        return table.upper()
+
+    assert _run_levels(connection, levels, task, workers=2) == {t: t.upper() for level in levels for t in level}
+    assert connection.clones and set(map(id, used.values())) <= set(map(id, connection.clones))
+    assert all(clone.closed for clone in connection.clones) and not connection.closed
+    assert set(_run_levels(connection, levels, lambda table, conn: conn, workers=1).values()) == {connection}
+
+
+class StateConnection:
+    """Reports whether the migration state table exists and fails reading it if asked to."""
+
+    def __init__(self, exists, error=None):
+        self.exists, self.error = exists, error
+        self.queries = []
+
+    def query(self, sql, args=None):
+        self.queries.append(sql)
+        if "information_schema" in sql:
+            row = (int(self.exists),)
+        elif self.error is not None:
+            raise self.error
+        else:
+            row = None
+        return type("Cursor", (), {"fetchone": lambda self: row})()
+
+
+def test_checkpoint_read_errors_propagate():
+    connection = StateConnection(exists=False)
+    checkpoint = _MigrationCheckpoint(connection, "lab", "task")
+    assert not checkpoint.resumed and checkpoint.last_key is None
+    assert len(connection.queries) == 1  # the missing table is not queried
+
+    # a failure reading existing progress must not restart the migration from scratch
+    with pytest.raises(ConnectionError):
+        _MigrationCheckpoint(StateConnection(exists=True, error=ConnectionError("lost connection")), "lab", "task")
+
+
+def test_throughput_counts_concurrent_adds():
+    throughput = _Throughput("copy", total=8 * 1000, interval=0)
+    throughput.resume(10, 100)
+
+    def work(_):
+        for _ in range(1000):
+            throughput.add(1, 3)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(work, range(8)))
+    metrics = throughput.metrics()
+    assert (metrics["objects"], metrics["bytes"]) == (8010, 24100)
+    assert metrics["eta_s"] == 0
@@ -0,0 +1,118 @@
+"""Unit tests for query hooks, operation tags, and profiles."""
+
+import threading
+
+import pytest
+
+import datajoint as dj
+from datajoint import profiling
+from datajoint.profiling import operation
+
+
+def _query(sql="SELECT 1", duration=0.01, rowcount=1, nbytes=100):
+    """Simulate a round trip the way Connection.query reports it."""
+    event = profiling.before_query(None, sql, ())
+    event.duration, event.rowcount, event.nbytes = duration, rowcount, nbytes
+    profiling.after_query(event)
+    return event
+
+
+@pytest.fixture
+def events():
+    before, after = [], []
+    dj.add_query_hook(before=before.append, after=after.append)
+    yield before, after
+    dj.remove_query_hook(before=before.append, after=after.append)
+    assert not profiling.enabled()
+
+
+def test_hooks(events):
+    before, after = events
+    assert profiling.enabled()
+    with operation("populate"), operation("populate.make"), operation("insert"):
+        event = _query("INSERT INTO `lab`.`session` VALUES (%s)")
+    assert before == after == [event]
+    assert event.operations == ("populate", "populate.make", "insert")
+    assert event.operation == "insert"
+    assert _query().operation is None
+
+
+def test_nested_fetch_is_reported_once(events):
+    _, after = events
+
+    @operation("to_dicts", fetch=True)
+    def to_dicts():
+        return _query()
+
+    @operation("to_pandas", fetch=True)
+    def to_pandas():
+        return to_dicts()
+
+    assert to_pandas().operations == ("to_pandas",)
+    with operation("populate.make"):
+        assert to_dicts().operations == ("populate.make", "to_dicts")
+
+
+def test_operations_are_per_thread(events):
+    _, after = events
+    with operation("delete"):
+        thread = threading.Thread(target=_query)
+        thread.start()
+        thread.join()
+    assert after[0].operations == ()
+
+
+def test_shared_operation_across_threads(events):
+    _, after = events
+    load = operation("load")
+    entered, first_done = threading.Barrier(2), threading.Event()
+    errors = []
+
+    def run(first):
+        try:
+            with load:
+                entered.wait()
+                if not first:
+                    first_done.wait()  # leave in the opposite order of entering
+                _query()
+            if first:
+                first_done.set()
+        except Exception as e:
+            errors.append(e)
+            first_done.set()
+
+    threads = [threading.Thread(target=run, args=(first,)) for first in (True, False)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not errors
+    assert [event.operations for event in after] == [("load",), ("load",)]
+    with load, load:  # and recursively
+        assert profiling.current_operations() == ("load", "load")
+    assert profiling.current_operations() == ()
+
+
+def test_profile():
+    with dj.profile() as p:
+        with operation("populate.make"):
+            _query(duration=0.5, rowcount=10, nbytes=2**20)
+            with operation("insert"):
+                _query("INSERT", duration=0.25, rowcount=3)
+        with operation("insert"):
+            _query("INSERT", duration=0.25, rowcount=2)
+        _query("SHOW TABLES", duration=0.125)
+    _query()  # after the profile
+    assert len(p.queries) == 4 and all(event.args == () for event in p.queries)
+    make, insert, untagged = p.operations["populate.make"], p.operations["insert"], p.operations[None]
+    assert (make["calls"], make["queries"], make["database_seconds"], make["rows"]) == (1, 2, 0.75, 13)
+    assert (insert["calls"], insert["queries"], insert["database_seconds"]) == (2, 2, 0.5)
+    assert (untagged["queries"], untagged["seconds"]) == (1, 0.125)
+    assert [event.sql for event in p.slowest(2)] == ["SELECT 1", "INSERT"]
+
+    report = p.report()
+    assert report.splitlines()[0].split()[:2] == ["operation", "calls"]
+    assert "populate.make" in report and "(no operation)" in report
+    assert "4 queries" in report and "slowest queries" in report
+    assert "4 queries" in repr(p)
+    assert not profiling.enabled()
@@ -0,0 +1,170 @@
+"""Unit tests for the query result cache: byte-bounded LRU, disk tier, and per-table invalidation."""
+
+import datetime
+import threading
+import time
+
+import pytest
+
+from datajoint.adapters import get_adapter
+from datajoint.query_cache import QueryCache, _sizeof, dropped_schema, tables_in
+
+SESSION, TRIAL = "`lab`.`session`", "`lab`.`_trial`"
+
+
+def _rows(n, width=100):
+    return tuple((i, "x" * width) for i in range(n))
+
+
+def _put(cache, query, rows, tables):
+    key = cache.key(query)
+    cache.put(key, rows, tables, cache.snapshot(tables))
+    return key
+
+
+def test_tables_in():
+    query = (
+        "SELECT `session_id`,`trial_id` FROM `lab`.`_trial` WHERE "
+        "((`session_id`) in (SELECT `session_id` FROM `lab`.`session` WHERE (`rig`='A')))"
+    )
+    assert tables_in(query, get_adapter("mysql")) == {SESSION, TRIAL}
+    assert tables_in("INSERT INTO `lab`.`session` VALUES (1)", get_adapter("mysql")) == {SESSION}
+    assert tables_in("SELECT 1", get_adapter("mysql")) == frozenset()
+
+    class PostgresQuoting:
+        @staticmethod
+        def quote_identifier(name):
+            return f'"{name}"'
+
+    assert tables_in('SELECT * FROM "lab"."session" NATURAL JOIN "lab"."_trial"', PostgresQuoting()) == {
+        '"lab"."session"',
+        '"lab"."_trial"',
+    }
+
+
+def test_dropped_schema():
+    mysql = get_adapter("mysql")
+    assert dropped_schema(mysql.drop_schema_sql("lab"), mysql) == "`lab`"
+    assert dropped_schema("drop database `lab`", mysql) == "`lab`"
+    assert dropped_schema("DROP TABLE `lab`.`session`", mysql) is None
+
+
+def test_hit_miss_and_key():
+    cache = QueryCache()
+    key = _put(cache, "SELECT * FROM `lab`.`session`", _rows(3), {SESSION})
+    assert cache.get(key) == _rows(3)
+    assert cache.get(cache.key("SELECT * FROM `lab`.`session`", as_dict=True)) is None
+    assert cache.key("SELECT %s", (1,)) != cache.key("SELECT %s", (2,))
+    assert (cache.stats["hits"], cache.stats["misses"]) == (1, 1)
+
+
+def test_lru_eviction_by_bytes():
+    rows = _rows(10)
+    cache = QueryCache(max_bytes=int(2.5 * _sizeof(rows)))
+    a = _put(cache, "a", rows, {SESSION})
+    b = _put(cache, "b", rows, {SESSION})
+    assert cache.get(a) is not None  # b is now least recently used
+    c = _put(cache, "c", rows, {TRIAL})
+    assert cache.get(b) is None
+    assert cache.get(a) is not None and cache.get(c) is not None
+    assert cache.stats["evictions"] == 1 and len(cache) == 2
+    # results larger than the whole budget are not cached
+    assert cache.get(_put(cache, "d", _rows(100), {SESSION})) is None
+
+
+def test_disk_tier(tmp_path):
+    rows = _rows(10)
+    stale = tmp_path / ("0" + QueryCache.suffix)
+    stale.write_bytes(b"")
+    cache = QueryCache(max_bytes=int(1.5 * _sizeof(rows)), path=tmp_path)
+    assert not stale.exists()
+    a = _put(cache, "a", rows, {SESSION})
+    b = _put(cache, "b", rows, {TRIAL})
+    assert len(list(tmp_path.glob("*" + cache.suffix))) == 1
+    assert "1 on disk" in repr(cache)
+    # promoted back to memory, evicting b to disk
+    assert cache.get(a) == rows
+    assert cache.stats["disk_hits"] == 1
+    assert cache.get(b) == rows
+    cache.invalidate(TRIAL)
+    assert cache.get(b) is None
+    assert cache.get(a) == rows
+    cache.clear()
+    assert len(cache) == 0 and not list(tmp_path.glob("*" + cache.suffix))
+
+
+def test_disk_tier_values(tmp_path):
+    # TIME columns are fetched as timedelta
+    rows = tuple((i, datetime.timedelta(seconds=i), datetime.date(2020, 1, 1 + i)) for i in range(10))
+    cache = QueryCache(max_bytes=int(1.5 * _sizeof(rows)), path=tmp_path)
+    a = _put(cache, "a", rows, {SESSION})
+    _put(cache, "b", rows, {TRIAL})
+    assert cache.get(a) == rows
+    assert cache.stats["disk_hits"] == 1
+
+    # rows that cannot be written to disk are evicted without leaving tags behind
+    unpicklable = tuple((i, threading.Lock()) for i in range(10))
+    cache = QueryCache(max_bytes=int(1.5 * _sizeof(unpicklable)), path=tmp_path)
+    a = _put(cache, "a", unpicklable, {SESSION})
+    _put(cache, "b", unpicklable, {TRIAL})
+    assert cache.get(a) is None
+    assert SESSION not in cache._tagged and len(cache) == 1
+
+
+def test_disk_budget(tmp_path):
+    rows = _rows(10)
+    cache = QueryCache(max_bytes=_sizeof(rows), path=tmp_path, disk_max_bytes=1)
+    a = _put(cache, "a", rows, {SESSION})
+    _put(cache, "b", rows, {SESSION})
+    assert cache.get(a) is None
+    assert len(cache) == 1
+
+
+def test_invalidation_by_table():
+    cache = QueryCache()
+    session = _put(cache, "session", _rows(2), {SESSION})
+    join = _put(cache, "join", _rows(2), {SESSION, TRIAL})
+    trial = _put(cache, "trial", _rows(2), {TRIAL})
+    cache.invalidate([TRIAL])
+    assert cache.get(trial) is None and cache.get(join) is None
+    assert cache.get(session) is not None
+    assert cache.stats["invalidations"] == 2
+
+
+def test_invalidation_by_schema():
+    cache = QueryCache()
+    other = "`other`.`session`"
+    session = _put(cache, "session", _rows(2), {SESSION})
+    join = _put(cache, "join", _rows(2), {SESSION, other})
+    kept = _put(cache, "other", _rows(2), {other})
+    snapshot = cache.snapshot({TRIAL})
+    cache.invalidate_schema("`lab`")
+    assert cache.get(session) is None and cache.get(join) is None
+    assert cache.get(kept) is not None
+    # results read before the schema was dropped are not cached
+    key = cache.key("trial")
+    cache.put(key, _rows(2), {TRIAL}, snapshot)
+    assert cache.get(key) is None
+
+
+def test_put_rejected_after_concurrent_change():
+    cache = QueryCache()
+    snapshot = cache.snapshot({SESSION, TRIAL})
+    cache.invalidate(TRIAL)  # modified while the query ran
+    key = cache.key("join")
+    cache.put(key, _rows(2), {SESSION, TRIAL}, snapshot)
+    assert cache.get(key) is None
+    cache.put(key, _rows(2), {SESSION, TRIAL}, cache.snapshot({TRIAL, SESSION}))
+    assert cache.get(key) is not None
+
+
+@pytest.mark.parametrize("on_disk", [False, True])
+def test_ttl(tmp_path, on_disk):
+    rows = _rows(10)
+    cache = QueryCache(max_bytes=_sizeof(rows) if on_disk else 2**20, path=tmp_path, ttl=0.05)
+    key = _put(cache, "a", rows, {SESSION})
+    if on_disk:
+        _put(cache, "b", rows, {SESSION})
+    time.sleep(0.1)
+    assert cache.get(key) is None
+    assert not cache._tagged.get(SESSION, set()) & {key}
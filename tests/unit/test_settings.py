@@ -11,6 +11,7 @@ from datajoint.errors import DataJointError
 from datajoint.settings import (
     CONFIG_FILENAME,
     SECRETS_DIRNAME,
+    BlobSettings,
     find_config_file,
     find_secrets_dir,
     read_secret_file,
@@ -336,6 +337,15 @@ class TestStoreSpec:
         finally:
             dj.config.stores = original_stores
 
+    def test_get_store_spec_max_workers(self):
+        """Test that stores accept max_workers for concurrent transfers."""
+        original_stores = dj.config.stores.copy()
+        try:
+            dj.config.stores["test_file"] = {"protocol": "file", "location": "/tmp/test", "max_workers": 32}
+            assert dj.config.get_store_spec("test_file")["max_workers"] == 32
+        finally:
+            dj.config.stores = original_stores
+
     def test_get_store_spec_s3_without_credentials(self):
         """s3 no longer requires access_key/secret_key (#1537) — matches gcs/azure."""
         original_stores = dj.config.stores.copy()
@@ -726,9 +736,14 @@ class TestSaveTemplate:
         assert "database" in content
         assert "connection" in content
         assert "display" in content
+        assert "blob" in content
         assert "stores" in content
         assert "loglevel" in content
         assert "safemode" in content
+        # Every blob setting is listed with its default
+        assert set(content["blob"]) == set(BlobSettings.model_fields)
+        assert content["blob"] == {name: field.default for name, field in BlobSettings.model_fields.items()}
+        assert content["connection"]["ping_interval"] == 60.0
         # Verify stores structure
         assert "default" in content["stores"]
         assert "main" in content["stores"]